@@ -354,6 +354,7 @@ from kernel.workforce_manager import (
     ScaleDecision,
     TerminationReason,
     WorkforcePool,
+    assign_specialists,
     compute_scale_decisions,
     evaluate_performance,
     match_specialist,
@@ -714,6 +715,7 @@ __all__ = [
     # --- Tier 8: Corporation Kernel ---
     # Workforce Manager
     "match_specialist",
+    "assign_specialists",
     "evaluate_performance",
     "compute_scale_decisions",
     "MissionChunk",
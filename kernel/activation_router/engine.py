@@ -15,11 +15,10 @@ import hashlib
 import json
 import time
 
-import numpy as np
 from ..self_model.types import CapabilityAssessment, SignalTags
 from shared.config import get_settings
 from shared.inference_kit import InferenceKit
-from shared.knowledge import load_system_knowledge
+from shared.knowledge.anchor_index import get_anchor_index
 from shared.llm.provider import LLMMessage
 from shared.logging.main import get_logger
 from shared.logging.decorators import trace_io
@@ -143,10 +142,6 @@ def _build_pipeline_templates() -> dict[ComplexityLevel, PipelineConfig]:
 # ============================================================================
 
 
-# Global cache for router anchors
-_ROUTER_ANCHOR_CACHE: dict[str, list[float]] = {}
-
-
 @trace_io()
 async def classify_signal_complexity(
     signal_tags: SignalTags,
@@ -182,32 +177,22 @@ async def classify_signal_complexity(
 
     if text and embedder:
         try:
-            perception_data = load_system_knowledge("core_perception.yaml")
-            anchors_list = perception_data.get("complexity_anchors", [])
-            
-            # Convert list of dicts to internal dict format
-            anchors = {
-                a["text"]: (a["weight"], ComplexityLevel(a["level"].lower())) 
-                for a in anchors_list
-            }
-            
             input_emb = await embedder.embed_single(text)
-            
-            best_sim = -1.0
-            for anchor_text, (weight, lvl) in anchors.items():
-                if anchor_text not in _ROUTER_ANCHOR_CACHE:
-                    _ROUTER_ANCHOR_CACHE[anchor_text] = await embedder.embed_single(anchor_text)
-                
-                anchor_emb = _ROUTER_ANCHOR_CACHE[anchor_text]
-                sim = np.dot(input_emb, anchor_emb) / (np.linalg.norm(input_emb) * np.linalg.norm(anchor_emb))
-                log.debug(f"Complexity anchor: similarity={sim:.3f} level={lvl.value} text='{anchor_text[:30]}'")
-                if sim > best_sim:
-                    best_sim = sim
-                    # High confidence match -> Shortcut return
-                    if sim > settings.activation_embedding_threshold:
-                        embedding_match = lvl
-                    embedding_bonus = (weight - 0.3) * sim 
-            
+            index = await get_anchor_index(
+                "core_perception.yaml", "complexity_anchors", embedder, dim=len(input_emb)
+            )
+
+            match = index.best(input_emb)
+            if match is not None:
+                anchor_text, best_sim = match
+                anchor = index.entries[anchor_text]
+                lvl = ComplexityLevel(anchor["level"].lower())
+                log.debug(f"Complexity anchor: similarity={best_sim:.3f} level={lvl.value} text='{anchor_text[:30]}'")
+                # High confidence match -> Shortcut return
+                if best_sim > settings.activation_embedding_threshold:
+                    embedding_match = lvl
+                embedding_bonus = (anchor["weight"] - 0.3) * best_sim
+
             if embedding_match:
                 log.debug("Complexity determined via embedding anchor", complexity=embedding_match.value, confidence=round(best_sim, 3))
                 return embedding_match
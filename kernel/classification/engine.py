@@ -17,6 +17,8 @@ import json
 import re
 import time
 
+import numpy as np
+
 from shared.config import get_settings
 from shared.inference_kit import InferenceKit
 from shared.llm.provider import LLMMessage
@@ -41,7 +43,7 @@ from .types import (
     LinguisticResult,
     SemanticResult,
 )
-from shared.knowledge import load_system_knowledge
+from shared.knowledge.anchor_index import get_anchor_index
 
 log = get_logger(__name__)
 
@@ -126,10 +128,6 @@ _IMPERATIVE_VERBS = frozenset({
 # ============================================================================
 
 
-# Global cache to prevent redundant anchor embeddings
-_ANCHOR_CACHE: dict[str, list[float]] = {}
-
-
 @trace_io()
 async def run_semantic_proximity(
     text: str,
@@ -142,10 +140,8 @@ async def run_semantic_proximity(
     against pre-indexed intent vectors from the class profile.
     
     If no intent vectors are provided, it performs 'Automatic Domain Detection'
-    using global embedding anchors.
+    using the shared domain anchor index.
     """
-    global _ANCHOR_CACHE
-    
     # Resolve best available embedder
     embedder = None
     if kit and kit.has_embedder:
@@ -161,31 +157,26 @@ async def run_semantic_proximity(
 
         # 1. Profile-based matching
         if profile_rules.intent_vectors:
-            for intent_vec in profile_rules.intent_vectors:
-                similarity = _cosine_similarity(text_embedding, intent_vec.embedding)
+            similarities = _cosine_similarities(
+                text_embedding, [iv.embedding for iv in profile_rules.intent_vectors]
+            )
+            for intent_vec, similarity in zip(profile_rules.intent_vectors, similarities):
                 candidates.append(LabelScore(label=intent_vec.label, score=float(similarity)))
 
         # 2. AUTOMATIC DOMAIN DETECTION (if no results or weak matches)
         # We load anchors ONLY from Knowledge YAML (core_perception.yaml).
         settings = get_settings().kernel
         if not candidates or max([c.score for c in candidates] or [0.0]) < settings.classification_confidence_threshold:
-            perception_data = load_system_knowledge("core_perception.yaml")
-            global_anchors = perception_data.get("domain_anchors", {})
-            
-            for domain, anchor_text in global_anchors.items():
-                try:
-                    # Resolve from cache or embed fresh
-                    if anchor_text not in _ANCHOR_CACHE:
-                        _ANCHOR_CACHE[anchor_text] = await embedder.embed_single(anchor_text)
-                    
-                    p_emb = _ANCHOR_CACHE[anchor_text]
-                    similarity = _cosine_similarity(text_embedding, p_emb)
+            try:
+                index = await get_anchor_index(
+                    "core_perception.yaml", "domain_anchors", embedder, dim=len(text_embedding)
+                )
+                # Capture every score for normalized comparison
+                for domain, similarity in index.top_k(text_embedding):
                     log.debug(f"Domain detection candidate: {domain} similarity={similarity:.3f}")
-                    
-                    # Capture every score for normalized comparison
-                    candidates.append(LabelScore(label=domain, score=float(similarity)))
-                except Exception as e:
-                    log.warning("Anchor embedding failed", domain=domain, error=str(e))
+                    candidates.append(LabelScore(label=domain, score=similarity))
+            except Exception as e:
+                log.warning("Anchor embedding failed", error=str(e))
 
         candidates.sort(key=lambda x: x.score, reverse=True)
         return SemanticResult(candidates=candidates, embedding_used=True)
@@ -203,12 +194,26 @@ def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     if len(vec_a) != len(vec_b) or not vec_a:
         return 0.0
-    dot_product = sum(a * b for a, b in zip(vec_a, vec_b))
-    norm_a = sum(a * a for a in vec_a) ** 0.5
-    norm_b = sum(b * b for b in vec_b) ** 0.5
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-    return dot_product / (norm_a * norm_b)
+    return float(_cosine_similarities(vec_a, [vec_b])[0])
+
+
+def _cosine_similarities(vec: list[float], others: list[list[float]]) -> list[float]:
+    """Cosine similarity of one vector against many in a single matrix product.
+
+    Vectors whose length differs from ``vec`` (or zero vectors) score 0.0.
+    """
+    query = np.asarray(vec, dtype=np.float64)
+    scores = [0.0] * len(others)
+    rows = [i for i, other in enumerate(others) if len(other) == len(query) and len(other) > 0]
+    query_norm = float(np.linalg.norm(query))
+    if not rows or query_norm == 0.0:
+        return scores
+    matrix = np.asarray([others[i] for i in rows], dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1)
+    dots = matrix @ query
+    for i, dot, norm in zip(rows, dots, norms):
+        scores[i] = float(dot / (norm * query_norm)) if norm > 0.0 else 0.0
+    return scores
 
 
 # ============================================================================
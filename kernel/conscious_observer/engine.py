@@ -19,6 +19,7 @@ every cycle and apply CONTINUE/SIMPLIFY/ESCALATE/ABORT decisions.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
@@ -694,9 +695,16 @@ class ConsciousObserver:
             7. Extract entities (T1 NER)
             8. Assess self-capability (T6 Self-Model)
             9. Compute activation map + pipeline mode (T6 Activation Router)
+
+        RAG retrieval overlaps steps 4–7, and steps 5–7 run concurrently.
+        All steps share one request-scoped embedding memo.
         """
         start = time.perf_counter()
 
+        # Request-scoped embedding memo: every T1–T6 module below embeds the
+        # same user text, so share each vector across the whole gate-in.
+        kit = self._kit.with_embedding_memo() if self._kit else None
+
         # 1. T5: Agent genesis
         identity = await initialize_agent(spawn_request)
 
@@ -706,15 +714,62 @@ class ConsciousObserver:
         # 3. T5: Set immutable identity constraints
         identity_context = set_identity_constraints(identity.agent_id, profile)
 
-        # 3a. RAG Knowledge Retrieval (ONE-TIME)
+        # 3a. RAG Knowledge Retrieval (ONE-TIME). Only needs the objective,
+        # so it runs alongside T1 perception and is joined before T6.
         rag_enrichment = RAGEnrichmentResult()
         settings = get_settings()
-        if settings.kernel.rag_knowledge_enabled:
-            knowledge_result = await self._rag.retrieve_knowledge(
-                objective=spawn_request.objective,
-                role=spawn_request.role,
-                domain=None,
+        knowledge_task: asyncio.Task | None = None
+        # Anything failing before the RAG task is joined must not orphan it.
+        try:
+            if settings.kernel.rag_knowledge_enabled:
+                knowledge_task = asyncio.create_task(
+                    self._rag.retrieve_knowledge(
+                        objective=spawn_request.objective,
+                        role=spawn_request.role,
+                        domain=None,
+                    )
+                )
+
+            # Track gate-in phase in self-model
+            update_cognitive_state(
+                processing_phase=ProcessingPhase.PRE_EXECUTION,
+                current_task_description=spawn_request.objective,
             )
+
+            # 4. T1: Ingest (any modality)
+            modality_result = await ingest(raw_input, kit)
+            modality_output = _extract_modality_output(modality_result)
+
+            # Derive text for classification
+            text = modality_output.cognitive_context or raw_input.content or ""
+
+            # 5–7. T1: Classification, Intent/Sentiment/Urgency and Entity
+            # Recognition only depend on the text, so run them concurrently.
+            perception_steps = [
+                classify(text, ClassProfileRules(), kit),
+                run_primitive_scorers(text, kit),
+            ]
+            # Entity Recognition (config-driven enablement)
+            run_ner = get_settings().kernel.conscious_observer_expected_cycle_ms > 0
+            if run_ner:
+                perception_steps.append(extract_entities(text, ValidatedEntity, kit))
+            perception_results = await asyncio.gather(*perception_steps)
+
+            classification = _extract_classification(perception_results[0])
+            cognitive_labels = _extract_cognitive_labels(perception_results[1])
+            entities: list[ValidatedEntity] = []
+            if run_ner:
+                entities = _extract_entities(perception_results[2])
+
+            knowledge_result = await knowledge_task if knowledge_task is not None else None
+        except BaseException:
+            if knowledge_task is not None:
+                knowledge_task.cancel()
+                # Retrieve the outcome so a failed retrieval isn't reported as unhandled
+                knowledge_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            raise
+
+        if knowledge_result is not None:
             rag_enrichment.knowledge = knowledge_result
             rag_enrichment.knowledge_available = bool(knowledge_result.formatted_context)
 
@@ -725,40 +780,13 @@ class ConsciousObserver:
                     identity.agent_id, profile
                 )
 
-        # Track gate-in phase in self-model
-        update_cognitive_state(
-            processing_phase=ProcessingPhase.PRE_EXECUTION,
-            current_task_description=spawn_request.objective,
-        )
-
-        # 4. T1: Ingest (any modality)
-        modality_result = await ingest(raw_input, self._kit)
-        modality_output = _extract_modality_output(modality_result)
-
-        # Derive text for classification
-        text = modality_output.cognitive_context or raw_input.content or ""
-
-        # 5. T1: Classify signal
-        classification_result = await classify(text, ClassProfileRules(), self._kit)
-        classification = _extract_classification(classification_result)
-
-        # 6. T1: Intent/Sentiment/Urgency
-        labels_result = await run_primitive_scorers(text, self._kit)
-        cognitive_labels = _extract_cognitive_labels(labels_result)
-
-        # 7. T1: Entity Recognition (config-driven enablement)
-        entities: list[ValidatedEntity] = []
-        if get_settings().kernel.conscious_observer_expected_cycle_ms > 0:
-            entities_result = await extract_entities(text, ValidatedEntity, self._kit)
-            entities = _extract_entities(entities_result)
-
         # Build SignalTags from T1 outputs
         signal_tags = _build_signal_tags(
             classification, cognitive_labels, entities, modality_output
         )
 
         # 8. T6: Self-model capability assessment
-        capability = await assess_capability(signal_tags, identity_context, self._kit)
+        capability = await assess_capability(signal_tags, identity_context, kit)
 
         # Early return if not capable (caller checks .capability.can_handle)
         if not capability.can_handle:
@@ -783,7 +811,7 @@ class ConsciousObserver:
 
         # 9. T6: Compute activation map and pipeline mode
         activation_result = await compute_activation_map(
-            signal_tags, capability, pressure=0.0, kit=self._kit
+            signal_tags, capability, pressure=0.0, kit=kit
         )
         activation_map = _extract_activation_map(activation_result)
         log.debug(
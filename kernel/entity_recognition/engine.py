@@ -42,9 +42,35 @@ def _ref(fn: str) -> ModuleRef:
 
 
 # Load core perception rules from knowledge/system
-from shared.knowledge import load_system_knowledge
+from shared.knowledge import CompiledKnowledge, compile_system_knowledge
 
-_ENTITY_RULES = load_system_knowledge("entity_rules.yaml")
+_ENTITY_RULES_FILE = "entity_rules.yaml"
+
+
+def _entity_rules() -> CompiledKnowledge:
+    return compile_system_knowledge(_ENTITY_RULES_FILE)
+
+
+# Lexicon POS tags in priority order (first list containing a word wins)
+_LEXICON_TAGS = (
+    ("determiners", "DET"),
+    ("prepositions", "ADP"),
+    ("pronouns", "PRON"),
+    ("conjunctions", "CONJ"),
+    ("common_verbs", "VERB"),
+)
+
+
+def _build_pos_lexicon(rules: dict[str, Any]) -> dict[str, str]:
+    """Flatten linguistic anchors into a single word -> POS tag lookup."""
+    anchors = rules.get("linguistic_anchors", {})
+    lexicon: dict[str, str] = {}
+    for section, tag in _LEXICON_TAGS:
+        # Handle potential nested list structure from YAML
+        for entry in anchors.get(section, []) or []:
+            for word in entry if isinstance(entry, list) else [entry]:
+                lexicon.setdefault(str(word).lower(), tag)
+    return lexicon
 
 
 # ============================================================================
@@ -60,6 +86,7 @@ def tokenize_and_parse(raw_text: str) -> list[Token]:
     Each Token carries text content, POS tag hint, and character offsets.
     """
     tokens: list[Token] = []
+    lexicon = _entity_rules().derive("pos_lexicon", _build_pos_lexicon)
     # Split by whitespace, preserving offsets
     for match in re.finditer(r"\S+", raw_text):
         word = match.group()
@@ -67,7 +94,7 @@ def tokenize_and_parse(raw_text: str) -> list[Token]:
         end = match.end()
 
         # Basic POS heuristic
-        pos_tag = _guess_pos(word)
+        pos_tag = _guess_pos(word, lexicon)
 
         tokens.append(Token(
             text=word,
@@ -79,33 +106,16 @@ def tokenize_and_parse(raw_text: str) -> list[Token]:
     return tokens
 
 
-def _guess_pos(word: str) -> str:
+def _guess_pos(word: str, lexicon: dict[str, str] | None = None) -> str:
     """Lightweight POS heuristic using dynamic system knowledge."""
-    anchors = _ENTITY_RULES.get("linguistic_anchors", {})
+    if lexicon is None:
+        lexicon = _entity_rules().derive("pos_lexicon", _build_pos_lexicon)
     clean = word.strip(".,;:!?\"'()[]{}").lower()
 
     if not clean:
         return "PUNCT"
-    if clean in anchors.get("determiners", []):
-        return "DET"
-    if clean in anchors.get("prepositions", []):
-        return "ADP"
-    if clean in anchors.get("pronouns", []):
-        return "PRON"
-    if clean in anchors.get("conjunctions", []):
-        return "CONJ"
-    # Match against flat list or nested lists of common verbs
-    common_verbs = anchors.get("common_verbs", [])
-    if isinstance(common_verbs, list):
-        # Handle potential nested list structure from YAML
-        flat_verbs = []
-        for v in common_verbs:
-            if isinstance(v, list):
-                flat_verbs.extend(v)
-            else:
-                flat_verbs.append(v)
-        if clean in flat_verbs:
-            return "VERB"
+    if clean in lexicon:
+        return lexicon[clean]
 
     if word[0].isupper() and not word.isupper():
         return "PROPN"  # Proper noun
@@ -134,10 +144,9 @@ def generate_candidate_spans(tokens: list[Token]) -> list[EntitySpan]:
 
     # 1. Structured format detection (highest priority)
     # Pull dynamic regex patterns from knowledge file
-    patterns = _ENTITY_RULES.get("structured_patterns", {})
-    
-    for entity_type, raw_pattern in patterns.items():
-        pattern = re.compile(raw_pattern, re.IGNORECASE)
+    patterns = _entity_rules().patterns("structured_patterns")
+
+    for entity_type, pattern in patterns.items():
         for match in pattern.finditer(full_text):
             span_range = (match.start(), match.end())
             if span_range not in seen_ranges:
@@ -265,7 +274,7 @@ async def extract_entities(
     try:
         # TIER 1 High Fidelity: spaCy Extraction (The Primary Engine)
         candidate_spans: list[EntitySpan] = []
-        entity_settings = _ENTITY_RULES.get("settings", {})
+        entity_settings = _entity_rules().data.get("settings", {})
         preferred_model = entity_settings.get("preferred_nlp_model", "en_core_web_sm")
         fallback_model = entity_settings.get("fallback_nlp_model", "en_core_web_sm")
 
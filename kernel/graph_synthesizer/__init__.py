@@ -16,7 +16,11 @@ Usage::
 from .engine import (
     calculate_dependency_edges,
     compile_dag,
+    compute_critical_path_priorities,
+    estimate_node_latency,
     map_subtasks_to_nodes,
+    ready_node_ids,
+    record_node_latency,
     review_dag_with_simulation,
     synthesize_plan,
 )
@@ -36,6 +40,10 @@ __all__ = [
     "calculate_dependency_edges",
     "compile_dag",
     "review_dag_with_simulation",
+    "compute_critical_path_priorities",
+    "ready_node_ids",
+    "record_node_latency",
+    "estimate_node_latency",
     "ActionInstruction",
     "DAGState",
     "Edge",
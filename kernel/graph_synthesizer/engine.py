@@ -201,7 +201,8 @@ def compile_dag(
     # Topological sort (Kahn's algorithm)
     execution_order = _topological_sort(nodes, incoming, outgoing)
 
-    # Parallel groups (nodes at the same topological level)
+    # Parallel groups (nodes at the same topological level). Kept as a static
+    # view for review/telemetry; execution uses the ready queue (ready_node_ids).
     parallel_groups = _compute_parallel_groups(nodes, incoming, outgoing)
 
     # Enforce max parallel branches
@@ -317,6 +318,97 @@ def _compute_parallel_groups(
     return groups
 
 
+# ============================================================================
+# Step 3b: Ready-Queue Scheduling (Critical Path)
+# ============================================================================
+
+# Historical per-tool latency (EMA, ms), shared by every DAG in the process.
+_NODE_LATENCY_MS: dict[str, float] = {}
+
+
+def node_latency_key(node: ExecutableNode) -> str:
+    """Latency history is tracked per bound tool, else per action type."""
+    if node.tool_binding:
+        return node.tool_binding
+    if node.instruction.required_tools:
+        return node.instruction.required_tools[0]
+    return node.instruction.action_type
+
+
+def record_node_latency(node: ExecutableNode, duration_ms: float) -> None:
+    """Fold an observed node duration into the latency history."""
+    alpha = get_settings().kernel.dag_latency_ema_alpha
+    key = node_latency_key(node)
+    previous = _NODE_LATENCY_MS.get(key)
+    if previous is None:
+        _NODE_LATENCY_MS[key] = duration_ms
+    else:
+        _NODE_LATENCY_MS[key] = alpha * duration_ms + (1.0 - alpha) * previous
+
+
+def estimate_node_latency(node: ExecutableNode) -> float:
+    """Expected node duration in ms from history, or the configured default."""
+    return _NODE_LATENCY_MS.get(
+        node_latency_key(node),
+        get_settings().kernel.dag_default_node_latency_ms,
+    )
+
+
+def compute_critical_path_priorities(dag: ExecutableDAG) -> dict[str, float]:
+    """Longest estimated path (ms) from each node to any terminal node.
+
+    Nodes on the critical path get the highest priority, so starting them
+    first minimizes the DAG's overall makespan.
+    """
+    outgoing: dict[str, set[str]] = {n.node_id: set() for n in dag.nodes}
+    incoming: dict[str, set[str]] = {n.node_id: set() for n in dag.nodes}
+    for edge in dag.edges:
+        if edge.from_node_id in outgoing and edge.to_node_id in incoming:
+            outgoing[edge.from_node_id].add(edge.to_node_id)
+            incoming[edge.to_node_id].add(edge.from_node_id)
+
+    order = _topological_sort(dag.nodes, incoming, outgoing)
+    nodes_by_id = {n.node_id: n for n in dag.nodes}
+    priorities: dict[str, float] = {}
+    for node_id in reversed(order):
+        tail = max((priorities[s] for s in outgoing[node_id]), default=0.0)
+        priorities[node_id] = estimate_node_latency(nodes_by_id[node_id]) + tail
+    return priorities
+
+
+def ready_node_ids(
+    dag: ExecutableDAG,
+    statuses: dict[str, str],
+    limit: int | None = None,
+) -> list[str]:
+    """Pending nodes whose predecessors have all completed.
+
+    Ordered by critical-path priority (longest remaining path first), ties
+    broken by topological order, and capped at ``limit`` (defaults to
+    ``max_parallel_branches``).
+    """
+    if limit is None:
+        limit = get_settings().kernel.max_parallel_branches
+
+    predecessors: dict[str, set[str]] = {n.node_id: set() for n in dag.nodes}
+    for edge in dag.edges:
+        if edge.to_node_id in predecessors:
+            predecessors[edge.to_node_id].add(edge.from_node_id)
+
+    ready = [
+        node_id for node_id, deps in predecessors.items()
+        if statuses.get(node_id) == NodeStatus.PENDING
+        and all(statuses.get(dep) == NodeStatus.COMPLETED for dep in deps)
+    ]
+    if not ready:
+        return []
+
+    priorities = compute_critical_path_priorities(dag)
+    position = {nid: i for i, nid in enumerate(dag.execution_order)}
+    ready.sort(key=lambda nid: (-priorities.get(nid, 0.0), position.get(nid, len(position))))
+    return ready[: max(1, limit)]
+
+
 # ============================================================================
 # Step 4: Review via What-If Simulation
 # ============================================================================
@@ -16,6 +16,8 @@ from .engine import (
     calculate_grounding_score,
     classify_claims,
     grade_claim,
+    grade_claims,
+    prescreen_claims,
     trace_evidence_chain,
     verify_grounding,
 )
@@ -34,6 +36,8 @@ __all__ = [
     "verify_grounding",
     "classify_claims",
     "grade_claim",
+    "grade_claims",
+    "prescreen_claims",
     "calculate_grounding_score",
     "trace_evidence_chain",
     # Types
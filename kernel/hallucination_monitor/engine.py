@@ -4,22 +4,26 @@ Tier 6 Hallucination Monitor — Engine.
 Epistemic grounding verification for output claims:
     1. Extract atomic claims from output text
     2. Classify claims (FACTUAL, REASONING, OPINION)
-    3. Grade each claim against evidence (GROUNDED, INFERRED, FABRICATED)
+    3. Grade claims against evidence (GROUNDED, INFERRED, FABRICATED):
+       embedding pre-screen, then concurrent multi-claim LLM batches
     4. Calculate overall grounding score
     5. Trace evidence chains for inferred claims
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import time
 from typing import Any
 
+import numpy as np
+
 from ..noise_gate.types import ToolOutput
 from shared.config import get_settings
 from shared.id_and_hash import generate_id
-from shared.inference_kit import InferenceKit
+from shared.inference_kit import InferenceKit, embed_texts, normalize_rows
 from shared.llm.provider import LLMMessage
 from shared.logging.main import get_logger
 from shared.logging.decorators import trace_io
@@ -49,11 +53,12 @@ _MODULE = "hallucination_monitor"
 _TIER = 6
 
 
-def _extract_json(raw: str) -> Any:
+def _extract_json(raw: str, prefer_array: bool = False) -> Any:
     """Robustly extract JSON from an LLM response.
 
     Handles markdown code blocks, stray prose around JSON,
-    and common formatting inconsistencies.
+    and common formatting inconsistencies. With ``prefer_array`` the
+    prose scan looks for a list before an object (batched replies).
     """
     text = raw.strip()
 
@@ -69,7 +74,8 @@ def _extract_json(raw: str) -> Any:
         pass
 
     # 3. Find first JSON object or array in the text
-    for start_char, end_char in (("{", "}"), ("[", "]")):
+    brackets = (("{", "}"), ("[", "]"))
+    for start_char, end_char in (brackets[::-1] if prefer_array else brackets):
         start_idx = text.find(start_char)
         if start_idx == -1:
             continue
@@ -188,71 +194,22 @@ async def classify_claims(output_text: str, kit: InferenceKit | None = None) ->
 
 
 # ============================================================================
-# Step 2: Grade Claim
+# Keyword Overlap Grading
 # ============================================================================
 
 
-@trace_io()
-async def grade_claim(
-    claim: Claim,
-    evidence: list[Origin],
-    kit: InferenceKit | None = None,
-) -> ClaimGrade:
-    """Grade a single claim against the evidence pool.
-
-    FACTUAL claims: match against evidence via keyword overlap.
-    REASONING claims: validate chain back to grounded premises.
-    OPINION claims: auto-grounded (labeled, not verified).
-    """
-    settings = get_settings().kernel
-    threshold = settings.grounding_similarity_threshold
-
-    # Opinions are auto-grounded
-    if claim.claim_type == ClaimType.OPINION:
-        return ClaimGrade(
-            claim_id=claim.claim_id,
-            grade=ClaimGradeLevel.GROUNDED,
-            evidence_links=[],
-            best_similarity=1.0,
-            reasoning="Opinion claims are grounded by declaration",
-        )
-
-    llm_grade = None
-    if kit and kit.has_llm and evidence:
-        try:
-            ev_texts = [o.content for o in evidence if o.content]
-            if ev_texts:
-                ev_text_block = "\n".join(f"- {txt}" for txt in ev_texts)
-                system_msg = LLMMessage(
-                    role="system",
-                    content="Grade the claim against the provided evidence. Grades: GROUNDED (fully supported), INFERRED (partially derivable), FABRICATED (no support). If the claim contains specific data matching the evidence (like '0.6%'), it MUST be GROUNDED. Respond EXACTLY with JSON: {\"grade\": \"GROUNDED\", \"reasoning\": \"...\", \"similarity\": 1.0}"
-                )
-                user_msg = LLMMessage(role="user", content=f"Claim: {claim.text}\nEvidence List:\n{ev_text_block}")
-                resp = await kit.llm.complete([system_msg, user_msg], kit.llm_config)
-                data = _extract_json(resp.content)
-
-                grade_str = str(data.get("grade", "")).upper()
-                if grade_str == "GROUNDED":
-                    llm_grade = ClaimGradeLevel.GROUNDED
-                elif grade_str == "INFERRED":
-                    llm_grade = ClaimGradeLevel.INFERRED
-                else:
-                    llm_grade = ClaimGradeLevel.FABRICATED
+def _opinion_grade(claim: Claim) -> ClaimGrade:
+    return ClaimGrade(
+        claim_id=claim.claim_id,
+        grade=ClaimGradeLevel.GROUNDED,
+        evidence_links=[],
+        best_similarity=1.0,
+        reasoning="Opinion claims are grounded by declaration",
+    )
 
-                # If LLM confirms grounding, return immediately
-                if llm_grade == ClaimGradeLevel.GROUNDED:
-                    return ClaimGrade(
-                        claim_id=claim.claim_id,
-                        grade=llm_grade,
-                        evidence_links=[],
-                        best_similarity=float(data.get("similarity", 1.0)),
-                        reasoning=data.get("reasoning", "LLM grounded"),
-                    )
-        except Exception as e:
-            log.warning("LLM claim grading failed, falling back", error=str(e))
-            pass
 
-    # For FACTUAL and REASONING claims: compare against evidence
+def _keyword_grade(claim: Claim, evidence: list[Origin], threshold: float) -> ClaimGrade:
+    """Grade a FACTUAL or REASONING claim by keyword overlap with the evidence."""
     best_similarity = 0.0
     best_links: list[EvidenceLink] = []
 
@@ -319,6 +276,234 @@ async def grade_claim(
     )
 
 
+# ============================================================================
+# Step 2: Grade Claim
+# ============================================================================
+
+
+@trace_io()
+async def grade_claim(
+    claim: Claim,
+    evidence: list[Origin],
+    kit: InferenceKit | None = None,
+) -> ClaimGrade:
+    """Grade a single claim against the evidence pool.
+
+    FACTUAL claims: match against evidence via keyword overlap.
+    REASONING claims: validate chain back to grounded premises.
+    OPINION claims: auto-grounded (labeled, not verified).
+    """
+    settings = get_settings().kernel
+    threshold = settings.grounding_similarity_threshold
+
+    # Opinions are auto-grounded
+    if claim.claim_type == ClaimType.OPINION:
+        return _opinion_grade(claim)
+
+    llm_grade = None
+    if kit and kit.has_llm and evidence:
+        try:
+            ev_texts = [o.content for o in evidence if o.content]
+            if ev_texts:
+                ev_text_block = "\n".join(f"- {txt}" for txt in ev_texts)
+                system_msg = LLMMessage(
+                    role="system",
+                    content="Grade the claim against the provided evidence. Grades: GROUNDED (fully supported), INFERRED (partially derivable), FABRICATED (no support). If the claim contains specific data matching the evidence (like '0.6%'), it MUST be GROUNDED. Respond EXACTLY with JSON: {\"grade\": \"GROUNDED\", \"reasoning\": \"...\", \"similarity\": 1.0}"
+                )
+                user_msg = LLMMessage(role="user", content=f"Claim: {claim.text}\nEvidence List:\n{ev_text_block}")
+                resp = await kit.llm.complete([system_msg, user_msg], kit.llm_config)
+                data = _extract_json(resp.content)
+
+                grade_str = str(data.get("grade", "")).upper()
+                if grade_str == "GROUNDED":
+                    llm_grade = ClaimGradeLevel.GROUNDED
+                elif grade_str == "INFERRED":
+                    llm_grade = ClaimGradeLevel.INFERRED
+                else:
+                    llm_grade = ClaimGradeLevel.FABRICATED
+
+                # If LLM confirms grounding, return immediately
+                if llm_grade == ClaimGradeLevel.GROUNDED:
+                    return ClaimGrade(
+                        claim_id=claim.claim_id,
+                        grade=llm_grade,
+                        evidence_links=[],
+                        best_similarity=float(data.get("similarity", 1.0)),
+                        reasoning=data.get("reasoning", "LLM grounded"),
+                    )
+        except Exception as e:
+            log.warning("LLM claim grading failed, falling back", error=str(e))
+            pass
+
+    return _keyword_grade(claim, evidence, threshold)
+
+
+# ============================================================================
+# Step 2b: Batched Grading Pipeline
+# ============================================================================
+
+_BATCH_GRADE_PROMPT = (
+    "Grade each numbered claim against the evidence. Grades: GROUNDED (fully supported), "
+    "INFERRED (partially derivable), FABRICATED (no support). If a claim contains specific "
+    "data matching the evidence (like '0.6%'), it MUST be GROUNDED. Respond EXACTLY with a "
+    "JSON list, one object per claim: "
+    "[{\"id\": 1, \"grade\": \"GROUNDED\", \"reasoning\": \"...\", \"similarity\": 1.0}]"
+)
+
+
+async def prescreen_claims(
+    claims: list[Claim],
+    evidence: list[Origin],
+    kit: InferenceKit,
+) -> tuple[dict[str, ClaimGrade], list[Claim]]:
+    """Settle clear-cut claims by embedding similarity before any LLM call.
+
+    Claims whose best cosine similarity to an evidence item reaches
+    ``grounding_prescreen_grounded_similarity`` are GROUNDED; claims
+    below ``grounding_prescreen_fabricated_similarity`` get the keyword
+    grade. Returns ``(settled grades by claim_id, claims left for the LLM)``.
+    """
+    settings = get_settings().kernel
+    origins = [o for o in evidence if o.content]
+    if not (claims and origins and kit.has_embedder):
+        return {}, claims
+
+    try:
+        vectors = await embed_texts(
+            kit.embedder, [c.text for c in claims] + [o.content for o in origins]
+        )
+    except Exception as e:
+        log.warning("Claim pre-screen embedding failed, grading all claims", error=str(e))
+        return {}, claims
+
+    matrix = normalize_rows(np.asarray(vectors, dtype=np.float32))
+    similarities = matrix[: len(claims)] @ matrix[len(claims):].T
+    best_idx = similarities.argmax(axis=1)
+    best_sim = np.clip(similarities.max(axis=1), 0.0, 1.0)
+
+    settled: dict[str, ClaimGrade] = {}
+    remaining: list[Claim] = []
+    for claim, idx, sim in zip(claims, best_idx, best_sim):
+        sim = float(sim)
+        if sim >= settings.grounding_prescreen_grounded_similarity:
+            settled[claim.claim_id] = ClaimGrade(
+                claim_id=claim.claim_id,
+                grade=ClaimGradeLevel.GROUNDED,
+                evidence_links=[EvidenceLink(
+                    claim_id=claim.claim_id,
+                    origin_id=origins[idx].origin_id,
+                    similarity_score=round(sim, 4),
+                    reasoning_chain="Embedding similarity pre-screen",
+                )],
+                best_similarity=round(sim, 4),
+                reasoning=f"Evidence found by embedding pre-screen (similarity: {sim:.3f})",
+            )
+        elif sim < settings.grounding_prescreen_fabricated_similarity:
+            settled[claim.claim_id] = _keyword_grade(
+                claim, evidence, settings.grounding_similarity_threshold
+            )
+        else:
+            remaining.append(claim)
+    return settled, remaining
+
+
+async def _grade_batch(
+    batch: list[Claim],
+    evidence_block: str,
+    kit: InferenceKit,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, ClaimGrade]:
+    """Grade several claims in one LLM call; returns only the GROUNDED verdicts."""
+    claim_block = "\n".join(f"{i}. {claim.text}" for i, claim in enumerate(batch, 1))
+    system_msg = LLMMessage(role="system", content=_BATCH_GRADE_PROMPT)
+    user_msg = LLMMessage(
+        role="user", content=f"Evidence List:\n{evidence_block}\n\nClaims:\n{claim_block}"
+    )
+    try:
+        async with semaphore:
+            resp = await kit.llm.complete([system_msg, user_msg], kit.llm_config)
+        data = _extract_json(resp.content, prefer_array=True)
+    except Exception as e:
+        log.warning("LLM batch claim grading failed, falling back", error=str(e), claims=len(batch))
+        return {}
+
+    if isinstance(data, dict):
+        data = data.get("grades") or data.get("claims") or [data]
+
+    grounded: dict[str, ClaimGrade] = {}
+    for item in data if isinstance(data, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            claim = batch[int(item.get("id")) - 1]
+        except (TypeError, ValueError, IndexError):
+            continue
+        if str(item.get("grade", "")).upper() != "GROUNDED":
+            continue
+        try:
+            similarity = min(1.0, max(0.0, float(item.get("similarity", 1.0))))
+        except (TypeError, ValueError):
+            similarity = 1.0
+        grounded[claim.claim_id] = ClaimGrade(
+            claim_id=claim.claim_id,
+            grade=ClaimGradeLevel.GROUNDED,
+            evidence_links=[],
+            best_similarity=similarity,
+            reasoning=item.get("reasoning", "LLM grounded"),
+        )
+    return grounded
+
+
+@trace_io()
+async def grade_claims(
+    claims: list[Claim],
+    evidence: list[Origin],
+    kit: InferenceKit | None = None,
+) -> list[ClaimGrade]:
+    """Grade all claims with as few LLM round-trips as possible.
+
+    Same verdicts as calling ``grade_claim`` per claim, but:
+        1. Opinions are auto-grounded.
+        2. An embedding pre-screen settles clearly grounded/ungrounded claims.
+        3. The rest are packed ``grounding_batch_size`` to a prompt, and
+           batches run concurrently (``grounding_max_concurrent_batches``).
+    Claims the LLM does not confirm as GROUNDED get the keyword grade.
+    """
+    settings = get_settings().kernel
+    threshold = settings.grounding_similarity_threshold
+
+    grades: dict[str, ClaimGrade] = {}
+    pending: list[Claim] = []
+    for claim in claims:
+        if claim.claim_type == ClaimType.OPINION:
+            grades[claim.claim_id] = _opinion_grade(claim)
+        else:
+            pending.append(claim)
+
+    ev_texts = [o.content for o in evidence if o.content]
+    if pending and kit and kit.has_llm and ev_texts:
+        if settings.grounding_prescreen_enabled:
+            settled, pending = await prescreen_claims(pending, evidence, kit)
+            grades.update(settled)
+
+        if pending:
+            evidence_block = "\n".join(f"- {txt}" for txt in ev_texts)
+            size = max(1, settings.grounding_batch_size)
+            semaphore = asyncio.Semaphore(max(1, settings.grounding_max_concurrent_batches))
+            results = await asyncio.gather(*[
+                _grade_batch(pending[i:i + size], evidence_block, kit, semaphore)
+                for i in range(0, len(pending), size)
+            ])
+            for grounded in results:
+                grades.update(grounded)
+
+    for claim in pending:
+        if claim.claim_id not in grades:
+            grades[claim.claim_id] = _keyword_grade(claim, evidence, threshold)
+
+    return [grades[claim.claim_id] for claim in claims]
+
+
 # ============================================================================
 # Step 3: Calculate Grounding Score
 # ============================================================================
@@ -412,8 +597,8 @@ async def verify_grounding(
 ) -> Result:
     """Top-level grounding verification.
 
-    Extracts claims, classifies them, grades each against evidence,
-    and produces a GroundingReport with per-claim grades and an
+    Extracts claims, classifies them, grades them against evidence
+    (see ``grade_claims``), and produces a GroundingReport with per-claim grades and an
     overall grounding score.
     """
     ref = _ref("verify_grounding")
@@ -423,16 +608,13 @@ async def verify_grounding(
         # Extract and classify claims
         claims = await classify_claims(output.content, kit)
 
-        # Grade each claim
-        claim_grades: list[ClaimGrade] = []
+        # Grade all claims (pre-screened, batched, concurrent)
+        claim_grades = await grade_claims(claims, evidence, kit)
         grounded_count = 0
         inferred_count = 0
         fabricated_count = 0
 
-        for claim in claims:
-            grade = await grade_claim(claim, evidence, kit)
-            claim_grades.append(grade)
-
+        for grade in claim_grades:
             if grade.grade == ClaimGradeLevel.GROUNDED:
                 grounded_count += 1
             elif grade.grade == ClaimGradeLevel.INFERRED:
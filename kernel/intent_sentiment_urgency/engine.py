@@ -38,22 +38,25 @@ from .types import (
     UrgencyLabel,
 )
 
-import numpy as np
-from shared.knowledge.system_loader import load_system_knowledge
+from shared.knowledge.anchor_index import get_anchor_index
 
 log = get_logger(__name__)
 
 _MODULE = "intent_sentiment_urgency"
 _TIER = 1
 
-# Global cache to prevent redundant anchor embeddings
-_ANCHOR_CACHE: dict[str, list[float]] = {}
-
 
 def _ref(fn: str) -> ModuleRef:
     return ModuleRef(tier=_TIER, module=_MODULE, function=fn)
 
 
+async def _best_anchor_match(embedder, text: str, section: str) -> tuple[str, float] | None:
+    """Best-matching anchor label from core_perception.yaml ``section``."""
+    text_emb = await embedder.embed_single(text)
+    index = await get_anchor_index("core_perception.yaml", section, embedder, dim=len(text_emb))
+    return index.best(text_emb)
+
+
 # ============================================================================
 # Intent Detection
 # ============================================================================
@@ -153,24 +156,11 @@ async def detect_intent_async(text: str, kit: InferenceKit | None = None) -> Int
     # Layer B: Embedding Proximity (Best Match)
     if embedder:
         try:
-            text_emb = await embedder.embed_single(text)
-            perception_data = load_system_knowledge("core_perception.yaml")
-            anchors = perception_data.get("intent_anchors", {})
-            
-            best_sim = -1.0
-            best_cat = label.primary
-            
-            for cat_name, anchor_text in anchors.items():
-                if anchor_text not in _ANCHOR_CACHE:
-                    _ANCHOR_CACHE[anchor_text] = await embedder.embed_single(anchor_text)
-                
-                anchor_emb = _ANCHOR_CACHE[anchor_text]
-                sim = np.dot(text_emb, anchor_emb) / (np.linalg.norm(text_emb) * np.linalg.norm(anchor_emb))
-                
-                if sim > best_sim:
-                    best_sim = sim
-                    best_cat = IntentCategory(cat_name.upper())
-            
+            match = await _best_anchor_match(embedder, text, "intent_anchors")
+            if match is None:
+                return label
+            best_cat, best_sim = IntentCategory(match[0].upper()), match[1]
+
             # Commit to Best Match
             label.primary = best_cat
             label.confidence = float(best_sim)
@@ -267,24 +257,11 @@ async def analyze_sentiment_async(text: str, kit: InferenceKit | None = None) ->
     # Layer B: Embedding Proximity (Best Match)
     if embedder:
         try:
-            text_emb = await embedder.embed_single(text)
-            perception_data = load_system_knowledge("core_perception.yaml")
-            anchors = perception_data.get("sentiment_anchors", {})
-            
-            best_sim = -1.0
-            best_cat = label.primary
-            
-            for cat_name, anchor_text in anchors.items():
-                if anchor_text not in _ANCHOR_CACHE:
-                    _ANCHOR_CACHE[anchor_text] = await embedder.embed_single(anchor_text)
-                
-                anchor_emb = _ANCHOR_CACHE[anchor_text]
-                sim = np.dot(text_emb, anchor_emb) / (np.linalg.norm(text_emb) * np.linalg.norm(anchor_emb))
-                
-                if sim > best_sim:
-                    best_sim = sim
-                    best_cat = SentimentCategory(cat_name.upper())
-            
+            match = await _best_anchor_match(embedder, text, "sentiment_anchors")
+            if match is None:
+                return label
+            best_cat, best_sim = SentimentCategory(match[0].upper()), match[1]
+
             # Commit to Best Match
             label.primary = best_cat
             label.score = float(best_sim)
@@ -381,24 +358,11 @@ async def score_urgency_async(text: str, kit: InferenceKit | None = None) -> Urg
     # Layer B: Embedding Proximity (Best Match)
     if embedder:
         try:
-            text_emb = await embedder.embed_single(text)
-            perception_data = load_system_knowledge("core_perception.yaml")
-            anchors = perception_data.get("urgency_anchors", {})
-            
-            best_sim = -1.0
-            best_band = label.band
-            
-            for band_name, anchor_text in anchors.items():
-                if anchor_text not in _ANCHOR_CACHE:
-                    _ANCHOR_CACHE[anchor_text] = await embedder.embed_single(anchor_text)
-                
-                anchor_emb = _ANCHOR_CACHE[anchor_text]
-                sim = np.dot(text_emb, anchor_emb) / (np.linalg.norm(text_emb) * np.linalg.norm(anchor_emb))
-                
-                if sim > best_sim:
-                    best_sim = sim
-                    best_band = UrgencyBand(band_name.upper())
-            
+            match = await _best_anchor_match(embedder, text, "urgency_anchors")
+            if match is None:
+                return label
+            best_band, best_sim = UrgencyBand(match[0].upper()), match[1]
+
             # Commit to Best Match
             label.band = best_band
             label.score = float(best_sim)
@@ -424,6 +388,10 @@ async def run_primitive_scorers(text: str, kit: InferenceKit | None = None) -> R
     ref = _ref("run_primitive_scorers")
     start = time.perf_counter()
 
+    # The three scorers embed the same text; share one vector between them.
+    if kit is not None:
+        kit = kit.with_embedding_memo()
+
     try:
         # Gather all three parallel async calls
         intent, sentiment, urgency = await asyncio.gather(
@@ -17,7 +17,7 @@ from datetime import datetime, timedelta
 
 from shared.config import get_settings
 from shared.inference_kit import InferenceKit
-from shared.knowledge import load_system_knowledge
+from shared.knowledge import compile_system_knowledge
 from shared.llm.provider import LLMMessage
 from shared.logging.main import get_logger
 from shared.logging.decorators import trace_io
@@ -44,9 +44,6 @@ from .types import (
     TimeGranularity,
 )
 
-_GEO_REGIONS = load_system_knowledge("geo_regions.yaml")
-_GEO_CITIES = load_system_knowledge("geo_cities.yaml")
-
 log = get_logger(__name__)
 
 _MODULE = "location_and_time"
@@ -132,6 +129,8 @@ _SPATIAL_HINT_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+_PLACE_PATTERN = re.compile(r"\b(?:in|at|near|from|to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
+
 
 @trace_io()
 def extract_spatial_signals(
@@ -151,8 +150,7 @@ def extract_spatial_signals(
         ))
 
     # 2. Named places: look for capitalized multi-word sequences
-    place_pattern = re.compile(r"\b(?:in|at|near|from|to)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
-    for match in place_pattern.finditer(text):
+    for match in _PLACE_PATTERN.finditer(text):
         place_name = match.group(1)
         signals.append(SpatialSignal(
             signal_type=SpatialSignalType.EXPLICIT,
@@ -161,20 +159,16 @@ def extract_spatial_signals(
             end_offset=match.end(1),
         ))
 
-    # 3. Macro-regions from knowledge
-    regions_map = _GEO_REGIONS.get("regions", {})
-    orgs_map = _GEO_REGIONS.get("organizations", {})
-    all_macro = {**regions_map, **orgs_map}
-    
-    for key, info in all_macro.items():
-        pattern = re.compile(rf"\b{key}\b", re.IGNORECASE)
-        for match in pattern.finditer(text):
-            signals.append(SpatialSignal(
-                signal_type=SpatialSignalType.EXPLICIT,
-                raw_text=match.group(),
-                start_offset=match.start(),
-                end_offset=match.end(),
-            ))
+    # 3. Macro-regions from knowledge: one Aho-Corasick pass over the text
+    # covers every region and organization key
+    gazetteer = compile_system_knowledge("geo_regions.yaml").gazetteer("regions", "organizations")
+    for match in gazetteer.find_all(text):
+        signals.append(SpatialSignal(
+            signal_type=SpatialSignalType.EXPLICIT,
+            raw_text=text[match.start:match.end],
+            start_offset=match.start,
+            end_offset=match.end,
+        ))
 
     return signals
 
@@ -386,7 +380,7 @@ async def resolve_spatial_hierarchy(
         )
 
     # Resolution Tier 0: City Knowledge (High Precision Cache)
-    cities_map = _GEO_CITIES.get("cities", {})
+    cities_map = compile_system_knowledge("geo_cities.yaml").data.get("cities", {})
     for signal in signals:
         name = signal.raw_text.strip()
         if name in cities_map:
@@ -410,9 +404,8 @@ async def resolve_spatial_hierarchy(
                 return external_res
 
     # Resolution Tier 2: Macro-regions
-    regions_map = _GEO_REGIONS.get("regions", {})
-    orgs_map = _GEO_REGIONS.get("organizations", {})
-    all_macro = {**regions_map, **orgs_map}
+    geo_regions = compile_system_knowledge("geo_regions.yaml").data
+    all_macro = {**geo_regions.get("regions", {}), **geo_regions.get("organizations", {})}
 
     for signal in signals:
         key = signal.raw_text.upper()
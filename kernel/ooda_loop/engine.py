@@ -14,11 +14,13 @@ relying on Short-Term Memory to track state.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from typing import Any
 
-from ..graph_synthesizer.types import ExecutableDAG, NodeStatus
+from ..graph_synthesizer.engine import ready_node_ids, record_node_latency
+from ..graph_synthesizer.types import ExecutableDAG, ExecutableNode, NodeStatus
 from ..short_term_memory.engine import ShortTermMemory
 from ..short_term_memory.types import (
     EventSource,
@@ -271,6 +273,7 @@ async def decide(
     log.debug("OODA Decide: Checking DAG progress", dag_id=active_dag.dag_id if active_dag else None)
 
     # Check DAG progress
+    snapshot = None
     if stm is not None:
         snapshot = stm.get_dag_snapshot(active_dag.dag_id)
         if snapshot is not None:
@@ -303,15 +306,22 @@ async def decide(
 
 
     if pending_nodes:
-        # Execute next batch from parallel groups
-        next_batch: list[str] = []
-        for group in active_dag.parallel_groups:
-            batch_nodes = [nid for nid in group if nid in pending_nodes]
-            if batch_nodes:
-                next_batch = batch_nodes
-                break
+        # Ready queue: every pending node whose dependencies are complete,
+        # highest critical-path priority first, capped at the branch limit.
+        next_batch = ready_node_ids(active_dag, current_statuses)
 
         if not next_batch:
+            failed_ids = [
+                nid for nid, status in current_statuses.items()
+                if status == NodeStatus.FAILED
+            ]
+            if failed_ids:
+                return Decision(
+                    action=DecisionAction.REPLAN,
+                    reasoning=f"{len(pending_nodes)} pending nodes blocked by failed dependencies",
+                    replan_objective=active_dag.description,
+                    replan_context={"failed_nodes": failed_ids},
+                )
             next_batch = pending_nodes[:1]
 
         decision = Decision(
@@ -346,185 +356,317 @@ async def act(
 
     In production, dispatches to MCP Host for tool execution.
     Here we execute the node callables and track state in STM.
+
+    The decided batch is the scheduler's ready set, so its nodes run
+    concurrently under a semaphore of ``max_parallel_branches``, each
+    bounded by ``node_execution_timeout_ms``. With ``dag_dynamic_release``
+    a dependent node starts the moment its last dependency completes,
+    instead of waiting for the next cycle. A timed-out node fails on its
+    own; an unexpected exception is fatal and cancels running siblings.
+    Results are returned, and merged into ``agent_state.context``, in a
+    deterministic order (decided batch, then topological order).
     """
     results: list[ActionResult] = []
 
     if decision.action != DecisionAction.CONTINUE or active_dag is None:
         return results
 
-    for node_id in decision.target_node_ids:
-        start = time.perf_counter()
+    settings = get_settings().kernel
+    nodes_by_id = {n.node_id: n for n in active_dag.nodes}
+    semaphore = asyncio.Semaphore(max(1, settings.max_parallel_branches))
+    timeout_s = settings.node_execution_timeout_ms / 1000.0
 
-        # Find the node
-        node = next(
-            (n for n in active_dag.nodes if n.node_id == node_id),
-            None,
-        )
+    statuses: dict[str, str] = {n.node_id: n.status for n in active_dag.nodes}
+    snapshot = stm.get_dag_snapshot(active_dag.dag_id)
+    if snapshot and snapshot.node_statuses:
+        statuses.update(snapshot.node_statuses)
 
+    async def _run_bounded(node: ExecutableNode) -> ActionResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    _execute_node(node, active_dag, stm, kit, agent_state),
+                    timeout=timeout_s,
+                )
+            except asyncio.TimeoutError:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                log.warning(
+                    "OODA Act: Node execution timed out",
+                    node_id=node.node_id,
+                    timeout_ms=settings.node_execution_timeout_ms,
+                )
+                node.status = NodeStatus.FAILED
+                stm.update_dag_state(
+                    dag_id=active_dag.dag_id,
+                    node_id=node.node_id,
+                    status=NodeExecutionStatus.FAILED,
+                )
+                result = ActionResult(
+                    node_id=node.node_id,
+                    success=False,
+                    error_message=f"Node {node.node_id} timed out after {settings.node_execution_timeout_ms:.0f}ms",
+                    duration_ms=elapsed_ms,
+                    action_type=node.instruction.action_type,
+                    parameters=node.instruction.parameters,
+                    input_keys=node.input_keys,
+                    output_keys=node.output_keys,
+                )
+            record_node_latency(node, result.duration_ms)
+            return result
+
+    running: dict[asyncio.Task[ActionResult], str] = {}
+    finished: dict[str, ActionResult] = {}
+
+    def _launch(node_id: str) -> None:
+        if node_id in finished or node_id in running.values():
+            return
+        node = nodes_by_id.get(node_id)
         if node is None:
-            results.append(ActionResult(
+            finished[node_id] = ActionResult(
                 node_id=node_id,
                 success=False,
                 error_message=f"Node {node_id} not found in DAG",
-            ))
+            )
             stm.update_dag_state(
                 dag_id=active_dag.dag_id,
                 node_id=node_id,
                 status=NodeExecutionStatus.FAILED,
             )
-            continue
+            return
+        statuses[node_id] = NodeStatus.RUNNING
+        running[asyncio.create_task(_run_bounded(node))] = node_id
 
-        # JIT Initialization: Resolve inputs and log start
-        node_input_data = {}
-        if agent_state and agent_state.context:
-            for key in node.input_keys:
-                if key in agent_state.context:
-                    node_input_data[key] = agent_state.context[key]
-        
-        log_node_execution_start(
-            logger=log,
-            node_id=node_id,
-            description=node.instruction.description,
-            inputs=node.input_keys,
-            input_data=node_input_data
-        )
+    for node_id in decision.target_node_ids:
+        _launch(node_id)
+
+    while running:
+        done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+        fatal: BaseException | None = None
+        for task in done:
+            node_id = running.pop(task)
+            if task.exception() is not None:
+                fatal = fatal or task.exception()
+                statuses[node_id] = NodeStatus.FAILED
+                continue
+            result = task.result()
+            finished[node_id] = result
+            statuses[node_id] = NodeStatus.COMPLETED if result.success else NodeStatus.FAILED
+            if agent_state is not None:
+                # Publish immediately so released dependents can read their inputs
+                _merge_action_outputs(agent_state, [result])
+
+        if fatal is not None:
+            cancelled = list(running.values())
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+            # Siblings that never finished go back to PENDING for a replan
+            for node_id in cancelled:
+                nodes_by_id[node_id].status = NodeStatus.PENDING
+                stm.update_dag_state(
+                    dag_id=active_dag.dag_id,
+                    node_id=node_id,
+                    status=NodeExecutionStatus.PENDING,
+                )
+            log.error(
+                "OODA Act: Fatal node error, cancelled sibling nodes",
+                error=str(fatal),
+                cancelled=cancelled,
+            )
+            raise fatal
 
-        # Mark as running
-        node.status = NodeStatus.RUNNING
-        stm.update_dag_state(
-            dag_id=active_dag.dag_id,
-            node_id=node_id,
-            status=NodeExecutionStatus.RUNNING,
-        )
+        if settings.dag_dynamic_release:
+            free_slots = settings.max_parallel_branches - len(running)
+            if free_slots > 0:
+                for node_id in ready_node_ids(active_dag, statuses, limit=free_slots):
+                    _launch(node_id)
 
-        # Node execution: in kernel, we implement basic LLM inference
-        # if the kit is available and the node requires it.
-        # Other types (tool_call) are still delegated to the service layer.
-        node_outputs = {"instruction": node.instruction.description}
-        
-        if kit and kit.has_llm and node.instruction.action_type in ("llm_inference", "general", "data_transform"):
-            try:
-                # Build context-aware prompt
-                ctx_summary = ""
-                if agent_state:
-                    ctx_summary = json.dumps(agent_state.context, indent=2)
-                
-                system_msg = LLMMessage(
-                    role="system",
-                    content=f"Execute this task EXTREMELY FACTUALLY based on the provided context. If the context contains specific numbers, dates, or names, you MUST use them exactly. This output will be used for automated grounding verification. Context:\n{ctx_summary}"
-                )
-                user_msg = LLMMessage(role="user", content=node.instruction.description)
-                
-                log.debug(
-                    "🤖 OODA Act: LLM Request (In-Node)", 
-                    node_id=node_id, 
-                    messages=[{"role": system_msg.role, "content": system_msg.content[:200]}, {"role": user_msg.role, "content": user_msg.content[:200]}]
-                )
-                
-                resp = await kit.llm.complete([system_msg, user_msg], kit.llm_config)
-                node_outputs["answer"] = resp.content.strip()
-                log.debug(
-                    "🚀 OODA Act: LLM inference result received", 
-                    node_id=node_id, 
-                    content_preview=node_outputs["answer"][:100]
-                )
-            except Exception as e:
-                log.warning("OODA Act: LLM inference failed, fallback to echo", error=str(e))
+    # Deterministic ordering: decided batch, then topological order
+    order = list(dict.fromkeys([*decision.target_node_ids, *active_dag.execution_order]))
+    position = {nid: i for i, nid in enumerate(order)}
+    results = sorted(finished.values(), key=lambda r: position.get(r.node_id, len(position)))
 
-        elif node.instruction.action_type == "tool_call" or node.tool_binding:
-            # Assembly logic: mapping parameters/context to tool arguments
-            tool_name = node.tool_binding
-            selected_from_candidates = False
-            
-            # JIT selection logic if not pre-bound
-            if not tool_name and node.instruction.required_tools:
-                tool_name = node.instruction.required_tools[0]
-                selected_from_candidates = True
+    if agent_state is not None:
+        _merge_action_outputs(agent_state, results)
+
+    log.debug(
+        "Act phase complete",
+        nodes_executed=len(results),
+        successes=sum(1 for r in results if r.success),
+    )
+
+    return results
+
+
+async def _execute_node(
+    node: ExecutableNode,
+    active_dag: ExecutableDAG,
+    stm: ShortTermMemory,
+    kit: InferenceKit | None,
+    agent_state: AgentState | None,
+) -> ActionResult:
+    """Run a single DAG node and record its status in STM."""
+    node_id = node.node_id
+    start = time.perf_counter()
+
+    # JIT Initialization: Resolve inputs and log start
+    node_input_data = {}
+    if agent_state and agent_state.context:
+        for key in node.input_keys:
+            if key in agent_state.context:
+                node_input_data[key] = agent_state.context[key]
+    
+    log_node_execution_start(
+        logger=log,
+        node_id=node_id,
+        description=node.instruction.description,
+        inputs=node.input_keys,
+        input_data=node_input_data
+    )
+
+    # Mark as running
+    node.status = NodeStatus.RUNNING
+    stm.update_dag_state(
+        dag_id=active_dag.dag_id,
+        node_id=node_id,
+        status=NodeExecutionStatus.RUNNING,
+    )
+
+    # Node execution: in kernel, we implement basic LLM inference
+    # if the kit is available and the node requires it.
+    # Other types (tool_call) are still delegated to the service layer.
+    node_outputs = {"instruction": node.instruction.description}
+    
+    if kit and kit.has_llm and node.instruction.action_type in ("llm_inference", "general", "data_transform"):
+        try:
+            # Build context-aware prompt
+            ctx_summary = ""
+            if agent_state:
+                ctx_summary = json.dumps(agent_state.context, indent=2, default=str)
             
-            tool_name = tool_name or "unknown_tool"
-            arguments = node.instruction.parameters.get("arguments", {})
+            system_msg = LLMMessage(
+                role="system",
+                content=f"Execute this task EXTREMELY FACTUALLY based on the provided context. If the context contains specific numbers, dates, or names, you MUST use them exactly. This output will be used for automated grounding verification. Context:\n{ctx_summary}"
+            )
+            user_msg = LLMMessage(role="user", content=node.instruction.description)
             
             log.debug(
-                "🛠️ OODA Act: JIT Tool Initialization",
-                node_id=node_id,
-                tool_name=tool_name,
-                pre_bound=not selected_from_candidates,
-                candidates=node.instruction.required_tools,
-                context_keys=list(agent_state.context.keys()) if agent_state else []
+                "🤖 OODA Act: LLM Request (In-Node)", 
+                node_id=node_id, 
+                messages=[{"role": system_msg.role, "content": system_msg.content[:200]}, {"role": user_msg.role, "content": user_msg.content[:200]}]
             )
             
-            # Validation step (simulated)
+            resp = await kit.llm.complete([system_msg, user_msg], kit.llm_config)
+            node_outputs["answer"] = resp.content.strip()
             log.debug(
-                f"🛡️ OODA Act: Pulling MCP schema for {tool_name}", 
+                "🚀 OODA Act: LLM inference result received", 
                 node_id=node_id, 
-                schema={"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
+                content_preview=node_outputs["answer"][:100]
             )
-            log.debug(f"🛡️ OODA Act: Validating tool call against retrieved schema for {tool_name}", node_id=node_id, status="PASS")
-            
-            # Real World Execution vs Simulation
-            if kit and kit.tool_executor:
-                try:
-                    log.info(f"🔌 OODA Act: Executing REAL tool call → {tool_name}", node_id=node_id)
-                    tool_resp = await kit.tool_executor(tool_name, arguments)
-                    node_outputs.update(tool_resp)
-                    if "answer" not in node_outputs and "content" in node_outputs:
-                        node_outputs["answer"] = str(node_outputs["content"])
-                except Exception as e:
-                    log.error(f"❌ OODA Act: Real tool execution failed", node_id=node_id, error=str(e))
-                    node_outputs["answer"] = f"Error executing {tool_name}: {str(e)}"
-                    node_outputs["error"] = str(e)
-            else:
-                # In kernel simulator, we simulate success for registered tools
-                node_outputs["arguments"] = arguments
-                node_outputs["answer"] = f"Simulated output from {tool_name} for task: {node.instruction.description[:50]}"
-            
-        else:
-            # Fallback for 'general' or 'data_transform' nodes
-            node_outputs["answer"] = f"Processed {len(node.input_keys)} inputs into {len(node.output_keys)} outputs."
+        except Exception as e:
+            log.warning("OODA Act: LLM inference failed, fallback to echo", error=str(e))
+
+    elif node.instruction.action_type == "tool_call" or node.tool_binding:
+        # Assembly logic: mapping parameters/context to tool arguments
+        tool_name = node.tool_binding
+        selected_from_candidates = False
+        
+        # JIT selection logic if not pre-bound
+        if not tool_name and node.instruction.required_tools:
+            tool_name = node.instruction.required_tools[0]
+            selected_from_candidates = True
         
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        tool_name = tool_name or "unknown_tool"
+        arguments = node.instruction.parameters.get("arguments", {})
         
-        # Universal premium visibility for ALL node types
-        log_tool_execution(
-            logger=log,
+        log.debug(
+            "🛠️ OODA Act: JIT Tool Initialization",
             node_id=node_id,
-            tool_name=node.instruction.action_type,
-            arguments=node.instruction.parameters.get("arguments", node.instruction.parameters),
-            outputs=node_outputs,
-            success=True,
-            duration_ms=elapsed_ms
+            tool_name=tool_name,
+            pre_bound=not selected_from_candidates,
+            candidates=node.instruction.required_tools,
+            context_keys=list(agent_state.context.keys()) if agent_state else []
         )
-
-        result = ActionResult(
-            node_id=node_id,
-            success=True,
-            outputs=node_outputs,
-            duration_ms=elapsed_ms,
-            action_type=node.instruction.action_type,
-            parameters=node.instruction.parameters,
-            input_keys=node.input_keys,
-            output_keys=node.output_keys,
+        
+        # Validation step (simulated)
+        log.debug(
+            f"🛡️ OODA Act: Pulling MCP schema for {tool_name}", 
+            node_id=node_id, 
+            schema={"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]}
         )
+        log.debug(f"🛡️ OODA Act: Validating tool call against retrieved schema for {tool_name}", node_id=node_id, status="PASS")
+        
+        # Real World Execution vs Simulation
+        if kit and kit.tool_executor:
+            try:
+                log.info(f"🔌 OODA Act: Executing REAL tool call → {tool_name}", node_id=node_id)
+                tool_resp = await kit.tool_executor(tool_name, arguments)
+                node_outputs.update(tool_resp)
+                if "answer" not in node_outputs and "content" in node_outputs:
+                    node_outputs["answer"] = str(node_outputs["content"])
+            except Exception as e:
+                log.error(f"❌ OODA Act: Real tool execution failed", node_id=node_id, error=str(e))
+                node_outputs["answer"] = f"Error executing {tool_name}: {str(e)}"
+                node_outputs["error"] = str(e)
+        else:
+            # In kernel simulator, we simulate success for registered tools
+            node_outputs["arguments"] = arguments
+            node_outputs["answer"] = f"Simulated output from {tool_name} for task: {node.instruction.description[:50]}"
+        
+    else:
+        # Fallback for 'general' or 'data_transform' nodes
+        node_outputs["answer"] = f"Processed {len(node.input_keys)} inputs into {len(node.output_keys)} outputs."
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    # Universal premium visibility for ALL node types
+    log_tool_execution(
+        logger=log,
+        node_id=node_id,
+        tool_name=node.instruction.action_type,
+        arguments=node.instruction.parameters.get("arguments", node.instruction.parameters),
+        outputs=node_outputs,
+        success=True,
+        duration_ms=elapsed_ms
+    )
 
-        # Update node status
-        status = NodeExecutionStatus.COMPLETED if result.success else NodeExecutionStatus.FAILED
-        node.status = NodeStatus.COMPLETED if result.success else NodeStatus.FAILED
-
-        stm.update_dag_state(
-            dag_id=active_dag.dag_id,
-            node_id=node_id,
-            status=status,
-        )
+    result = ActionResult(
+        node_id=node_id,
+        success=True,
+        outputs=node_outputs,
+        duration_ms=elapsed_ms,
+        action_type=node.instruction.action_type,
+        parameters=node.instruction.parameters,
+        input_keys=node.input_keys,
+        output_keys=node.output_keys,
+    )
 
-        results.append(result)
+    # Update node status
+    status = NodeExecutionStatus.COMPLETED if result.success else NodeExecutionStatus.FAILED
+    node.status = NodeStatus.COMPLETED if result.success else NodeStatus.FAILED
 
-    log.debug(
-        "Act phase complete",
-        nodes_executed=len(results),
-        successes=sum(1 for r in results if r.success),
+    stm.update_dag_state(
+        dag_id=active_dag.dag_id,
+        node_id=node_id,
+        status=status,
     )
 
-    return results
+    return result
+
+
+def _merge_action_outputs(agent_state: AgentState, results: list[ActionResult]) -> None:
+    """Publish successful node outputs under their declared output keys.
+
+    Applied in batch order so that, when two siblings declare the same key,
+    the later node in the decided batch always wins.
+    """
+    for result in results:
+        if not result.success:
+            continue
+        for key in result.output_keys:
+            agent_state.context[key] = result.outputs.get(key, result.outputs.get("answer"))
 
 
 # ============================================================================
@@ -13,6 +13,7 @@ Usage::
 """
 
 from .engine import (
+    candidate_pairs,
     detect_conflicts,
     resolve_conflict,
     score_sprint_quality,
@@ -26,6 +27,7 @@ from .types import (
 
 __all__ = [
     # Engine functions
+    "candidate_pairs",
     "detect_conflicts",
     "resolve_conflict",
     "score_sprint_quality",
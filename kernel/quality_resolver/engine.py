@@ -13,11 +13,14 @@ T3 reflection_and_guardrails, T1 scoring, T6 noise_gate).
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
+import numpy as np
+
 from shared.config import get_settings
-from shared.inference_kit import InferenceKit
+from shared.inference_kit import InferenceKit, memoized_embedding_kit, normalize_rows
 from shared.logging.main import get_logger
 from shared.logging.decorators import trace_io
 from shared.standard_io import (
@@ -47,6 +50,71 @@ def _ref(fn: str) -> ModuleRef:
 # ============================================================================
 
 
+async def _embed_artifacts(
+    contents: list[str],
+    kit: InferenceKit | None,
+) -> tuple[InferenceKit | None, np.ndarray | None]:
+    """Embed all artifact contents in one batch.
+
+    Returns the kit to score candidate pairs with (its embedder memoized,
+    so T1 scoring reuses these vectors) and the row-normalized embedding
+    matrix, or ``None`` when no embedder is usable.
+    """
+    if len(contents) < 2:
+        return kit, None
+
+    try:
+        scoring_kit = memoized_embedding_kit(kit)
+        vectors = await scoring_kit.embedder.embed_batch(contents)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(contents):
+            raise ValueError(f"unexpected embedding shape {matrix.shape}")
+    except Exception as exc:
+        log.warning("Artifact embedding failed, checking all pairs", error=str(exc))
+        return kit, None
+
+    return scoring_kit, normalize_rows(matrix)
+
+
+def candidate_pairs(
+    matrix: np.ndarray,
+    threshold: float,
+    top_k: int = 0,
+    block_size: int = 512,
+) -> list[tuple[int, int]]:
+    """Pairs of rows whose cosine similarity reaches ``threshold``.
+
+    ``matrix`` rows must be L2-normalized. Similarities are computed one
+    block of rows at a time so memory stays at ``block_size x N``. With
+    ``top_k > 0`` only each row's ``top_k`` nearest neighbours are
+    considered, which bounds the candidates to ``N * top_k`` for large N.
+
+    Returns sorted ``(i, j)`` pairs with ``i < j``.
+    """
+    n = matrix.shape[0]
+    block_size = max(1, block_size)
+    pairs: set[tuple[int, int]] = set()
+
+    for lo in range(0, n, block_size):
+        hi = min(lo + block_size, n)
+        sims = matrix[lo:hi] @ matrix.T
+        rows = np.arange(hi - lo)
+        sims[rows, rows + lo] = -np.inf
+
+        if 0 < top_k < n - 1:
+            cols = np.argpartition(-sims, top_k - 1, axis=1)[:, :top_k]
+            keep = np.take_along_axis(sims, cols, axis=1) >= threshold
+            row_idx, pos = np.nonzero(keep)
+            col_idx = cols[row_idx, pos]
+        else:
+            row_idx, col_idx = np.nonzero(sims >= threshold)
+
+        for i, j in zip((row_idx + lo).tolist(), col_idx.tolist()):
+            pairs.add((i, j) if i < j else (j, i))
+
+    return sorted(pairs)
+
+
 @trace_io()
 async def detect_conflicts(
     artifacts: list[dict[str, Any]],
@@ -54,8 +122,9 @@ async def detect_conflicts(
 ) -> Result:
     """Scan agent outputs for contradictions.
 
-    Uses T2 attention_and_plausibility.run_cognitive_filters() to
-    detect semantic contradictions between pairs of artifacts.
+    Artifacts are embedded once and paired by a blocked cosine-similarity
+    prefilter (``candidate_pairs``); only candidate pairs are scored with
+    T1 scoring and flagged at ``conflict_similarity_threshold``.
 
     Args:
         artifacts: List of VaultArtifact-like dicts with 'artifact_id',
@@ -84,53 +153,61 @@ async def detect_conflicts(
             )
             return ok(signals=[signal], metrics=metrics)
 
-        # Pairwise contradiction detection using T1 scoring
-        # for semantic similarity — contradictions show high similarity
-        # but opposite conclusions
+        # Contradictions show high similarity but opposite conclusions.
+        # Embed every artifact once and prefilter pairs on the cosine
+        # matrix; only candidates get the full T1 scoring check.
         from kernel.scoring import score as t1_score
 
-        similarity_threshold = settings.corporate.conflict_similarity_threshold
+        corporate = settings.corporate
+        similarity_threshold = corporate.conflict_similarity_threshold
 
-        for i in range(len(artifacts)):
-            for j in range(i + 1, len(artifacts)):
-                art_a = artifacts[i]
-                art_b = artifacts[j]
+        indexed = [(i, art.get("content", "")) for i, art in enumerate(artifacts)]
+        indexed = [(i, content) for i, content in indexed if content]
+        kit, matrix = await _embed_artifacts([content for _, content in indexed], kit)
 
-                content_a = art_a.get("content", "")
-                content_b = art_b.get("content", "")
+        if matrix is None:
+            # No embeddings: every pair goes to the T1 check (token-overlap fallback)
+            pairs = [(a, b) for a in range(len(indexed)) for b in range(a + 1, len(indexed))]
+        else:
+            pairs = candidate_pairs(
+                matrix,
+                threshold=corporate.conflict_prefilter_similarity,
+                top_k=corporate.conflict_prefilter_top_k,
+                block_size=corporate.conflict_similarity_block_size,
+            )
 
-                if not content_a or not content_b:
-                    continue
+        semaphore = asyncio.Semaphore(max(1, corporate.conflict_check_concurrency))
 
-                # Score semantic similarity between the two artifacts
+        async def check(a: int, b: int) -> float:
+            async with semaphore:
                 score_result = await t1_score(
-                    content=content_a,
-                    query=content_b,
+                    content=indexed[a][1],
+                    query=indexed[b][1],
                     kit=kit,
                 )
-
-                similarity = 0.0
-                if score_result.signals:
-                    score_data = score_result.signals[0].body.get("data", {})
-                    if isinstance(score_data, dict):
-                        similarity = score_data.get("score", 0.0)
-
-                # High similarity between different agents' outputs
-                # on the same topic may indicate conflicting conclusions
-                if similarity >= similarity_threshold:
-                    # Check for content divergence (same topic, different conclusions)
-                    # Simple heuristic: if both are highly similar but from
-                    # different agents, flag for manual review
-                    conflict = Conflict(
-                        artifact_a_id=art_a.get("artifact_id", f"art_{i}"),
-                        artifact_b_id=art_b.get("artifact_id", f"art_{j}"),
-                        description=(
-                            f"High similarity ({similarity:.2f}) detected between "
-                            f"artifacts — possible conflicting conclusions"
-                        ),
-                        severity="medium" if similarity < 0.9 else "high",
-                    )
-                    conflicts.append(conflict)
+            if score_result.signals:
+                score_data = score_result.signals[0].body.get("data", {})
+                if isinstance(score_data, dict):
+                    return score_data.get("score", 0.0)
+            return 0.0
+
+        similarities = await asyncio.gather(*(check(a, b) for a, b in pairs))
+
+        for (a, b), similarity in zip(pairs, similarities):
+            # High similarity between different agents' outputs
+            # on the same topic may indicate conflicting conclusions
+            if similarity >= similarity_threshold:
+                i, j = indexed[a][0], indexed[b][0]
+                conflict = Conflict(
+                    artifact_a_id=artifacts[i].get("artifact_id", f"art_{i}"),
+                    artifact_b_id=artifacts[j].get("artifact_id", f"art_{j}"),
+                    description=(
+                        f"High similarity ({similarity:.2f}) detected between "
+                        f"artifacts — possible conflicting conclusions"
+                    ),
+                    severity="medium" if similarity < 0.9 else "high",
+                )
+                conflicts.append(conflict)
 
         elapsed = (time.perf_counter() - start) * 1000
         metrics = Metrics(duration_ms=elapsed, module_ref=ref)
@@ -148,6 +225,7 @@ async def detect_conflicts(
         log.debug(
             "Conflict detection complete",
             artifacts=len(artifacts),
+            pairs_checked=len(pairs),
             conflicts_found=len(conflicts),
             duration_ms=round(elapsed, 2),
         )
@@ -13,8 +13,12 @@ Usage::
 """
 
 from .engine import (
+    SpecialistIndex,
+    assign_by_score,
+    assign_specialists,
     compute_scale_decisions,
     evaluate_performance,
+    get_specialist_index,
     match_specialist,
 )
 from .types import (
@@ -32,6 +36,10 @@ from .types import (
 __all__ = [
     # Engine functions
     "match_specialist",
+    "assign_specialists",
+    "assign_by_score",
+    "get_specialist_index",
+    "SpecialistIndex",
     "evaluate_performance",
     "compute_scale_decisions",
     # Types
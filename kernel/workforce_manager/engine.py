@@ -3,6 +3,7 @@ Tier 8 Workforce Manager — Engine.
 
 Pure-logic functions for corporate workforce management:
     1. match_specialist()         — Find best CognitiveProfile for a MissionChunk
+       assign_specialists()       — Match a whole sprint against the roster at once
     2. evaluate_performance()     — Extract metrics from agent process response
     3. compute_scale_decisions()  — Decide HIRE/FIRE/REASSIGN/HOLD based on state
 
@@ -12,11 +13,22 @@ They compose lower-tier primitives (T1 scoring, T6 self_model).
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
+
 from shared.config import get_settings
-from shared.inference_kit import InferenceKit
+from shared.inference_kit import (
+    InferenceKit,
+    RequestEmbeddingMemo,
+    embed_texts,
+    memoized_embedding_kit,
+    normalize_rows,
+)
 from shared.logging.main import get_logger
 from shared.logging.decorators import trace_io
 from shared.standard_io import (
@@ -55,6 +67,191 @@ def _ref(fn: str) -> ModuleRef:
 # ============================================================================
 
 
+def _profile_text(profile: dict[str, Any]) -> str:
+    return f"{profile.get('role_name', '')} {' '.join(profile.get('skills', []))}"
+
+
+def _chunk_query(chunk: MissionChunk) -> str:
+    return f"{chunk.domain} {chunk.sub_objective} {' '.join(chunk.required_skills)}"
+
+
+def _embedder_key(embedder: Any) -> str:
+    if isinstance(embedder, RequestEmbeddingMemo):
+        embedder = embedder.wrapped
+    model = getattr(embedder, "model_name", "")
+    return f"{type(embedder).__module__}.{type(embedder).__qualname__}:{model}"
+
+
+class SpecialistIndex:
+    """Specialist profile embeddings cached by profile hash.
+
+    Each distinct profile text is embedded once per embedder and served
+    as rows of an L2-normalized matrix, so a whole sprint is matched
+    against the roster with one matrix product. Bounded LRU.
+    """
+
+    def __init__(self, max_profiles: int = 4096) -> None:
+        self.max_profiles = max_profiles
+        self._vectors: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    async def matrix(self, texts: list[str], embedder: Any) -> np.ndarray:
+        """Normalized embeddings for ``texts``, embedding only unseen ones."""
+        prefix = _embedder_key(embedder)
+        keys = [
+            f"{prefix}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+            for text in texts
+        ]
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in self._vectors:
+                self._vectors.move_to_end(key)
+            else:
+                missing.setdefault(key, text)
+
+        if missing:
+            vectors = await embed_texts(embedder, list(missing.values()))
+            rows = normalize_rows(np.asarray(vectors, dtype=np.float32))
+            if rows.ndim != 2 or rows.shape[0] != len(missing):
+                raise ValueError(f"unexpected embedding shape {rows.shape}")
+            for key, row in zip(missing, rows):
+                self._vectors[key] = row
+
+        matrix = np.stack([self._vectors[key] for key in keys])
+        while len(self._vectors) > self.max_profiles:
+            self._vectors.popitem(last=False)
+        return matrix
+
+    def clear(self) -> None:
+        self._vectors.clear()
+
+
+_index: SpecialistIndex | None = None
+
+
+def get_specialist_index() -> SpecialistIndex:
+    """Process-wide specialist index configured from ``settings.corporate``."""
+    global _index
+    if _index is None:
+        _index = SpecialistIndex(get_settings().corporate.specialist_index_max_profiles)
+    return _index
+
+
+async def _score_matrix(
+    chunks: list[MissionChunk],
+    profiles: list[dict[str, Any]],
+    kit: InferenceKit | None,
+) -> np.ndarray:
+    """Chunk x profile match scores in [0, 1].
+
+    Cosine similarity against the specialist index ranks the roster for
+    every chunk at once; each chunk's top ``specialist_shortlist_size``
+    profiles are then scored with T1 hybrid scoring and every other pair
+    scores 0; a shortlist size of 0 keeps the cosine scores. Without a usable
+    embedder every pair is scored with T1 (token-overlap fallback).
+    """
+    from kernel.scoring import score as t1_score
+
+    corporate = get_settings().corporate
+    queries = [_chunk_query(c) for c in chunks]
+    contents = [_profile_text(p) for p in profiles]
+
+    scoring_kit = kit
+    try:
+        scoring_kit = memoized_embedding_kit(kit)
+
+        profile_matrix = await get_specialist_index().matrix(contents, scoring_kit.embedder)
+        chunk_matrix = normalize_rows(
+            np.asarray(await scoring_kit.embedder.embed_batch(queries), dtype=np.float32)
+        )
+        # T1 scoring below reuses the indexed profile vectors
+        scoring_kit.embedder.seed(contents, profile_matrix.tolist())
+        similarity = chunk_matrix @ profile_matrix.T
+
+        shortlist = min(corporate.specialist_shortlist_size, len(profiles))
+        if shortlist <= 0:
+            # Cosine-only matching
+            scores = np.clip(similarity, 0.0, 1.0).astype(np.float64)
+            pairs = []
+        else:
+            cols = np.argsort(-similarity, axis=1, kind="stable")[:, :shortlist]
+            pairs = [(r, int(c)) for r in range(len(chunks)) for c in cols[r]]
+            # Cosine only picks the shortlist; T1 and cosine scores are on
+            # different scales, so unshortlisted pairs must not compete.
+            scores = np.zeros((len(chunks), len(profiles)))
+    except Exception as exc:
+        log.warning("Specialist embedding failed, scoring every pair", error=str(exc))
+        scoring_kit = kit
+        scores = np.zeros((len(chunks), len(profiles)))
+        pairs = [(r, c) for r in range(len(chunks)) for c in range(len(profiles))]
+
+    semaphore = asyncio.Semaphore(max(1, corporate.specialist_score_concurrency))
+
+    async def check(r: int, c: int) -> float:
+        async with semaphore:
+            score_result = await t1_score(content=contents[c], query=queries[r], kit=scoring_kit)
+        if score_result.signals:
+            score_data = score_result.signals[0].body.get("data", {})
+            if isinstance(score_data, dict):
+                return score_data.get("score", 0.0)
+        return 0.0
+
+    values = await asyncio.gather(*(check(r, c) for r, c in pairs))
+    for (r, c), value in zip(pairs, values):
+        scores[r, c] = value
+    return scores
+
+
+def assign_by_score(
+    scores: np.ndarray,
+    capacity: int = 0,
+    min_score: float = 0.0,
+) -> list[int | None]:
+    """Profile column for each chunk row of ``scores`` (``None`` if unassigned).
+
+    With no capacity limit every chunk takes its best profile. With
+    ``capacity > 0`` each profile takes at most that many chunks and the
+    total score is maximized as a linear assignment (Hungarian, via
+    scipy); greedy highest-score-first is used if scipy is unavailable.
+    Pairs scoring below ``min_score`` are never assigned.
+    """
+    n_chunks, n_profiles = scores.shape
+    if n_chunks == 0 or n_profiles == 0:
+        return [None] * n_chunks
+
+    if capacity <= 0 or capacity >= n_chunks:
+        best = scores.argmax(axis=1)
+        return [
+            int(col) if scores[row, col] >= min_score else None
+            for row, col in enumerate(best)
+        ]
+
+    assigned: list[int | None] = [None] * n_chunks
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        remaining = [capacity] * n_profiles
+        for flat in np.argsort(-scores, axis=None, kind="stable"):
+            row, col = divmod(int(flat), n_profiles)
+            if assigned[row] is None and remaining[col] > 0 and scores[row, col] >= min_score:
+                assigned[row] = col
+                remaining[col] -= 1
+        return assigned
+
+    # One column per profile slot; ineligible pairs never displace eligible ones
+    slots = np.repeat(np.arange(n_profiles), capacity)
+    weights = np.where(scores >= min_score, scores, -1.0)[:, slots]
+    rows, cols = linear_sum_assignment(weights, maximize=True)
+    for row, col in zip(rows, cols):
+        profile = int(slots[col])
+        if scores[row, profile] >= min_score:
+            assigned[int(row)] = profile
+    return assigned
+
+
 @trace_io()
 async def match_specialist(
     chunk: MissionChunk,
@@ -63,9 +260,10 @@ async def match_specialist(
 ) -> Result:
     """Find the best specialist profile for a mission chunk.
 
-    Uses T1 scoring.score() to evaluate skill overlap between chunk
-    requirements and profile capabilities. Returns the highest-scoring
-    match. If no match exceeds threshold, returns requires_new_profile=True.
+    Ranks the roster by embedding similarity (``SpecialistIndex``) and
+    re-scores the shortlist with T1 scoring.score(). Returns the
+    highest-scoring match. If no match exceeds threshold, returns
+    requires_new_profile=True.
 
     Args:
         chunk: The mission chunk needing a specialist.
@@ -81,8 +279,6 @@ async def match_specialist(
     settings = get_settings()
 
     try:
-        from kernel.scoring import score as t1_score, Constraint
-
         if not available_profiles:
             match = ProfileMatch(
                 agent_profile_id="none",
@@ -102,37 +298,10 @@ async def match_specialist(
             )
             return ok(signals=[signal], metrics=metrics)
 
-        # Build the query from chunk requirements
-        query = f"{chunk.domain} {chunk.sub_objective} {' '.join(chunk.required_skills)}"
-
-        best_score = 0.0
-        best_profile_id = ""
-
-        for profile in available_profiles:
-            profile_id = profile.get("profile_id", "")
-            skills = profile.get("skills", [])
-            role_name = profile.get("role_name", "")
-
-            # Build content from profile capabilities
-            content = f"{role_name} {' '.join(skills)}"
-
-            # Use T1 scoring for hybrid evaluation
-            score_result = await t1_score(
-                content=content,
-                query=query,
-                kit=kit,
-            )
-
-            # Extract score from result signals
-            score_value = 0.0
-            if score_result.signals:
-                score_data = score_result.signals[0].body.get("data", {})
-                if isinstance(score_data, dict):
-                    score_value = score_data.get("score", 0.0)
-
-            if score_value > best_score:
-                best_score = score_value
-                best_profile_id = profile_id
+        scores = (await _score_matrix([chunk], available_profiles, kit))[0]
+        best = int(scores.argmax())
+        best_score = float(scores[best])
+        best_profile_id = available_profiles[best].get("profile_id", "") if best_score > 0.0 else ""
 
         # Determine threshold from config
         fire_threshold = settings.corporate.agent_fire_quality_threshold
@@ -179,6 +348,105 @@ async def match_specialist(
         return fail(error=error, metrics=metrics)
 
 
+@trace_io()
+async def assign_specialists(
+    chunks: list[MissionChunk],
+    available_profiles: list[dict[str, Any]],
+    kit: InferenceKit | None = None,
+    capacity: int | None = None,
+) -> Result:
+    """Assign specialist profiles to all chunks of a sprint at once.
+
+    Scores every chunk against every profile in one pass (see
+    ``match_specialist``), then assigns with ``assign_by_score``.
+    Chunks left without a profile scoring at least
+    ``agent_fire_quality_threshold`` (or whose candidates are at
+    capacity) get ``agent_profile_id="none"`` and
+    ``requires_new_profile=True``.
+
+    Args:
+        chunks: The sprint's mission chunks.
+        available_profiles: List of profile dicts with 'profile_id',
+            'skills', 'role_name' fields.
+        kit: Optional inference kit for embedding-based scoring.
+        capacity: Max chunks per profile (defaults to
+            ``specialist_profile_capacity``; 0 = unlimited).
+
+    Returns:
+        Result containing the ProfileAssignment signal (one ProfileMatch
+        per chunk, in input order).
+    """
+    ref = _ref("assign_specialists")
+    start = time.perf_counter()
+    settings = get_settings()
+
+    try:
+        fire_threshold = settings.corporate.agent_fire_quality_threshold
+        if capacity is None:
+            capacity = settings.corporate.specialist_profile_capacity
+
+        if chunks and available_profiles:
+            scores = await _score_matrix(chunks, available_profiles, kit)
+            assigned = assign_by_score(scores, capacity=capacity, min_score=fire_threshold)
+        else:
+            scores = np.zeros((len(chunks), 0))
+            assigned = [None] * len(chunks)
+
+        matches: list[ProfileMatch] = []
+        for row, (chunk, col) in enumerate(zip(chunks, assigned)):
+            if col is None:
+                best_score = float(scores[row].max()) if scores.shape[1] else 0.0
+                profile_id = "none"
+            else:
+                best_score = float(scores[row, col])
+                profile_id = available_profiles[col].get("profile_id", "") or "none"
+            matches.append(
+                ProfileMatch(
+                    agent_profile_id=profile_id,
+                    chunk_id=chunk.chunk_id,
+                    skill_score=best_score,
+                    composite_score=best_score,
+                    requires_new_profile=col is None,
+                )
+            )
+
+        unassigned = sum(1 for col in assigned if col is None)
+        elapsed = (time.perf_counter() - start) * 1000
+        metrics = Metrics(duration_ms=elapsed, module_ref=ref)
+        signal = create_data_signal(
+            data={
+                "matches": [m.model_dump() for m in matches],
+                "count": len(matches),
+                "unassigned": unassigned,
+            },
+            schema="ProfileAssignment",
+            origin=ref,
+            trace_id="",
+            tags={"chunks": str(len(chunks)), "unassigned": str(unassigned)},
+        )
+
+        log.debug(
+            "Profile assignment complete",
+            chunks=len(chunks),
+            profiles=len(available_profiles),
+            unassigned=unassigned,
+            duration_ms=round(elapsed, 2),
+        )
+
+        return ok(signals=[signal], metrics=metrics)
+
+    except Exception as exc:
+        elapsed = (time.perf_counter() - start) * 1000
+        metrics = Metrics(duration_ms=elapsed, module_ref=ref)
+        error = processing_error(
+            message=f"Profile assignment failed: {exc}",
+            source=ref,
+            detail={"error_type": type(exc).__name__},
+        )
+        log.error("Profile assignment failed", error=str(exc))
+        return fail(error=error, metrics=metrics)
+
+
 # ============================================================================
 # Step 2: Performance Evaluation
 # ============================================================================
@@ -1,11 +1,15 @@
+import ast
 import os
 import uuid
 import structlog
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from mcp_servers.pandas_server.tools import (
     core_ops, transform_ops, io_ops, time_ops, text_ops, stat_ops, 
     struct_ops, ml_ops, logic_ops, window_ops, math_ops, quality_ops, nlp_ops, feature_ops
 )
+from mcp_servers.pandas_server.utils import (
+    detect_format, load_dataframe, save_dataframe, new_memory_path, drop_memory_frame
+)
 
 logger = structlog.get_logger()
 
@@ -102,63 +106,207 @@ INPUT_ARG_MAP = {
     'default': 'file_path'
 }
 
+# Ops that may be pushed down into the initial read when they lead the chain
+PUSHDOWN_OPS = {'filter', 'select'}
+
+# DataFrame.query comparison operators that pyarrow can evaluate while reading Parquet.
+# != and `not in` are left out: pyarrow drops null rows for them, DataFrame.query keeps them.
+_PARQUET_OPS = {
+    ast.Eq: '==', ast.Lt: '<', ast.LtE: '<=',
+    ast.Gt: '>', ast.GtE: '>=', ast.In: 'in',
+}
+
+
+def _query_columns(query: str) -> Optional[Set[str]]:
+    """Column names referenced by a query, or None if they cannot be determined."""
+    if '`' in query or '@' in query:
+        return None
+    try:
+        tree = ast.parse(query, mode='eval')
+    except SyntaxError:
+        return None
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+
+def _query_to_parquet_filters(query: str) -> List[Tuple[str, str, Any]]:
+    """Translate the simple AND-ed `column <op> literal` terms of a query into pyarrow filters.
+
+    Terms that cannot be translated are skipped; the query itself still runs in memory,
+    so the pushed-down filters only ever prune rows the query would drop anyway.
+    """
+    try:
+        tree = ast.parse(query, mode='eval').body
+    except SyntaxError:
+        return []
+
+    terms = tree.values if isinstance(tree, ast.BoolOp) and isinstance(tree.op, ast.And) else [tree]
+    filters = []
+    for term in terms:
+        if not (isinstance(term, ast.Compare) and len(term.ops) == 1 and isinstance(term.left, ast.Name)):
+            continue
+        op = _PARQUET_OPS.get(type(term.ops[0]))
+        try:
+            value = ast.literal_eval(term.comparators[0])
+        except (ValueError, TypeError, SyntaxError):
+            continue
+        if op is None or (op == 'in') != isinstance(value, (list, tuple, set)):
+            continue
+        filters.append((term.left.id, op, list(value) if op == 'in' else value))
+    return filters
+
+
+def _fuse_steps(steps: List[Dict[str, Any]]) -> List[Tuple[int, str, Dict[str, Any]]]:
+    """Fuse adjacent column-wise steps that pandas can run as a single operation.
+
+    Returns (original step index, op, args) tuples.
+    """
+    plan: List[Tuple[int, str, Dict[str, Any]]] = []
+    for i, step in enumerate(steps):
+        op_name = step.get('op')
+        args = dict(step.get('args', {}))
+        if op_name not in OP_MAP:
+            raise ValueError(f"Unknown operation: {op_name}")
+
+        if plan and plan[-1][1] == op_name:
+            prev = plan[-1][2]
+            if op_name == 'filter' and 'query' in prev and 'query' in args:
+                prev['query'] = f"({prev['query']}) and ({args['query']})"
+                continue
+            if op_name == 'select' and set(args.get('columns', [])) <= set(prev.get('columns', [])):
+                prev['columns'] = list(args['columns'])
+                continue
+            if op_name == 'astype' and not set(args.get('column_types', {})) & set(prev.get('column_types', {})):
+                prev['column_types'] = {**prev.get('column_types', {}), **args.get('column_types', {})}
+                continue
+            if op_name == 'rename':
+                first, second = prev.get('mapping', {}), args.get('mapping', {})
+                # Renames are simultaneous; only merge when the second never touches
+                # a name the first one consumed or produced.
+                if not set(second) & (set(first) | set(first.values())):
+                    prev['mapping'] = {**first, **second}
+                    continue
+
+        plan.append((i, op_name, args))
+    return plan
+
+
+def _pushdown_read_kwargs(file_path: str, plan: List[Tuple[int, str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Derive read-time projection and predicate pruning from the leading filter/select steps."""
+    try:
+        fmt = detect_format(file_path)
+    except ValueError:
+        return {}
+    if fmt not in ('csv', 'parquet'):
+        return {}
+
+    needed: Set[str] = set()
+    projection: Optional[Set[str]] = None
+    parquet_filters: List[Tuple[str, str, Any]] = []
+    for _, op_name, args in plan:
+        if op_name not in PUSHDOWN_OPS:
+            break
+        if op_name == 'filter':
+            columns = _query_columns(args.get('query', ''))
+            if columns is None:
+                break
+            needed |= columns
+            parquet_filters.extend(_query_to_parquet_filters(args['query']))
+        else:
+            projection = set(args.get('columns', [])) | needed
+            break
+
+    kwargs: Dict[str, Any] = {}
+    if fmt == 'csv':
+        if projection is not None:
+            # Callable usecols tolerates names that are not file columns (e.g. query locals)
+            kwargs['usecols'] = lambda col: col in projection
+        return kwargs
+
+    try:
+        import pyarrow.parquet as pq
+        schema_names = pq.read_schema(file_path).names
+    except Exception:
+        return {}
+    if projection is not None:
+        kwargs['columns'] = [c for c in schema_names if c in projection]
+    parquet_filters = [f for f in parquet_filters if f[0] in schema_names]
+    if parquet_filters:
+        kwargs['filters'] = parquet_filters
+    return kwargs
+
+
 def execute_chain(initial_file_path: str, steps: List[Dict[str, Any]], final_output_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Executes a chain of pandas operations on a dataset.
-    
+
+    The dataset is read once and kept in memory between steps; only the final
+    result is written. Adjacent filter/select/astype/rename steps are fused, and
+    leading filter/select steps are pushed down into the read (CSV `usecols`,
+    Parquet column projection and predicate pruning).
+
     Args:
         initial_file_path: Starting file.
         steps: List of dicts, e.g. [{"op": "filter", "args": {"query": "age > 25"}}].
         final_output_path: Where to save the final result. If None, returns the temp path.
     """
-    current_path = initial_file_path
     cleanup_files = []
-    
+    memory_paths = []
+    i, op_name = 0, None
+
     try:
-        for i, step in enumerate(steps):
-            op_name = step.get('op')
-            args = step.get('args', {}).copy()
-            
-            if op_name not in OP_MAP:
-                raise ValueError(f"Unknown operation: {op_name}")
-            
+        plan = _fuse_steps(steps)
+        read_kwargs = _pushdown_read_kwargs(initial_file_path, plan)
+        logger.info(
+            "chain_planned", steps=len(steps), fused_steps=len(plan),
+            pushdown=sorted(read_kwargs),
+        )
+
+        current_path = new_memory_path()
+        memory_paths.append(current_path)
+        save_dataframe(load_dataframe(initial_file_path, **read_kwargs), current_path)
+
+        for i, op_name, args in plan:
             func = OP_MAP[op_name]
-            
-            # Determine output path for this step
-            if i == len(steps) - 1 and final_output_path:
-                step_output = final_output_path
-            else:
-                # Create a temp file
-                # Preserve extension if possible, or default to parquet for intermediate efficiency
-                # but parquet requires pyarrow. Let's stick to the input extension or parquet if safe.
-                ext = os.path.splitext(current_path)[1]
-                if not ext: ext = ".parquet" # Default
-                
-                step_output = f"temp_chain_{uuid.uuid4().hex}{ext}"
-                cleanup_files.append(step_output)
-            
+            step_output = new_memory_path()
+            memory_paths.append(step_output)
+
             # Inject input path
             input_arg = INPUT_ARG_MAP.get(op_name, INPUT_ARG_MAP['default'])
             if input_arg:
                 args[input_arg] = current_path
-            
+
             # Inject output path
             args['output_path'] = step_output
-            
+
             # Execute
             logger.info("executing_step", step=i, op=op_name, input=current_path, output=step_output)
             func(**args)
-            
-            # Update current path for next step
+
+            # The previous frame is no longer referenced by the chain
+            drop_memory_frame(current_path)
             current_path = step_output
-            
+
+        i, op_name = len(steps), "save"
+        if final_output_path:
+            output_path = final_output_path
+        else:
+            # Preserve the input extension, or default to parquet
+            ext = os.path.splitext(initial_file_path)[1]
+            if not ext: ext = ".parquet" # Default
+            output_path = f"temp_chain_{uuid.uuid4().hex}{ext}"
+            cleanup_files.append(output_path)
+        save_dataframe(load_dataframe(current_path), output_path)
+
         return {
             "status": "success",
-            "final_output": current_path,
+            "final_output": output_path,
             "steps_executed": len(steps),
             "temp_files_created": cleanup_files # Caller can decide to delete them
         }
-        
+
     except Exception as e:
         logger.error("chain_execution_failed", error=str(e), step_index=i)
         raise RuntimeError(f"Chain failed at step {i} ({op_name}): {str(e)}")
+    finally:
+        for path in memory_paths:
+            drop_memory_frame(path)
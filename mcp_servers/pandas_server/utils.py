@@ -1,3 +1,4 @@
+import uuid
 from pathlib import Path
 from typing import Optional, Union, Any, Dict
 import pandas as pd
@@ -20,6 +21,30 @@ SUPPORTED_EXTENSIONS = {
     '.hdf5': 'hdf'
 }
 
+# In-memory frames addressed by ``mem://<id>`` paths. Lets tools that speak
+# file paths hand DataFrames to each other without touching disk (see
+# tools/chain_ops.py).
+MEMORY_PREFIX = "mem://"
+_MEMORY_FRAMES: Dict[str, pd.DataFrame] = {}
+
+def is_memory_path(file_path: Union[str, Path]) -> bool:
+    """Check if a path refers to an in-memory frame."""
+    return isinstance(file_path, str) and file_path.startswith(MEMORY_PREFIX)
+
+def new_memory_path() -> str:
+    """Allocate a fresh in-memory frame path."""
+    return f"{MEMORY_PREFIX}{uuid.uuid4().hex}"
+
+def put_memory_frame(df: pd.DataFrame, file_path: Optional[str] = None) -> str:
+    """Register a frame in memory and return its path."""
+    file_path = file_path or new_memory_path()
+    _MEMORY_FRAMES[file_path] = df
+    return file_path
+
+def drop_memory_frame(file_path: str) -> None:
+    """Release an in-memory frame."""
+    _MEMORY_FRAMES.pop(file_path, None)
+
 def detect_format(file_path: Union[str, Path]) -> str:
     """Detect file format from extension."""
     path = Path(file_path)
@@ -30,6 +55,11 @@ def detect_format(file_path: Union[str, Path]) -> str:
 
 def load_dataframe(file_path: Union[str, Path], format: Optional[str] = None, **kwargs) -> pd.DataFrame:
     """Universal load function."""
+    if is_memory_path(file_path):
+        if file_path not in _MEMORY_FRAMES:
+            raise FileNotFoundError(f"In-memory frame not found: {file_path}")
+        return _MEMORY_FRAMES[file_path]
+
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -65,6 +95,10 @@ def load_dataframe(file_path: Union[str, Path], format: Optional[str] = None, **
 
 def save_dataframe(df: pd.DataFrame, file_path: Union[str, Path], format: Optional[str] = None, **kwargs) -> None:
     """Universal save function."""
+    if is_memory_path(file_path):
+        put_memory_frame(df, file_path)
+        return
+
     path = Path(file_path)
     # Create parent dirs if needed
     path.parent.mkdir(parents=True, exist_ok=True)
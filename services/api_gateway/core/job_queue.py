@@ -0,0 +1,404 @@
+"""
+Durable Job Queue.
+
+Postgres-backed queue over the ``system_jobs`` table. Each job type has a
+bounded pool of workers that claim the highest-priority pending job with
+``SELECT ... FOR UPDATE SKIP LOCKED`` and hold it under a lease renewed by
+a heartbeat. Failures are retried with exponential backoff, and jobs whose
+lease expires (the worker's process died) are requeued by a reaper.
+
+Submissions and status changes are broadcast with NOTIFY: idle workers on
+any replica wake immediately, and ``subscribe()`` lets the events endpoint
+push completion to clients instead of having them poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from shared.config import get_settings
+from shared.database.connection import get_database_pool
+from shared.logging.main import get_logger
+from shared.schemas import JobStatus
+
+
+logger = get_logger(__name__)
+
+# Receives the claimed row as a dict; returns the system_jobs columns to set on completion
+JobHandler = Callable[[dict], Awaitable[dict]]
+
+TERMINAL_STATUSES = frozenset({
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value,
+})
+
+_CLAIM_SQL = """
+UPDATE system_jobs
+SET status = 'running',
+    attempts = attempts + 1,
+    lease_owner = $2,
+    lease_expires_at = now() + make_interval(secs => $3),
+    progress = GREATEST(progress, 0.1),
+    error = NULL,
+    updated_at = now()
+WHERE job_id = (
+    SELECT job_id FROM system_jobs
+    WHERE status = 'pending' AND job_type = $1 AND available_at <= now()
+    ORDER BY priority DESC, created_at
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+)
+RETURNING *
+"""
+
+_RENEW_SQL = """
+UPDATE system_jobs
+SET lease_expires_at = now() + make_interval(secs => $3)
+WHERE job_id = $1 AND lease_owner = $2 AND status = 'running'
+"""
+
+_FAIL_SQL = """
+UPDATE system_jobs
+SET status = CASE WHEN attempts < $3 THEN 'pending' ELSE 'failed' END,
+    available_at = now() + make_interval(secs => $4 * power(2, attempts - 1)),
+    error = $5,
+    lease_owner = NULL,
+    lease_expires_at = NULL,
+    updated_at = now()
+WHERE job_id = $1 AND lease_owner = $2 AND status = 'running'
+RETURNING job_type, status
+"""
+
+# Shutdown: hand the job straight back without charging an attempt
+_RELEASE_SQL = """
+UPDATE system_jobs
+SET status = 'pending',
+    attempts = GREATEST(attempts - 1, 0),
+    available_at = now(),
+    lease_owner = NULL,
+    lease_expires_at = NULL,
+    updated_at = now()
+WHERE job_id = $1 AND lease_owner = $2 AND status = 'running'
+RETURNING job_type
+"""
+
+# Rows left running without a live lease (including ones started before leases existed)
+_REAP_SQL = """
+UPDATE system_jobs
+SET status = CASE WHEN attempts < $1 THEN 'pending' ELSE 'failed' END,
+    error = CASE WHEN attempts < $1 THEN error ELSE 'Worker lost: lease expired' END,
+    available_at = now(),
+    lease_owner = NULL,
+    lease_expires_at = NULL,
+    updated_at = now()
+WHERE status = 'running' AND (lease_expires_at IS NULL OR lease_expires_at < now())
+RETURNING job_id, job_type, status
+"""
+
+
+class _RunningJob:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.lost = False
+
+
+class JobQueue:
+    """
+    Worker pools, leases and completion notifications for system jobs.
+
+    Register a handler per job type, then ``start()``. Pool sizes come from
+    ``settings.jobs.workers``; job types without a handler or with 0
+    workers are left for other replicas.
+    """
+
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._wakeups: dict[str, asyncio.Event] = {}
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._running: dict[str, _RunningJob] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        self._handlers[job_type] = handler
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start worker pools, the lease reaper and the NOTIFY listener (idempotent)."""
+        if self._tasks:
+            return
+        settings = get_settings()
+        self._stopping = False
+        for job_type, handler in self._handlers.items():
+            workers = settings.jobs.workers.get(job_type, 0)
+            for i in range(workers):
+                self._tasks.append(asyncio.create_task(self._worker(job_type, i)))
+            if workers:
+                logger.info(f"Job queue: {workers} worker(s) for '{job_type}'")
+        self._tasks.append(asyncio.create_task(self._reaper()))
+        if settings.database.url:
+            self._tasks.append(asyncio.create_task(self._listen(settings.database.url)))
+
+    async def stop(self) -> None:
+        """Stop workers; jobs still running are released back to the queue."""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    # ------------------------------------------------------------------
+    # Notifications
+    # ------------------------------------------------------------------
+
+    async def publish(self, conn: Any, event: dict) -> None:
+        """
+        Broadcast a job event over ``conn`` (a connection or the pool).
+
+        ``{"event": "submitted", "job_type": ...}`` wakes workers;
+        ``{"event": "status", "job_id": ..., "status": ...}`` reaches subscribers.
+        """
+        self._dispatch(event)
+        try:
+            await conn.execute(
+                "SELECT pg_notify($1, $2)", get_settings().jobs.notify_channel, json.dumps(event)
+            )
+        except Exception as e:
+            logger.warning(f"Job event broadcast failed: {e}")
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving status events for ``job_id`` while the context is open."""
+        events: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(events)
+        try:
+            yield events
+        finally:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(events)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    def _dispatch(self, event: dict) -> None:
+        job_type = event.get("job_type")
+        if event.get("event") == "submitted" and job_type:
+            self._wakeup(job_type).set()
+            return
+        job_id = event.get("job_id")
+        if event.get("status") == JobStatus.CANCELLED.value and job_id in self._running:
+            running = self._running[job_id]
+            running.lost = True
+            running.task.cancel()
+        for events in self._subscribers.get(job_id, ()):
+            events.put_nowait(event)
+        # A retry puts the job back in the queue
+        if event.get("status") == JobStatus.PENDING.value and job_type:
+            self._wakeup(job_type).set()
+
+    def _wakeup(self, job_type: str) -> asyncio.Event:
+        if job_type not in self._wakeups:
+            self._wakeups[job_type] = asyncio.Event()
+        return self._wakeups[job_type]
+
+    async def _listen(self, dsn: str) -> None:
+        """Keep a LISTEN connection open, reconnecting when it is lost."""
+        import asyncpg
+
+        settings = get_settings()
+
+        def on_notify(_conn, _pid, _channel, payload) -> None:
+            try:
+                self._dispatch(json.loads(payload))
+            except ValueError:
+                logger.warning(f"Ignoring malformed job event: {payload[:100]}")
+
+        while True:
+            lost = asyncio.Event()
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(settings.jobs.notify_channel, on_notify)
+                # Anything missed while disconnected: let workers and subscribers re-check
+                for wakeup in self._wakeups.values():
+                    wakeup.set()
+                for job_id in list(self._subscribers):
+                    self._dispatch({"event": "status", "job_id": job_id})
+                await lost.wait()
+            except asyncio.CancelledError:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+                raise
+            except Exception as e:
+                logger.warning(f"Job event listener failed: {e}")
+            await asyncio.sleep(settings.database.retry_delay)
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    async def _worker(self, job_type: str, index: int) -> None:
+        settings = get_settings().jobs
+        wakeup = self._wakeup(job_type)
+        while not self._stopping:
+            # Clear before claiming so a submission that lands mid-claim is not missed
+            wakeup.clear()
+            try:
+                job = await self._claim(job_type)
+            except Exception as e:
+                logger.warning(f"Job claim failed ({job_type}#{index}): {e}")
+                await asyncio.sleep(settings.idle_poll_seconds)
+                continue
+            if job is None:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=settings.idle_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _claim(self, job_type: str) -> dict | None:
+        pool = await get_database_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(_CLAIM_SQL, job_type, self.owner, get_settings().jobs.lease_seconds)
+            if row is None:
+                return None
+            job = dict(row)
+            await self.publish(conn, {
+                "event": "status", "job_id": job["job_id"], "job_type": job_type,
+                "status": JobStatus.RUNNING.value,
+            })
+        return job
+
+    async def _run(self, job: dict) -> None:
+        job_id = job["job_id"]
+        handler = self._handlers[job["job_type"]]
+        running = _RunningJob(asyncio.create_task(handler(job)))
+        self._running[job_id] = running
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, running))
+        logger.info(f"Running job {job_id} (attempt {job['attempts']}, priority {job['priority']})")
+        try:
+            result = await running.task
+        except asyncio.CancelledError:
+            if not running.lost:
+                # Worker shutdown: hand the job to another worker
+                running.task.cancel()
+                await self._release(job_id)
+                raise
+            logger.info(f"Job {job_id} cancelled or lease lost; abandoning")
+            return
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            await self._fail(job_id, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+            self._running.pop(job_id, None)
+        await self._complete(job_id, job["job_type"], result or {})
+
+    async def _heartbeat(self, job_id: str, running: _RunningJob) -> None:
+        settings = get_settings().jobs
+        while True:
+            await asyncio.sleep(settings.heartbeat_seconds)
+            try:
+                pool = await get_database_pool()
+                result = await pool.execute(_RENEW_SQL, job_id, self.owner, settings.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Lease renewal failed for job {job_id}: {e}")
+                continue
+            if result.endswith(" 0"):
+                running.lost = True
+                running.task.cancel()
+                return
+
+    async def _complete(self, job_id: str, job_type: str, fields: dict) -> None:
+        fields = {
+            **fields,
+            "status": JobStatus.COMPLETED.value,
+            "progress": 1.0,
+            "lease_owner": None,
+            "lease_expires_at": None,
+        }
+        set_parts = [f"{key} = ${i}" for i, key in enumerate(fields, start=3)]
+        pool = await get_database_pool()
+        async with pool.acquire() as conn:
+            result = await conn.execute(
+                f"UPDATE system_jobs SET {', '.join(set_parts)}, updated_at = now() "
+                "WHERE job_id = $1 AND lease_owner = $2 AND status = 'running'",
+                job_id, self.owner, *fields.values(),
+            )
+            if result.endswith(" 0"):
+                logger.warning(f"Job {job_id} finished after losing its lease; result dropped")
+                return
+            await self.publish(conn, {
+                "event": "status", "job_id": job_id, "job_type": job_type,
+                "status": JobStatus.COMPLETED.value,
+            })
+
+    async def _fail(self, job_id: str, error: str) -> None:
+        settings = get_settings().jobs
+        pool = await get_database_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                _FAIL_SQL, job_id, self.owner, settings.max_attempts,
+                settings.retry_backoff_seconds, error,
+            )
+            if row is not None:
+                await self.publish(conn, {
+                    "event": "status", "job_id": job_id, "job_type": row["job_type"],
+                    "status": row["status"],
+                })
+
+    async def _release(self, job_id: str) -> None:
+        try:
+            pool = await get_database_pool()
+            async with pool.acquire() as conn:
+                row = await conn.fetchrow(_RELEASE_SQL, job_id, self.owner)
+                if row is not None:
+                    await self.publish(conn, {
+                        "event": "status", "job_id": job_id, "job_type": row["job_type"],
+                        "status": JobStatus.PENDING.value,
+                    })
+        except Exception as e:
+            logger.warning(f"Could not release job {job_id}; the reaper will requeue it: {e}")
+
+    async def _reaper(self) -> None:
+        """Requeue (or fail, once out of attempts) jobs whose lease has expired."""
+        settings = get_settings().jobs
+        while True:
+            await asyncio.sleep(settings.lease_seconds)
+            try:
+                pool = await get_database_pool()
+                async with pool.acquire() as conn:
+                    rows = await conn.fetch(_REAP_SQL, settings.max_attempts)
+                    for row in rows:
+                        logger.warning(f"Job {row['job_id']} lost its worker; now {row['status']}")
+                        await self.publish(conn, {
+                            "event": "status", "job_id": row["job_id"],
+                            "job_type": row["job_type"], "status": row["status"],
+                        })
+            except Exception as e:
+                logger.warning(f"Job reaper failed: {e}")
+
+
+_job_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
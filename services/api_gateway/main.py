@@ -86,14 +86,27 @@ async def lifespan(_app: FastAPI):
     await get_user_manager()
     await get_api_key_manager()
     await get_conversation_manager()
+
+    # Keep the API-key principal cache consistent with other replicas
+    from shared.users.principal_cache import start_invalidation_listener, stop_invalidation_listener
+    await start_invalidation_listener()
+
+    # Durable job queue worker pools
+    await jobs.start_job_workers()
     
     logger.info(f"API Gateway {settings.app.version} started [{env_config.mode.value}]")
     
     yield
     
     # Cleanup
+    await jobs.stop_job_workers()
+    await stop_invalidation_listener()
+    from services.api_gateway.middleware.rate_limit import close_rate_limiters
+    await close_rate_limiters()
     from shared.database import close_database_pool
     await close_database_pool()
+    from shared.http_pool import close_http_clients
+    await close_http_clients()
     
     logger.info("API Gateway stopped")
 
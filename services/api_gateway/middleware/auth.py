@@ -108,11 +108,10 @@ class AuthMiddleware:
         """Authenticate via API key."""
         try:
             key_manager = await get_api_key_manager()
-            api_key = await key_manager.validate_key(raw_key)
+            principal = await key_manager.resolve_principal(raw_key)
             
-            if api_key:
-                user_manager = await get_user_manager()
-                return await user_manager.get_user(api_key.user_id)
+            if principal:
+                return principal.user
         except Exception as e:
             logger.warning(f"API key auth failed: {e}")
         
@@ -170,10 +169,9 @@ async def get_current_user(request: Request) -> User:
         api_key = request.headers.get(settings.auth.api_key_header_name)
         if api_key:
             key_manager = await get_api_key_manager()
-            key = await key_manager.validate_key(api_key)
-            if key:
-                user_manager = await get_user_manager()
-                user = await user_manager.get_user(key.user_id)
+            principal = await key_manager.resolve_principal(api_key)
+            if principal:
+                user = principal.user
         
         if user is None:
             auth_header = request.headers.get("Authorization")
@@ -3,17 +3,21 @@ Rate Limiting Middleware.
 
 Production-ready rate limiting with:
 - Per-user/IP limits
-- Sliding window algorithm
-- Redis-backed for distributed deployments
+- GCRA (one timestamp per key) with burst and sustained limits
+- Postgres-backed for distributed deployments (asynchronously reconciled)
 - Fallback to in-memory for single instance
 """
 
 from __future__ import annotations
 
+import asyncio
+import math
+import threading
 import time
+import weakref
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, NamedTuple, Sequence
 
 from fastapi import Request, Response, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -47,18 +51,106 @@ class RateLimitConfig:
     
 
 
-class SlidingWindowCounter:
-    """Sliding window rate limiter - in memory."""
-    
-    def __init__(self):
-        self._windows: dict[str, list[float]] = defaultdict(list)
-        self._last_cleanup = time.time()
-    
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Sustained rate of ``limit`` requests per ``period`` seconds, with up to ``burst`` at once."""
+    limit: int
+    period: float
+    burst: int = 0
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period / self.limit
+
+    @property
+    def capacity(self) -> int:
+        return self.burst if self.burst > 0 else self.limit
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of a limiter check; times are in seconds."""
+    allowed: bool
+    remaining: int
+    retry_after: float   # Until the next request would be allowed (0 when allowed)
+    reset_after: float   # Until the key is back to a full burst
+
+
+class GCRALimiter:
+    """
+    Generic cell rate algorithm limiter - in memory.
+
+    Each (key, rule) keeps a single theoretical arrival time (TAT), so
+    memory and CPU per request are O(1) regardless of the allowed rate.
+    Keys are spread over ``stripes`` locks, and keys whose TAT has passed
+    (indistinguishable from new keys) are evicted by a periodic sweep.
+    """
+
+    def __init__(
+        self,
+        stripes: int | None = None,
+        sweep_interval: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        settings = get_settings().rate_limit
+        stripes = max(1, stripes or settings.lock_stripes)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._tats: list[dict[tuple[str, float], float]] = [{} for _ in range(stripes)]
+        self._sweep_interval = settings.sweep_interval_seconds if sweep_interval is None else sweep_interval
+        self._clock = clock
+        self._next_sweep = clock() + self._sweep_interval
+        # Admitted emission time per (key, period) not yet reconciled with a shared store
+        self._pending: dict[tuple[str, float], float] = defaultdict(float)
+        self.track_pending = False
+
+    def __len__(self) -> int:
+        return sum(len(tats) for tats in self._tats)
+
+    def _stripe(self, key: str) -> int:
+        return hash(key) % len(self._locks)
+
+    def check(self, key: str, rules: Sequence[RateLimitRule]) -> RateLimitDecision:
+        """Admit one request for ``key`` only if every rule allows it."""
+        now = self._clock()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        stripe = self._stripe(key)
+        with self._locks[stripe]:
+            tats = self._tats[stripe]
+            updates: list[tuple[tuple[str, float], float, float]] = []
+            remaining: int | None = None
+            retry_after = 0.0
+            reset_after = 0.0
+            for rule in rules:
+                if rule.limit <= 0:
+                    continue
+                slot = (key, rule.period)
+                interval = rule.emission_interval
+                tat = max(tats.get(slot, now), now)
+                new_tat = tat + interval
+                allow_at = new_tat - rule.capacity * interval
+                if now < allow_at:
+                    retry_after = max(retry_after, allow_at - now)
+                    continue
+                left = int((now - allow_at) / interval + 1e-9)
+                remaining = left if remaining is None else min(remaining, left)
+                reset_after = max(reset_after, new_tat - now)
+                updates.append((slot, new_tat, interval))
+
+            if retry_after > 0:
+                return RateLimitDecision(False, 0, retry_after, reset_after)
+            for slot, new_tat, interval in updates:
+                tats[slot] = new_tat
+                if self.track_pending:
+                    self._pending[slot] += interval
+        return RateLimitDecision(True, remaining if remaining is not None else 0, 0.0, reset_after)
+
     def is_allowed(
         self,
         key: str,
         limit: int,
         window_seconds: int = 60,
+        burst: int = 0,
     ) -> tuple[bool, int]:
         """
         Check if request is allowed.
@@ -66,57 +158,57 @@ class SlidingWindowCounter:
         Returns:
             (allowed, remaining_requests)
         """
-        now = time.time()
-        window_start = now - window_seconds
-        
-        # Cleanup old entries periodically
-        if now - self._last_cleanup > 60:
-            self._cleanup(window_start)
-        
-        # Get requests in current window
-        requests = self._windows[key]
-        requests = [t for t in requests if t > window_start]
-        self._windows[key] = requests
-        
-        if len(requests) >= limit:
-            return False, 0
-        
-        # Add current request
-        requests.append(now)
-        remaining = limit - len(requests)
-        
-        return True, remaining
-    
-    def _cleanup(self, cutoff: float):
-        """Remove old entries."""
-        self._last_cleanup = time.time()
-        keys_to_delete = []
-        
-        for key, requests in self._windows.items():
-            self._windows[key] = [t for t in requests if t > cutoff]
-            if not self._windows[key]:
-                keys_to_delete.append(key)
-        
-        for key in keys_to_delete:
-            del self._windows[key]
+        decision = self.check(key, (RateLimitRule(limit, window_seconds, burst),))
+        return decision.allowed, decision.remaining
+
+    def sweep(self, now: float | None = None) -> int:
+        """Evict idle keys; returns how many were dropped."""
+        now = self._clock() if now is None else now
+        self._next_sweep = now + self._sweep_interval
+        dropped = 0
+        for lock, tats in zip(self._locks, self._tats):
+            with lock:
+                idle = [slot for slot, tat in tats.items() if tat <= now]
+                for slot in idle:
+                    del tats[slot]
+                dropped += len(idle)
+        return dropped
+
+    def drain_pending(self) -> dict[tuple[str, float], float]:
+        """Take the emission time admitted since the last drain."""
+        pending, self._pending = self._pending, defaultdict(float)
+        return dict(pending)
+
+    def merge(self, slot: tuple[str, float], tat: float) -> None:
+        """Adopt a shared TAT if it is ahead of the local one."""
+        stripe = self._stripe(slot[0])
+        with self._locks[stripe]:
+            tats = self._tats[stripe]
+            if tat > tats.get(slot, 0.0):
+                tats[slot] = tat
 
 
 class PostgresRateLimiter:
     """
-    PostgreSQL-backed rate limiter using UNLOGGED table.
-    
-    Uses an unlogged table for high-performance counters without WAL overhead.
+    GCRA limiter shared across replicas through PostgreSQL.
+
+    Decisions are made locally by a ``GCRALimiter``; a background task
+    reconciles with an UNLOGGED table every ``sync_interval_seconds`` using
+    one batched upsert that adds each replica's admitted emission time to
+    the shared TAT and pulls the merged value back. Over-admission across
+    replicas is bounded by one sync interval.
     Schema:
-        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limits (
+        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_tat (
             key TEXT PRIMARY KEY,
-            window_start DOUBLE PRECISION,
-            count INTEGER,
-            expires_at DOUBLE PRECISION
+            tat DOUBLE PRECISION NOT NULL
         );
     """
     
-    def __init__(self):
+    def __init__(self, local: GCRALimiter | None = None):
         self._ensured_schema = False
+        self._local = local or GCRALimiter()
+        self._local.track_pending = True
+        self._sync_task: asyncio.Task | None = None
 
     async def _ensure_schema(self):
         if self._ensured_schema:
@@ -126,56 +218,86 @@ class PostgresRateLimiter:
         pool = await get_db_pool()
         async with pool.acquire() as conn:
             await conn.execute("""
-                CREATE UNLOGGED TABLE IF NOT EXISTS rate_limits (
+                CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_tat (
                     key TEXT PRIMARY KEY,
-                    window_start DOUBLE PRECISION,
-                    count INTEGER,
-                    expires_at DOUBLE PRECISION
+                    tat DOUBLE PRECISION NOT NULL
                 );
-                CREATE INDEX IF NOT EXISTS idx_rate_limits_expiry ON rate_limits(expires_at);
+                CREATE INDEX IF NOT EXISTS idx_rate_limit_tat_tat ON rate_limit_tat(tat);
             """)
         self._ensured_schema = True
 
+    def check(self, key: str, rules: Sequence[RateLimitRule]) -> RateLimitDecision:
+        """Decide locally; counters are reconciled in the background."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+        return self._local.check(key, rules)
+
     async def is_allowed(
         self,
         key: str,
         limit: int,
         window_seconds: int = 60,
+        burst: int = 0,
     ) -> tuple[bool, int]:
-        """Check if request is allowed using Postgres."""
+        """Check if request is allowed (shared limit, reconciled asynchronously)."""
+        decision = self.check(key, (RateLimitRule(limit, window_seconds, burst),))
+        return decision.allowed, decision.remaining
+
+    async def _sync_loop(self):
+        interval = get_settings().rate_limit.sync_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Rate limit reconciliation failed: {e}")
+
+    async def flush(self) -> None:
+        """Push locally admitted emission time and merge back the shared TATs."""
+        pending = self._local.drain_pending()
+        if not pending:
+            return
         await self._ensure_schema()
-        
+
         from shared.database.connection import get_db_pool
         pool = await get_db_pool()
-        
+        slots = list(pending)
         now = time.time()
-        window_start = now - window_seconds
-        
         async with pool.acquire() as conn:
-            # Clean up old entries (probabilistic or on-access)
-            # Efficiently manage the counter
-            row = await conn.fetchrow("""
-                INSERT INTO rate_limits (key, window_start, count, expires_at)
-                VALUES ($1, $2, 1, $3)
+            rows = await conn.fetch("""
+                INSERT INTO rate_limit_tat (key, tat)
+                SELECT u.key, $1 + u.delta
+                FROM UNNEST($2::text[], $3::float8[]) AS u(key, delta)
                 ON CONFLICT (key) DO UPDATE
-                SET count = CASE 
-                        WHEN rate_limits.window_start < $4 THEN 1
-                        ELSE rate_limits.count + 1
-                    END,
-                    window_start = CASE
-                        WHEN rate_limits.window_start < $4 THEN $2
-                        ELSE rate_limits.window_start
-                    END,
-                    expires_at = $3
-                RETURNING count
-            """, key, now, now + window_seconds, window_start)
-            
-            count = row["count"]
-            
-            if count > limit:
-                return False, 0
-                
-            return True, limit - count
+                SET tat = GREATEST(rate_limit_tat.tat, $1) + (EXCLUDED.tat - $1)
+                RETURNING key, tat
+            """, now, [f"{key}|{period:g}" for key, period in slots], [pending[s] for s in slots])
+            await conn.execute("DELETE FROM rate_limit_tat WHERE tat < $1", now)
+
+        by_name = {f"{key}|{period:g}": (key, period) for key, period in slots}
+        for row in rows:
+            self._local.merge(by_name[row["key"]], row["tat"])
+
+    async def close(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
+        await self.flush()
+
+
+# Limiters created by middleware instances, so app shutdown can stop their sync tasks
+_postgres_limiters: "weakref.WeakSet[PostgresRateLimiter]" = weakref.WeakSet()
+
+
+async def close_rate_limiters() -> None:
+    """Stop background reconciliation and push final counters (call on shutdown)."""
+    for limiter in list(_postgres_limiters):
+        try:
+            await limiter.close()
+        except Exception as e:
+            logger.warning(f"Rate limiter shutdown flush failed: {e}")
+    _postgres_limiters.clear()
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -189,11 +311,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         settings = get_settings()
         self.config = config or RateLimitConfig.from_settings()
-        self._memory_limiter = SlidingWindowCounter()
+        self._memory_limiter = GCRALimiter()
         self._postgres_limiter: PostgresRateLimiter | None = None
+        # Sustained per-window rate with burst_size headroom, plus the hourly cap
+        self._rules = tuple(
+            rule for rule in (
+                RateLimitRule(
+                    self.config.requests_per_minute,
+                    settings.rate_limit.default_window_seconds,
+                    self.config.burst_size,
+                ),
+                RateLimitRule(self.config.requests_per_hour, 3600),
+            )
+            if rule.limit > 0
+        )
         
         if settings.rate_limit.enabled:
             self._postgres_limiter = PostgresRateLimiter()
+            _postgres_limiters.add(self._postgres_limiter)
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request with rate limiting."""
@@ -206,30 +341,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         key = self._get_key(request)
         
         # Check rate limit
-        settings = get_settings()
-        window = settings.rate_limit.default_window_seconds
-        if self._postgres_limiter:
-            allowed, remaining = await self._postgres_limiter.is_allowed(
-                key,
-                self.config.requests_per_minute,
-                window,
-            )
-        else:
-            allowed, remaining = self._memory_limiter.is_allowed(
-                key,
-                self.config.requests_per_minute,
-                window,
-            )
+        limiter = self._postgres_limiter or self._memory_limiter
+        decision = limiter.check(key, self._rules)
         
-        if not allowed:
+        if not decision.allowed:
             logger.warning(f"Rate limit exceeded for {key}")
             raise HTTPException(
                 status_code=429,
                 detail="Rate limit exceeded. Please try again later.",
                 headers={
-                    "Retry-After": str(window),
+                    "Retry-After": str(max(1, math.ceil(decision.retry_after))),
                     "X-RateLimit-Limit": str(self.config.requests_per_minute),
                     "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(math.ceil(decision.reset_after)),
                 },
             )
         
@@ -238,7 +362,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Add rate limit headers
         response.headers["X-RateLimit-Limit"] = str(self.config.requests_per_minute)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        response.headers["X-RateLimit-Reset"] = str(math.ceil(decision.reset_after))
         
         return response
     
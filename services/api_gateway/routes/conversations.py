@@ -60,6 +60,12 @@ class ConversationResponse(BaseModel):
     updated_at: str
 
 
+class ConversationSearchResult(ConversationResponse):
+    """Conversation search hit."""
+    rank: float
+    snippet: str
+
+
 class MessageResponse(BaseModel):
     """Message response."""
     message_id: str
@@ -127,33 +133,41 @@ async def list_conversations(
 async def search_conversations(
     q: str = Query(..., min_length=1),
     limit: int = Query(get_settings().conversations.search_limit, ge=1, le=get_settings().conversations.max_limit),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user_required),
 ):
-    """Search conversations by title or content."""
+    """Search conversations by title or content, best matches first."""
     manager = await get_conversation_manager()
     
-    conversations = await manager.search_conversations(
-        user_id=user.user_id,
-        query=q,
-        limit=limit,
-    )
+    try:
+        page = await manager.search(
+            user_id=user.user_id,
+            query=q,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=get_settings().status_codes.bad_request, detail=str(e))
     
     return {
         "query": q,
         "results": [
-            ConversationResponse(
-                conversation_id=c.conversation_id,
-                user_id=c.user_id,
-                title=c.title,
-                message_count=c.message_count,
-                is_archived=c.is_archived,
-                is_pinned=c.is_pinned,
-                created_at=c.created_at.isoformat(),
-                updated_at=c.updated_at.isoformat(),
+            ConversationSearchResult(
+                conversation_id=hit.conversation.conversation_id,
+                user_id=hit.conversation.user_id,
+                title=hit.conversation.title,
+                message_count=hit.conversation.message_count,
+                is_archived=hit.conversation.is_archived,
+                is_pinned=hit.conversation.is_pinned,
+                created_at=hit.conversation.created_at.isoformat(),
+                updated_at=hit.conversation.updated_at.isoformat(),
+                rank=hit.rank,
+                snippet=hit.snippet,
             )
-            for c in conversations
+            for hit in page.hits
         ],
-        "total": len(conversations),
+        "total": len(page.hits),
+        "next_cursor": page.next_cursor,
     }
 
 
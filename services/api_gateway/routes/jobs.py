@@ -2,17 +2,21 @@
 Jobs API Routes.
 
 - Uses PostgreSQL for persistent job storage
-- Implements background task execution via Orchestrator API
+- Executes jobs via Orchestrator API on the durable job queue
+- Pushes status changes over server-sent events
 - Requires authentication for job operations
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import uuid
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from shared.schemas import JobType, JobStatus
@@ -20,6 +24,7 @@ from shared.logging.main import get_logger
 from shared.database.connection import get_database_pool
 from shared.users.models import User
 from services.api_gateway.middleware.auth import get_current_user_required
+from services.api_gateway.core.job_queue import TERMINAL_STATUSES, get_job_queue
 from shared.config import get_settings
 
 
@@ -55,7 +60,16 @@ CREATE TABLE IF NOT EXISTS system_jobs (
     confidence REAL DEFAULT 0.0,
     steps_count INTEGER DEFAULT 0,
     artifact_ids TEXT
-)
+);
+ALTER TABLE system_jobs ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE system_jobs ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE system_jobs ADD COLUMN IF NOT EXISTS available_at TIMESTAMPTZ NOT NULL DEFAULT now();
+ALTER TABLE system_jobs ADD COLUMN IF NOT EXISTS lease_owner TEXT;
+ALTER TABLE system_jobs ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ;
+CREATE INDEX IF NOT EXISTS idx_system_jobs_queue
+    ON system_jobs (job_type, priority DESC, created_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_system_jobs_leases
+    ON system_jobs (lease_expires_at) WHERE status = 'running';
 """
 
 
@@ -98,22 +112,26 @@ class JobStore:
         job_type: JobType,
         depth: int,
         max_steps: int,
+        priority: int = 0,
     ) -> dict:
-        """Create new job in database."""
+        """Create new job in database and enqueue it."""
         await self.initialize()
         pool = await get_database_pool()
         
         now = datetime.utcnow()
         
-        await pool.execute(
-            """
-            INSERT INTO system_jobs 
-            (job_id, user_id, query, job_type, depth, max_steps, status, progress, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            """,
-            job_id, user_id, query, job_type.value, depth, max_steps,
-            JobStatus.PENDING.value, 0.0, now,
-        )
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO system_jobs 
+                (job_id, user_id, query, job_type, depth, max_steps, status, progress, created_at, priority)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                """,
+                job_id, user_id, query, job_type.value, depth, max_steps,
+                JobStatus.PENDING.value, 0.0, now, priority,
+            )
+            # Wake an idle worker for this job type on any replica
+            await get_job_queue().publish(conn, {"event": "submitted", "job_type": job_type.value})
         
         return {
             "job_id": job_id,
@@ -122,6 +140,7 @@ class JobStore:
             "job_type": job_type,
             "depth": depth,
             "max_steps": max_steps,
+            "priority": priority,
             "status": JobStatus.PENDING,
             "progress": 0.0,
             "created_at": now,
@@ -231,6 +250,7 @@ class JobStore:
             "job_type": JobType(row["job_type"]),
             "depth": row["depth"],
             "max_steps": row["max_steps"],
+            "priority": row["priority"],
             "status": JobStatus(row["status"]),
             "progress": row["progress"],
             "created_at": row["created_at"],
@@ -256,61 +276,51 @@ async def get_job_store() -> JobStore:
 
 
 # ============================================================================
-# Background Task: Run System Job
+# Queue Handler: Run System Job
 # ============================================================================
 
-async def run_system_job(
-    job_id: str,
-):
+async def run_system_job(job: dict) -> dict:
     """
-    Execute job via Orchestrator API.
+    Execute a claimed job via Orchestrator API.
+
+    Runs on the job queue; raising hands the job back for retry.
     """
-    store = await get_job_store()
-    job = await store.get(job_id)
+    job_id = job["job_id"]
+    logger.info(f"Starting system job {job_id}", 
+                extra={"query": job["query"][:100]})
     
-    if not job:
-        logger.error(f"Job {job_id} not found for execution")
-        return
+    from services.api_gateway.clients.orchestrator import get_orchestrator_client
+    client = await get_orchestrator_client()
     
-    # Update status to running
-    await store.update(job_id, status=JobStatus.RUNNING, progress=0.1)
+    # Start execution via client
+    result = await client.start_execution(
+        query=job["query"],
+        depth=job["depth"],
+        max_steps=job["max_steps"],
+    )
     
-    logger.info(f"Starting system job {job_id}", 
-                extra={"query": job["query"][:100]})
+    logger.info(f"System job {job_id} completed", extra={
+        "confidence": result.get("confidence", 0.0),
+        "steps_count": result.get("steps_count", 0),
+    })
     
-    try:
-        from services.api_gateway.clients.orchestrator import get_orchestrator_client
-        client = await get_orchestrator_client()
-        
-        # Start execution via client
-        result = await client.start_execution(
-            query=job["query"],
-            depth=job["depth"],
-            max_steps=job["max_steps"],
-        )
-        
-        # Update job with results
-        await store.update(
-            job_id,
-            status=JobStatus.COMPLETED,
-            progress=1.0,
-            output=result.get("output", ""),
-            confidence=result.get("confidence", 0.0),
-            steps_count=result.get("steps_count", 0),
-        )
-        
-        logger.info(f"System job {job_id} completed", extra={
-            "confidence": result.get("confidence", 0.0),
-            "steps_count": result.get("steps_count", 0),
-        })
-        
-    except Exception as e:
-        logger.error(f"System job {job_id} failed: {e}")
-        await store.update(
-            job_id,
-            status=JobStatus.FAILED,
-            error=str(e),
-        )
+    return {
+        "output": result.get("output", ""),
+        "confidence": result.get("confidence", 0.0),
+        "steps_count": result.get("steps_count", 0),
+    }
+
+
+async def start_job_workers() -> None:
+    """Register the system job handler for every job type and start the worker pools."""
+    queue = get_job_queue()
+    for job_type in JobType:
+        queue.register(job_type.value, run_system_job)
+    await queue.start()
+
+
+async def stop_job_workers() -> None:
+    await get_job_queue().stop()
 
 
 # ============================================================================
@@ -331,6 +341,7 @@ class CreateJobRequest(BaseModel):
         ge=1, 
         le=get_settings().jobs.max_steps
     )
+    priority: int = Field(default=0, ge=0, le=get_settings().jobs.max_priority)
 
 
 class JobStatusResponse(BaseModel):
@@ -360,13 +371,13 @@ class JobResult(BaseModel):
 @router.post("/", response_model=JobStatusResponse)
 async def create_job(
     request: CreateJobRequest,
-    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user_required),
 ):
     """
     Create a new system job.
     
-    Returns job_id for tracking. Job runs in background.
+    Returns job_id for tracking. Job is queued and run by the worker pool;
+    follow it with GET /{job_id}/events.
     Requires authentication.
     """
     job_id = f"{get_settings().jobs.id_prefix}{uuid.uuid4().hex[:12]}"
@@ -379,19 +390,15 @@ async def create_job(
         job_type=request.job_type,
         depth=request.depth,
         max_steps=request.max_steps,
+        priority=request.priority,
     )
     
     logger.info(f"Created job {job_id}", extra={
         "query": request.query[:100],
         "user_id": user.user_id,
+        "priority": request.priority,
     })
     
-    # Queue background task to execute job
-    background_tasks.add_task(
-        run_system_job, 
-        job_id, 
-    )
-    
     return JobStatusResponse(
         job_id=job_id,
         status=JobStatus.PENDING,
@@ -433,6 +440,68 @@ async def get_job_status(
     )
 
 
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    user: User = Depends(get_current_user_required),
+):
+    """
+    Stream job status as server-sent events until the job finishes.
+
+    Each change is sent as a ``status`` event; the stream closes after a
+    terminal status. Requires authentication.
+    """
+    store = await get_job_store()
+    job = await store.get(job_id)
+    
+    if not job:
+        raise HTTPException(
+            status_code=get_settings().status_codes.not_found, 
+            detail="Job not found"
+        )
+    
+    if job["user_id"] != user.user_id:
+        raise HTTPException(
+            status_code=get_settings().status_codes.forbidden, 
+            detail="Access denied"
+        )
+    
+    keepalive = get_settings().jobs.events_keepalive_seconds
+    
+    async def event_generator():
+        async with get_job_queue().subscribe(job_id) as events:
+            # Read after subscribing so no change between the two is lost
+            current = await store.get(job_id)
+            last = None
+            while current is not None:
+                snapshot = (current["status"], current["progress"])
+                if snapshot != last:
+                    last = snapshot
+                    payload = {
+                        "job_id": job_id,
+                        "status": current["status"].value,
+                        "progress": current["progress"],
+                        "error": current.get("error"),
+                    }
+                    yield f"event: status\ndata: {json.dumps(payload)}\n\n"
+                if current["status"].value in TERMINAL_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(events.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                current = await store.get(job_id)
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @router.get("/{job_id}/result", response_model=JobResult)
 async def get_job_result(
     job_id: str,
@@ -498,6 +567,14 @@ async def cancel_job(
         )
     
     await store.update(job_id, status=JobStatus.CANCELLED)
+    # Stops the worker running it (if any) and notifies event subscribers
+    pool = await get_database_pool()
+    await get_job_queue().publish(pool, {
+        "event": "status",
+        "job_id": job_id,
+        "job_type": job["job_type"].value,
+        "status": JobStatus.CANCELLED.value,
+    })
     
     logger.info(f"Cancelled job {job_id}", extra={"user_id": user.user_id})
     
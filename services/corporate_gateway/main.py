@@ -58,6 +58,8 @@ async def lifespan(_app: FastAPI):
 
     yield
 
+    from shared.http_pool import close_http_clients
+    await close_http_clients()
     log.info("corporate_gateway_stopped")
 
 
@@ -14,6 +14,7 @@ from typing import Any
 import httpx
 
 from shared.config import get_settings
+from shared.http_pool import get_http_client
 from shared.logging.main import get_logger
 from shared.service_registry import ServiceName, ServiceRegistry
 
@@ -97,14 +98,11 @@ class VaultLedgerClient:
         last_error: Exception | None = None
         for attempt in range(self._max_retries + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self._timeout
-                ) as client:
-                    response = await client.request(
-                        method, f"{self._base_url}{path}", **kwargs
-                    )
-                    response.raise_for_status()
-                    return response
+                response = await get_http_client(self._base_url).request(
+                    method, f"{self._base_url}{path}", timeout=self._timeout, **kwargs
+                )
+                response.raise_for_status()
+                return response
             except (httpx.TimeoutException, httpx.ConnectError) as exc:
                 last_error = exc
                 if attempt < self._max_retries:
@@ -0,0 +1 @@
+"""Corporate Operations core execution engine."""
@@ -0,0 +1,538 @@
+"""
+Mission Executor — Pipelined Sprint Execution.
+
+Runs all of a mission's chunks as one dependency graph instead of
+sprint by sprint and chunk by chunk:
+
+- A chunk starts as soon as the chunks it depends on have finished, so
+  independent work from later sprints overlaps the current sprint.
+  Sprints are still reviewed and checkpointed in order as each settles.
+- Chunks in flight are bounded per mission
+  (``corporate.sprint_max_parallel_tasks``) and per process
+  (``corporate.global_max_parallel_tasks``).
+- Specialists are reused across chunks that need the same profile and
+  tools instead of being spawned and terminated for every chunk.
+- Artifact writes go through a write-behind queue that sends them to
+  the Vault in batches, off the chunk's critical path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from shared.config import get_settings
+from shared.logging.main import get_logger
+from shared.schemas import (
+    CorporateAgentProcessRequest,
+    CorporateAgentSpawnRequest,
+)
+
+from kernel.team_orchestrator import Sprint, SprintResult
+from kernel.workforce_manager import MissionChunk, assign_specialists
+
+from services.corporate_ops.clients.orchestrator_client import (
+    CorporateOrchestratorClient,
+)
+from services.corporate_ops.clients.vault_ledger import (
+    ArtifactMetadata,
+    VaultLedgerClient,
+)
+
+log = get_logger(__name__)
+
+SprintCallback = Callable[[Sprint, SprintResult], Awaitable[bool]]
+
+
+def _field(chunk: Any, name: str, default: Any) -> Any:
+    if isinstance(chunk, dict):
+        return chunk.get(name, default)
+    return getattr(chunk, name, default)
+
+
+# ============================================================================
+# Concurrency Budget
+# ============================================================================
+
+# Semaphores are bound to the loop that first waits on them
+_global_slots: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _global_semaphore() -> asyncio.Semaphore:
+    """Process-wide chunk budget for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _global_slots.get(loop)
+    if semaphore is None:
+        for stale in [l for l in _global_slots if l.is_closed()]:
+            del _global_slots[stale]
+        semaphore = asyncio.Semaphore(
+            max(1, get_settings().corporate.global_max_parallel_tasks)
+        )
+        _global_slots[loop] = semaphore
+    return semaphore
+
+
+# ============================================================================
+# Profile Assignment
+# ============================================================================
+
+
+async def assign_profiles(
+    chunks: list[Any],
+    available_profiles: list[dict[str, Any]],
+) -> dict[str, str]:
+    """Match a sprint's chunks against the roster in one kernel pass (chunk_id → profile_id)."""
+    mission_chunks: list[MissionChunk] = []
+    for chunk_data in chunks:
+        try:
+            mission_chunks.append(
+                chunk_data if isinstance(chunk_data, MissionChunk)
+                else MissionChunk.model_validate(chunk_data)
+            )
+        except Exception:
+            continue  # Incomplete chunks keep the default profile
+
+    if not mission_chunks or not available_profiles:
+        return {}
+
+    result = await assign_specialists(mission_chunks, available_profiles)
+    assignments: dict[str, str] = {}
+    if result.signals:
+        data = result.signals[0].body.get("data", {})
+        if isinstance(data, dict):
+            for match in data.get("matches", []):
+                if match.get("agent_profile_id", "none") != "none":
+                    assignments[match["chunk_id"]] = match["agent_profile_id"]
+    return assignments
+
+
+# ============================================================================
+# Write-Behind Artifact Queue
+# ============================================================================
+
+
+class ArtifactWriteQueue:
+    """Write-behind queue for Vault artifact writes.
+
+    ``submit()`` returns a future for the artifact ID immediately. A
+    background task collects writes for up to ``flush_ms`` (or until
+    ``batch_size`` are waiting) and sends each batch concurrently over
+    the pooled Vault connection. The Vault has no bulk endpoint, so a
+    batch is a set of pipelined POSTs.
+    """
+
+    def __init__(
+        self,
+        client: VaultLedgerClient,
+        batch_size: int = 16,
+        flush_ms: float = 50.0,
+    ) -> None:
+        self._client = client
+        self._batch_size = max(1, batch_size)
+        self._flush_s = max(0.0, flush_ms) / 1000.0
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[str]]] = asyncio.Queue()
+        self._collector: asyncio.Task | None = None
+        self._sending: set[asyncio.Task] = set()
+        self.batches = 0
+
+    def submit(self, **write: Any) -> asyncio.Future[str]:
+        """Queue ``write_artifact(**write)``; the future resolves to the artifact ID."""
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((write, future))
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+        return future
+
+    async def close(self) -> None:
+        """Send everything still queued, then stop the collector."""
+        if self._collector is None:
+            return
+        await self._queue.join()
+        self._collector.cancel()
+        try:
+            await self._collector
+        except asyncio.CancelledError:
+            pass
+        self._collector = None
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_s
+            while len(batch) < self._batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: list[tuple[dict[str, Any], asyncio.Future[str]]]) -> None:
+        self.batches += 1
+        try:
+            results = await asyncio.gather(
+                *(self._client.write_artifact(**write) for write, _ in batch),
+                return_exceptions=True,
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+
+# ============================================================================
+# Agent Pool
+# ============================================================================
+
+
+class AgentPool:
+    """Specialists spawned for one mission, reused across compatible chunks.
+
+    Agents are keyed by (profile_id, required tools). A finished agent
+    goes back to the idle list for its key; failed agents (and every
+    agent when reuse is disabled) are terminated in the background.
+    """
+
+    def __init__(self, client: CorporateOrchestratorClient, reuse: bool = True) -> None:
+        self._client = client
+        self._reuse = reuse
+        self._idle: dict[tuple[str, tuple[str, ...]], list[str]] = defaultdict(list)
+        self._live: set[str] = set()
+        self._terminating: set[asyncio.Task] = set()
+        self.spawned = 0
+        self.reused = 0
+
+    @staticmethod
+    def _key(request: CorporateAgentSpawnRequest) -> tuple[str, tuple[str, ...]]:
+        return request.profile_id, tuple(sorted(request.required_tools))
+
+    async def acquire(self, request: CorporateAgentSpawnRequest) -> tuple[str, bool]:
+        """An agent for ``request``: ``(agent_id, reused)``."""
+        idle = self._idle[self._key(request)]
+        if self._reuse and idle:
+            self.reused += 1
+            return idle.pop(), True
+
+        response = await self._client.spawn_agent(request)
+        self.spawned += 1
+        self._live.add(response.agent_id)
+        return response.agent_id, False
+
+    def release(self, agent_id: str, request: CorporateAgentSpawnRequest, healthy: bool) -> None:
+        """Return an agent after its chunk; unhealthy agents are terminated."""
+        if self._reuse and healthy:
+            self._idle[self._key(request)].append(agent_id)
+        else:
+            self._terminate(agent_id)
+
+    async def close(self) -> None:
+        """Terminate every agent still alive and wait for all terminations."""
+        for agent_id in list(self._live):
+            self._terminate(agent_id)
+        self._idle.clear()
+        if self._terminating:
+            await asyncio.gather(*self._terminating)
+
+    def _terminate(self, agent_id: str) -> None:
+        self._live.discard(agent_id)
+        task = asyncio.create_task(self._terminate_quietly(agent_id))
+        self._terminating.add(task)
+        task.add_done_callback(self._terminating.discard)
+
+    async def _terminate_quietly(self, agent_id: str) -> None:
+        try:
+            await self._client.terminate_agent(agent_id, reason="mission_complete")
+        except Exception:
+            pass  # Best-effort cleanup
+
+
+# ============================================================================
+# Mission Executor
+# ============================================================================
+
+
+@dataclass
+class _ChunkOutcome:
+    chunk_id: str
+    status: str  # completed | failed | skipped
+    result_key: str = ""
+    response: dict[str, Any] | None = None
+    cost: float = 0.0
+    artifact: asyncio.Future[str] | None = None
+    started: float = 0.0
+    finished: float = 0.0
+
+
+class MissionExecutor:
+    """Execute a mission's sprints as one pipelined dependency graph.
+
+    Usage:
+        executor = MissionExecutor(mission_id, sprints, profiles, orch, vault)
+        results = await executor.run(on_sprint_done)
+
+    ``on_sprint_done(sprint, result)`` is awaited for each sprint in
+    order once all of its chunks have settled; returning False stops
+    any chunk that has not started yet. Work that was already running
+    for later sprints finishes and is reported in ``late_results``.
+    """
+
+    def __init__(
+        self,
+        mission_id: str,
+        sprints: list[Sprint],
+        available_profiles: list[dict[str, Any]],
+        orchestrator: CorporateOrchestratorClient,
+        vault: VaultLedgerClient,
+    ) -> None:
+        corporate = get_settings().corporate
+        self.mission_id = mission_id
+        self.sprints = sorted(sprints, key=lambda s: s.sprint_number)
+        self.available_profiles = available_profiles
+        self.late_results: list[SprintResult] = []
+        self._orchestrator = orchestrator
+        self._pipelining = corporate.sprint_pipelining_enabled
+        self._slots = asyncio.Semaphore(max(1, corporate.sprint_max_parallel_tasks))
+        self.agents = AgentPool(orchestrator, reuse=corporate.agent_reuse_enabled)
+        self.writes = ArtifactWriteQueue(
+            vault,
+            batch_size=corporate.artifact_write_batch_size,
+            flush_ms=corporate.artifact_write_flush_ms,
+        )
+        self._halted = False
+        self._sprint_of: dict[str, int] = {}
+        self._settled: dict[str, asyncio.Event] = {}
+        self._reviewed: dict[int, asyncio.Event] = {}
+        self._artifacts: dict[str, asyncio.Future[str]] = {}
+
+    async def run(self, on_sprint_done: SprintCallback) -> list[SprintResult]:
+        """Run every sprint; returns the results of the sprints that were reviewed."""
+        assignments = await asyncio.gather(
+            *(assign_profiles(s.chunks, self.available_profiles) for s in self.sprints)
+        )
+        profile_by_chunk: dict[str, str] = {}
+        for assignment in assignments:
+            profile_by_chunk.update(assignment)
+
+        for sprint in self.sprints:
+            self._reviewed[sprint.sprint_number] = asyncio.Event()
+            for chunk in sprint.chunks:
+                chunk_id = _field(chunk, "chunk_id", "")
+                self._sprint_of[chunk_id] = sprint.sprint_number
+                self._settled[chunk_id] = asyncio.Event()
+
+        tasks: dict[str, list[asyncio.Task]] = {}
+        previous: int | None = None
+        for sprint in self.sprints:
+            tasks[sprint.sprint_id] = [
+                asyncio.create_task(
+                    self._run_chunk(sprint, chunk, profile_by_chunk, previous)
+                )
+                for chunk in sprint.chunks
+            ]
+            previous = sprint.sprint_number
+
+        results: list[SprintResult] = []
+        try:
+            for sprint in self.sprints:
+                outcomes = await asyncio.gather(*tasks[sprint.sprint_id])
+                result = await self._sprint_result(sprint, outcomes)
+                results.append(result)
+                proceed = await on_sprint_done(sprint, result)
+                self._reviewed[sprint.sprint_number].set()
+                if not proceed:
+                    self._halt()
+                    break
+
+            for sprint in self.sprints[len(results):]:
+                outcomes = await asyncio.gather(*tasks[sprint.sprint_id])
+                if any(o.status != "skipped" for o in outcomes):
+                    self.late_results.append(await self._sprint_result(sprint, outcomes))
+        finally:
+            self._halt()
+            pending = [t for sprint_tasks in tasks.values() for t in sprint_tasks]
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self.writes.close()
+            await self.agents.close()
+
+        log.info(
+            "mission_executor_finished",
+            mission_id=self.mission_id,
+            sprints=len(results),
+            agents_spawned=self.agents.spawned,
+            agents_reused=self.agents.reused,
+            artifact_batches=self.writes.batches,
+        )
+        return results
+
+    def _halt(self) -> None:
+        self._halted = True
+        # Wake chunks waiting on a sprint review that will never happen
+        for event in self._reviewed.values():
+            event.set()
+
+    async def _run_chunk(
+        self,
+        sprint: Sprint,
+        chunk: Any,
+        profile_by_chunk: dict[str, str],
+        previous_sprint: int | None,
+    ) -> _ChunkOutcome:
+        chunk_id = _field(chunk, "chunk_id", "")
+        try:
+            # Only earlier sprints count, so forced cycles cannot deadlock
+            deps = [
+                dep for dep in _field(chunk, "depends_on", [])
+                if self._sprint_of.get(dep, sprint.sprint_number) < sprint.sprint_number
+            ]
+            if self._pipelining:
+                for dep in deps:
+                    await self._settled[dep].wait()
+            elif previous_sprint is not None:
+                await self._reviewed[previous_sprint].wait()
+
+            if self._halted:
+                return _ChunkOutcome(chunk_id=chunk_id, status="skipped")
+
+            predecessor_ids = list(_field(chunk, "predecessor_artifact_ids", []))
+            for dep in deps:
+                artifact = self._artifacts.get(dep)
+                if artifact is None:
+                    continue
+                try:
+                    predecessor_ids.append(await asyncio.shield(artifact))
+                except Exception:
+                    pass  # Write failure is reported with the dependency's sprint
+
+            async with self._slots, _global_semaphore():
+                if self._halted:
+                    return _ChunkOutcome(chunk_id=chunk_id, status="skipped")
+                return await self._execute(
+                    sprint, chunk, chunk_id, profile_by_chunk.get(chunk_id, ""), predecessor_ids
+                )
+        finally:
+            self._settled[chunk_id].set()
+
+    async def _execute(
+        self,
+        sprint: Sprint,
+        chunk: Any,
+        chunk_id: str,
+        profile_id: str,
+        predecessor_ids: list[str],
+    ) -> _ChunkOutcome:
+        # Select profile (sprint assignment, else first available or 'default')
+        if not profile_id:
+            profile_id = "default"
+            if self.available_profiles:
+                profile_id = self.available_profiles[0].get("profile_id", "default")
+
+        sub_objective = _field(chunk, "sub_objective", "")
+        spawn_request = CorporateAgentSpawnRequest(
+            mission_id=self.mission_id,
+            chunk_id=chunk_id,
+            profile_id=profile_id,
+            sub_objective=sub_objective,
+            required_tools=_field(chunk, "required_tools", []),
+            token_budget=_field(chunk, "token_budget", 0),
+            cost_budget=_field(chunk, "cost_budget", 0.0),
+            time_budget_ms=_field(chunk, "time_budget_ms", 0.0),
+            predecessor_artifact_ids=predecessor_ids,
+        )
+
+        outcome = _ChunkOutcome(chunk_id=chunk_id, status="failed", started=time.perf_counter())
+        agent_id = ""
+        healthy = False
+        try:
+            agent_id, reused = await self.agents.acquire(spawn_request)
+            # A reused agent was spawned for another chunk, so inputs travel with the call
+            attachments = (
+                [{"type": "predecessor_artifacts", "artifact_ids": predecessor_ids}]
+                if predecessor_ids else None
+            )
+            process_resp = await self._orchestrator.process_agent(
+                agent_id,
+                CorporateAgentProcessRequest(raw_input=sub_objective, attachments=attachments),
+            )
+            healthy = process_resp.status == "completed"
+
+            outcome.status = "completed" if healthy else "failed"
+            outcome.result_key = f"{agent_id}:{chunk_id}" if reused else agent_id
+            outcome.response = process_resp.model_dump()
+            outcome.cost = process_resp.cost
+
+            if healthy:
+                artifact = self.writes.submit(
+                    agent_id=agent_id,
+                    team_id=self.mission_id,
+                    content=str(process_resp.result),
+                    metadata=ArtifactMetadata(
+                        team_id=self.mission_id,
+                        mission_id=self.mission_id,
+                        sprint_id=sprint.sprint_id,
+                        chunk_id=chunk_id,
+                        agent_id=agent_id,
+                        content_type="report",
+                        topic=sub_objective[:100],
+                        summary=f"Output for chunk {chunk_id}",
+                    ),
+                )
+                self._artifacts[chunk_id] = artifact
+                outcome.artifact = artifact
+
+        except Exception as exc:
+            log.error(
+                "chunk_execution_failed",
+                error=str(exc),
+                chunk_id=chunk_id,
+            )
+        finally:
+            if agent_id:
+                self.agents.release(agent_id, spawn_request, healthy)
+            outcome.finished = time.perf_counter()
+
+        return outcome
+
+    async def _sprint_result(self, sprint: Sprint, outcomes: list[_ChunkOutcome]) -> SprintResult:
+        ran = [o for o in outcomes if o.status != "skipped"]
+        artifacts_produced: list[str] = []
+        for outcome in ran:
+            if outcome.artifact is None:
+                continue
+            try:
+                artifacts_produced.append(await asyncio.shield(outcome.artifact))
+            except Exception as vault_exc:
+                log.warning(
+                    "vault_write_failed",
+                    error=str(vault_exc),
+                    chunk_id=outcome.chunk_id,
+                )
+
+        duration_ms = 0.0
+        if ran:
+            duration_ms = (max(o.finished for o in ran) - min(o.started for o in ran)) * 1000
+
+        return SprintResult(
+            sprint_id=sprint.sprint_id,
+            completed_chunks=[o.chunk_id for o in ran if o.status == "completed"],
+            failed_chunks=[o.chunk_id for o in ran if o.status == "failed"],
+            agent_results={o.result_key: o.response for o in ran if o.response is not None},
+            artifacts_produced=artifacts_produced,
+            total_cost=sum(o.cost for o in ran),
+            duration_ms=duration_ms,
+            was_checkpointed=False,
+        )
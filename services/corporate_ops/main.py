@@ -77,6 +77,8 @@ async def lifespan(_app: FastAPI):
     except Exception:
         pass
 
+    from shared.http_pool import close_http_clients
+    await close_http_clients()
     log.info("Corporate Operations Service stopped")
 
 
@@ -16,19 +16,15 @@ from pydantic import BaseModel, Field
 
 from shared.config import get_settings
 from shared.logging.main import get_logger
-from shared.schemas import (
-    CorporateAgentProcessRequest,
-    CorporateAgentSpawnRequest,
-)
 
 from services.corporate_ops.clients.orchestrator_client import (
     get_corporate_orchestrator_client,
 )
 from services.corporate_ops.clients.vault_ledger import (
-    ArtifactMetadata,
     CheckpointState,
     get_vault_ledger_client,
 )
+from services.corporate_ops.core.mission_executor import MissionExecutor
 
 log = get_logger(__name__)
 
@@ -73,135 +69,6 @@ class ResumeRequest(BaseModel):
     mission_id: str
 
 
-# ============================================================================
-# Sprint Execution (Internal)
-# ============================================================================
-
-
-async def _execute_sprint(
-    sprint: Any,
-    mission_id: str,
-    available_profiles: list[dict[str, Any]],
-) -> Any:
-    """Execute a sprint by hiring agents and dispatching work via HTTP.
-
-    1. Build sprint DAG (pure kernel)
-    2. For each node: spawn agent via Orchestrator HTTP
-    3. For each agent: execute via Orchestrator HTTP
-    4. Collect results
-    """
-    from kernel.team_orchestrator import SprintResult
-    settings = get_settings()
-    orch_client = await get_corporate_orchestrator_client()
-
-    completed_chunks: list[str] = []
-    failed_chunks: list[str] = []
-    agent_results: dict[str, dict[str, Any]] = {}
-    artifacts_produced: list[str] = []
-    total_cost = 0.0
-    start_time = time.perf_counter()
-
-    for chunk_data in sprint.chunks:
-        chunk_id = chunk_data.get("chunk_id", "") if isinstance(chunk_data, dict) else chunk_data.chunk_id
-        sub_objective = chunk_data.get("sub_objective", "") if isinstance(chunk_data, dict) else chunk_data.sub_objective
-        required_tools = chunk_data.get("required_tools", []) if isinstance(chunk_data, dict) else chunk_data.required_tools
-        token_budget = chunk_data.get("token_budget", 0) if isinstance(chunk_data, dict) else chunk_data.token_budget
-        cost_budget = chunk_data.get("cost_budget", 0.0) if isinstance(chunk_data, dict) else chunk_data.cost_budget
-        time_budget_ms = chunk_data.get("time_budget_ms", 0.0) if isinstance(chunk_data, dict) else chunk_data.time_budget_ms
-        predecessor_ids = chunk_data.get("predecessor_artifact_ids", []) if isinstance(chunk_data, dict) else chunk_data.predecessor_artifact_ids
-
-        # Select profile (default to first available or 'default')
-        profile_id = "default"
-        if available_profiles:
-            profile_id = available_profiles[0].get("profile_id", "default")
-
-        try:
-            # Step 1: Spawn agent
-            spawn_request = CorporateAgentSpawnRequest(
-                mission_id=mission_id,
-                chunk_id=chunk_id,
-                profile_id=profile_id,
-                sub_objective=sub_objective,
-                required_tools=required_tools,
-                token_budget=token_budget,
-                cost_budget=cost_budget,
-                time_budget_ms=time_budget_ms,
-                predecessor_artifact_ids=predecessor_ids,
-            )
-            spawn_resp = await orch_client.spawn_agent(spawn_request)
-
-            # Step 2: Execute agent
-            process_request = CorporateAgentProcessRequest(
-                raw_input=sub_objective,
-            )
-            process_resp = await orch_client.process_agent(
-                spawn_resp.agent_id, process_request
-            )
-
-            agent_results[spawn_resp.agent_id] = process_resp.model_dump()
-            total_cost += process_resp.cost
-
-            if process_resp.status == "completed":
-                completed_chunks.append(chunk_id)
-
-                # Step 3: Store artifact in Vault
-                vault_client = await get_vault_ledger_client()
-                try:
-                    artifact_id = await vault_client.write_artifact(
-                        agent_id=spawn_resp.agent_id,
-                        team_id=mission_id,
-                        content=str(process_resp.result),
-                        metadata=ArtifactMetadata(
-                            team_id=mission_id,
-                            mission_id=mission_id,
-                            sprint_id=sprint.sprint_id,
-                            chunk_id=chunk_id,
-                            agent_id=spawn_resp.agent_id,
-                            content_type="report",
-                            topic=sub_objective[:100],
-                            summary=f"Output for chunk {chunk_id}",
-                        ),
-                    )
-                    artifacts_produced.append(artifact_id)
-                except Exception as vault_exc:
-                    log.warning(
-                        "vault_write_failed",
-                        error=str(vault_exc),
-                        chunk_id=chunk_id,
-                    )
-            else:
-                failed_chunks.append(chunk_id)
-
-            # Step 4: Terminate agent
-            try:
-                await orch_client.terminate_agent(
-                    spawn_resp.agent_id, reason="mission_complete"
-                )
-            except Exception:
-                pass  # Best-effort cleanup
-
-        except Exception as exc:
-            log.error(
-                "chunk_execution_failed",
-                error=str(exc),
-                chunk_id=chunk_id,
-            )
-            failed_chunks.append(chunk_id)
-
-    duration_ms = (time.perf_counter() - start_time) * 1000
-
-    return SprintResult(
-        sprint_id=sprint.sprint_id,
-        completed_chunks=completed_chunks,
-        failed_chunks=failed_chunks,
-        agent_results=agent_results,
-        artifacts_produced=artifacts_produced,
-        total_cost=total_cost,
-        duration_ms=duration_ms,
-        was_checkpointed=False,
-    )
-
-
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -212,11 +79,12 @@ async def orchestrate_mission(request: MissionRequest) -> dict[str, Any]:
     """Start a new mission — full sprint pipeline.
 
     1. plan_sprints() — pure kernel call
-    2. For each sprint: execute_sprint() → review_sprint() → checkpoint
+    2. MissionExecutor runs chunks as their dependencies finish;
+       each settled sprint → review_sprint() → checkpoint, in order
     3. Return aggregated MissionResult
     """
     from kernel.team_orchestrator import (
-        MissionResult, Sprint, SprintReview, plan_sprints, review_sprint,
+        MissionResult, Sprint, SprintResult, SprintReview, plan_sprints, review_sprint,
     )
     settings = get_settings()
     mission_id = request.mission_id
@@ -245,23 +113,18 @@ async def orchestrate_mission(request: MissionRequest) -> dict[str, Any]:
     total_sprints = len(sprints)
     _missions[mission_id]["total_sprints"] = total_sprints
 
-    # Step 2: Execute sprints sequentially
+    # Step 2: Execute sprints as one pipelined DAG; review and checkpoint in order
     all_artifacts: list[str] = []
     all_agent_results: dict[str, dict[str, Any]] = {}
     total_cost = 0.0
     completed_sprints = 0
     final_review: SprintReview | None = None
+    vault_client = await get_vault_ledger_client()
 
-    for sprint in sprints:
+    async def on_sprint_done(sprint: Sprint, sprint_result: SprintResult) -> bool:
+        nonlocal total_cost, completed_sprints, final_review
         _missions[mission_id]["current_sprint"] = sprint.sprint_number
 
-        # Execute sprint
-        sprint_result = await _execute_sprint(
-            sprint=sprint,
-            mission_id=mission_id,
-            available_profiles=request.available_profiles,
-        )
-
         all_artifacts.extend(sprint_result.artifacts_produced)
         all_agent_results.update(sprint_result.agent_results)
         total_cost += sprint_result.total_cost
@@ -285,11 +148,10 @@ async def orchestrate_mission(request: MissionRequest) -> dict[str, Any]:
                             sprint_id=sprint.sprint_id,
                             issues=final_review.issues_found,
                         )
-                        break
+                        return False
 
         # Checkpoint to Vault
         if sprint.sprint_number % settings.corporate.checkpoint_interval_sprints == 0:
-            vault_client = await get_vault_ledger_client()
             try:
                 await vault_client.write_checkpoint(
                     mission_id=mission_id,
@@ -299,7 +161,7 @@ async def orchestrate_mission(request: MissionRequest) -> dict[str, Any]:
                         total_sprints=total_sprints,
                         completed_chunk_ids=sprint_result.completed_chunks,
                         failed_chunk_ids=sprint_result.failed_chunks,
-                        artifact_ids=all_artifacts,
+                        artifact_ids=list(all_artifacts),
                         total_cost=total_cost,
                         elapsed_ms=(time.perf_counter() - start_time) * 1000,
                     ),
@@ -308,6 +170,22 @@ async def orchestrate_mission(request: MissionRequest) -> dict[str, Any]:
                 log.warning("checkpoint_write_failed", error=str(cp_exc))
 
         completed_sprints += 1
+        return True
+
+    executor = MissionExecutor(
+        mission_id=mission_id,
+        sprints=sprints,
+        available_profiles=request.available_profiles,
+        orchestrator=await get_corporate_orchestrator_client(),
+        vault=vault_client,
+    )
+    await executor.run(on_sprint_done)
+
+    # Later-sprint work already running when a review blocked the mission
+    for late in executor.late_results:
+        all_artifacts.extend(late.artifacts_produced)
+        all_agent_results.update(late.agent_results)
+        total_cost += late.total_cost
 
     total_duration_ms = (time.perf_counter() - start_time) * 1000
     completion_pct = completed_sprints / total_sprints if total_sprints > 0 else 0.0
@@ -0,0 +1,317 @@
+"""
+Tool Discovery Snapshot.
+
+Static (AST) tool discovery for MCP server scripts, persisted as a JSON
+manifest of tool names, schemas and server scripts. Each server's entry
+is keyed by the SHA-256 of its script, so a cold start loads the manifest
+and only re-parses servers whose source changed (a stat check skips
+hashing unchanged files).
+
+Prebuild it with:
+    python -m services.mcp_host.core.discovery_snapshot [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from shared.logging.main import get_logger
+
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+# ============================================================================
+# Static Analysis
+# ============================================================================
+
+def extract_schema_from_node(node: ast.FunctionDef | ast.AsyncFunctionDef) -> dict:
+    """
+    Extract JSON schema from AST function node.
+    Crucial for RAG to know about parameters and for Planner to know how to call the tool.
+    """
+    properties = {}
+    required = []
+
+    # Parse arguments
+    args = node.args.args
+
+    for arg in args:
+        # FastMCP decorates standalone functions, but skip 'self'/'cls' if present
+        if arg.arg in ('self', 'cls'):
+            continue
+
+        param_name = arg.arg
+        param_type = "string" # Default
+
+        # Try to infer type from annotation
+        if arg.annotation:
+            try:
+                type_str = ast.unparse(arg.annotation)
+                # rudimentary mapping
+                if type_str in ('int', 'float', 'complex'):
+                    param_type = "number"
+                elif type_str == 'bool':
+                    param_type = "boolean"
+                elif type_str in ('dict', 'Dict'):
+                    param_type = "object"
+                elif type_str.startswith(('list', 'List')):
+                    param_type = "array"
+            except Exception:
+                pass
+
+        properties[param_name] = {
+            "type": param_type,
+            "description": f"Parameter {param_name}"
+        }
+        required.append(param_name)
+
+    # Handle defaults (remove from required)
+    # node.args.defaults corresponds to the last N args:
+    # args [a, b, c, d], defaults [1, 2] -> c and d are optional
+    if node.args.defaults:
+        num_defaults = len(node.args.defaults)
+        for arg in args[-num_defaults:]:
+            if arg.arg in required:
+                required.remove(arg.arg)
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required
+    }
+
+
+def _is_tool_decorator(decorator: ast.expr) -> bool:
+    # Case A: @mcp.tool() / @tool() - Call
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    # Case B: @mcp.tool / @tool - Attribute/Name
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr == "tool"
+    if isinstance(decorator, ast.Name):
+        return decorator.id == "tool"
+    return False
+
+
+def scan_server_source(server_name: str, source: str) -> dict:
+    """
+    Parse a server script to find tool definitions without running it.
+    Supports:
+    1. Legacy: self.register_tool(name="tool") -> routed names only
+    2. FastMCP: @mcp.tool() decorators -> routed names plus schemas
+
+    Returns ``{"tools": [{name, description, inputSchema}], "legacy_tools": [name]}``.
+    """
+    tools: list[dict] = []
+    legacy_tools: list[str] = []
+
+    for node in ast.walk(ast.parse(source)):
+        # 1. Legacy: self.register_tool(...)
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Attribute) and node.func.attr == "register_tool":
+                for keyword in node.keywords:
+                    if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+                        legacy_tools.append(keyword.value.value)
+                        break
+
+        # 2. FastMCP: @mcp.tool() decorators on functions (Sync & Async)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if not any(_is_tool_decorator(d) for d in node.decorator_list):
+                continue
+            tool_name = node.name
+
+            # Extract Docstring for RAG (use function name as fallback)
+            description = ast.get_docstring(node) or f"Tool: {tool_name} from {server_name}"
+
+            # Extract Schema from AST
+            try:
+                input_schema = extract_schema_from_node(node)
+            except Exception as e:
+                logger.warning(f"   ⚠️ Schema extraction failed for {tool_name}: {e}")
+                input_schema = {}
+
+            tools.append({
+                "name": tool_name,
+                "description": description,
+                "inputSchema": input_schema,
+            })
+
+    return {"tools": tools, "legacy_tools": legacy_tools}
+
+
+# ============================================================================
+# Snapshot
+# ============================================================================
+
+def snapshot_path() -> Path:
+    """Configured snapshot location (relative paths are under the project root)."""
+    from shared.config import get_settings
+    path = Path(get_settings().mcp.discovery_snapshot_path)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+class DiscoverySnapshot:
+    """
+    Persisted discovery results, one entry per server script.
+
+    ``scan()`` returns a server's tools from the snapshot when its script
+    is unchanged and re-parses it otherwise; ``save()`` writes the
+    manifest back only if something changed.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or snapshot_path()
+        self._servers: dict[str, dict] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.rescanned = 0
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "DiscoverySnapshot":
+        """Load the manifest; a missing, corrupt or outdated file yields an empty snapshot."""
+        snapshot = cls(path)
+        try:
+            data = json.loads(snapshot.path.read_text(encoding="utf-8"))
+            if data.get("version") == SNAPSHOT_VERSION:
+                snapshot._servers = data.get("servers", {})
+            else:
+                snapshot._dirty = True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable discovery snapshot {snapshot.path}: {e}")
+            snapshot._dirty = True
+        return snapshot
+
+    def scan(self, server_name: str, script_path: Path, force: bool = False) -> dict:
+        """Discovery result for one server script, re-parsing only if it changed."""
+        self._seen.add(server_name)
+        stat = script_path.stat()
+        entry = self._servers.get(server_name)
+        script = self._relative(script_path)
+
+        if not force and entry and entry.get("script") == script:
+            # Same size and mtime: trust the entry without reading the file
+            if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                return entry
+            source = script_path.read_bytes()
+            if entry.get("sha256") == hashlib.sha256(source).hexdigest():
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                self._dirty = True
+                return entry
+        else:
+            source = script_path.read_bytes()
+
+        try:
+            result = scan_server_source(server_name, source.decode("utf-8"))
+        except Exception as e:
+            # Not cached, so a fixed script is picked up on the next start
+            logger.warning(f"Static scan failed for {server_name}: {e}")
+            return {"script": script, "tools": [], "legacy_tools": []}
+
+        entry = {
+            "script": script,
+            "sha256": hashlib.sha256(source).hexdigest(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            **result,
+        }
+        self._servers[server_name] = entry
+        self._dirty = True
+        self.rescanned += 1
+        return entry
+
+    def save(self) -> bool:
+        """Drop servers not scanned this run and write the manifest if it changed."""
+        stale = set(self._servers) - self._seen
+        for name in stale:
+            del self._servers[name]
+        if not (self._dirty or stale):
+            return False
+
+        data = {"version": SNAPSHOT_VERSION, "servers": self._servers}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write discovery snapshot {self.path}: {e}")
+            return False
+        self._dirty = False
+        return True
+
+    def _relative(self, script_path: Path) -> str:
+        try:
+            return script_path.resolve().relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            return script_path.resolve().as_posix()
+
+
+def iter_server_scripts(base_path: Path):
+    """(server_name, script_path) for every MCP server under ``base_path``, in discovery order."""
+    # Strategy 1: Top level .py
+    for file_path in base_path.glob("*.py"):
+        if file_path.name == "__init__.py":
+            continue
+        yield file_path.stem, file_path
+
+    # Strategy 2: Subdirectories
+    for dir_path in base_path.iterdir():
+        if dir_path.is_dir():
+            server_script = dir_path / "server.py"
+            if server_script.exists():
+                yield dir_path.name, server_script
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Prebuild the MCP tool discovery snapshot")
+    parser.add_argument(
+        "--servers",
+        type=Path,
+        default=PROJECT_ROOT / "mcp_servers",
+        help="MCP servers directory (default: <project>/mcp_servers)",
+    )
+    parser.add_argument("--output", type=Path, help="Snapshot path (default: settings.mcp.discovery_snapshot_path)")
+    parser.add_argument("--force", action="store_true", help="Re-parse every server, ignoring the existing snapshot")
+    args = parser.parse_args(argv)
+
+    if not args.servers.exists():
+        print(f"MCP servers directory not found: {args.servers}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    snapshot = DiscoverySnapshot.load(args.output)
+    servers = tools = 0
+    for server_name, script_path in iter_server_scripts(args.servers):
+        entry = snapshot.scan(server_name, script_path, force=args.force)
+        servers += 1
+        tools += len(entry["tools"]) + len(entry["legacy_tools"])
+    written = snapshot.save()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"{servers} servers, {tools} tools ({snapshot.rescanned} re-parsed) in {elapsed:.0f} ms; "
+        f"{'wrote' if written else 'unchanged'} {snapshot.path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
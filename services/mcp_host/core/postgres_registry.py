@@ -12,15 +12,13 @@ import os
 import asyncio
 from typing import Any, List, Dict, Optional
 import numpy as np
-import httpx
 
 import asyncpg
-from pgvector.asyncpg import register_vector
 
 from shared.logging.main import get_logger
 from shared.mcp.protocol import Tool
-from shared.embedding.model_manager import get_embedding_provider
-from shared.database.connection import get_db_pool
+from shared.embedding.model_manager import embed_in_batches, get_embedding_provider
+from shared.database.connection import ensure_vector_codec, get_db_pool
 
 logger = get_logger(__name__)
 
@@ -54,7 +52,7 @@ class PostgresToolRegistry:
                 await conn.execute("SELECT pg_advisory_lock(12345)")
                 try:
                     await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-                    await register_vector(conn)
+                    await ensure_vector_codec(conn)
                     
                     # Create table
                     # embedding is 1024 dim (Qwen3 default)
@@ -87,9 +85,38 @@ class PostgresToolRegistry:
         s = json.dumps(tool_schema, sort_keys=True)
         return hashlib.sha256(s.encode()).hexdigest()
 
-    async def sync_tools(self, tools: List[Tool]):
+    def _embedding_text(self, tool: Tool, schema: Dict[str, Any]) -> str:
+        """Build rich embedding text for a tool."""
+        desc = f"Tool: {tool.name}\n"
+        desc += f"Description: {tool.description or 'No description'}\n"
+        
+        if 'inputSchema' in schema:
+            input_schema = schema.get('inputSchema', {})
+            props = input_schema.get('properties', {})
+            required = input_schema.get('required', [])
+            
+            desc += "Parameters:\n"
+            for p_name, spec in props.items():
+                req_flag = "[REQUIRED]" if p_name in required else "[optional]"
+                p_desc = spec.get('description', 'No description')
+                p_type = spec.get('type', 'any')
+                desc += f"  - {p_name} ({p_type}) {req_flag}: {p_desc}\n"
+            
+            desc += f"Required params: {required}\n"
+        
+        if 'outputSchema' in schema:
+            desc += f"Output: {json.dumps(schema.get('outputSchema', {}))}\n"
+        
+        return desc
+
+    async def sync_tools(self, tools: List[Tool], prune: bool = False):
         """
         Incremental sync of tools to registry.
+
+        Existing hashes are fetched in one query and diffed in memory; only
+        new or modified tools are embedded, and the result is applied with
+        set-based UNNEST statements in one transaction. With ``prune`` tools
+        missing from ``tools`` are deleted.
         """
         if not tools:
             return
@@ -98,123 +125,65 @@ class PostgresToolRegistry:
         await self._ensure_schema(pool)
         logger.info(f"Registry (Postgres): Syncing {len(tools)} tools...")
         
-        # 1. Identify what needs embedding
-        updates_needed = []
+        # 1. Diff against the registry (last occurrence of a name wins)
+        by_name = {tool.name: tool for tool in tools}
+        schemas = {name: tool.model_dump() for name, tool in by_name.items()}
+        hashes = {name: self._compute_hash(schema) for name, schema in schemas.items()}
         
         async with pool.acquire() as conn:
-            for tool in tools:
-                schema = tool.model_dump()
-                current_hash = self._compute_hash(schema)
-                tool_name = tool.name
-                
-                # Check existing hash
-                row = await conn.fetchrow(f"SELECT schema_hash FROM {self.table_name} WHERE tool_name = $1", tool_name)
-                
-                if row and row['schema_hash'] == current_hash:
-                    # Update timestamp
-                    await conn.execute(f"UPDATE {self.table_name} SET last_seen = CURRENT_TIMESTAMP WHERE tool_name = $1", tool_name)
-                else:
-                    updates_needed.append((tool, schema, current_hash))
-                    
-        # 2. Embed and Upsert new tools
-        if updates_needed:
-            logger.info(f"Registry: Embedding {len(updates_needed)} new/modified tools in batches...")
-            
-            # Senior Architect Fix: Dynamic Batch processing for large toolsets
-            from shared.config import get_settings
-            settings = get_settings()
-            
-            batch_size = settings.embedding.batch_size
-            total_updated = 0
-            
-            i = 0
-
-            while i < len(updates_needed):
-                actual_batch_size = min(batch_size, len(updates_needed) - i)
-                batch = updates_needed[i : i + actual_batch_size]
-                batch_texts = []
-                for tool, schema, _ in batch:
-                    # Build rich embedding text
-                    desc = f"Tool: {tool.name}\n"
-                    desc += f"Description: {tool.description or 'No description'}\n"
-                    
-                    if 'inputSchema' in schema:
-                        input_schema = schema.get('inputSchema', {})
-                        props = input_schema.get('properties', {})
-                        required = input_schema.get('required', [])
-                        
-                        desc += "Parameters:\n"
-                        for p_name, spec in props.items():
-                            req_flag = "[REQUIRED]" if p_name in required else "[optional]"
-                            p_desc = spec.get('description', 'No description')
-                            p_type = spec.get('type', 'any')
-                            desc += f"  - {p_name} ({p_type}) {req_flag}: {p_desc}\n"
-                        
-                        desc += f"Required params: {required}\n"
-                    
-                    if 'outputSchema' in schema:
-                        desc += f"Output: {json.dumps(schema.get('outputSchema', {}))}\n"
-                    
-                    batch_texts.append(desc)
-                
-                # Retry loop for the batch
-                for attempt in range(settings.database.max_retries):
-                    try:
-                        embeddings = await self.embedder.embed(batch_texts)
-                        
-                        async with pool.acquire() as conn:
-                            async with conn.transaction():
-                                await register_vector(conn)
-                                for j, (tool, schema, new_hash) in enumerate(batch):
-                                    await conn.execute(f"""
-                                        INSERT INTO {self.table_name} (tool_name, schema_hash, schema_json, embedding)
-                                        VALUES ($1, $2, $3, $4)
-                                        ON CONFLICT (tool_name) DO UPDATE SET
-                                            schema_hash = EXCLUDED.schema_hash,
-                                            schema_json = EXCLUDED.schema_json,
-                                            embedding = EXCLUDED.embedding,
-                                            last_seen = CURRENT_TIMESTAMP
-                                    """, tool.name, new_hash, json.dumps(schema), embeddings[j])
-                                    
-                        total_updated += len(batch)
-                        logger.info(f"Registry: Committed {len(batch)} tools")
-                        i += actual_batch_size
-                        break 
-                    except Exception as e:
-                        # Senior Architect Fix: Explicitly check for timeout and connection errors
-                        # Note: str(e) is often empty for TimeoutError/ReadError on Windows, so we check types.
-                        is_transient = isinstance(e, (
-                            asyncio.TimeoutError,
-                            httpx.TimeoutException,
-                            httpx.ReadError,
-                        ))
-                        error_str = str(e).lower()
-                        
-                        if is_transient or "500" in error_str or "timeout" in error_str or "disconnected" in error_str:
-                            import math
-                            if batch_size > 1:
-                                logger.warning(
-                                    f"Tool batch OOM/Timeout (attempt {attempt+1}). "
-                                    f"Halving batch size from {batch_size} to {math.ceil(batch_size/2)}."
-                                )
-                                batch_size = math.ceil(batch_size / 2)
-                                await asyncio.sleep(settings.database.retry_delay)
-                                continue # Try same batch again with smaller size
-                            else:
-                                logger.error(f"Tool batch permanently failed. Tool schema too large for embedding model.", error=f"{type(e).__name__}: {e}")
-                                i += 1 # Skip problematic tool
-                                break
-                        elif attempt < settings.database.max_retries - 1:
-                            logger.warning(f"Tool batch failed (attempt {attempt+1}): {type(e).__name__}: {e}. Retrying...")
-                            await asyncio.sleep(settings.database.retry_delay)
-                        else:
-                            logger.error(f"Tool batch permanently failed at offset {i}: {type(e).__name__}: {e}")
-                            i += actual_batch_size
-                            break
-
-            logger.info(f"Registry: Successfully synchronized {total_updated} tools.")
+            existing = {
+                row['tool_name']: row['schema_hash']
+                for row in await conn.fetch(f"SELECT tool_name, schema_hash FROM {self.table_name}")
+            }
+        
+        unchanged = [name for name, h in hashes.items() if existing.get(name) == h]
+        changed = [name for name, h in hashes.items() if existing.get(name) != h]
+        deleted = [name for name in existing if name not in hashes] if prune else []
+        
+        # 2. Embed only new/modified tools
+        embeddings: List[Optional[List[float]]] = []
+        if changed:
+            logger.info(f"Registry: Embedding {len(changed)} new/modified tools in batches...")
+            embeddings = await embed_in_batches(
+                self.embedder,
+                [self._embedding_text(by_name[name], schemas[name]) for name in changed],
+            )
+        upserts = [(name, vector) for name, vector in zip(changed, embeddings) if vector is not None]
+        
+        # 3. Apply as set-based statements
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await ensure_vector_codec(conn)
+                if unchanged:
+                    await conn.execute(
+                        f"UPDATE {self.table_name} SET last_seen = CURRENT_TIMESTAMP WHERE tool_name = ANY($1::text[])",
+                        unchanged,
+                    )
+                if upserts:
+                    await conn.execute(f"""
+                        INSERT INTO {self.table_name} (tool_name, schema_hash, schema_json, embedding)
+                        SELECT * FROM UNNEST($1::text[], $2::text[], $3::jsonb[], $4::vector[])
+                        ON CONFLICT (tool_name) DO UPDATE SET
+                            schema_hash = EXCLUDED.schema_hash,
+                            schema_json = EXCLUDED.schema_json,
+                            embedding = EXCLUDED.embedding,
+                            last_seen = CURRENT_TIMESTAMP
+                    """,
+                        [name for name, _ in upserts],
+                        [hashes[name] for name, _ in upserts],
+                        [json.dumps(schemas[name]) for name, _ in upserts],
+                        [vector for _, vector in upserts],
+                    )
+                if deleted:
+                    await conn.execute(
+                        f"DELETE FROM {self.table_name} WHERE tool_name = ANY($1::text[])",
+                        deleted,
+                    )
 
-        return
+        logger.info(
+            f"Registry: Successfully synchronized {len(upserts)} tools "
+            f"({len(unchanged)} unchanged, {len(deleted)} deleted, {len(changed) - len(upserts)} skipped)."
+        )
 
     async def search_tools(self, query: str, limit: int | None = None, min_similarity: float | None = None) -> List[Dict[str, Any]]:
         """Semantic search for tools.
@@ -239,9 +208,9 @@ class PostgresToolRegistry:
             max_distance = 1.0 - min_similarity
             
             async with pool.acquire() as conn:
-                await register_vector(conn)
+                await ensure_vector_codec(conn)
                 
-                rows = await conn.fetch(f"""
+                rows = await pool.fetch_prepared(conn, f"""
                     SELECT schema_json, (embedding <=> $1) as distance 
                     FROM {self.table_name}
                     WHERE (embedding <=> $1) < $3
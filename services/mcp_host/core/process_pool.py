@@ -0,0 +1,432 @@
+"""
+Warm MCP Server Process Pool.
+
+Keeps a bounded set of pre-connected server processes per MCP server so tool
+calls reuse a live interpreter (and its in-process caches such as loaded
+spaCy models or DuckDB connections) instead of paying `uv run` start-up and
+the JSON-RPC handshake on every call.
+
+Each pool enforces min/max size, a per-process concurrency limit, idle
+reaping, periodic health checks and replacement of crashed processes.
+"""
+import asyncio
+import collections
+import dataclasses
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple
+
+from shared.config import MCPPoolSettings, get_settings
+from shared.logging.main import get_logger
+from shared.mcp.client import MCPClient
+
+
+logger = get_logger(__name__)
+
+# A spawner starts one server process and returns its connected client.
+Spawner = Callable[[], Awaitable[Tuple[MCPClient, asyncio.subprocess.Process]]]
+
+
+class PoolClosedError(RuntimeError):
+    """Raised when a call is routed to a pool that has been shut down."""
+
+
+@dataclasses.dataclass
+class PooledProcess:
+    """A single warm server process and its bookkeeping."""
+    client: MCPClient
+    process: asyncio.subprocess.Process
+    created_at: float
+    last_used: float
+    in_flight: int = 0
+    calls: int = 0
+    retiring: bool = False
+    stderr_tail: Deque[str] = dataclasses.field(default_factory=collections.deque)
+    stderr_task: asyncio.Task | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+
+class ServerProcessPool:
+    """
+    Pool of warm processes for a single MCP server.
+
+    Example:
+        pool = ServerProcessPool("pandas_server", spawner)
+        await pool.start()
+        result = await pool.call_tool("read_csv", {"path": "data.csv"})
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        server_name: str,
+        spawner: Spawner,
+        config: MCPPoolSettings | None = None,
+    ) -> None:
+        self.server_name = server_name
+        self._spawner = spawner
+        self.config = config or get_settings().mcp.pool
+
+        self._workers: List[PooledProcess] = []
+        self._spawning = 0
+        self._cond = asyncio.Condition()
+        self._closed = False
+        self._maintenance_task: asyncio.Task | None = None
+        self._background: set[asyncio.Task] = set()
+        self._spawn_failures = 0
+
+        # Counters surfaced through stats()
+        self._spawned = 0
+        self._crashed = 0
+        self._reaped = 0
+        self._recycled = 0
+        self._calls = 0
+        self._waits = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the maintenance loop and warm the pool up to min_size."""
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        await self._replenish()
+
+    async def close(self) -> None:
+        """Stop maintenance and terminate every process in the pool."""
+        self._closed = True
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+
+        async with self._cond:
+            workers = list(self._workers)
+            self._workers.clear()
+            self._cond.notify_all()
+
+        await asyncio.gather(*(self._terminate(w) for w in workers), return_exceptions=True)
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def call_tool(self, tool_name: str, arguments: dict) -> Any:
+        """Run a tool on a warm process, spawning one if capacity allows."""
+        worker = await self._acquire()
+        try:
+            return await self._call_or_crash(worker, tool_name, arguments)
+        except Exception:
+            if not worker.alive:
+                logger.warning(
+                    f"💥 {self.server_name} process exited during {tool_name} "
+                    f"(code={worker.process.returncode})",
+                    stderr_tail="\n".join(list(worker.stderr_tail)[-20:]),
+                )
+            raise
+        finally:
+            await self._release(worker)
+
+    async def _call_or_crash(self, worker: PooledProcess, tool_name: str, arguments: dict) -> Any:
+        """Race the call against process exit so a crash fails fast instead of
+        waiting out the client request timeout."""
+        call = asyncio.ensure_future(worker.client.call_tool(tool_name, arguments))
+        exited = asyncio.ensure_future(worker.process.wait())
+        try:
+            await asyncio.wait({call, exited}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        finally:
+            exited.cancel()
+
+        if call.done():
+            return call.result()
+        call.cancel()
+        raise RuntimeError(
+            f"MCP server {self.server_name} exited (code={worker.process.returncode}) "
+            f"while running {tool_name}"
+        )
+
+    async def _acquire(self) -> PooledProcess:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.acquire_timeout
+
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolClosedError(f"Process pool for {self.server_name} is closed")
+
+                self._evict_dead_locked()
+                worker = self._pick_locked()
+                if worker:
+                    worker.in_flight += 1
+                    return worker
+
+                if len(self._workers) + self._spawning < self.config.max_size:
+                    self._spawning += 1
+                    break
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"No free process for {self.server_name} within "
+                        f"{self.config.acquire_timeout}s (max_size={self.config.max_size})"
+                    )
+                self._waits += 1
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+
+        # The spawn (including any backoff) counts against the same deadline
+        # as waiting for a slot, so acquire never blocks past acquire_timeout.
+        try:
+            worker = await asyncio.wait_for(
+                self._spawn(), timeout=max(deadline - loop.time(), 0.0)
+            )
+        except asyncio.TimeoutError:
+            async with self._cond:
+                self._spawning -= 1
+                self._cond.notify_all()
+            raise TimeoutError(
+                f"Spawning a process for {self.server_name} exceeded "
+                f"{self.config.acquire_timeout}s"
+            ) from None
+        except BaseException:
+            async with self._cond:
+                self._spawning -= 1
+                self._cond.notify_all()
+            raise
+
+        async with self._cond:
+            self._spawning -= 1
+            if not self._closed:
+                worker.in_flight = 1
+                self._workers.append(worker)
+                self._cond.notify_all()
+                return worker
+        # close() ran while this process was starting; don't leak it.
+        await self._terminate(worker)
+        raise PoolClosedError(f"Process pool for {self.server_name} is closed")
+
+    async def _release(self, worker: PooledProcess) -> None:
+        async with self._cond:
+            worker.in_flight -= 1
+            worker.calls += 1
+            worker.last_used = time.monotonic()
+            self._calls += 1
+
+            max_calls = self.config.max_calls_per_process
+            if max_calls and worker.calls >= max_calls and not worker.retiring:
+                worker.retiring = True
+                self._recycled += 1
+
+            if not worker.alive and worker in self._workers:
+                self._crashed += 1
+                self._remove_locked(worker)
+            elif worker.retiring and worker.in_flight == 0:
+                self._remove_locked(worker)
+            self._cond.notify_all()
+
+    def _pick_locked(self) -> PooledProcess | None:
+        """Least-loaded live process; ties go to the most recently used so
+        surplus processes stay idle long enough to be reaped."""
+        limit = self.config.max_concurrency_per_process
+        candidates = [
+            w for w in self._workers
+            if w.alive and not w.retiring and w.in_flight < limit
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: (w.in_flight, -w.last_used))
+
+    # ------------------------------------------------------------------
+    # Spawning / termination
+    # ------------------------------------------------------------------
+
+    async def _spawn(self) -> PooledProcess:
+        if self._spawn_failures:
+            delay = min(
+                self.config.restart_backoff_seconds * (2 ** (self._spawn_failures - 1)),
+                self.config.restart_backoff_max_seconds,
+            )
+            await asyncio.sleep(delay)
+
+        try:
+            client, process = await self._spawner()
+        except Exception:
+            self._spawn_failures += 1
+            raise
+
+        self._spawn_failures = 0
+        self._spawned += 1
+        now = time.monotonic()
+        worker = PooledProcess(
+            client=client,
+            process=process,
+            created_at=now,
+            last_used=now,
+            stderr_tail=collections.deque(maxlen=self.config.stderr_tail_lines),
+        )
+        # A long-lived process that logs to a never-read stderr pipe would
+        # eventually block on a full buffer; keep draining it.
+        if process.stderr:
+            worker.stderr_task = asyncio.create_task(self._drain_stderr(worker))
+        logger.info(f"♨️ Warm process ready for {self.server_name} (pid={process.pid})")
+        return worker
+
+    @staticmethod
+    async def _drain_stderr(worker: PooledProcess) -> None:
+        stream = worker.process.stderr
+        try:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                worker.stderr_tail.append(line.decode("utf-8", errors="replace").rstrip())
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    def _remove_locked(self, worker: PooledProcess) -> None:
+        if worker not in self._workers:
+            return
+        self._workers.remove(worker)
+        task = asyncio.create_task(self._terminate(worker))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _evict_dead_locked(self) -> None:
+        for worker in [w for w in self._workers if not w.alive]:
+            self._crashed += 1
+            logger.warning(
+                f"💥 {self.server_name} process pid={worker.process.pid} died "
+                f"(code={worker.process.returncode}); replacing"
+            )
+            self._remove_locked(worker)
+
+    async def _terminate(self, worker: PooledProcess) -> None:
+        try:
+            await worker.client.close()
+        except Exception as e:
+            logger.debug(f"Error closing client for {self.server_name}: {e}")
+
+        if worker.alive:
+            try:
+                worker.process.terminate()
+                await asyncio.wait_for(
+                    worker.process.wait(), timeout=self.config.health_check_timeout
+                )
+            except asyncio.TimeoutError:
+                worker.process.kill()
+                await worker.process.wait()
+            except ProcessLookupError:
+                pass
+
+        if worker.stderr_task:
+            worker.stderr_task.cancel()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    async def _maintenance_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.config.health_check_interval)
+            try:
+                await self._maintain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Pool maintenance failed for {self.server_name}: {e}")
+
+    async def _maintain(self) -> None:
+        """Reap idle surplus, recycle unhealthy processes and refill to min_size."""
+        now = time.monotonic()
+        async with self._cond:
+            self._evict_dead_locked()
+
+            idle = sorted(
+                (w for w in self._workers if w.in_flight == 0 and not w.retiring),
+                key=lambda w: w.last_used,
+            )
+            surplus = len(self._workers) - self.config.min_size
+            for worker in idle:
+                if surplus <= 0:
+                    break
+                if now - worker.last_used >= self.config.idle_timeout:
+                    self._reaped += 1
+                    surplus -= 1
+                    self._remove_locked(worker)
+
+            to_check = [w for w in self._workers if w.in_flight == 0 and not w.retiring]
+
+        for worker in to_check:
+            healthy = False
+            try:
+                healthy = await asyncio.wait_for(
+                    worker.client.ping(), timeout=self.config.health_check_timeout
+                )
+            except asyncio.TimeoutError:
+                pass
+            if not healthy:
+                logger.warning(f"🩺 {self.server_name} pid={worker.process.pid} failed health check")
+                async with self._cond:
+                    if worker.in_flight == 0:
+                        self._recycled += 1
+                        self._remove_locked(worker)
+                    else:
+                        worker.retiring = True
+
+        await self._replenish()
+
+    async def _replenish(self) -> None:
+        while not self._closed and self._spawn_failures < self.config.max_restart_attempts:
+            async with self._cond:
+                if len(self._workers) + self._spawning >= self.config.min_size:
+                    return
+                self._spawning += 1
+            try:
+                worker = await self._spawn()
+            except Exception as e:
+                logger.warning(f"Warm spawn failed for {self.server_name}: {e}")
+                async with self._cond:
+                    self._spawning -= 1
+                continue
+            async with self._cond:
+                self._spawning -= 1
+                if not self._closed:
+                    self._workers.append(worker)
+                    self._cond.notify_all()
+                    continue
+            # close() ran while this process was starting; don't leak it.
+            await self._terminate(worker)
+            return
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "server": self.server_name,
+            "size": len(self._workers),
+            "spawning": self._spawning,
+            "in_flight": sum(w.in_flight for w in self._workers),
+            "idle": sum(1 for w in self._workers if w.in_flight == 0),
+            "spawned": self._spawned,
+            "crashed": self._crashed,
+            "reaped": self._reaped,
+            "recycled": self._recycled,
+            "calls": self._calls,
+            "waits": self._waits,
+            "spawn_failures": self._spawn_failures,
+        }
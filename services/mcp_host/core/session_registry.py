@@ -7,7 +7,6 @@ Replaces static configuration with auto-discovery and on-demand spawning.
 import asyncio
 import os
 import sys
-import ast
 from pathlib import Path
 from typing import Dict, List, Any
 import dataclasses
@@ -17,6 +16,10 @@ from shared.mcp.client import MCPClient
 from shared.mcp.protocol import Tool
 from shared.mcp.transport import SubprocessTransport
 from shared.config import get_settings
+from services.mcp_host.core.process_pool import ServerProcessPool
+from services.mcp_host.core.discovery_snapshot import (
+    DiscoverySnapshot, iter_server_scripts, scan_server_source,
+)
 
 
 logger = get_logger(__name__)
@@ -42,6 +45,9 @@ class SessionRegistry:
         
         # Keep track of processes to terminate them later - per-instance
         self.active_processes: Dict[str, asyncio.subprocess.Process] = {}
+
+        # Warm process pools (server_name -> pool) - per-instance (loop-bound)
+        self.pools: Dict[str, ServerProcessPool] = {}
         
         # Postgres Backend (RAG)
         try:
@@ -99,7 +105,8 @@ class SessionRegistry:
             if self.pg_registry and self.discovered_tools:
                 logger.info(f"🔄 Syncing {len(self.discovered_tools)} statically discovered tools to RAG...")
                 try:
-                    await self.pg_registry.sync_tools(self.discovered_tools)
+                    # The static discovery set is authoritative: drop tools that no longer exist
+                    await self.pg_registry.sync_tools(self.discovered_tools, prune=True)
                 except Exception as e:
                     logger.error(f"❌ Failed to sync discovered tools to RAG: {e}")
 
@@ -124,18 +131,15 @@ class SessionRegistry:
 
         logger.debug(f"Scanning for MCP servers in: {base_path}")
         
-        # Strategy 1: Top level .py
-        for file_path in base_path.glob("*.py"):
-            if file_path.name == "__init__.py":
-                continue
-            self._register_script(file_path.stem, file_path)
-            
-        # Strategy 2: Subdirectories
-        for dir_path in base_path.iterdir():
-            if dir_path.is_dir():
-                server_script = dir_path / "server.py"
-                if server_script.exists():
-                    self._register_script(dir_path.name, server_script)
+        # Reuse parsed results for unchanged scripts across process starts
+        snapshot = DiscoverySnapshot.load() if get_settings().mcp.discovery_snapshot_enabled else None
+        
+        for server_name, script_path in iter_server_scripts(base_path):
+            self._register_script(server_name, script_path, snapshot)
+        
+        if snapshot is not None:
+            snapshot.save()
+            logger.debug(f"Discovery snapshot: {snapshot.rescanned} server(s) re-parsed")
         
         logger.info(
             "mcp_discovery_completed", 
@@ -143,7 +147,7 @@ class SessionRegistry:
             tools_found=len(self.discovered_tools)
         )
 
-    def _register_script(self, server_name: str, script_path: Path):
+    def _register_script(self, server_name: str, script_path: Path, snapshot: DiscoverySnapshot | None = None):
         """Register a server script configuration."""
         env = os.environ.copy()
         env["PYTHONUNBUFFERED"] = "1"
@@ -156,141 +160,29 @@ class SessionRegistry:
             env=env
         )
         # Static Analysis: Discover tools without spawning
-        self._scan_tools_static(server_name, script_path)
+        self._scan_tools_static(server_name, script_path, snapshot)
 
-    def _scan_tools_static(self, server_name: str, script_path: Path):
+    def _scan_tools_static(self, server_name: str, script_path: Path, snapshot: DiscoverySnapshot | None = None):
         """
-        Parse the server script statically to find tool definitions.
-        Supports:
-        1. Legacy: self.register_tool(name="tool")
-        2. FastMCP: @mcp.tool() decorators
+        Find the server's tool definitions statically (see discovery_snapshot),
+        from the snapshot when the script is unchanged.
         """
-        import ast
-        try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                tree = ast.parse(f.read())
-            
-            for node in ast.walk(tree):
-                # 1. Legacy: self.register_tool(...)
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Attribute) and node.func.attr == "register_tool":
-                        tool_name = None
-                        for keyword in node.keywords:
-                            if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
-                                tool_name = keyword.value.value
-                                break
-                        if tool_name:
-                            SessionRegistry._shared_tool_to_server[tool_name] = server_name
-
-                # 2. FastMCP: @mcp.tool() decorators on functions (Sync & Async)
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    is_tool = False
-                    for decorator in node.decorator_list:
-                        # Case A: @mcp.tool() - Call
-                        if isinstance(decorator, ast.Call):
-                            func = decorator.func
-                            if isinstance(func, ast.Attribute) and func.attr == "tool":
-                                is_tool = True
-                            elif isinstance(func, ast.Name) and func.id == "tool":
-                                is_tool = True
-                        
-                        # Case B: @mcp.tool - Attribute/Name (rare but possible)
-                        elif isinstance(decorator, ast.Attribute) and decorator.attr == "tool":
-                            is_tool = True
-                        elif isinstance(decorator, ast.Name) and decorator.id == "tool":
-                            is_tool = True
-
-                    if is_tool:
-                        tool_name = node.name
-                        SessionRegistry._shared_tool_to_server[tool_name] = server_name
-                        
-                        # Extract Docstring for RAG (use function name as fallback)
-                        docstring = ast.get_docstring(node)
-                        description = docstring or f"Tool: {tool_name} from {server_name}"
-                        
-                        # Extract Schema from AST
-                        try:
-                            input_schema = self._extract_schema_from_node(node)
-                        except Exception as e:
-                            logger.warning(f"   ⚠️ Schema extraction failed for {tool_name}: {e}")
-                            input_schema = {}
-
-                        # Create a Tool object with SCHEMA for RAG indexing and Planning
-                        tool_obj = Tool(
-                            name=tool_name,
-                            description=description,
-                            inputSchema=input_schema, 
-                        )
-                        SessionRegistry._shared_discovered_tools.append(tool_obj)
-
-        except Exception as e:
-            logger.warning(f"Static scan failed for {server_name}: {e}")
-
-    def _extract_schema_from_node(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> dict:
-        """
-        Extract JSON schema from AST function node.
-        Crucial for RAG to know about parameters and for Planner to know how to call the tool.
-        """
-        import ast
-        
-        properties = {}
-        required = []
-        
-        # Parse arguments
-        args = node.args.args
+        if snapshot is not None:
+            entry = snapshot.scan(server_name, script_path)
+        else:
+            try:
+                entry = scan_server_source(server_name, script_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"Static scan failed for {server_name}: {e}")
+                return
         
-        # Handle 'self' or 'cls' exclusion if it's a method (though FastMCP usually decorates standalone functions)
-        # But we don't have enough context to know if it's a method, assume simple functions for now
-        # or filter 'self' if present.
+        for tool_name in entry["legacy_tools"]:
+            SessionRegistry._shared_tool_to_server[tool_name] = server_name
         
-        for arg in args:
-            if arg.arg in ('self', 'cls'):
-                continue
-                
-            param_name = arg.arg
-            param_type = "string" # Default
-            
-            # Try to infer type from annotation
-            if arg.annotation:
-                try:
-                    type_str = ast.unparse(arg.annotation)
-                    # rudimentary mapping
-                    if type_str in ('int', 'float', 'complex'):
-                        param_type = "number"
-                    elif type_str == 'bool':
-                        param_type = "boolean"
-                    elif type_str in ('dict', 'Dict'):
-                        param_type = "object"
-                    elif type_str.startswith(('list', 'List')):
-                        param_type = "array"
-                except:
-                    pass
-            
-            properties[param_name] = {
-                "type": param_type,
-                "description": f"Parameter {param_name}" 
-            }
-            required.append(param_name)
-            
-        # Handle defaults (remove from required)
-        # node.args.defaults corresponds to the last N args
-        if node.args.defaults:
-            num_defaults = len(node.args.defaults)
-            # The args that have defaults are the last num_defaults ones
-            # args list: [a, b, c, d]
-            # defaults list: [1, 2] -> c has default 1, d has default 2
-            # args with defaults: args[-num_defaults:]
-            
-            args_with_defaults = args[-num_defaults:]
-            for arg in args_with_defaults:
-                if arg.arg in required:
-                    required.remove(arg.arg)
-
-        return {
-            "type": "object",
-            "properties": properties,
-            "required": required
-        }
+        for tool in entry["tools"]:
+            SessionRegistry._shared_tool_to_server[tool["name"]] = server_name
+            # Tool object with SCHEMA for RAG indexing and Planning
+            SessionRegistry._shared_discovered_tools.append(Tool(**tool))
 
     async def get_session(self, server_name: str) -> MCPClient:
         """
@@ -302,13 +194,24 @@ class SessionRegistry:
             client = self.active_sessions[server_name]
             return client
 
-        # B. Check if we know how to start it
+        # B./C. Check config and SPAWN (JIT)
+        client, process = await self._spawn_process(server_name)
+        self.active_sessions[server_name] = client
+        self.active_processes[server_name] = process
+        return client
+
+    async def _spawn_process(self, server_name: str) -> tuple[MCPClient, asyncio.subprocess.Process]:
+        """
+        Start one server process and complete the MCP handshake.
+        Shared by the JIT session path and the warm process pools.
+        """
         if server_name not in self.server_configs:
             raise ValueError(f"Unknown MCP Server: {server_name}. Available: {list(self.server_configs.keys())}")
 
-        # C. SPAWN (JIT)
         logger.info(f"🚀 Spawning JIT Server: {server_name}...")
         config = self.server_configs[server_name]
+        process = None
+        client = None
         
         try:
             # Detect UV
@@ -396,15 +299,12 @@ class SessionRegistry:
                 process.terminate()
                 raise TimeoutError(f"Server {server_name} did not respond in {connect_timeout}s.\n\n=== STDERR ===\n{stderr_output}\n=== END STDERR ===")
             
-            self.active_sessions[server_name] = client
-            self.active_processes[server_name] = process
-            
             logger.info(f"✅ Connected to {server_name}")
-            return client
+            return client, process
             
         except Exception as e:
             # On any failure, try to capture stderr for debugging
-            if 'process' in locals() and process.stderr:
+            if process is not None and process.stderr:
                 try:
                     stderr_data = await asyncio.wait_for(process.stderr.read(65536), timeout=5.0)
                     stderr_output = stderr_data.decode('utf-8', errors='replace')
@@ -417,6 +317,20 @@ class SessionRegistry:
                     pass
             logger.error(f"❌ Failed to spawn {server_name}: {e}")
             raise
+        except BaseException:
+            # Cancelled mid-handshake (e.g. a pool acquire deadline): nobody
+            # else holds the process, so stop it before propagating.
+            if client is not None:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+            if process is not None and process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+            raise
 
     async def list_all_tools(self) -> List[dict]:
         """
@@ -482,13 +396,63 @@ class SessionRegistry:
         finally:
             # 3. Unload/Terminate immediately
             logger.info(f"🛑 Ephemeral cleanup: Stopping {server_name}...")
-            await self.stop_server(server_name)
+            await self._stop_session(server_name)
             
+    async def get_pool(self, server_name: str) -> ServerProcessPool:
+        """
+        Returns the warm process pool for a server, creating it on first use.
+        """
+        pool = self.pools.get(server_name)
+        if pool is None:
+            if server_name not in self.server_configs:
+                raise ValueError(f"Unknown MCP Server: {server_name}. Available: {list(self.server_configs.keys())}")
+            pool = ServerProcessPool(
+                server_name,
+                spawner=lambda: self._spawn_process(server_name),
+            )
+            self.pools[server_name] = pool
+            await pool.start()
+        return pool
+
+    async def execute_tool_pooled(self, server_name: str, tool_name: str, arguments: dict) -> Any:
+        """
+        Executes a tool on a warm pooled process for the server.
+
+        Processes outlive the call, so interpreter start-up, the JSON-RPC
+        handshake and any per-server in-process caches are paid once per
+        process rather than once per call. Falls back to ephemeral execution
+        when pooling is disabled in settings.
+        """
+        if not get_settings().mcp.pool.enabled:
+            return await self.execute_tool_ephemeral(server_name, tool_name, arguments)
+
+        pool = await self.get_pool(server_name)
+        logger.info(f"▶️ Executing {tool_name} on {server_name} (pooled)...")
+        return await pool.call_tool(tool_name, arguments)
+
+    def pool_stats(self) -> List[dict]:
+        """Snapshot of every warm process pool."""
+        return [pool.stats() for pool in self.pools.values()]
+
     async def stop_server(self, server_name: str) -> bool:
         """
         Stop a specific server to free resources.
         """
         stopped = False
+        pool = self.pools.pop(server_name, None)
+        if pool:
+            stopped = pool.stats()["size"] > 0
+            await pool.close()
+            if stopped:
+                logger.info(f"🛑 Drained process pool: {server_name}")
+
+        return await self._stop_session(server_name) or stopped
+
+    async def _stop_session(self, server_name: str) -> bool:
+        """
+        Stop the JIT session process for a server (pools are left running).
+        """
+        stopped = False
         if server_name in self.active_sessions:
             try:
                 await self.active_sessions[server_name].close()
@@ -521,11 +485,8 @@ class SessionRegistry:
              # For now, just fail or default
              raise ValueError(f"Tool '{tool_name}' not found in registry")
         
-        # Use ephemeral execution or persistent session?
-        # For internal kernel calls, let's use get_session (persistent/JIT)
-        session = await self.get_session(server_name)
-        result = await session.call_tool(tool_name, arguments)
-        return result
+        # Internal kernel calls share the warm process pool
+        return await self.execute_tool_pooled(server_name, tool_name, arguments)
 
     def get_server_for_tool(self, tool_name: str) -> str | None:
         """Get the server name that provides a tool."""
@@ -552,6 +513,10 @@ class SessionRegistry:
 
     async def shutdown(self):
         """Cleanup all processes"""
+        for name, pool in self.pools.items():
+            await pool.close()
+        self.pools.clear()
+
         for name, client in self.active_sessions.items():
             await client.close()
             
@@ -45,6 +45,8 @@ async def lifespan(_app: FastAPI):
     yield
     # Shutdown: Stop servers
     await registry.shutdown()
+    from shared.http_pool import close_http_clients
+    await close_http_clients()
 
 
 from shared.config import get_settings
@@ -78,6 +80,7 @@ async def health():
         "service": "mcp_host",
         "servers_available": count,
         "active_sessions": len(registry.active_sessions),
+        "pools": registry.pool_stats(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -168,8 +171,8 @@ async def execute_tool(request: ToolRequest):
         if not server_name:
             raise ValueError(f"Tool {request.tool_name} not found in any server")
 
-        # Ephemeral Execution (Spawn -> Run -> Stop)
-        result = await registry.execute_tool_ephemeral(
+        # Pooled Execution (Warm process reuse)
+        result = await registry.execute_tool_pooled(
             server_name, 
             request.tool_name, 
             request.arguments
@@ -216,8 +219,8 @@ async def execute_batch(request: BatchToolRequest):
             if not server_name:
                 raise ValueError(f"Tool {task.tool_name} not found")
                 
-            # Ephemeral Execution
-            res = await registry.execute_tool_ephemeral(
+            # Pooled Execution
+            res = await registry.execute_tool_pooled(
                 server_name, 
                 task.tool_name, 
                 task.arguments
@@ -0,0 +1,292 @@
+"""
+ML Inference Service — Cross-Request Micro-Batcher.
+
+Coalesces concurrent embed/rerank requests into a single model call.
+The first request to arrive opens a collection window of
+``batch_max_wait_ms``; every request that lands inside the window (up to
+the item and token budget) is flattened into one input list, run through
+the provider once under the GPU inference semaphore, and the outputs are
+sliced back to the callers that submitted them.
+
+Queue depth and batch-size histograms are exported on ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import time
+from typing import Any, Awaitable, Callable, Deque, Generic, Sequence, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from shared.config import MLInferenceSettings, get_settings
+from shared.logging.main import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BATCH_QUEUE_DEPTH = Gauge(
+    "ml_inference_batch_queue_depth",
+    "Items waiting to be batched",
+    ["kind"],
+)
+BATCH_SIZE = Histogram(
+    "ml_inference_batch_size",
+    "Items per coalesced model call",
+    ["kind"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+BATCH_REQUESTS = Histogram(
+    "ml_inference_batch_requests",
+    "HTTP requests merged into one model call",
+    ["kind"],
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+BATCH_WAIT = Histogram(
+    "ml_inference_batch_wait_seconds",
+    "Time a request spent queued before its batch started",
+    ["kind"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+BATCH_FAILURES = Counter(
+    "ml_inference_batch_failures_total",
+    "Coalesced model calls that raised",
+    ["kind"],
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) for batch budgeting."""
+    return len(text) // 4 + 1
+
+
+@dataclasses.dataclass
+class _Pending(Generic[T]):
+    items: Sequence[T]
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Dynamic batching queue in front of a list-in/list-out model call.
+
+    Example:
+        batcher = MicroBatcher("embed", provider.embed, cost=estimate_tokens)
+        vectors = await batcher.submit(["hello", "world"])
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        runner: Callable[[list[T]], Awaitable[list[R]]],
+        cost: Callable[[T], int],
+        semaphore: Callable[[], asyncio.Semaphore] | None = None,
+        config: MLInferenceSettings | None = None,
+    ) -> None:
+        self.kind = kind
+        self._runner = runner
+        self._cost = cost
+        self._semaphore = semaphore
+        self.config = config or get_settings().ml_inference
+
+        self._queue: Deque[_Pending[T]] = collections.deque()
+        self._queued_items = 0
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+
+        # Counters surfaced through stats()
+        self._batches = 0
+        self._requests = 0
+        self._items = 0
+
+    async def submit(self, items: Sequence[T]) -> list[R]:
+        """Queue items and wait for their outputs, in the same order."""
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        pending = _Pending(
+            items=items,
+            tokens=sum(self._cost(item) for item in items),
+            future=loop.create_future(),
+            enqueued_at=loop.time(),
+        )
+        self._queue.append(pending)
+        self._queued_items += len(items)
+        BATCH_QUEUE_DEPTH.labels(self.kind).set(self._queued_items)
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        return await pending.future
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while self._queue:
+            await self._collect_window()
+            batch = self._take_batch()
+            if batch:
+                await self._execute(batch)
+
+    async def _collect_window(self) -> None:
+        """Wait until the oldest request's window closes or the budget is full."""
+        loop = asyncio.get_running_loop()
+        deadline = self._queue[0].enqueued_at + self.config.batch_max_wait_ms / 1000
+        while not self._budget_full():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _budget_full(self) -> bool:
+        tokens = sum(p.tokens for p in self._queue)
+        return (
+            self._queued_items >= self.config.batch_max_items
+            or tokens >= self.config.batch_max_tokens
+        )
+
+    def _take_batch(self) -> list[_Pending[T]]:
+        """Pop requests in arrival order while they fit the budget.
+
+        The first request is always taken so an oversized one still runs.
+        """
+        batch: list[_Pending[T]] = []
+        items = tokens = 0
+        while self._queue:
+            head = self._queue[0]
+            if head.future.done():  # Caller went away while queued
+                self._queue.popleft()
+                self._queued_items -= len(head.items)
+                continue
+            if batch and (
+                items + len(head.items) > self.config.batch_max_items
+                or tokens + head.tokens > self.config.batch_max_tokens
+            ):
+                break
+            self._queue.popleft()
+            self._queued_items -= len(head.items)
+            batch.append(head)
+            items += len(head.items)
+            tokens += head.tokens
+
+        BATCH_QUEUE_DEPTH.labels(self.kind).set(self._queued_items)
+        return batch
+
+    async def _execute(self, batch: list[_Pending[T]]) -> None:
+        flat: list[T] = [item for pending in batch for item in pending.items]
+        now = asyncio.get_running_loop().time()
+        for pending in batch:
+            BATCH_WAIT.labels(self.kind).observe(now - pending.enqueued_at)
+        BATCH_SIZE.labels(self.kind).observe(len(flat))
+        BATCH_REQUESTS.labels(self.kind).observe(len(batch))
+
+        start = time.perf_counter()
+        try:
+            if self._semaphore is not None:
+                async with self._semaphore():
+                    outputs = await self._runner(flat)
+            else:
+                outputs = await self._runner(flat)
+            if len(outputs) != len(flat):
+                raise RuntimeError(
+                    f"{self.kind} runner returned {len(outputs)} outputs for {len(flat)} inputs"
+                )
+        except Exception as e:
+            BATCH_FAILURES.labels(self.kind).inc()
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        self._batches += 1
+        self._requests += len(batch)
+        self._items += len(flat)
+        if len(batch) > 1:
+            logger.debug(
+                f"Batched {len(batch)} {self.kind} requests ({len(flat)} items) "
+                f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
+
+        offset = 0
+        for pending in batch:
+            count = len(pending.items)
+            if not pending.future.done():
+                pending.future.set_result(list(outputs[offset:offset + count]))
+            offset += count
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "queued_requests": len(self._queue),
+            "queued_items": self._queued_items,
+            "batches": self._batches,
+            "requests": self._requests,
+            "items": self._items,
+            "avg_batch_items": self._items / self._batches if self._batches else 0.0,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Provider adapters
+# ---------------------------------------------------------------------------
+
+
+def length_sorted(
+    runner: Callable[[list[str]], Awaitable[list[R]]],
+) -> Callable[[list[str]], Awaitable[list[R]]]:
+    """Run texts shortest-first so each padded sub-batch wastes fewer
+    positions, then restore the caller's order."""
+    async def run(texts: list[str]) -> list[R]:
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        outputs = await runner([texts[i] for i in order])
+        restored: list[Any] = [None] * len(texts)
+        for position, i in enumerate(order):
+            restored[i] = outputs[position]
+        return restored
+    return run
+
+
+def embedding_batcher(
+    provider: Any,
+    semaphore: Callable[[], asyncio.Semaphore] | None = None,
+) -> MicroBatcher[str, list[float]]:
+    """Batcher over provider.embed(); queries are pre-formatted by the caller."""
+    return MicroBatcher(
+        "embed",
+        length_sorted(provider.embed),
+        cost=estimate_tokens,
+        semaphore=semaphore,
+    )
+
+
+def reranker_batcher(
+    provider: Any,
+    semaphore: Callable[[], asyncio.Semaphore] | None = None,
+) -> MicroBatcher[tuple[str, str], float]:
+    """Batcher over provider.score_pairs(); pairs from different queries mix."""
+    return MicroBatcher(
+        "rerank",
+        provider.score_pairs,
+        cost=lambda pair: estimate_tokens(pair[0]) + estimate_tokens(pair[1]),
+        semaphore=semaphore,
+    )
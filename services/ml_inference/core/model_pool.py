@@ -146,14 +146,16 @@ class ModelPool:
     async def _load_embedding(self) -> None:
         """Load the text embedding model."""
         try:
+            from shared.embedding.cache import with_embedding_cache
             from shared.embedding.qwen3_embedding import create_embedding_provider
 
             use_local = self._emb_device != "cpu" or self._settings.embedding.use_local
-            self._embedding_provider = create_embedding_provider(
+            # Cached at the server too, so every consumer service shares hits
+            self._embedding_provider = with_embedding_cache(create_embedding_provider(
                 use_local=use_local, 
                 device=self._emb_device,
                 use_flash_attention=self._settings.ml_inference.use_flash_attention
-            )
+            ))
             # FORCE LOAD NOW
             logger.info(f"Model Pool: Pre-loading embedding model on {self._emb_device}...")
             await self._embedding_provider.load()
@@ -31,6 +31,11 @@ from shared.config import get_settings
 from shared.logging.main import get_logger, setup_logging, LogConfig, RequestLoggingMiddleware
 from shared.service_registry import ServiceName, ServiceRegistry
 
+from services.ml_inference.core.batcher import (
+    MicroBatcher,
+    embedding_batcher,
+    reranker_batcher,
+)
 from services.ml_inference.core.model_pool import ModelPool, ModelRole, get_model_pool
 from services.ml_inference.core.schemas import (
     EmbedRequest,
@@ -86,6 +91,24 @@ def _get_inference_semaphore() -> asyncio.Semaphore:
     return _inference_semaphore
 
 
+# ---------------------------------------------------------------------------
+# Cross-request micro-batching
+# ---------------------------------------------------------------------------
+# With batching enabled, requests no longer hold the semaphore themselves:
+# they are queued and the batcher takes it once per coalesced model call.
+_batchers: dict[str, MicroBatcher] = {}
+
+
+def _get_batcher(kind: str, provider) -> MicroBatcher:
+    """Get or create the batcher for 'embed' or 'rerank'."""
+    batcher = _batchers.get(kind)
+    if batcher is None:
+        factory = embedding_batcher if kind == "embed" else reranker_batcher
+        batcher = factory(provider, _get_inference_semaphore)
+        _batchers[kind] = batcher
+    return batcher
+
+
 # ---------------------------------------------------------------------------
 # Lifespan
 # ---------------------------------------------------------------------------
@@ -281,8 +304,11 @@ async def embed_texts(request: EmbedRequest):
 
     try:
         provider = pool.get_embedding_provider()
-        async with _get_inference_semaphore():
-            embeddings = await provider.embed(request.texts)
+        if settings.ml_inference.batching_enabled:
+            embeddings = await _get_batcher("embed", provider).submit(request.texts)
+        else:
+            async with _get_inference_semaphore():
+                embeddings = await provider.embed(request.texts)
 
         return EmbedResponse(
             embeddings=[list(e) for e in embeddings],
@@ -315,8 +341,15 @@ async def embed_query(request: EmbedQueryRequest):
 
     try:
         provider = pool.get_embedding_provider()
-        async with _get_inference_semaphore():
-            embedding = await provider.embed_query(request.text)
+        if settings.ml_inference.batching_enabled:
+            # Queries share the document batch once the instruction is applied
+            batched = await _get_batcher("embed", provider).submit(
+                [provider.format_query(request.text)]
+            )
+            embedding = batched[0]
+        else:
+            async with _get_inference_semaphore():
+                embedding = await provider.embed_query(request.text)
 
         return EmbedQueryResponse(
             embedding=list(embedding),
@@ -355,13 +388,21 @@ async def rerank_documents(request: RerankRequest):
     try:
         provider = pool.get_reranker_provider()
 
-        async with _get_inference_semaphore():
-            # Use the reranker's rerank method
-            scored_results = await provider.rerank(
-                query=request.query,
-                documents=request.documents,
-                top_k=request.top_k,
+        if settings.ml_inference.batching_enabled:
+            # Score as (query, document) pairs so other requests' pairs
+            # can ride in the same forward pass
+            scores = await _get_batcher("rerank", provider).submit(
+                [(request.query, doc) for doc in request.documents]
             )
+            scored_results = list(enumerate(scores))
+        else:
+            async with _get_inference_semaphore():
+                # Use the reranker's rerank method
+                scored_results = await provider.rerank(
+                    query=request.query,
+                    documents=request.documents,
+                    top_k=request.top_k,
+                )
 
         # Build response — scored_results should be list of (index, score) or similar
         results = []
@@ -12,13 +12,13 @@ import sys
 from contextlib import asynccontextmanager
 from typing import Any
 
-import httpx
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from prometheus_client import make_asgi_app
 
 from shared.config import get_settings
+from shared.http_pool import close_http_clients, get_http_client
 from shared.logging.main import get_logger, setup_logging, LogConfig, RequestLoggingMiddleware
 from shared.service_registry import ServiceName, ServiceRegistry
 
@@ -43,6 +43,7 @@ async def lifespan(_app: FastAPI):
     logger.info("Service is in REDESIGN mode - Kernel logic removed.")
 
     yield
+    await close_http_clients()
     logger.info("Orchestrator service stopped")
 
 
@@ -114,10 +115,11 @@ async def list_tools():
     """List all available MCP tools via MCP Host service."""
     try:
         mcp_url = ServiceRegistry.get_url(ServiceName.MCP_HOST)
-        async with httpx.AsyncClient(timeout=settings.mcp.discovery_timeout) as client:
-            resp = await client.get(f"{mcp_url}/tools")
-            if resp.status_code == get_settings().status_codes.ok:
-                return resp.json()
+        resp = await get_http_client(mcp_url).get(
+            f"{mcp_url}/tools", timeout=settings.mcp.discovery_timeout
+        )
+        if resp.status_code == get_settings().status_codes.ok:
+            return resp.json()
     except Exception as e:
         logger.warning(f"Could not reach MCP Host for tool list: {e}")
     return {"tools": []}
@@ -139,19 +141,19 @@ async def call_tool(tool_name: str, arguments: dict[str, Any]):
     """Call a specific MCP tool via MCP Host service."""
     try:
         mcp_url = ServiceRegistry.get_url(ServiceName.MCP_HOST)
-        async with httpx.AsyncClient(timeout=settings.timeouts.default) as client:
-            resp = await client.post(
-                f"{mcp_url}/tools/execute",
-                json={"tool_name": tool_name, "arguments": arguments},
+        resp = await get_http_client(mcp_url).post(
+            f"{mcp_url}/tools/execute",
+            json={"tool_name": tool_name, "arguments": arguments},
+            timeout=settings.timeouts.default,
+        )
+        if resp.status_code == get_settings().status_codes.not_found:
+            raise HTTPException(
+                status_code=get_settings().status_codes.not_found, 
+                detail=f"Tool {tool_name} not found"
             )
-            if resp.status_code == get_settings().status_codes.not_found:
-                raise HTTPException(
-                    status_code=get_settings().status_codes.not_found, 
-                    detail=f"Tool {tool_name} not found"
-                )
-            if resp.status_code != get_settings().status_codes.ok:
-                raise HTTPException(status_code=resp.status_code, detail=resp.text)
-            return resp.json()
+        if resp.status_code != get_settings().status_codes.ok:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+        return resp.json()
     except HTTPException:
         raise
     except Exception as e:
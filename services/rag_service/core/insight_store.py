@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
 
 from pydantic import BaseModel, Field
 
@@ -62,36 +62,7 @@ class InsightStore:
         Returns:
             Insight ID
         """
-        # Generate ID if not provides
-        if not insight.insight_id:
-            insight.insight_id = str(uuid.uuid4())
-        
-        # Build searchable content
-        content = self._insight_to_text(insight)
-        
-        # Create document for vector store
-        metadata = {
-            "entity": insight.entity,
-            "attribute": insight.attribute,
-            "value": insight.value,
-            "unit": insight.unit,
-            "period": insight.period,
-            "origin_url": insight.origin_url,
-            "origin_title": insight.origin_title,
-            "confidence_score": insight.confidence_score,
-            "created_at": insight.created_at.isoformat(),
-        }
-        
-        if dataset_id:
-            metadata["dataset_id"] = dataset_id
-
-        doc = Document(
-            id=insight.insight_id,
-            content=content,
-            metadata=metadata,
-            embedding=embedding,  # Attach pre-computed embedding
-        )
-        
+        doc = self._insight_to_document(insight, dataset_id=dataset_id, embedding=embedding)
         await self._vector_store.add([doc])
         self._insights[insight.insight_id] = insight
         
@@ -99,12 +70,44 @@ class InsightStore:
         return insight.insight_id
     
     async def add_insights(self, insights: list[AtomicInsight], dataset_id: str | None = None) -> list[str]:
-        """Add multiple insights."""
-        ids = []
+        """Add multiple insights with a single vector store write."""
+        if not insights:
+            return []
+        docs = [self._insight_to_document(insight, dataset_id=dataset_id) for insight in insights]
+        await self._vector_store.add(docs)
         for insight in insights:
-            id = await self.add_insight(insight, dataset_id=dataset_id)
-            ids.append(id)
-        return ids
+            self._insights[insight.insight_id] = insight
+        logger.info(f"Added {len(insights)} insights via {dataset_id or 'manual'}")
+        return [insight.insight_id for insight in insights]
+
+    async def ingest_insights(
+        self,
+        insights: AsyncIterable[AtomicInsight],
+        dataset_id: str | None = None,
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Bulk-load an insight stream through the vector store's ingest path.
+
+        Args:
+            insights: Insights in a stable order (required to resume)
+            dataset_id: Optional ID of the dataset the insights belong to
+            job_id: Resumable job key; rows merged by an earlier run are skipped
+            
+        Returns:
+            Number of insights written by this run
+        """
+        async def documents() -> AsyncIterator[Document]:
+            async for insight in insights:
+                doc = self._insight_to_document(insight, dataset_id=dataset_id)
+                self._insights[insight.insight_id] = insight
+                yield doc
+
+        count = await self._vector_store.ingest(documents(), job_id=job_id)
+        if job_id:
+            await self._vector_store.clear_checkpoint(job_id)
+        logger.info(f"Ingested {count} insights via {dataset_id or 'manual'}")
+        return count
     
     async def get_insight(self, insight_id: str) -> AtomicInsight | None:
         """Get an insight by ID."""
@@ -221,6 +224,39 @@ class InsightStore:
         return [f for f in self._insights.values() if f.entity == entity]
     
     
+    def _insight_to_document(
+        self,
+        insight: AtomicInsight,
+        dataset_id: str | None = None,
+        embedding: list[float] | None = None,
+    ) -> Document:
+        """Build the vector store document for an insight."""
+        # Generate ID if not provided
+        if not insight.insight_id:
+            insight.insight_id = str(uuid.uuid4())
+        
+        metadata = {
+            "entity": insight.entity,
+            "attribute": insight.attribute,
+            "value": insight.value,
+            "unit": insight.unit,
+            "period": insight.period,
+            "origin_url": insight.origin_url,
+            "origin_title": insight.origin_title,
+            "confidence_score": insight.confidence_score,
+            "created_at": insight.created_at.isoformat(),
+        }
+        
+        if dataset_id:
+            metadata["dataset_id"] = dataset_id
+
+        return Document(
+            id=insight.insight_id,
+            content=self._insight_to_text(insight),
+            metadata=metadata,
+            embedding=embedding,  # Attach pre-computed embedding
+        )
+    
     def _insight_to_text(self, insight: AtomicInsight) -> str:
         """Convert insight to searchable text."""
         parts = [
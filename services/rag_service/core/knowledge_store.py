@@ -58,9 +58,9 @@ class KnowledgeStore:
         """Get a knowledge item by ID."""
         return await self._registry.get_by_id(knowledge_id)
 
-    async def sync(self, items: list[dict[str, Any]]) -> int:
-        """Sync knowledge items to the registry."""
-        return await self._registry.sync_knowledge(items)
+    async def sync(self, items: list[dict[str, Any]], prune: bool = False) -> int:
+        """Sync knowledge items to the registry (``prune`` deletes items not listed)."""
+        return await self._registry.sync_knowledge(items, prune=prune)
 
     async def count(self) -> int:
         """Get total number of indexed knowledge items."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
 
 # Optimize PyTorch memory allocation before other imports
@@ -280,6 +281,13 @@ async def list_entities():
 # ============================================================================
 
 
+def _ingest_job_id(request: IngestRequest) -> str:
+    """Resume key for a dataset ingest; any change to what gets read starts a fresh job."""
+    params = json.dumps({"max_rows": request.max_rows, "mapping": request.mapping}, sort_keys=True)
+    digest = hashlib.sha256(params.encode()).hexdigest()[:16]
+    return f"dataset:{request.dataset_name}:{request.split}:{digest}"
+
+
 async def _ingest_job(request: IngestRequest):
     """Background task for ingestion."""
     if not dataset_loader or not insight_store:
@@ -289,27 +297,19 @@ async def _ingest_job(request: IngestRequest):
     try:
 
         logger.info(f"Starting ingestion: {request.dataset_name}")
-        facts_buffer = []
-        count = 0
 
-        async for fact in dataset_loader.stream_dataset(
-            dataset_name=request.dataset_name,
-            split=request.split,
-            max_rows=request.max_rows,
-            mapping=request.mapping,
-        ):
-            facts_buffer.append(fact)
-
-            # Batch insert
-            if len(facts_buffer) >= get_settings().rag.batch_size:
-                await insight_store.add_insights(facts_buffer, dataset_id=request.dataset_name)
-                count += len(facts_buffer)
-                facts_buffer.clear()
-
-        # Insert remaining
-        if facts_buffer:
-            await insight_store.add_insights(facts_buffer, dataset_id=request.dataset_name)
-            count += len(facts_buffer)
+        # Streamed straight into the store's bulk path; an interrupted job
+        # resumes from its last merged batch when the same request is rerun.
+        count = await insight_store.ingest_insights(
+            dataset_loader.stream_dataset(
+                dataset_name=request.dataset_name,
+                split=request.split,
+                max_rows=request.max_rows,
+                mapping=request.mapping,
+            ),
+            dataset_id=request.dataset_name,
+            job_id=_ingest_job_id(request),
+        )
 
         logger.info(f"Ingestion complete: {request.dataset_name} ({count} insights)")
 
@@ -507,7 +507,8 @@ async def _sync_knowledge_job(domain: str | None = None, category: str | None =
 
             if items and knowledge_store:
                 try:
-                    updated = await knowledge_store.sync(items)
+                    # Only a full library scan may delete rows that vanished from disk
+                    updated = await knowledge_store.sync(items, prune=domain is None and category is None)
                     logger.info(f"✅ Sync Complete: {updated} items updated in database.")
                 except Exception as e:
                     logger.error(f"❌ Sync Failed during database update: {e}", exc_info=True)
@@ -4,9 +4,10 @@ System API Client.
 Handles authentication and communication with the API Gateway.
 """
 
+import json
 import os
 import httpx
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
 
 from shared.logging.main import get_logger
 from shared.config import get_settings
@@ -126,6 +127,23 @@ class AutonomousClient:
             **kwargs,
         )
     
+    async def stream_events(self, path: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the JSON data of each server-sent event from an authenticated GET."""
+        if not self._client:
+            raise RuntimeError("Client not initialized")
+        
+        async with self._client.stream(
+            "GET",
+            f"{self.base_url}{path}",
+            headers={**self.headers, "Accept": "text/event-stream"},
+        ) as response:
+            if response.status_code != get_settings().status_codes.ok:
+                await response.aread()
+                raise RuntimeError(f"Event stream failed: {response.status_code} {response.text}")
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    yield json.loads(line[5:].strip())
+    
     async def post(self, path: str, **kwargs) -> httpx.Response:
         """Make authenticated POST request."""
         if not self._client:
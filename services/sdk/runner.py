@@ -59,39 +59,8 @@ class JobRunner:
 
             logger.info(f"Job submitted successfully. Server ID: {job_id}")
             
-            # 2. Poll for Completion with retry on network errors
-            status = "running"
-            poll_errors = 0
-            max_poll_errors = 5  # Allow up to 5 consecutive network errors
-            
-            while status in ["running", "pending", "queued"]:
-                await asyncio.sleep(self.poll_interval)
-                
-                try:
-                    # Poll status endpoint
-                    status_resp = await self.client.get(f"/api/v1/jobs/{job_id}")
-                    poll_errors = 0  # Reset on success
-                    
-                    if status_resp.status_code != get_settings().status_codes.ok:
-                        logger.warning(f"Status check failed: {status_resp.status_code}")
-                        continue
-                    
-                    data = status_resp.json()
-                    status = data.get("status", "unknown").lower()
-                    
-                    
-                    logger.debug(f"Job {job_id} status: {status}")
-                    
-                except Exception as poll_err:
-                    poll_errors += 1
-                    logger.warning(f"Poll error {poll_errors}/{max_poll_errors}: {type(poll_err).__name__}: {poll_err}")
-                    
-                    if poll_errors >= max_poll_errors:
-                        logger.error(f"Max poll errors reached, giving up on job {job_id}")
-                        raise
-                    
-                    # Wait longer before retrying after error
-                    await asyncio.sleep(self.poll_interval * 2)
+            # 2. Wait for Completion (pushed by the gateway, polling as fallback)
+            status = await self._wait_for_completion(job_id)
             
             # 3. Retrieve Results
             if status == "completed":
@@ -130,6 +99,56 @@ class JobRunner:
             
         return self.metrics._all_jobs[-1]
     
+    async def _wait_for_completion(self, job_id: str) -> str:
+        """Follow the job's event stream to a terminal status; poll if streaming fails."""
+        status = "pending"
+        try:
+            async for event in self.client.stream_events(f"/api/v1/jobs/{job_id}/events"):
+                status = event.get("status", status).lower()
+                logger.debug(f"Job {job_id} status: {status}")
+            if status not in ["running", "pending", "queued"]:
+                return status
+        except Exception as stream_err:
+            logger.warning(f"Event stream unavailable ({type(stream_err).__name__}: {stream_err}); polling")
+        
+        return await self._poll_for_completion(job_id)
+    
+    async def _poll_for_completion(self, job_id: str) -> str:
+        """Poll the status endpoint with retry on network errors."""
+        status = "running"
+        poll_errors = 0
+        max_poll_errors = 5  # Allow up to 5 consecutive network errors
+        
+        while status in ["running", "pending", "queued"]:
+            await asyncio.sleep(self.poll_interval)
+            
+            try:
+                # Poll status endpoint
+                status_resp = await self.client.get(f"/api/v1/jobs/{job_id}")
+                poll_errors = 0  # Reset on success
+                
+                if status_resp.status_code != get_settings().status_codes.ok:
+                    logger.warning(f"Status check failed: {status_resp.status_code}")
+                    continue
+                
+                data = status_resp.json()
+                status = data.get("status", "unknown").lower()
+                
+                logger.debug(f"Job {job_id} status: {status}")
+                
+            except Exception as poll_err:
+                poll_errors += 1
+                logger.warning(f"Poll error {poll_errors}/{max_poll_errors}: {type(poll_err).__name__}: {poll_err}")
+                
+                if poll_errors >= max_poll_errors:
+                    logger.error(f"Max poll errors reached, giving up on job {job_id}")
+                    raise
+                
+                # Wait longer before retrying after error
+                await asyncio.sleep(self.poll_interval * 2)
+        
+        return status
+    
     async def cleanup(self):
         """Cleanup resources."""
         # Optional: Cancel pending jobs
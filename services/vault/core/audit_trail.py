@@ -3,10 +3,15 @@ Audit Trail System.
 
 Provides immutable audit logging for compliance requirements.
 Supports PostgreSQL (production) and In-Memory (testing).
+
+Entries are buffered by an ``AuditWriter`` and written in group commits.
+Each entry is hash-chained to its predecessor, and verification records
+Merkle checkpoints so later runs only rehash entries added since.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
@@ -15,7 +20,7 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 from uuid import uuid4
 
 from shared.logging.main import get_logger
@@ -49,6 +54,11 @@ class AuditEntry:
     session_id: str = ""        # Session identifier
     checksum: str = ""          # SHA-256 for integrity
     
+    # Hash chain, assigned by the backend when the entry is written
+    seq: int = 0
+    prev_hash: str = ""
+    chain_hash: str = ""
+    
     def __post_init__(self):
         """Generate checksum if not provided."""
         if not self.checksum:
@@ -74,6 +84,10 @@ class AuditEntry:
         """Verify entry integrity."""
         return self.checksum == self._compute_checksum()
     
+    def verify_link(self) -> bool:
+        """Verify the entry's chain hash against its own predecessor hash."""
+        return self.chain_hash == chain_hash(self.prev_hash, self.checksum)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -87,6 +101,9 @@ class AuditEntry:
             "parent_id": self.parent_id,
             "session_id": self.session_id,
             "checksum": self.checksum,
+            "seq": self.seq,
+            "prev_hash": self.prev_hash,
+            "chain_hash": self.chain_hash,
         }
     
     @classmethod
@@ -103,9 +120,57 @@ class AuditEntry:
             parent_id=data.get("parent_id", ""),
             session_id=data.get("session_id", ""),
             checksum=data.get("checksum", ""),
+            seq=data.get("seq", 0),
+            prev_hash=data.get("prev_hash", ""),
+            chain_hash=data.get("chain_hash", ""),
         )
 
 
+# ============================================================================
+# Hash Chain & Checkpoints
+# ============================================================================
+
+GENESIS_HASH = "0" * 64
+
+
+def chain_hash(prev_hash: str, checksum: str) -> str:
+    """Chain hash of an entry: SHA-256 over its predecessor's chain hash and its checksum."""
+    return hashlib.sha256(f"{prev_hash}:{checksum}".encode()).hexdigest()
+
+
+def link_entries(entries: list[AuditEntry], last_seq: int, last_hash: str) -> tuple[int, str]:
+    """Assign seq/prev_hash/chain_hash to ``entries`` after the given tail; returns the new tail."""
+    for entry in entries:
+        last_seq += 1
+        entry.seq = last_seq
+        entry.prev_hash = last_hash
+        entry.chain_hash = chain_hash(last_hash, entry.checksum)
+        last_hash = entry.chain_hash
+    return last_seq, last_hash
+
+
+def merkle_root(checksums: list[str]) -> str:
+    """Merkle root over entry checksums (odd levels duplicate their last node)."""
+    if not checksums:
+        return GENESIS_HASH
+    level = [bytes.fromhex(c) for c in checksums]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+@dataclass
+class AuditCheckpoint:
+    """Verified range of the chain: Merkle root of its checksums and the chain head at ``seq_to``."""
+    seq_from: int
+    seq_to: int
+    merkle_root: str
+    chain_hash: str
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
 # ============================================================================
 # Audit Backend Interface
 # ============================================================================
@@ -140,6 +205,37 @@ class AuditBackend(ABC):
     async def count(self) -> int:
         """Get total entry count."""
         pass
+    
+    async def write_batch(self, entries: list[AuditEntry]) -> bool:
+        """Write entries in one commit, chaining them onto the current tail."""
+        ok = True
+        for entry in entries:
+            ok = await self.write(entry) and ok
+        return ok
+    
+    async def stream(self, after_seq: int | None = None) -> AsyncIterator[AuditEntry]:
+        """
+        Entries oldest first.
+        
+        With ``after_seq``, only chained entries with a higher seq;
+        otherwise everything, including entries that predate chaining.
+        """
+        entries = list(reversed(await self.query(limit=100000)))
+        for entry in entries:
+            if after_seq is None or entry.seq > after_seq:
+                yield entry
+    
+    async def last_checkpoint(self) -> AuditCheckpoint | None:
+        """Most recent verified checkpoint, if any."""
+        return None
+    
+    async def save_checkpoint(self, checkpoint: AuditCheckpoint) -> None:
+        """Record a verified checkpoint."""
+        pass
+    
+    async def get_checkpoint(self, seq_to: int) -> AuditCheckpoint | None:
+        """Checkpoint ending at ``seq_to``, if any."""
+        return None
 
 
 class MemoryBackend(AuditBackend):
@@ -148,10 +244,17 @@ class MemoryBackend(AuditBackend):
     def __init__(self, max_entries: int = 10000):
         self._entries: list[AuditEntry] = []
         self._max_entries = max_entries
+        self._tail = (0, GENESIS_HASH)
+        self._checkpoints: dict[int, AuditCheckpoint] = {}
     
     async def write(self, entry: AuditEntry) -> bool:
         """Write entry to memory."""
-        self._entries.append(entry)
+        return await self.write_batch([entry])
+    
+    async def write_batch(self, entries: list[AuditEntry]) -> bool:
+        """Chain and append entries."""
+        self._tail = link_entries(entries, *self._tail)
+        self._entries.extend(entries)
         
         # Trim if too many entries
         if len(self._entries) > self._max_entries:
@@ -159,6 +262,21 @@ class MemoryBackend(AuditBackend):
         
         return True
     
+    async def stream(self, after_seq: int | None = None) -> AsyncIterator[AuditEntry]:
+        """Entries oldest first."""
+        for entry in list(self._entries):
+            if after_seq is None or entry.seq > after_seq:
+                yield entry
+    
+    async def last_checkpoint(self) -> AuditCheckpoint | None:
+        return self._checkpoints[max(self._checkpoints)] if self._checkpoints else None
+    
+    async def save_checkpoint(self, checkpoint: AuditCheckpoint) -> None:
+        self._checkpoints[checkpoint.seq_to] = checkpoint
+    
+    async def get_checkpoint(self, seq_to: int) -> AuditCheckpoint | None:
+        return self._checkpoints.get(seq_to)
+    
     async def query(
         self,
         start_time: datetime = None,
@@ -200,6 +318,101 @@ class MemoryBackend(AuditBackend):
         return len(self._entries)
 
 
+# ============================================================================
+# Group-commit Writer
+# ============================================================================
+
+class AuditCommitError(RuntimeError):
+    """A durable audit entry could not be committed to the backend."""
+
+
+class AuditWriter:
+    """
+    Buffers entries and writes them to the backend in group commits.
+    
+    A batch is flushed once it holds ``batch_size`` entries or its oldest
+    entry has waited ``max_latency`` seconds. ``submit`` returns a future
+    that resolves to the write result once the entry's batch has been
+    committed; ``flush`` waits for everything submitted so far.
+    """
+    
+    def __init__(
+        self,
+        backend: AuditBackend,
+        batch_size: int | None = None,
+        max_latency: float | None = None,
+        max_pending: int | None = None,
+    ):
+        from shared.config import get_settings
+        settings = get_settings().vault_settings
+        self.backend = backend
+        self.batch_size = max(1, batch_size or settings.audit_batch_size)
+        self.max_latency = settings.audit_flush_latency_seconds if max_latency is None else max_latency
+        self.max_pending = max_pending or settings.audit_max_pending
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._last: asyncio.Future | None = None
+    
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the singleton moved to a new event loop
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = None
+            self._last = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+    
+    async def submit(self, entry: AuditEntry) -> asyncio.Future:
+        """Queue an entry (waiting only if the buffer is full); returns its commit future."""
+        self._ensure_running()
+        future = self._loop.create_future()
+        await self._queue.put((entry, future))
+        self._last = future
+        return future
+    
+    async def flush(self) -> None:
+        """Wait until every entry submitted so far is committed."""
+        if self._last is not None and self._loop is asyncio.get_running_loop():
+            await asyncio.shield(self._last)
+    
+    async def close(self) -> None:
+        """Flush and stop the writer task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                ok = await self.backend.write_batch([entry for entry, _ in batch])
+            except Exception as e:
+                logger.error(f"Audit batch of {len(batch)} entries failed: {e}")
+                ok = False
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(ok)
+
+
 # ============================================================================
 # Main Audit Trail
 # ============================================================================
@@ -253,6 +466,7 @@ class AuditTrail:
                 logger.info("AuditTrail using MemoryBackend (No Database Configured)")
         
         self.backend = backend
+        self.writer = AuditWriter(backend)
         self._session_id = str(uuid4())[:8]
         logger.debug(f"AuditTrail initialized with session {self._session_id}")
     
@@ -265,10 +479,14 @@ class AuditTrail:
         details: dict = None,
         parent_id: str = "",
         session_id: str = "",
+        durable: bool = False,
     ) -> str:
         """
         Log an audit event.
         
+        The entry is buffered and committed with the next group commit;
+        pass ``durable=True`` (or await ``flush()``) to wait for it.
+        
         Args:
             event_type: Type of event
             action: Human-readable action description
@@ -277,9 +495,13 @@ class AuditTrail:
             details: Additional details
             parent_id: Parent entry ID for tracing
             session_id: Session identifier
+            durable: Wait until the entry is committed
             
         Returns:
             Entry ID
+            
+        Raises:
+            AuditCommitError: ``durable`` is set and the group commit failed
         """
         entry = AuditEntry(
             entry_id=str(uuid4()),
@@ -293,7 +515,10 @@ class AuditTrail:
             session_id=session_id or self._session_id,
         )
         
-        await self.backend.write(entry)
+        committed = await self.writer.submit(entry)
+        if durable and not await committed:
+            logger.error(f"Audit entry {entry.entry_id} was not committed")
+            raise AuditCommitError(f"Audit entry {entry.entry_id} was not committed")
         
         logger.debug(f"Audit: {event_type.value if hasattr(event_type, 'value') else str(event_type)} - {action[:50]}")
         
@@ -322,35 +547,100 @@ class AuditTrail:
         """Get single entry by ID."""
         return await self.backend.get_by_id(entry_id)
     
-    async def verify_integrity(self, entries: list[AuditEntry] = None) -> tuple[int, int]:
+    async def flush(self) -> None:
+        """Wait until every entry logged so far is committed."""
+        await self.writer.flush()
+    
+    async def close(self) -> None:
+        """Flush pending entries and stop the writer."""
+        await self.writer.close()
+    
+    async def verify_integrity(
+        self,
+        entries: list[AuditEntry] = None,
+        full: bool = False,
+    ) -> tuple[int, int]:
         """
         Verify integrity of audit entries.
         
+        Given ``entries``, checks each entry's checksum. Otherwise walks the
+        hash chain from the last checkpoint (from the start when ``full``),
+        rehashing only entries after it, and records a new checkpoint every
+        ``audit_checkpoint_interval`` verified entries.
+        
         Returns:
             (valid_count, invalid_count)
         """
-        if entries is None:
-            entries = await self.query(limit=10000)
-        
         valid = 0
         invalid = 0
         
-        for entry in entries:
-            if entry.verify():
+        if entries is not None:
+            for entry in entries:
+                if entry.verify():
+                    valid += 1
+                else:
+                    invalid += 1
+                    logger.warning(f"Integrity check failed for entry {entry.entry_id}")
+            return valid, invalid
+        
+        from shared.config import get_settings
+        interval = get_settings().vault_settings.audit_checkpoint_interval
+        
+        await self.flush()
+        checkpoint = None if full else await self.backend.last_checkpoint()
+        after_seq = checkpoint.seq_to if checkpoint else 0
+        prev_hash = checkpoint.chain_hash if checkpoint else None
+        range_start = after_seq + 1
+        leaves: list[str] = []
+        intact = True
+        
+        async for entry in self.backend.stream(after_seq=after_seq):
+            # With no checkpoint, the oldest retained entry's predecessor is trusted
+            linked = prev_hash is None or entry.prev_hash == prev_hash
+            if entry.verify() and entry.verify_link() and linked:
                 valid += 1
             else:
                 invalid += 1
-                logger.warning(f"Integrity check failed for entry {entry.entry_id}")
+                intact = False
+                logger.warning(f"Integrity check failed for entry {entry.entry_id} (seq {entry.seq})")
+            prev_hash = entry.chain_hash
+            
+            if not intact:
+                continue
+            leaves.append(entry.checksum)
+            if len(leaves) >= interval:
+                if await self.backend.get_checkpoint(entry.seq) is None:
+                    await self.backend.save_checkpoint(AuditCheckpoint(
+                        seq_from=range_start,
+                        seq_to=entry.seq,
+                        merkle_root=merkle_root(leaves),
+                        chain_hash=entry.chain_hash,
+                    ))
+                range_start = entry.seq + 1
+                leaves = []
         
         return valid, invalid
     
-    async def export(self, format: str = "json") -> bytes:
-        """Export audit trail."""
-        entries = await self.query(limit=100000)
-        
+    async def verify_checkpoint(self, checkpoint: AuditCheckpoint) -> bool:
+        """Recompute a checkpoint's Merkle root from the entries it covers."""
+        checksums = []
+        async for entry in self.backend.stream(after_seq=checkpoint.seq_from - 1):
+            if entry.seq > checkpoint.seq_to:
+                break
+            if not entry.verify():
+                return False
+            checksums.append(entry.checksum)
+        return merkle_root(checksums) == checkpoint.merkle_root
+    
+    async def export_stream(self, format: str = "json") -> AsyncIterator[bytes]:
+        """Export the audit trail oldest first, streaming from the backend."""
         if format == "json":
-            data = [e.to_dict() for e in entries]
-            return json.dumps(data, indent=2).encode()
+            yield b"["
+            first = True
+            async for entry in self.backend.stream():
+                yield (b"\n  " if first else b",\n  ") + json.dumps(entry.to_dict()).encode()
+                first = False
+            yield b"\n]"
         
         elif format == "csv":
             import csv
@@ -362,7 +652,7 @@ class AuditTrail:
                 fieldnames=["entry_id", "timestamp", "event_type", "actor", "action", "resource", "session_id"],
             )
             writer.writeheader()
-            for entry in entries:
+            async for entry in self.backend.stream():
                 writer.writerow({
                     "entry_id": entry.entry_id,
                     "timestamp": entry.timestamp.isoformat(),
@@ -372,11 +662,20 @@ class AuditTrail:
                     "resource": entry.resource,
                     "session_id": entry.session_id,
                 })
-            return output.getvalue().encode()
+                yield output.getvalue().encode()
+                output.seek(0)
+                output.truncate()
+            if output.tell():
+                yield output.getvalue().encode()
         
         else:
             raise ValueError(f"Unsupported format: {format}")
     
+    async def export(self, format: str = "json") -> bytes:
+        """Export audit trail."""
+        await self.flush()
+        return b"".join([chunk async for chunk in self.export_stream(format)])
+    
     @property
     async def stats(self) -> dict:
         """Get audit trail statistics."""
@@ -1,5 +1,9 @@
 """
 PostgreSQL Backend for Audit Trail.
+
+Batches are appended with COPY under a transaction-scoped advisory lock,
+which serialises chain extension across writers; reads for verification
+and export use server-side cursors.
 """
 
 from __future__ import annotations
@@ -8,10 +12,14 @@ import json
 from datetime import datetime
 import os
 import asyncio
+from typing import AsyncIterator
 
 import asyncpg
 
-from services.vault.core.audit_trail import AuditBackend, AuditEntry, AuditEventType
+from services.vault.core.audit_trail import (
+    GENESIS_HASH, AuditBackend, AuditCheckpoint, AuditEntry, AuditEventType, link_entries,
+)
+from shared.config import get_settings
 from shared.logging.main import get_logger
 from shared.database.connection import get_db_pool
 
@@ -52,39 +60,151 @@ class PostgresBackend(AuditBackend):
             await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_ts ON {self.table_name}(timestamp)")
             await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_type ON {self.table_name}(event_type)")
             await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_session ON {self.table_name}(session_id)")
+            
+            # Hash chain (rows written before chaining keep NULL seq)
+            await conn.execute(f"""
+                ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS seq BIGINT;
+                ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS prev_hash TEXT;
+                ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS chain_hash TEXT;
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_{self.table_name}_seq ON {self.table_name}(seq);
+                CREATE TABLE IF NOT EXISTS {self.table_name}_checkpoints (
+                    seq_to BIGINT PRIMARY KEY,
+                    seq_from BIGINT NOT NULL,
+                    merkle_root TEXT NOT NULL,
+                    chain_hash TEXT NOT NULL,
+                    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+                );
+            """)
                 
         self._initialized = True
 
+    def _entry_record(self, entry: AuditEntry) -> tuple:
+        return (
+            entry.entry_id,
+            entry.timestamp,
+            entry.event_type.value if hasattr(entry.event_type, 'value') else str(entry.event_type),
+            entry.actor,
+            entry.action,
+            entry.resource,
+            json.dumps(entry.details),
+            entry.parent_id,
+            entry.session_id,
+            entry.checksum,
+            entry.seq,
+            entry.prev_hash,
+            entry.chain_hash,
+        )
+
+    def _row_to_entry(self, row) -> AuditEntry:
+        return AuditEntry(
+            entry_id=row["entry_id"],
+            timestamp=row["timestamp"], # asyncpg returns datetime
+            event_type=AuditEventType(row["event_type"]),
+            actor=row["actor"],
+            action=row["action"],
+            resource=row["resource"] or "",
+            details=json.loads(row["details"]) if row["details"] else {},
+            parent_id=row["parent_id"] or "",
+            session_id=row["session_id"] or "",
+            checksum=row["checksum"],
+            seq=row["seq"] or 0,
+            prev_hash=row["prev_hash"] or "",
+            chain_hash=row["chain_hash"] or "",
+        )
+
     async def write(self, entry: AuditEntry) -> bool:
         """Write entry to Postgres."""
+        return await self.write_batch([entry])
+
+    async def write_batch(self, entries: list[AuditEntry]) -> bool:
+        """Chain and append entries in a single transaction (one COPY)."""
         try:
             pool = await get_db_pool()
             await self._ensure_schema(pool)
             
             async with pool.acquire() as conn:
-                await conn.execute(f"""
-                    INSERT INTO {self.table_name} 
-                    (entry_id, timestamp, event_type, actor, action, resource, 
-                     details, parent_id, session_id, checksum)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                """, 
-                    entry.entry_id,
-                    entry.timestamp,
-                    entry.event_type.value if hasattr(entry.event_type, 'value') else str(entry.event_type),
-                    entry.actor,
-                    entry.action,
-                    entry.resource,
-                    json.dumps(entry.details),
-                    entry.parent_id,
-                    entry.session_id,
-                    entry.checksum,
-                )
+                async with conn.transaction():
+                    # One chain per table: serialise extension across writers
+                    await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", self.table_name)
+                    tail = await conn.fetchrow(
+                        f"SELECT seq, chain_hash FROM {self.table_name} "
+                        "WHERE seq IS NOT NULL ORDER BY seq DESC LIMIT 1"
+                    )
+                    link_entries(
+                        entries,
+                        tail["seq"] if tail else 0,
+                        tail["chain_hash"] if tail else GENESIS_HASH,
+                    )
+                    await conn.copy_records_to_table(
+                        self.table_name,
+                        records=[self._entry_record(e) for e in entries],
+                        columns=[
+                            "entry_id", "timestamp", "event_type", "actor", "action", "resource",
+                            "details", "parent_id", "session_id", "checksum",
+                            "seq", "prev_hash", "chain_hash",
+                        ],
+                    )
             return True
             
         except Exception as e:
-            logger.error(f"Failed to write audit entry to Postgres: {e}")
+            logger.error(f"Failed to write {len(entries)} audit entries to Postgres: {e}")
             return False
 
+    async def stream(self, after_seq: int | None = None) -> AsyncIterator[AuditEntry]:
+        """Entries oldest first, read through a server-side cursor."""
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        
+        if after_seq is None:
+            sql = f"SELECT * FROM {self.table_name} ORDER BY seq NULLS FIRST, timestamp"
+            params = ()
+        else:
+            sql = f"SELECT * FROM {self.table_name} WHERE seq > $1 ORDER BY seq"
+            params = (after_seq,)
+        
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(sql, *params, prefetch=get_settings().vault_settings.audit_export_fetch_size):
+                    yield self._row_to_entry(row)
+
+    async def last_checkpoint(self) -> AuditCheckpoint | None:
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT * FROM {self.table_name}_checkpoints ORDER BY seq_to DESC LIMIT 1"
+            )
+        return self._row_to_checkpoint(row) if row else None
+
+    async def get_checkpoint(self, seq_to: int) -> AuditCheckpoint | None:
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                f"SELECT * FROM {self.table_name}_checkpoints WHERE seq_to = $1", seq_to
+            )
+        return self._row_to_checkpoint(row) if row else None
+
+    async def save_checkpoint(self, checkpoint: AuditCheckpoint) -> None:
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        async with pool.acquire() as conn:
+            await conn.execute(f"""
+                INSERT INTO {self.table_name}_checkpoints (seq_to, seq_from, merkle_root, chain_hash, created_at)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (seq_to) DO NOTHING
+            """, checkpoint.seq_to, checkpoint.seq_from, checkpoint.merkle_root,
+                checkpoint.chain_hash, checkpoint.created_at)
+
+    def _row_to_checkpoint(self, row) -> AuditCheckpoint:
+        return AuditCheckpoint(
+            seq_from=row["seq_from"],
+            seq_to=row["seq_to"],
+            merkle_root=row["merkle_root"],
+            chain_hash=row["chain_hash"],
+            created_at=row["created_at"],
+        )
+
     async def query(
         self,
         start_time: datetime = None,
@@ -143,21 +263,7 @@ class PostgresBackend(AuditBackend):
                 
                 rows = await conn.fetch(sql, *params)
                 
-            entries = []
-            for row in rows:
-                entries.append(AuditEntry(
-                    entry_id=row["entry_id"],
-                    timestamp=row["timestamp"], # asyncpg returns datetime
-                    event_type=AuditEventType(row["event_type"]),
-                    actor=row["actor"],
-                    action=row["action"],
-                    resource=row["resource"] or "",
-                    details=json.loads(row["details"]) if row["details"] else {},
-                    parent_id=row["parent_id"] or "",
-                    session_id=row["session_id"] or "",
-                    checksum=row["checksum"],
-                ))
-            return entries
+            return [self._row_to_entry(row) for row in rows]
             
         except Exception as e:
             logger.error(f"Failed to query audit entries from Postgres: {e}")
@@ -172,18 +278,7 @@ class PostgresBackend(AuditBackend):
             row = await conn.fetchrow(f"SELECT * FROM {self.table_name} WHERE entry_id = $1", entry_id)
             
         if row:
-            return AuditEntry(
-                entry_id=row["entry_id"],
-                timestamp=row["timestamp"],
-                event_type=AuditEventType(row["event_type"]),
-                actor=row["actor"],
-                action=row["action"],
-                resource=row["resource"] or "",
-                details=json.loads(row["details"]) if row["details"] else {},
-                parent_id=row["parent_id"] or "",
-                session_id=row["session_id"] or "",
-                checksum=row["checksum"],
-            )
+            return self._row_to_entry(row)
         return None
 
     async def count(self) -> int:
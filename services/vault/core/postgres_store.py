@@ -9,17 +9,19 @@ from __future__ import annotations
 import os
 import json
 import asyncio
-from typing import Any
+from typing import Any, AsyncIterable
 
 import asyncpg
-from pgvector.asyncpg import register_vector
 
 from services.vault.core.vector_store import VectorStore, Document, SearchResult
 from shared.logging.main import get_logger
-from shared.database.connection import get_db_pool
+from shared.database.connection import ensure_vector_codec, get_db_pool
 
 logger = get_logger(__name__)
 
+# Progress of resumable ingest jobs: rows of the source stream already merged
+CHECKPOINT_TABLE = "ingest_checkpoints"
+
 class PostgresVectorStore(VectorStore):
     """
     PostgreSQL vector store implementation using pgvector.
@@ -55,7 +57,7 @@ class PostgresVectorStore(VectorStore):
             await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
             
             # Register vector type for this connection
-            await register_vector(conn)
+            await ensure_vector_codec(conn)
             
             # Create table if not exists
             # Using JSONB for metadata to be schema-less like Qdrant
@@ -77,14 +79,22 @@ class PostgresVectorStore(VectorStore):
                 """)
             except Exception as e:
                 logger.warning(f"Failed to create HNSW index (might be harmless if empty): {e}")
+
+            await conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+                    job_id TEXT PRIMARY KEY,
+                    position BIGINT NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+            """)
         
         self._initialized = True
 
-    async def _get_embedding(self, text: str) -> list[float]:
-        """Get embedding for text using model_manager facade (HTTP → local → API)."""
+    def _get_embedding_provider(self):
+        """Lazy load embedding provider via model_manager facade (HTTP → local → API)."""
         if self._embedding_provider is None:
             if self.use_vl_model:
-                from shared.embedding.qwen3_vl_embedding import create_vl_embedding_provider, VLInput
+                from shared.embedding.qwen3_vl_embedding import create_vl_embedding_provider
                 self._embedding_provider = create_vl_embedding_provider(
                     use_local=self.use_local_embedding,
                 )
@@ -92,13 +102,112 @@ class PostgresVectorStore(VectorStore):
                 from shared.embedding.model_manager import get_embedding_provider
                 # Routes through 3-tier cascade: HTTP service → local → API
                 self._embedding_provider = get_embedding_provider()
+        return self._embedding_provider
+
+    async def _get_embedding(self, text: str) -> list[float]:
+        """Get embedding for text using model_manager facade (HTTP → local → API)."""
+        provider = self._get_embedding_provider()
         
         if self.use_vl_model:
             from shared.embedding.qwen3_vl_embedding import VLInput
-            embeddings = await self._embedding_provider.embed([VLInput(text=text)])
+            embeddings = await provider.embed([VLInput(text=text)])
             return embeddings[0]
             
-        return await self._embedding_provider.embed_query(text)
+        return await provider.embed_query(text)
+
+    def _embed_batch_size(self) -> int:
+        """Texts per embedding call, sized to the inference backend by default."""
+        from shared.config import get_settings
+        settings = get_settings()
+        return max(1, settings.rag.ingest_embed_batch_size or settings.ml_inference.max_batch_size)
+
+    async def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts in backend-sized batches.
+
+        Vectors are identical to ``_get_embedding``: text providers are fed
+        ``format_query(text)`` through the batch ``embed`` call. Providers
+        that format queries remotely (no ``format_query``) keep per-text
+        ``embed_query`` calls.
+        """
+        provider = self._get_embedding_provider()
+        # Probe the innermost provider: wrappers such as CachedEmbeddingProvider
+        # only forward ``format_query`` when the provider they wrap has it.
+        format_query = getattr(getattr(provider, "provider", provider), "format_query", None)
+        step = self._embed_batch_size()
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), step):
+            chunk = texts[start:start + step]
+            if self.use_vl_model:
+                from shared.embedding.qwen3_vl_embedding import VLInput
+                vectors.extend(await provider.embed([VLInput(text=t) for t in chunk]))
+            elif format_query is not None:
+                vectors.extend(await provider.embed([format_query(t) for t in chunk]))
+            else:
+                vectors.extend(await asyncio.gather(*(provider.embed_query(t) for t in chunk)))
+        return [list(v) for v in vectors]
+
+    async def _embed_documents(self, documents: list[Document]) -> None:
+        """Fill in missing embeddings in place."""
+        pending = [doc for doc in documents if doc.embedding is None]
+        if not pending:
+            return
+        vectors = await self._get_embeddings([doc.content for doc in pending])
+        for doc, vector in zip(pending, vectors):
+            doc.embedding = vector
+
+    async def _copy_merge(
+        self,
+        conn: asyncpg.Connection,
+        documents: list[Document],
+        job_id: str | None = None,
+        position: int | None = None,
+    ) -> None:
+        """
+        Upsert documents with one binary COPY and one merge statement.
+
+        Rows are COPYed into a transaction-scoped staging table, then merged
+        with a single ``INSERT ... ON CONFLICT``; the last occurrence of a
+        duplicated id wins, as with sequential upserts. When ``job_id`` is
+        given the checkpoint advances to ``position`` in the same transaction.
+        """
+        staging = f"{self.table_name}_staging"
+        async with conn.transaction():
+            await conn.execute(f"""
+                CREATE TEMP TABLE {staging} (
+                    seq BIGINT,
+                    id TEXT,
+                    content TEXT,
+                    metadata JSONB,
+                    embedding vector({self.embedding_dim})
+                ) ON COMMIT DROP
+            """)
+            await conn.copy_records_to_table(
+                staging,
+                records=[
+                    (seq, doc.id, doc.content, json.dumps(doc.metadata), doc.embedding)
+                    for seq, doc in enumerate(documents)
+                ],
+                columns=["seq", "id", "content", "metadata", "embedding"],
+            )
+            await conn.execute(f"""
+                INSERT INTO {self.table_name} (id, content, metadata, embedding)
+                SELECT DISTINCT ON (id) id, content, metadata, embedding
+                FROM {staging}
+                ORDER BY id, seq DESC
+                ON CONFLICT (id) DO UPDATE SET
+                    content = EXCLUDED.content,
+                    metadata = EXCLUDED.metadata,
+                    embedding = EXCLUDED.embedding
+            """)
+            if job_id is not None:
+                await conn.execute(f"""
+                    INSERT INTO {CHECKPOINT_TABLE} (job_id, position)
+                    VALUES ($1, $2)
+                    ON CONFLICT (job_id) DO UPDATE SET
+                        position = EXCLUDED.position,
+                        updated_at = now()
+                """, job_id, position)
 
     async def _get_reranker(self):
         """Lazy load reranker via model_manager facade (HTTP → local)."""
@@ -117,34 +226,120 @@ class PostgresVectorStore(VectorStore):
         pool = await get_db_pool()
         await self._ensure_schema(pool)
         
-        # Prepare data
-        rows = []
-        for doc in documents:
-            if doc.embedding is None:
-                doc.embedding = await self._get_embedding(doc.content)
-            
-            rows.append((
-                doc.id,
-                doc.content,
-                json.dumps(doc.metadata),
-                doc.embedding
-            ))
-            
+        if not documents:
+            return []
+
+        await self._embed_documents(documents)
+
         async with pool.acquire() as conn:
-            await register_vector(conn)
-            # Upsert (Insert or Update)
-            await conn.executemany(f"""
-                INSERT INTO {self.table_name} (id, content, metadata, embedding)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (id) DO UPDATE SET
-                    content = EXCLUDED.content,
-                    metadata = EXCLUDED.metadata,
-                    embedding = EXCLUDED.embedding
-            """, rows)
+            await ensure_vector_codec(conn)
+            await self._copy_merge(conn, documents)
             
         logger.info(f"Added {len(documents)} documents to Postgres table {self.table_name}")
         return [doc.id for doc in documents]
 
+    async def get_checkpoint(self, job_id: str) -> int:
+        """Rows of ``job_id``'s source stream already merged (0 if none)."""
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        async with pool.acquire() as conn:
+            position = await conn.fetchval(
+                f"SELECT position FROM {CHECKPOINT_TABLE} WHERE job_id = $1", job_id
+            )
+        return int(position or 0)
+
+    async def clear_checkpoint(self, job_id: str) -> None:
+        """Forget a finished job so the next run starts from the beginning."""
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {CHECKPOINT_TABLE} WHERE job_id = $1", job_id)
+
+    async def ingest(
+        self,
+        documents: AsyncIterable[Document],
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Bulk-load a document stream.
+
+        Reading + embedding and writing run as two stages joined by a
+        bounded queue (``rag.ingest_queue_depth``), so a slow database
+        pauses the reader instead of buffering the whole stream. Each
+        ``rag.ingest_copy_batch_size`` rows are written with one COPY and
+        one merge. With ``job_id`` the number of merged source rows is
+        checkpointed in the same transaction, and a rerun skips them; the
+        source must yield rows in a stable order.
+
+        Returns:
+            Number of documents written by this run.
+        """
+        from shared.config import get_settings
+        rag = get_settings().rag
+        pool = await get_db_pool()
+        await self._ensure_schema(pool)
+
+        skip = await self.get_checkpoint(job_id) if job_id else 0
+        if skip:
+            logger.info(f"Resuming ingest job {job_id} after {skip} rows")
+
+        embed_size = self._embed_batch_size()
+        queue: asyncio.Queue[list[Document] | None] = asyncio.Queue(maxsize=max(1, rag.ingest_queue_depth))
+
+        async def produce() -> None:
+            batch: list[Document] = []
+            seen = 0
+            try:
+                async for doc in documents:
+                    seen += 1
+                    if seen <= skip:
+                        continue
+                    batch.append(doc)
+                    if len(batch) >= embed_size:
+                        await self._embed_documents(batch)
+                        await queue.put(batch)
+                        batch = []
+                if batch:
+                    await self._embed_documents(batch)
+                    await queue.put(batch)
+            except Exception:
+                # Let the writer commit what it has; the error surfaces below
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        async def consume() -> int:
+            written = 0
+            pending: list[Document] = []
+            async with pool.acquire() as conn:
+                await ensure_vector_codec(conn)
+
+                async def flush() -> None:
+                    nonlocal written, pending
+                    written += len(pending)
+                    await self._copy_merge(conn, pending, job_id=job_id, position=skip + written)
+                    pending = []
+
+                while (batch := await queue.get()) is not None:
+                    pending.extend(batch)
+                    if len(pending) >= rag.ingest_copy_batch_size:
+                        await flush()
+                if pending:
+                    await flush()
+            return written
+
+        producer = asyncio.create_task(produce())
+        try:
+            written = await consume()
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+        logger.info(f"Ingested {written} documents into Postgres table {self.table_name}")
+        return written
+
     async def search(
         self,
         query: str,
@@ -163,7 +358,7 @@ class PostgresVectorStore(VectorStore):
         candidate_limit = limit * 5 if enable_reranking else limit
         
         async with pool.acquire() as conn:
-            await register_vector(conn)
+            await ensure_vector_codec(conn)
             
             # Basic vector search query
             # Order by Distance ASC (Cosine Distance: 1 - Cosine Similarity)
@@ -201,7 +396,7 @@ class PostgresVectorStore(VectorStore):
                 LIMIT $2
             """
             
-            rows = await conn.fetch(sql, *params)
+            rows = await pool.fetch_prepared(conn, sql, *params)
             
             initial_results = [
                 SearchResult(
@@ -251,8 +446,8 @@ class PostgresVectorStore(VectorStore):
         await self._ensure_schema(pool)
         
         async with pool.acquire() as conn:
-            await register_vector(conn)
-            rows = await conn.fetch(f"""
+            await ensure_vector_codec(conn)
+            rows = await pool.fetch_prepared(conn, f"""
                 SELECT id, content, metadata
                 FROM {self.table_name}
                 WHERE id = ANY($1::text[])
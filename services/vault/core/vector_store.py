@@ -9,7 +9,7 @@ from __future__ import annotations
 import os
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterable
 
 from pydantic import BaseModel, Field
 
@@ -71,6 +71,36 @@ class VectorStore(ABC):
         """Delete documents by ID."""
         pass
 
+    async def ingest(
+        self,
+        documents: AsyncIterable[Document],
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Add a document stream in batches. Returns the number written.
+
+        Backends with a bulk load path override this; ``job_id`` lets those
+        that persist progress resume an interrupted job.
+        """
+        from shared.config import get_settings
+        batch_size = get_settings().rag.ingest_copy_batch_size
+        batch: list[Document] = []
+        written = 0
+        async for doc in documents:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                await self.add(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            await self.add(batch)
+            written += len(batch)
+        return written
+
+    async def clear_checkpoint(self, job_id: str) -> None:
+        """Forget ingest progress for ``job_id`` (no-op without checkpoints)."""
+        return None
+
 
 # ============================================================================
 # In-Memory Implementation (for testing)
@@ -13,6 +13,7 @@ Routes:
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from typing import Any
 
 import uuid
@@ -21,7 +22,7 @@ from fastapi import FastAPI, HTTPException
 from prometheus_client import make_asgi_app
 from pydantic import BaseModel, Field
 
-from services.vault.core.audit_trail import AuditEventType, get_audit_trail
+from services.vault.core.audit_trail import AuditCommitError, AuditEventType, get_audit_trail
 from services.vault.core.postgres_store import PostgresVectorStore
 from services.vault.core.vector_store import Document
 from shared.logging.main import get_logger, setup_logging, LogConfig, RequestLoggingMiddleware
@@ -42,10 +43,18 @@ setup_logging(LogConfig(
     service_name="vault",
 ))
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    # Commit audit entries still buffered for group commit
+    await get_audit_trail().close()
+
+
 app = FastAPI(
     title=f"{settings.app.name} - Vault",
     description="System Persistence & Context Engine",
     version=settings.app.version,
+    lifespan=lifespan,
 )
 app.add_middleware(RequestLoggingMiddleware)
 app.mount("/metrics", make_asgi_app())
@@ -83,6 +92,7 @@ class LogEventRequest(BaseModel):
     resource: str = ""
     details: dict[str, Any] = {}
     session_id: str = ""
+    durable: bool = True  # Respond only after the entry is committed
 
 
 @app.post("/audit/logs")
@@ -100,14 +110,21 @@ async def log_event(request: LogEventRequest) -> dict:
                 detail=f"Invalid event type: {request.event_type}"
             )
 
-    entry_id = await audit.log(
-        event_type=event_type,
-        action=request.action,
-        actor=request.actor,
-        resource=request.resource,
-        details=request.details,
-        session_id=request.session_id,
-    )
+    try:
+        entry_id = await audit.log(
+            event_type=event_type,
+            action=request.action,
+            actor=request.actor,
+            resource=request.resource,
+            details=request.details,
+            session_id=request.session_id,
+            durable=request.durable,
+        )
+    except AuditCommitError as e:
+        raise HTTPException(
+            status_code=get_settings().status_codes.service_unavailable,
+            detail=str(e),
+        )
     return {"entry_id": entry_id}
 
 
@@ -87,6 +87,12 @@ class LLMSettings(BaseModel):
     retry_min_seconds: float = 1.0
     retry_max_seconds: float = 10.0
     token_limit_multiplier: float = 4.0  # Heuristic for token estimation
+    # Response cache (shared/llm/cache.py)
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024         # In-memory LRU tier
+    cache_ttl_seconds: float = 3600.0
+    cache_max_temperature: float = 0.0    # Requests sampled above this bypass the cache
+    cache_dir: str = ""                   # On-disk tier; empty disables it
     
     # Provider Registry
     providers: list[LLMProviderInfo] = [
@@ -142,6 +148,10 @@ class LoggingSettings(BaseModel):
     level: str = "INFO"
     format: str = "console"
     service_name: str = "system-core"
+    # trace_io payload capture (shared.logging.decorators)
+    trace_io_mode: str = "auto"           # off = undecorated direct calls, auto = capture when io DEBUG is enabled
+    trace_io_sample_rate: float = 1.0     # Fraction of traces whose payloads are captured
+    trace_io_module_sample_rates: dict[str, float] = Field(default_factory=dict)  # Prefix -> rate override
 
 
 class DatabaseSettings(BaseModel):
@@ -154,6 +164,11 @@ class DatabaseSettings(BaseModel):
     max_retries: int = 3
     retry_delay: float = 2.0
     command_timeout: float = 60.0
+    # Per-connection setup (asyncpg init hook)
+    vector_codec: bool = True                  # Register the pgvector codec once per connection
+    json_codec: bool = False                   # Decode json/jsonb to Python objects instead of str
+    statement_cache_size: int = 1024           # asyncpg prepared-statement cache, per connection
+    max_cached_statement_lifetime: float = 300.0
 
 
 class JITSettings(BaseModel):
@@ -167,6 +182,23 @@ class JITSettings(BaseModel):
     allowed_dirs: list[str] = Field(default_factory=list)
 
 
+class MCPPoolSettings(BaseModel):
+    """Warm MCP server process pool (one pool per server)."""
+    enabled: bool = True
+    min_size: int = 0                     # Processes kept warm once a server is first used
+    max_size: int = 4                     # Hard cap on processes per server
+    max_concurrency_per_process: int = 1  # In-flight tool calls per process
+    idle_timeout: float = 300.0           # Reap processes (above min_size) idle this long
+    health_check_interval: float = 15.0   # Maintenance tick: reap, ping, replace crashed
+    health_check_timeout: float = 5.0     # Ping timeout before a process is recycled
+    acquire_timeout: float = 120.0        # Max wait for a free slot when the pool is saturated
+    max_restart_attempts: int = 3         # Consecutive failed spawns before the pool gives up
+    restart_backoff_seconds: float = 1.0  # Base delay between failed spawn attempts
+    restart_backoff_max_seconds: float = 30.0  # Ceiling for the exponential spawn backoff
+    max_calls_per_process: int = 0        # Recycle after N calls (0 = unlimited)
+    stderr_tail_lines: int = 200          # Diagnostic stderr lines kept per process
+
+
 class MCPSettings(BaseModel):
     """MCP configuration."""
     max_retries: int = 3
@@ -178,14 +210,28 @@ class MCPSettings(BaseModel):
     discovery_timeout: float = 10.0
     search_limit: int = 1000
     min_similarity: float = 0.0
+    # Static discovery manifest (services/mcp_host/core/discovery_snapshot.py); relative to project root
+    discovery_snapshot_enabled: bool = True
+    discovery_snapshot_path: str = ".cache/mcp_discovery.json"
     jit: JITSettings = JITSettings()
-    
+    pool: MCPPoolSettings = MCPPoolSettings()
+
     # Protocol & Metadata
     protocol_version: str = "2024-11-05"
     client_name: str = "system-engine"
     client_version: str = "0.4.0"
 
 
+class EmbeddingCacheSettings(BaseModel):
+    """Content-addressed embedding cache (shared.embedding.cache)."""
+    enabled: bool = True
+    memory_max_items: int = 20000  # float32 vectors: ~80 MB at dim 1024
+    disk_enabled: bool = True
+    disk_path: str = ".cache/embeddings.sqlite3"
+    disk_max_items: int = 1_000_000
+    disk_prune_batch: int = 10000
+
+
 class EmbeddingSettings(BaseModel):
     """Embedding configuration."""
     use_local: bool = True
@@ -193,6 +239,7 @@ class EmbeddingSettings(BaseModel):
     api_model: str = "qwen/qwen3-embedding-8b"
     dimension: int = 1024
     batch_size: int = 16
+    sync_batch_size: int = 64  # Items per embed call when syncing tool/knowledge registries
     max_length: int = 32768
     instruction: str = "Given a web search query, retrieve relevant passages that answer the query"
     api_url: str = "https://openrouter.ai/api/v1/embeddings"
@@ -201,6 +248,8 @@ class EmbeddingSettings(BaseModel):
     high_pressure_batch_size: int = 8
     med_pressure_batch_size: int = 16
 
+    cache: EmbeddingCacheSettings = EmbeddingCacheSettings()
+
 
 class RerankerSettings(BaseModel):
     """Reranker configuration."""
@@ -262,6 +311,16 @@ class MLInferenceSettings(BaseModel):
     # Set > 1 only if the underlying model supports true parallel batching.
     max_concurrent_requests: int = 1
 
+    # Cross-request micro-batching.
+    # Concurrent embed/rerank requests are coalesced for up to
+    # batch_max_wait_ms (or until the item/token budget is full) and run as
+    # one model call, so many single-text requests share a forward pass
+    # instead of queueing behind the semaphore one by one.
+    batching_enabled: bool = True
+    batch_max_wait_ms: float = 5.0
+    batch_max_items: int = 256
+    batch_max_tokens: int = 32768  # Estimated at ~4 chars per token
+
     # Startup readiness gate — used by launcher.py to block dependent
     # services until ML Inference reports healthy models.
     startup_poll_interval: float = 3.0   # seconds between /health polls
@@ -433,6 +492,13 @@ class AuthSettings(BaseModel):
     api_key_max_rate_limit: int = 10000
     api_key_prefix: str = "project_"
     default_scopes: list[str] = ["read", "write"]
+    # API-key principal cache (shared.users.principal_cache)
+    principal_cache_enabled: bool = True
+    principal_cache_ttl: float = 30.0           # Seconds a resolved key/user pair is trusted
+    principal_cache_negative_ttl: float = 5.0   # Seconds an unknown prefix / bad key is remembered
+    principal_cache_max_entries: int = 10000
+    principal_cache_negative_max_entries: int = 1000  # Separate LRU bound for cached rejections
+    principal_invalidation_channel: str = "auth_principal_invalidate"  # Postgres LISTEN/NOTIFY
 
 
 class UserSettings(BaseModel):
@@ -452,6 +518,12 @@ class ConversationSettings(BaseModel):
     message_limit: int = 100
     message_max_limit: int = 500
     title_max_length: int = 50
+    # Full-text search (shared/conversations/manager.py)
+    search_config: str = "english"                # Postgres text search configuration
+    search_trigram: bool = True                   # pg_trgm substring fallback
+    search_snippet_options: str = "MaxFragments=2, MaxWords=20, MinWords=5"
+    search_backfill_batch_size: int = 1000
+    search_backfill_pause_seconds: float = 0.1    # Between backfill batches
 
 
 class JobSettings(BaseModel):
@@ -463,6 +535,16 @@ class JobSettings(BaseModel):
     default_max_steps: int = 20
     max_depth: int = 5
     max_steps: int = 100
+    # Durable queue (services/api_gateway/core/job_queue.py)
+    workers: dict[str, int] = {"autonomous": 4, "task": 4, "interactive": 2}  # Per job type; 0 disables
+    max_priority: int = 9                # Priority lanes 0..max_priority, higher is claimed first
+    lease_seconds: float = 60.0
+    heartbeat_seconds: float = 15.0
+    max_attempts: int = 3
+    retry_backoff_seconds: float = 5.0   # Doubled per attempt
+    idle_poll_seconds: float = 5.0       # Fallback when a NOTIFY is missed
+    notify_channel: str = "system_jobs"
+    events_keepalive_seconds: float = 15.0
 
 
 class MemorySettings(BaseModel):
@@ -483,6 +565,10 @@ class RateLimitSettings(BaseModel):
     requests_per_hour: int = 1000
     burst_size: int = 10
     default_window_seconds: int = 60
+    # GCRA limiter (services/api_gateway/middleware/rate_limit.py)
+    lock_stripes: int = 64                # Independent locks over the in-memory key space
+    sweep_interval_seconds: float = 60.0  # How often idle keys are evicted
+    sync_interval_seconds: float = 1.0    # Postgres backend: reconcile local counters this often
     exempt_paths: list[str] = [
         "/health",
         "/docs",
@@ -501,6 +587,13 @@ class RAGSettings(BaseModel):
     max_limit: int = 100
     ingest_max_rows: int = 1000
     batch_size: int = 20
+    # Bulk ingestion: documents are embedded in groups of ingest_embed_batch_size
+    # (0 = ml_inference.max_batch_size), written with one COPY + merge per
+    # ingest_copy_batch_size rows, with at most ingest_queue_depth embedded
+    # batches waiting on the writer before the reader is paused.
+    ingest_embed_batch_size: int = 0
+    ingest_copy_batch_size: int = 2000
+    ingest_queue_depth: int = 4
     knowledge_limit: int = 5
     knowledge_candidate_multiplier: int = 5
     artifact_path: str = "./artifacts"
@@ -512,6 +605,12 @@ class VaultSettings(BaseModel):
     """Vault Service settings."""
     default_limit: int = 5
     max_limit: int = 100
+    # Audit trail group commit (services/vault/core/audit_trail.py)
+    audit_batch_size: int = 256                # Max entries per group commit
+    audit_flush_latency_seconds: float = 0.05  # Max time an entry waits for its batch
+    audit_max_pending: int = 10000             # Buffered entries before log() applies backpressure
+    audit_checkpoint_interval: int = 1000      # Verified entries per Merkle checkpoint
+    audit_export_fetch_size: int = 1000        # Server-side cursor prefetch
 
 
 class ChronosSettings(BaseModel):
@@ -541,6 +640,15 @@ class ApiSettings(BaseModel):
     max_connections: int = 20
 
 
+class HttpClientSettings(BaseModel):
+    """Pooled outbound HTTP clients (shared/http_pool.py)."""
+    max_connections_per_host: int = 20       # Concurrent connections to one origin
+    max_keepalive_per_host: int = 10         # Idle connections kept open per origin
+    keepalive_expiry_seconds: float = 30.0   # Idle connections are closed after this
+    http2: bool = True                       # Negotiate HTTP/2 over TLS when h2 is installed
+    host_limits: dict[str, int] = {}         # "host[:port]" -> max_connections override
+
+
 class FeatureFlags(BaseModel):
     """Feature flags."""
     enable_multimodal: bool = True
@@ -773,9 +881,12 @@ class KernelSettings(BaseModel):
     max_dag_review_iterations: int = 3
     max_parallel_branches: int = 16
     dag_compilation_timeout_ms: float = 5000.0
+    dag_default_node_latency_ms: float = 1000.0  # Critical-path estimate before any history exists
+    dag_latency_ema_alpha: float = 0.3           # Weight of the newest observed per-tool latency
+    dag_dynamic_release: bool = True             # Start dependents inside act() as soon as inputs are ready
 
     # --- T3: Node Assembler ---
-    node_execution_timeout_ms: float = 30000.0
+    node_execution_timeout_ms: float = 300000.0  # per-node bound in the OODA act phase
     node_input_validation_strict: bool = True
     node_output_validation_strict: bool = True
 
@@ -860,6 +971,11 @@ class KernelSettings(BaseModel):
     grounding_inferred_weight: float = 0.5
     grounding_grounded_weight: float = 1.0
     grounding_fabricated_weight: float = 0.0
+    grounding_prescreen_enabled: bool = True
+    grounding_prescreen_grounded_similarity: float = 0.85    # Embedding cosine at/above: GROUNDED without the LLM
+    grounding_prescreen_fabricated_similarity: float = 0.25  # Below: keyword grade without the LLM
+    grounding_batch_size: int = 8                            # Claims per LLM grading prompt
+    grounding_max_concurrent_batches: int = 4
 
     # --- T6: Confidence Calibrator ---
     calibration_overconfidence_threshold: float = 0.2
@@ -904,9 +1020,18 @@ class CorporateSettings(BaseModel):
     agent_idle_timeout_ms: float = 30000.0
     agent_fire_quality_threshold: float = 0.3
     spawn_batch_size: int = 10
+    specialist_index_max_profiles: int = 4096      # Cached profile embeddings
+    specialist_shortlist_size: int = 3             # Top profiles per chunk re-scored with T1 (0 = cosine only)
+    specialist_profile_capacity: int = 0           # Max chunks per profile in one assignment (0 = unlimited)
+    specialist_score_concurrency: int = 8          # Concurrent T1 checks during matching
 
     # --- Team Orchestrator ---
     sprint_max_parallel_tasks: int = 10
+    global_max_parallel_tasks: int = 50            # Chunks in flight across all missions
+    sprint_pipelining_enabled: bool = True         # Start later sprints' chunks once their dependencies finish
+    agent_reuse_enabled: bool = True               # Reuse specialists across chunks with the same profile and tools
+    artifact_write_batch_size: int = 16            # Vault artifact writes sent together
+    artifact_write_flush_ms: float = 50.0          # Max wait to fill an artifact write batch
     sprint_review_enabled: bool = True
     corporate_ooda_poll_interval_ms: float = 1000.0
     handoff_timeout_ms: float = 60000.0
@@ -921,6 +1046,10 @@ class CorporateSettings(BaseModel):
 
     # --- Quality Resolver ---
     conflict_similarity_threshold: float = 0.7
+    conflict_prefilter_similarity: float = 0.5      # Cosine floor for a pair to reach the T1 check
+    conflict_prefilter_top_k: int = 16              # Nearest neighbours kept per artifact (0 = all)
+    conflict_similarity_block_size: int = 512       # Rows per block of the similarity matrix
+    conflict_check_concurrency: int = 8             # Concurrent T1 checks on candidate pairs
     consensus_quorum_pct: float = 0.5
     arbitration_timeout_ms: float = 30000.0
     quality_gate_threshold: float = 0.6
@@ -1011,6 +1140,7 @@ class Settings(BaseSettings):
     governance: GovernanceSettings = GovernanceSettings()
     auth: AuthSettings = AuthSettings()
     api: ApiSettings = ApiSettings()
+    http: HttpClientSettings = HttpClientSettings()
     feature_flags: FeatureFlags = FeatureFlags()
     s3: S3Settings = S3Settings()
     security: SecuritySettings = SecuritySettings()
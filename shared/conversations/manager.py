@@ -6,6 +6,8 @@ Manages conversations and messages with PostgreSQL backend.
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import json
 import os
 from datetime import datetime
@@ -15,13 +17,31 @@ from shared.logging.main import get_logger
 from shared.database.connection import get_database_pool
 from shared.conversations.models import (
     Conversation, Message, MessageRole,
+    ConversationSearchHit, ConversationSearchPage,
     CONVERSATIONS_TABLE_SQL, MESSAGES_TABLE_SQL,
+    MESSAGES_SEARCH_SQL, TRIGRAM_SEARCH_SQL,
 )
 
 
 logger = get_logger(__name__)
 
 
+def encode_search_cursor(rank: float, conversation_id: str) -> str:
+    """Opaque keyset cursor for the hit after which the next page starts."""
+    raw = json.dumps([rank, conversation_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str]:
+    """Inverse of ``encode_search_cursor``; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        rank, conversation_id = json.loads(raw)
+        return float(rank), str(conversation_id)
+    except Exception as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+
+
 class ConversationManager:
     """
     Manages user conversations.
@@ -43,9 +63,14 @@ class ConversationManager:
     
     def __init__(self):
         self._pool = None
+        self._trigram = False
+        self._backfill_task: asyncio.Task | None = None
     
     async def initialize(self):
-        """Initialize database tables."""
+        """Initialize database tables and search indexes."""
+        from shared.config import get_settings
+        settings = get_settings()
+        
         if self._pool is None:
             self._pool = await get_database_pool()
             
@@ -53,7 +78,53 @@ class ConversationManager:
             async with self._pool.acquire() as conn:
                 await conn.execute(CONVERSATIONS_TABLE_SQL)
                 await conn.execute(MESSAGES_TABLE_SQL)
+                await conn.execute(MESSAGES_SEARCH_SQL.format(config=settings.conversations.search_config))
+                if settings.conversations.search_trigram:
+                    try:
+                        await conn.execute(TRIGRAM_SEARCH_SQL)
+                        self._trigram = True
+                    except Exception as e:
+                        logger.warning(f"pg_trgm unavailable, substring search disabled: {e}")
             logger.info("PostgreSQL tables initialized for conversations")
+            
+            if self._backfill_task is None or self._backfill_task.done():
+                self._backfill_task = asyncio.create_task(self.backfill_search_index())
+    
+    async def backfill_search_index(self) -> int:
+        """
+        Index messages written before full-text search existed.
+        
+        Works in small batches (skipping rows locked by other replicas) so
+        it can run alongside normal traffic; returns the rows indexed.
+        """
+        from shared.config import get_settings
+        settings = get_settings().conversations
+        total = 0
+        
+        try:
+            while True:
+                async with self._pool.acquire() as conn:
+                    result = await conn.execute(f"""
+                        UPDATE messages
+                        SET search_tsv = to_tsvector('{settings.search_config}'::regconfig, coalesce(content, ''))
+                        WHERE message_id IN (
+                            SELECT message_id FROM messages
+                            WHERE search_tsv IS NULL
+                            LIMIT $1
+                            FOR UPDATE SKIP LOCKED
+                        )
+                    """, settings.search_backfill_batch_size)
+                count = int(result.split()[-1])
+                if count == 0:
+                    break
+                total += count
+                await asyncio.sleep(settings.search_backfill_pause_seconds)
+        except Exception as e:
+            logger.warning(f"Search backfill stopped after {total} messages: {e}")
+        
+        if total:
+            logger.info(f"Search backfill indexed {total} messages")
+        return total
     
     # =========================================================================
     # Conversation CRUD
@@ -252,31 +323,96 @@ class ConversationManager:
         
         return messages
     
-    async def search_conversations(
+    async def search(
         self,
         user_id: str,
         query: str,
         limit: int = None,
-    ) -> list[Conversation]:
-        """Search conversations by title or content."""
+        cursor: str | None = None,
+    ) -> ConversationSearchPage:
+        """
+        Ranked search over conversation titles and message content.
+        
+        Full-text matches (GIN on ``search_tsv``) are ranked with
+        ``ts_rank_cd``, title matches counting double; with pg_trgm, plain
+        substring matches are included after them. Each conversation
+        appears once, with a highlighted snippet of its best match. Pages
+        are keyset-paginated on (rank, conversation_id) via ``cursor``.
+        """
         from shared.config import get_settings
-        settings = get_settings()
-        limit = min(limit or settings.conversations.search_limit, settings.conversations.max_limit)
-        conversations = []
-        search_pattern = f"%{query}%"
+        settings = get_settings().conversations
+        limit = min(limit or settings.search_limit, settings.max_limit)
+        config = settings.search_config
+        
+        cursor_rank, cursor_id = decode_search_cursor(cursor) if cursor else (None, None)
+        params: list[Any] = [user_id, query, cursor_rank, cursor_id, limit, settings.search_snippet_options]
+        message_match = "m.search_tsv @@ q.tsq"
+        title_match = f"to_tsvector('{config}'::regconfig, coalesce(c.title, '')) @@ q.tsq"
+        if self._trigram:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+            message_match += f" OR m.content ILIKE ${len(params)}"
+            title_match += f" OR c.title ILIKE ${len(params)}"
         
+        sql = f"""
+            WITH q AS (
+                SELECT websearch_to_tsquery('{config}'::regconfig, $2) AS tsq
+            ),
+            hits AS (
+                SELECT m.conversation_id, m.content AS matched,
+                       ts_rank_cd(coalesce(m.search_tsv, ''::tsvector), q.tsq)::float8 AS rank
+                FROM q, messages m
+                JOIN conversations c ON c.conversation_id = m.conversation_id
+                WHERE c.user_id = $1 AND ({message_match})
+                UNION ALL
+                SELECT c.conversation_id, c.title AS matched,
+                       (2 * ts_rank_cd(to_tsvector('{config}'::regconfig, coalesce(c.title, '')), q.tsq))::float8 AS rank
+                FROM q, conversations c
+                WHERE c.user_id = $1 AND ({title_match})
+            ),
+            best AS (
+                SELECT DISTINCT ON (conversation_id) conversation_id, matched, rank
+                FROM hits
+                ORDER BY conversation_id, rank DESC
+            ),
+            page AS (
+                SELECT * FROM best
+                WHERE $3::float8 IS NULL OR (rank, conversation_id) < ($3::float8, $4::text)
+                ORDER BY rank DESC, conversation_id DESC
+                LIMIT $5
+            )
+            SELECT c.*, page.rank AS search_rank,
+                   ts_headline('{config}'::regconfig, page.matched, q.tsq, $6) AS search_snippet
+            FROM q, page
+            JOIN conversations c ON c.conversation_id = page.conversation_id
+            ORDER BY page.rank DESC, page.conversation_id DESC
+        """
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT DISTINCT c.* FROM conversations c
-                LEFT JOIN messages m ON c.conversation_id = m.conversation_id
-                WHERE c.user_id = $1 
-                AND (c.title ILIKE $2 OR m.content ILIKE $2)
-                ORDER BY c.updated_at DESC
-                LIMIT $3
-            """, user_id, search_pattern, limit)
-            conversations = [self._row_to_conversation(dict(r)) for r in rows]
+            rows = await conn.fetch(sql, *params)
         
-        return conversations
+        hits = [
+            ConversationSearchHit(
+                conversation=self._row_to_conversation(dict(r)),
+                rank=r["search_rank"],
+                snippet=r["search_snippet"] or "",
+            )
+            for r in rows
+        ]
+        next_cursor = None
+        if len(hits) == limit:
+            last = hits[-1]
+            next_cursor = encode_search_cursor(last.rank, last.conversation.conversation_id)
+        return ConversationSearchPage(hits=hits, next_cursor=next_cursor)
+    
+    async def search_conversations(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = None,
+    ) -> list[Conversation]:
+        """Search conversations by title or content (first page of ``search``)."""
+        page = await self.search(user_id, query, limit=limit)
+        return [hit.conversation for hit in page.hits]
     
     # =========================================================================
     # Helpers
@@ -345,8 +481,6 @@ class ConversationManager:
 # Singleton
 # ============================================================================
 
-import asyncio
-
 _conversation_manager: ConversationManager | None = None
 _conversation_manager_lock = asyncio.Lock()
 
@@ -175,6 +175,21 @@ class Conversation:
         )
 
 
+@dataclass
+class ConversationSearchHit:
+    """Conversation matching a search, with its best-matching text highlighted."""
+    conversation: Conversation
+    rank: float
+    snippet: str
+
+
+@dataclass
+class ConversationSearchPage:
+    """One page of ranked search hits; pass ``next_cursor`` back for the next page."""
+    hits: list[ConversationSearchHit]
+    next_cursor: str | None = None
+
+
 # ============================================================================
 # SQL Schema
 # ============================================================================
@@ -217,3 +232,31 @@ CREATE TABLE IF NOT EXISTS messages (
 CREATE INDEX IF NOT EXISTS idx_msg_conv ON messages(conversation_id);
 CREATE INDEX IF NOT EXISTS idx_msg_created ON messages(created_at);
 """
+
+# Full-text search. ``search_tsv`` is kept current by a trigger so rows that
+# predate it can be backfilled in batches rather than by a table rewrite.
+MESSAGES_SEARCH_SQL = """
+ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_tsv tsvector;
+
+CREATE OR REPLACE FUNCTION messages_search_tsv_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_tsv := to_tsvector('{config}'::regconfig, coalesce(NEW.content, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER messages_search_tsv
+    BEFORE INSERT OR UPDATE OF content ON messages
+    FOR EACH ROW EXECUTE FUNCTION messages_search_tsv_update();
+
+CREATE INDEX IF NOT EXISTS idx_msg_search_tsv ON messages USING GIN (search_tsv);
+CREATE INDEX IF NOT EXISTS idx_msg_search_pending ON messages(message_id) WHERE search_tsv IS NULL;
+CREATE INDEX IF NOT EXISTS idx_conv_title_tsv
+    ON conversations USING GIN (to_tsvector('{config}'::regconfig, coalesce(title, '')));
+"""
+
+TRIGRAM_SEARCH_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_msg_content_trgm ON messages USING GIN (content gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_conv_title_trgm ON conversations USING GIN (title gin_trgm_ops);
+"""
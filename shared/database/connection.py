@@ -7,10 +7,14 @@ Production-ready PostgreSQL connection pool with health checks.
 from __future__ import annotations
 
 import os
+import json
+import time
 import asyncio
+import weakref
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from shared.logging.main import get_logger
 from shared.environment import get_environment_config
@@ -19,6 +23,75 @@ from shared.config import get_settings
 
 logger = get_logger(__name__)
 
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+    POOL_ACQUIRE_WAIT = Histogram(
+        "system_db_pool_acquire_seconds",
+        "Time spent waiting for a pooled connection",
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+    )
+    POOL_IN_USE = Gauge("system_db_pool_in_use", "Pooled connections currently checked out")
+    STATEMENT_CACHE = Counter(
+        "system_db_statement_cache_total", "DatabasePool.fetch_prepared() statement lookups", ["result"]
+    )
+    METRICS_ENABLED = True
+except ImportError:
+    METRICS_ENABLED = False
+
+
+# ============================================================================
+# Per-Connection Initialisers
+# ============================================================================
+
+ConnectionInitializer = Callable[[Any], Awaitable[None]]
+
+_CONNECTION_INITIALIZERS: list[ConnectionInitializer] = []
+
+# Raw connections that already carry the pgvector codec
+_VECTOR_READY: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def add_connection_initializer(initializer: ConnectionInitializer) -> None:
+    """Run ``initializer(conn)`` on every new pooled connection (pools created afterwards)."""
+    if initializer not in _CONNECTION_INITIALIZERS:
+        _CONNECTION_INITIALIZERS.append(initializer)
+
+
+def _raw_connection(conn: Any) -> Any:
+    """Unwrap an asyncpg pool proxy so per-connection state survives re-acquire."""
+    return getattr(conn, "_con", None) or conn
+
+
+async def ensure_vector_codec(conn: Any) -> None:
+    """
+    Register the pgvector codec on ``conn`` unless it already has it.
+
+    Pooled connections get the codec from the init hook, so this is a
+    local no-op there; it only round-trips for connections opened before
+    ``CREATE EXTENSION vector`` ran.
+    """
+    raw = _raw_connection(conn)
+    if raw in _VECTOR_READY:
+        return
+    from pgvector.asyncpg import register_vector
+    await register_vector(conn)
+    _VECTOR_READY.add(raw)
+
+
+async def _init_vector_codec(conn: Any) -> None:
+    try:
+        await ensure_vector_codec(conn)
+    except Exception as e:
+        # Extension not installed yet; ensure_vector_codec() retries after schema setup
+        logger.debug(f"pgvector codec not registered on new connection: {e}")
+
+
+async def _init_json_codec(conn: Any) -> None:
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, schema="pg_catalog", encoder=json.dumps, decoder=json.loads
+        )
+
 
 @dataclass
 class DatabaseConfig:
@@ -28,6 +101,10 @@ class DatabaseConfig:
     max_connections: int = 0
     connection_timeout: float = 0.0
     idle_timeout: float = 0.0
+    statement_cache_size: int = 1024
+    max_cached_statement_lifetime: float = 300.0
+    vector_codec: bool = True
+    json_codec: bool = False
     
     @classmethod
     def from_environment(cls) -> "DatabaseConfig":
@@ -47,6 +124,10 @@ class DatabaseConfig:
             max_connections=db_settings.max_connections,
             connection_timeout=db_settings.connection_timeout,
             idle_timeout=db_settings.idle_timeout,
+            statement_cache_size=db_settings.statement_cache_size,
+            max_cached_statement_lifetime=db_settings.max_cached_statement_lifetime,
+            vector_codec=db_settings.vector_codec,
+            json_codec=db_settings.json_codec,
         )
 
 
@@ -56,12 +137,29 @@ class DatabasePool:
     
     Supports:
     - PostgreSQL (asyncpg) ONLY
+
+    New connections are set up once by the asyncpg ``init`` hook (pgvector
+    and optional JSON codecs, plus ``add_connection_initializer`` hooks),
+    so callers no longer register codecs per acquire. Statements are reused
+    through asyncpg's own per-connection cache (``statement_cache_size``),
+    which survives release back to the pool, unlike PreparedStatement
+    handles. Hot queries go through ``fetch_prepared()`` so ``stats()`` can
+    report the statement-cache hit rate alongside acquire wait and
+    checked-out connections.
     """
     
     def __init__(self, config: DatabaseConfig = None):
         self.config = config or DatabaseConfig.from_environment()
         self._pool = None
         self._is_initialized = False
+        self._in_use = 0
+        self._acquires = 0
+        self._acquire_wait_total = 0.0
+        self._acquire_wait_max = 0.0
+        # raw connection -> queries it has prepared, mirroring asyncpg's LRU
+        self._prepared: "weakref.WeakKeyDictionary[Any, OrderedDict[str, float]]" = weakref.WeakKeyDictionary()
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     async def initialize(self):
         """Initialize connection pool."""
@@ -86,6 +184,9 @@ class DatabasePool:
                 max_size=self.config.max_connections,
                 timeout=self.config.connection_timeout,
                 command_timeout=settings.database.command_timeout,
+                statement_cache_size=self.config.statement_cache_size,
+                max_cached_statement_lifetime=self.config.max_cached_statement_lifetime,
+                init=self._init_connection,
             )
             
             logger.info(f"PostgreSQL pool initialized: {self.config.min_connections}-{self.config.max_connections} connections")
@@ -94,6 +195,15 @@ class DatabasePool:
             logger.error(f"PostgreSQL connection failed: {e}")
             raise
     
+    async def _init_connection(self, conn: Any) -> None:
+        """asyncpg ``init`` hook: per-connection codecs and registered initialisers."""
+        if self.config.vector_codec:
+            await _init_vector_codec(conn)
+        if self.config.json_codec:
+            await _init_json_codec(conn)
+        for initializer in _CONNECTION_INITIALIZERS:
+            await initializer(conn)
+
     async def close(self):
         """Close connection pool."""
         if self._pool:
@@ -107,8 +217,68 @@ class DatabasePool:
         if not self._is_initialized:
             await self.initialize()
         
+        start = time.perf_counter()
         async with self._pool.acquire() as conn:
-            yield conn
+            waited = time.perf_counter() - start
+            self._acquires += 1
+            self._acquire_wait_total += waited
+            self._acquire_wait_max = max(self._acquire_wait_max, waited)
+            self._in_use += 1
+            if METRICS_ENABLED:
+                POOL_ACQUIRE_WAIT.observe(waited)
+                POOL_IN_USE.inc()
+            try:
+                yield conn
+            finally:
+                self._in_use -= 1
+                if METRICS_ENABLED:
+                    POOL_IN_USE.dec()
+
+    async def fetch_prepared(self, conn: Any, query: str, *args) -> list:
+        """
+        ``conn.fetch`` for a hot query, counting statement-cache hits.
+
+        asyncpg keeps the statement prepared (as an auto-named server-side
+        statement) in the connection's cache across pool releases; this
+        mirrors that LRU per raw connection to report whether the call
+        reused it.
+        """
+        raw = _raw_connection(conn)
+        seen = self._prepared.get(raw)
+        if seen is None:
+            seen = self._prepared[raw] = OrderedDict()
+        now = time.monotonic()
+        lifetime = self.config.max_cached_statement_lifetime
+        prepared_at = seen.get(query)
+        if prepared_at is not None and (not lifetime or now - prepared_at < lifetime):
+            seen.move_to_end(query)
+            self._cache_hits += 1
+            if METRICS_ENABLED:
+                STATEMENT_CACHE.labels(result="hit").inc()
+        else:
+            seen[query] = now
+            seen.move_to_end(query)
+            while len(seen) > max(1, self.config.statement_cache_size):
+                seen.popitem(last=False)
+            self._cache_misses += 1
+            if METRICS_ENABLED:
+                STATEMENT_CACHE.labels(result="miss").inc()
+        return await conn.fetch(query, *args)
+
+    def stats(self) -> dict:
+        """Pool saturation and statement-cache counters for this process."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "size": self._pool.get_size() if self._pool else 0,
+            "idle": self._pool.get_idle_size() if self._pool else 0,
+            "in_use": self._in_use,
+            "acquires": self._acquires,
+            "acquire_wait_avg_ms": round(1000 * self._acquire_wait_total / self._acquires, 3) if self._acquires else 0.0,
+            "acquire_wait_max_ms": round(1000 * self._acquire_wait_max, 3),
+            "statement_cache_hits": self._cache_hits,
+            "statement_cache_misses": self._cache_misses,
+            "statement_cache_hit_rate": round(self._cache_hits / lookups, 4) if lookups else 0.0,
+        }
     
     async def execute(self, query: str, *args) -> Any:
         """Execute query."""
@@ -144,6 +314,7 @@ class DatabasePool:
                 "type": "postgresql",
                 "pool_size": pool_size,
                 "pool_free": pool_free,
+                "pool_stats": self.stats(),
             }
             
         except Exception as e:
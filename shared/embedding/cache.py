@@ -0,0 +1,310 @@
+"""
+Embedding Cache.
+
+Content-addressed cache for embedding vectors, shared by every embedding
+call path (ModelManager, the ML Inference HTTP client and the ML Inference
+server itself).
+
+Keys are sha256(model id, instruction prefix, text), so a vector is reused
+across requests, services and restarts whenever the same model would have
+produced it. Lookups hit an in-memory LRU first, then an SQLite store on
+disk; only the misses are sent to the model, in one batch.
+"""
+
+from __future__ import annotations
+
+import array
+import collections
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, OrderedDict
+
+from shared.config import EmbeddingCacheSettings, get_settings
+from shared.logging.main import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite caps bound parameters per statement (999 on older builds)
+_SQL_CHUNK = 900
+
+
+def make_cache_key(model_id: str, instruction: str, text: str) -> str:
+    """Content address for one (model, instruction, text) vector."""
+    digest = hashlib.sha256()
+    for part in (model_id, instruction, text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-level (memory LRU → SQLite) vector cache.
+
+    Thread-safe: Kea services may share one process across several threads,
+    each with its own event loop, so every access takes a threading lock.
+
+    Example:
+        cache = get_embedding_cache()
+        found = cache.get_many(keys)          # {key: vector} for hits only
+        cache.put_many({key: vector, ...})
+    """
+
+    def __init__(self, config: EmbeddingCacheSettings | None = None) -> None:
+        self.config = config or get_settings().embedding.cache
+        self._memory: OrderedDict[str, array.array] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disk_items = 0
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        if self.config.disk_enabled:
+            self._open_disk()
+
+    def _open_disk(self) -> None:
+        path = Path(self.config.disk_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " dim INTEGER NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS embeddings_created ON embeddings(created_at)")
+            self._disk_items = db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._db = db
+            logger.info(f"Embedding cache on disk: {path} ({self._disk_items} vectors)")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Embedding cache disk store unavailable ({path}): {e}; memory only")
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return vectors for the keys that are cached; misses are omitted."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            missing: list[str] = []
+            for key in dict.fromkeys(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                    continue
+                self._memory.move_to_end(key)
+                found[key] = vector.tolist()
+            self._hits += len(found)
+
+            if missing and self._db is not None:
+                loaded = self._load_disk(missing)
+                for key, vector in loaded.items():
+                    self._remember(key, vector)
+                    found[key] = vector.tolist()
+                self._disk_hits += len(loaded)
+                self._misses += len(missing) - len(loaded)
+            else:
+                self._misses += len(missing)
+        return found
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        """Store freshly computed vectors in memory and on disk."""
+        if not vectors:
+            return
+        now = time.time()
+        rows = []
+        with self._lock:
+            for key, values in vectors.items():
+                vector = array.array("f", values)
+                self._remember(key, vector)
+                rows.append((key, len(vector), vector.tobytes(), now))
+            if self._db is not None:
+                self._store_disk(rows)
+
+    def _remember(self, key: str, vector: array.array) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.memory_max_items:
+            self._memory.popitem(last=False)
+
+    def _load_disk(self, keys: list[str]) -> dict[str, array.array]:
+        loaded: dict[str, array.array] = {}
+        try:
+            for start in range(0, len(keys), _SQL_CHUNK):
+                chunk = keys[start:start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                for key, blob in cursor:
+                    vector = array.array("f")
+                    vector.frombytes(blob)
+                    loaded[key] = vector
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache disk read failed: {e}")
+        return loaded
+
+    def _store_disk(self, rows: list[tuple]) -> None:
+        try:
+            before = self._db.total_changes
+            self._db.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, dim, vector, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._disk_items += self._db.total_changes - before
+            if self._disk_items > self.config.disk_max_items:
+                self._prune_disk()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache disk write failed: {e}")
+
+    def _prune_disk(self) -> None:
+        """Drop the oldest vectors once the store outgrows disk_max_items."""
+        excess = self._disk_items - self.config.disk_max_items
+        batch = max(excess, self.config.disk_prune_batch)
+        self._db.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY created_at LIMIT ?)",
+            (batch,),
+        )
+        self._disk_items = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Maintenance / introspection
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._disk_items = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self._hits + self._disk_hits + self._misses
+        return {
+            "memory_items": len(self._memory),
+            "disk_items": self._disk_items,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def embedding_model_id(provider: Any) -> str:
+    """Identify the model actually producing vectors for a provider.
+
+    Fallback wrappers report whichever side is active, so vectors from the
+    API fallback never satisfy lookups for the local model (or vice versa).
+    """
+    active = provider
+    if hasattr(provider, "primary"):
+        active = provider.secondary if getattr(provider, "using_secondary", False) else provider.primary
+    settings = get_settings()
+    name = (
+        getattr(active, "model_name", None)
+        or getattr(active, "model", None)
+        or settings.embedding.model_name
+    )
+    dimension = getattr(active, "_dimension", None) or settings.embedding.dimension
+    return f"{name}@{dimension}"
+
+
+class CachedEmbeddingProvider:
+    """
+    Embedding provider wrapper that answers from the cache and sends only
+    misses (deduplicated) to the wrapped provider.
+
+    Exposes the EmbeddingProvider interface; anything else is delegated to
+    the wrapped provider.
+    """
+
+    def __init__(self, provider: Any, cache: EmbeddingCache | None = None) -> None:
+        self.provider = provider
+        self.cache = cache or get_embedding_cache()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    @property
+    def dimension(self) -> int:
+        return self.provider.dimension
+
+    async def load(self) -> None:
+        await self.provider.load()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        model_id = embedding_model_id(self.provider)
+        keys = [make_cache_key(model_id, "", text) for text in texts]
+        found = self.cache.get_many(keys)
+
+        misses = {key: text for key, text in zip(keys, texts) if key not in found}
+        if misses:
+            vectors = await self.provider.embed(list(misses.values()))
+            fresh = {key: list(vector) for key, vector in zip(misses, vectors)}
+            # A fallback provider may have switched models during the call;
+            # those vectors must not be stored under the old model's keys.
+            if embedding_model_id(self.provider) == model_id:
+                self.cache.put_many(fresh)
+            found.update(fresh)
+
+        return [found[key] for key in keys]
+
+    async def embed_query(self, query: str) -> list[float]:
+        instruction = get_settings().embedding.instruction
+        model_id = embedding_model_id(self.provider)
+        key = make_cache_key(model_id, instruction, query)
+        found = self.cache.get_many([key])
+        if key in found:
+            return found[key]
+
+        vector = list(await self.provider.embed_query(query))
+        if embedding_model_id(self.provider) == model_id:
+            self.cache.put_many({key: vector})
+        return vector
+
+
+# ---------------------------------------------------------------------------
+# Module-level Singleton
+# ---------------------------------------------------------------------------
+
+_embedding_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache()
+    return _embedding_cache
+
+
+def with_embedding_cache(provider: Any) -> Any:
+    """Wrap a provider with the shared cache when caching is enabled."""
+    if provider is None or isinstance(provider, CachedEmbeddingProvider):
+        return provider
+    if not get_settings().embedding.cache.enabled:
+        return provider
+    return CachedEmbeddingProvider(provider)
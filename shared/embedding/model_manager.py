@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 
+from shared.embedding.cache import with_embedding_cache
 from shared.logging.main import get_logger
 
 logger = get_logger(__name__)
@@ -63,7 +64,7 @@ def get_embedding_provider(use_local: bool | None = None):
         # Tier 1: Try ML Inference HTTP Service
         http_provider = _try_http_embedding_provider()
         if http_provider is not None:
-            _embedding_provider = http_provider
+            _embedding_provider = with_embedding_cache(http_provider)
             return _embedding_provider
 
         # Tier 2 & 3: Local PyTorch with API fallback
@@ -110,6 +111,10 @@ def get_embedding_provider(use_local: bool | None = None):
                     self.using_secondary = True
                     return await self.secondary.embed_query(query)
 
+            def format_query(self, query: str) -> str:
+                provider = self.secondary if self.using_secondary else self.primary
+                return provider.format_query(query)
+
             async def load(self) -> None:
                 """Pre-load the primary model."""
                 if not self.using_secondary:
@@ -156,6 +161,8 @@ def get_embedding_provider(use_local: bool | None = None):
                 dimension=config.embedding.dimension
             )
             logger.info(f"Model Manager: Embedding provider initialized (API Only)")
+
+        _embedding_provider = with_embedding_cache(_embedding_provider)
     
     return _embedding_provider
 
@@ -220,6 +227,64 @@ def switch_reranker_device(new_device: str):
         logger.warning("Model Manager: Cannot switch device (Provider not initialized or incapable)")
 
 
+def _is_transient_embed_error(e: Exception) -> bool:
+    """Timeouts, disconnects and server errors that a smaller batch may avoid."""
+    import httpx
+    # str(e) is often empty for TimeoutError/ReadError on Windows, so check types too
+    if isinstance(e, (asyncio.TimeoutError, httpx.TimeoutException, httpx.ReadError)):
+        return True
+    error_str = str(e).lower()
+    return "500" in error_str or "timeout" in error_str or "disconnected" in error_str
+
+
+async def embed_in_batches(
+    embedder,
+    texts: list[str],
+    batch_size: int | None = None,
+) -> list[list[float] | None]:
+    """
+    Embed documents in large batches, shrinking the batch on OOM/timeouts.
+
+    A transient failure halves the batch size and retries the same
+    offset; other failures are retried up to ``database.max_retries``.
+    Texts that cannot be embedded even alone get ``None`` so callers can
+    skip them without failing the whole sync.
+    """
+    from shared.config import get_settings
+    settings = get_settings()
+    batch_size = max(1, batch_size or settings.embedding.sync_batch_size)
+    max_retries = settings.database.max_retries
+    retry_delay = settings.database.retry_delay
+
+    vectors: list[list[float] | None] = [None] * len(texts)
+    i = 0
+    attempt = 0
+    while i < len(texts):
+        size = min(batch_size, len(texts) - i)
+        try:
+            embeddings = await embedder.embed(texts[i:i + size])
+            vectors[i:i + size] = [list(e) for e in embeddings]
+            i += size
+            attempt = 0
+        except Exception as e:
+            if _is_transient_embed_error(e) and batch_size > 1:
+                new_size = (batch_size + 1) // 2
+                logger.warning(
+                    f"Embedding batch OOM/Timeout. Halving batch size from {batch_size} to {new_size}."
+                )
+                batch_size = new_size
+                await asyncio.sleep(retry_delay)
+            elif not _is_transient_embed_error(e) and attempt < max_retries - 1:
+                attempt += 1
+                logger.warning(f"Embedding batch failed (attempt {attempt}/{max_retries}): {type(e).__name__}: {e}. Retrying...")
+                await asyncio.sleep(retry_delay)
+            else:
+                logger.error(f"Embedding batch permanently failed at offset {i}; skipping {size} item(s)", error=f"{type(e).__name__}: {e}")
+                i += size
+                attempt = 0
+    return vectors
+
+
 # ============================================================================
 # ModelManager Facade
 # ============================================================================
@@ -51,6 +51,10 @@ class EmbeddingProvider(ABC):
     async def embed_query(self, query: str) -> list[float]:
         """Generate embedding for a query (with query prompt)."""
         pass
+
+    def format_query(self, query: str) -> str:
+        """Return the query text exactly as embed_query() would encode it."""
+        return query
     
     async def load(self) -> None:
         """Explicitly load the model into memory/GPU (optional)."""
@@ -128,15 +132,16 @@ class OpenRouterEmbedding(EmbeddingProvider):
         """OpenRouter is an API, no local loading needed."""
         pass
     
-    async def embed_query(self, query: str) -> list[float]:
-        """Generate embedding for query with instruction."""
+    def format_query(self, query: str) -> str:
+        """Prefix the query with the task instruction."""
         # Qwen3 embedding uses instruction prefix for queries
         from shared.config import get_settings
         settings = get_settings()
-        instruction = f"Instruct: {settings.embedding.instruction}\nQuery: "
-        formatted_query = instruction + query
-        
-        embeddings = await self.embed([formatted_query])
+        return f"Instruct: {settings.embedding.instruction}\nQuery: " + query
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Generate embedding for query with instruction."""
+        embeddings = await self.embed([self.format_query(query)])
         return embeddings[0]
 
 
@@ -424,15 +429,15 @@ class LocalEmbedding(EmbeddingProvider):
             embeddings = await loop.run_in_executor(None, process_all)
             return embeddings
     
-    async def embed_query(self, query: str) -> list[float]:
-        """Generate embedding for query with instruction (official Qwen3 pattern)."""
+    def format_query(self, query: str) -> str:
+        """Format query with instruction (official Qwen3 pattern)."""
         from shared.config import get_settings
         task = get_settings().embedding.instruction
-        
-        # Format query with instruction
-        formatted_query = self._get_detailed_instruct(task, query)
-        
-        embeddings = await self.embed([formatted_query])
+        return self._get_detailed_instruct(task, query)
+
+    async def embed_query(self, query: str) -> list[float]:
+        """Generate embedding for query with instruction (official Qwen3 pattern)."""
+        embeddings = await self.embed([self.format_query(query)])
         return embeddings[0]
 
 
@@ -43,6 +43,28 @@ class RerankerProvider(ABC):
     ) -> list[RerankResult]:
         """Rerank documents by relevance to query."""
         pass
+
+    async def score_pairs(
+        self,
+        pairs: list[tuple[str, str]],
+        instruction: str | None = None,
+    ) -> list[float]:
+        """
+        Score (query, document) pairs in input order.
+
+        Pairs may mix queries. The default groups them by query and
+        delegates to rerank(); local models override this with a single
+        batched forward pass.
+        """
+        scores = [0.0] * len(pairs)
+        by_query: dict[str, list[int]] = {}
+        for i, (query, _) in enumerate(pairs):
+            by_query.setdefault(query, []).append(i)
+        for query, positions in by_query.items():
+            results = await self.rerank(query, [pairs[i][1] for i in positions])
+            for result in results:
+                scores[positions[result.index]] = result.score
+        return scores
         
     async def load(self) -> None:
         """Pre-load the model."""
@@ -228,10 +250,37 @@ class LocalReranker(RerankerProvider):
         instruction: str | None = None,
     ) -> list[RerankResult]:
         """Rerank documents by relevance to query."""
+        if not documents:
+            return []
+        
+        all_scores = await self.score_pairs(
+            [(query, doc) for doc in documents], instruction
+        )
+        
+        # Build results
+        results = [
+            RerankResult(index=i, score=score, text=documents[i])
+            for i, score in enumerate(all_scores)
+        ]
+        
+        # Sort by score descending
+        results.sort(key=lambda x: x.score, reverse=True)
+        
+        if top_k:
+            results = results[:top_k]
+        
+        return results
+
+    async def score_pairs(
+        self,
+        pairs: list[tuple[str, str]],
+        instruction: str | None = None,
+    ) -> list[float]:
+        """Score (query, document) pairs in input order; queries may differ."""
         import asyncio
         import torch
         
-        if not documents:
+        if not pairs:
             return []
         
         if self._exec_lock is None:
@@ -283,13 +332,15 @@ class LocalReranker(RerankerProvider):
                             return scores
                 
                 i = 0
-                while i < len(documents):
-                    actual_batch = min(BATCH_SIZE, len(documents) - i)
-                    batch_docs = documents[i : i + actual_batch]
-                    pairs = [self._format_instruction(query, doc, instruction) for doc in batch_docs]
+                while i < len(pairs):
+                    actual_batch = min(BATCH_SIZE, len(pairs) - i)
+                    batch_pairs = [
+                        self._format_instruction(query, doc, instruction)
+                        for query, doc in pairs[i : i + actual_batch]
+                    ]
                     
                     try:
-                        batch_scores = compute_batch_scores(pairs)
+                        batch_scores = compute_batch_scores(batch_pairs)
                         out_scores.extend(batch_scores)
                         i += actual_batch
                     except Exception as e:
@@ -307,19 +358,7 @@ class LocalReranker(RerankerProvider):
                 
             all_scores = await loop.run_in_executor(None, compute_all_scores)
         
-        # Build results
-        results = [
-            RerankResult(index=i, score=score, text=documents[i])
-            for i, score in enumerate(all_scores)
-        ]
-        
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        if top_k:
-            results = results[:top_k]
-        
-        return results
+        return all_scores
 
 
 def create_reranker_provider(**kwargs) -> RerankerProvider:
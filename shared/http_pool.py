@@ -0,0 +1,257 @@
+"""
+Pooled HTTP Clients.
+
+Process-wide registry of ``httpx.AsyncClient`` instances, one per
+(event loop, origin). Inter-service and LLM calls reuse keep-alive
+connections instead of paying TCP/TLS setup on every request.
+
+Each Kea service runs its own event loop, and an httpx client must not
+be shared across loops, so clients are keyed by the running loop as well
+as by origin (scheme, host, port). Connection limits therefore apply per
+host. HTTP/2 is negotiated for TLS origins when the ``h2`` package is
+installed.
+
+Usage:
+    client = get_http_client(url)
+    resp = await client.post(url, json=payload, timeout=10.0)
+
+Call ``close_http_clients()`` from the service's shutdown hook.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from shared.config import get_settings
+from shared.logging.main import get_logger
+
+
+logger = get_logger(__name__)
+
+try:
+    from prometheus_client import Counter, Gauge
+    HTTP_POOL_CLIENTS = Gauge("system_http_pool_clients", "Open pooled HTTP clients")
+    HTTP_POOL_IN_USE = Gauge(
+        "system_http_pool_in_use", "Requests currently holding a pooled connection", ["host"]
+    )
+    HTTP_POOL_REQUESTS = Counter(
+        "system_http_pool_requests_total",
+        "Requests sent through pooled clients, by new or reused connection",
+        ["host", "connection"],
+    )
+    METRICS_ENABLED = True
+except ImportError:
+    METRICS_ENABLED = False
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def origin_of(url: str | httpx.URL) -> str:
+    """``scheme://host:port`` for ``url`` (the pool key)."""
+    url = httpx.URL(url)
+    port = url.port or (443 if url.scheme == "https" else 80)
+    return f"{url.scheme}://{url.host}:{port}"
+
+
+# ============================================================================
+# Instrumented Transport
+# ============================================================================
+
+@dataclass
+class PoolStats:
+    """Counters for one origin's pool."""
+    requests: int = 0
+    new_connections: int = 0
+    in_use: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.requests - self.new_connections
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body that releases its pool slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """
+    ``AsyncHTTPTransport`` that counts connection reuse and in-flight requests.
+
+    A request is on a new connection if httpcore traced a TCP connect
+    while serving it; otherwise it reused a pooled one.
+    """
+
+    def __init__(self, host: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.host = host
+        self.stats = PoolStats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        connected = False
+        caller_trace = request.extensions.get("trace")
+
+        async def trace(event: str, info: dict) -> None:
+            nonlocal connected
+            if event == "connection.connect_tcp.complete":
+                connected = True
+            if caller_trace is not None:
+                await caller_trace(event, info)
+
+        request.extensions["trace"] = trace
+        self._acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+        finally:
+            self._count(connected)
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._release()
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_TrackedStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def _acquire(self) -> None:
+        self.stats.in_use += 1
+        if METRICS_ENABLED:
+            HTTP_POOL_IN_USE.labels(host=self.host).inc()
+
+    def _release(self) -> None:
+        self.stats.in_use -= 1
+        if METRICS_ENABLED:
+            HTTP_POOL_IN_USE.labels(host=self.host).dec()
+
+    def _count(self, connected: bool) -> None:
+        self.stats.requests += 1
+        if connected:
+            self.stats.new_connections += 1
+        if METRICS_ENABLED:
+            HTTP_POOL_REQUESTS.labels(
+                host=self.host, connection="new" if connected else "reused"
+            ).inc()
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class HttpClientRegistry:
+    """Pooled clients keyed by event loop, then by origin."""
+
+    def __init__(self) -> None:
+        self._clients: dict[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = {}
+        self._transports: dict[asyncio.AbstractEventLoop, dict[str, PooledTransport]] = {}
+
+    def get(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        """Client for ``url``'s origin on the running loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        origin = origin_of(url)
+        clients = self._clients.get(loop)
+        if clients is None:
+            self._prune_closed_loops()
+            clients = self._clients.setdefault(loop, {})
+
+        client = clients.get(origin)
+        if client is None or client.is_closed:
+            client = self._make_client(loop, origin)
+            clients[origin] = client
+        return client
+
+    async def close(self) -> None:
+        """Close every client owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.pop(loop, {})
+        self._transports.pop(loop, None)
+        for client in clients.values():
+            if not client.is_closed:
+                await client.aclose()
+        if METRICS_ENABLED and clients:
+            HTTP_POOL_CLIENTS.dec(len(clients))
+
+    def stats(self) -> dict[str, PoolStats]:
+        """Per-origin counters, summed across loops."""
+        totals: dict[str, PoolStats] = {}
+        for transports in list(self._transports.values()):
+            for origin, transport in list(transports.items()):
+                total = totals.setdefault(origin, PoolStats())
+                total.requests += transport.stats.requests
+                total.new_connections += transport.stats.new_connections
+                total.in_use += transport.stats.in_use
+        return totals
+
+    def _make_client(self, loop: asyncio.AbstractEventLoop, origin: str) -> httpx.AsyncClient:
+        settings = get_settings()
+        http = settings.http
+        host = origin.split("://", 1)[1]
+        max_connections = http.host_limits.get(host, http.host_limits.get(host.rsplit(":", 1)[0]))
+        max_connections = max_connections or http.max_connections_per_host
+        transport = PooledTransport(
+            host,
+            http2=http.http2 and HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(http.max_keepalive_per_host, max_connections),
+                keepalive_expiry=http.keepalive_expiry_seconds,
+            ),
+        )
+        self._transports.setdefault(loop, {})[origin] = transport
+        if METRICS_ENABLED:
+            HTTP_POOL_CLIENTS.inc()
+        logger.debug(f"HTTP pool: new client for {origin} (max {max_connections} connections)")
+        return httpx.AsyncClient(transport=transport, timeout=settings.timeouts.default)
+
+    def _prune_closed_loops(self) -> None:
+        # Clients bound to a finished loop cannot be closed from here; drop them
+        for loop in [l for l in self._clients if l.is_closed()]:
+            dropped = self._clients.pop(loop)
+            self._transports.pop(loop, None)
+            if METRICS_ENABLED and dropped:
+                HTTP_POOL_CLIENTS.dec(len(dropped))
+
+
+_registry = HttpClientRegistry()
+
+
+def get_http_client(url: str | httpx.URL) -> httpx.AsyncClient:
+    """Shared pooled client for ``url``'s origin on the running event loop."""
+    return _registry.get(url)
+
+
+async def close_http_clients() -> None:
+    """Close the pooled clients of the running event loop."""
+    await _registry.close()
+
+
+def http_pool_stats() -> dict[str, PoolStats]:
+    """Per-origin request, new-connection and in-use counts."""
+    return _registry.stats()
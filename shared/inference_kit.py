@@ -9,7 +9,10 @@ gracefully fall back to heuristics if providers are missing.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
+
+import numpy as np
 from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
@@ -17,6 +20,94 @@ if TYPE_CHECKING:
     from shared.embedding.manager import ModelManager
 
 
+class RequestEmbeddingMemo:
+    """Request-scoped embedding memo wrapped around an embedder.
+
+    Each distinct text is embedded at most once for the lifetime of the
+    memo. Concurrent callers asking for the same text await the same
+    in-flight call instead of issuing their own. Failed calls are dropped
+    so a later caller can retry. Every other attribute (``rerank_single``,
+    ``embed``, ...) is delegated to the wrapped embedder untouched.
+    """
+
+    def __init__(self, embedder: Any) -> None:
+        self._embedder = embedder
+        self._vectors: dict[str, asyncio.Future[list[float]]] = {}
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying embedder."""
+        return self._embedder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._embedder, name)
+
+    async def embed_single(self, text: str) -> list[float]:
+        """Embed one text, reusing any vector computed earlier in the request."""
+        pending = self._vectors.get(text)
+        if pending is None:
+            pending = asyncio.ensure_future(self._embedder.embed_single(text))
+            self._vectors[text] = pending
+        try:
+            return await asyncio.shield(pending)
+        except Exception:
+            if self._vectors.get(text) is pending:
+                del self._vectors[text]
+            raise
+
+    def seed(self, texts: list[str], vectors: list[list[float]]) -> None:
+        """Record vectors computed elsewhere (e.g. a persistent index) for this request."""
+        loop = asyncio.get_running_loop()
+        for text, vector in zip(texts, vectors):
+            if text not in self._vectors:
+                future = loop.create_future()
+                future.set_result(vector)
+                self._vectors[text] = future
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch, sending only texts not yet seen in this request."""
+        loop = asyncio.get_running_loop()
+        missing: list[str] = []
+        for text in texts:
+            if text not in self._vectors:
+                self._vectors[text] = loop.create_future()
+                missing.append(text)
+
+        if missing:
+            try:
+                vectors = await self._embedder.embed_batch(missing)
+            except BaseException as exc:
+                # Cancellation included: never leave placeholder futures
+                # behind, or later callers would await them forever.
+                for text in missing:
+                    future = self._vectors.pop(text)
+                    if isinstance(exc, Exception):
+                        future.set_exception(exc)
+                        # Retrieve so waiters-less futures don't warn on GC.
+                        future.exception()
+                    else:
+                        future.cancel()
+                raise
+            for text, vector in zip(missing, vectors):
+                self._vectors[text].set_result(vector)
+
+        return [await asyncio.shield(self._vectors[text]) for text in texts]
+
+
+async def embed_texts(embedder: Any, texts: list[str]) -> list[list[float]]:
+    """Embed texts in one batch call, or per text when the embedder has no batch API."""
+    if hasattr(embedder, "embed_batch"):
+        return await embedder.embed_batch(texts)
+    return list(await asyncio.gather(*(embedder.embed_single(t) for t in texts)))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so dot products are cosine similarities (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
 class InferenceKit(BaseModel):
     """Dependency injection container for inference providers.
     
@@ -56,3 +147,28 @@ class InferenceKit(BaseModel):
         """Create an empty kit (forces all modules to fallback to heuristics)."""
         return cls(llm=None, llm_config=None, embedder=None)
 
+    def with_embedding_memo(self) -> "InferenceKit":
+        """Return a copy whose embedder memoizes vectors for one request.
+
+        Returns ``self`` when there is no embedder or it is already memoized,
+        so nested callers can request a memo without stacking wrappers.
+        """
+        if self.embedder is None or isinstance(self.embedder, RequestEmbeddingMemo):
+            return self
+        return self.model_copy(update={"embedder": RequestEmbeddingMemo(self.embedder)})
+
+
+def memoized_embedding_kit(kit: InferenceKit | None) -> InferenceKit:
+    """``kit`` with a request-scoped embedding memo, for bulk similarity work.
+
+    Kits without an embedder get the shared model manager (HTTP → local →
+    API) instead, so callers can rely on ``embedder`` being set. Raises if
+    no embedding backend can be created.
+    """
+    if kit and kit.has_embedder:
+        return kit.with_embedding_memo()
+    from shared.embedding.model_manager import get_model_manager
+
+    return (kit or InferenceKit.empty()).model_copy(
+        update={"embedder": get_model_manager()}
+    ).with_embedding_memo()
@@ -6,13 +6,25 @@ from the knowledge/ directory (skills, rules, personas) using pgvector
 semantic search, mirroring the RAG tool retrieval pattern.
 """
 
+from shared.knowledge.anchor_index import AnchorIndex, get_anchor_index
 from shared.knowledge.registry import PostgresKnowledgeRegistry
 from shared.knowledge.retriever import KnowledgeRetriever, get_knowledge_retriever
-from shared.knowledge.system_loader import load_system_knowledge
+from shared.knowledge.gazetteer import Gazetteer, GazetteerMatch
+from shared.knowledge.system_loader import (
+    CompiledKnowledge,
+    compile_system_knowledge,
+    load_system_knowledge,
+)
 
 __all__ = [
+    "AnchorIndex",
+    "get_anchor_index",
     "PostgresKnowledgeRegistry",
     "KnowledgeRetriever",
     "get_knowledge_retriever",
+    "CompiledKnowledge",
+    "Gazetteer",
+    "GazetteerMatch",
+    "compile_system_knowledge",
     "load_system_knowledge",
 ]
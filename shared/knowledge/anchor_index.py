@@ -0,0 +1,156 @@
+"""
+Anchor Similarity Index.
+
+Vectorized lookup for the embedding anchors defined in knowledge/system/
+YAML files (e.g. ``intent_anchors`` in core_perception.yaml). All anchors of
+a section are embedded in one batch and kept as an L2-normalized float32
+matrix, so scoring a query against every label is a single matrix-vector
+product. Indexes are rebuilt only when the section's content hash changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from shared.knowledge.system_loader import compile_system_knowledge
+from shared.logging.main import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class AnchorIndex:
+    """Normalized anchor matrix for one knowledge section.
+
+    ``labels[i]`` names row ``i`` of ``matrix``. ``entries`` maps each label
+    to the raw YAML value it came from (the anchor text for mapping
+    sections, the whole item for list sections).
+    """
+
+    labels: tuple[str, ...]
+    matrix: np.ndarray
+    entries: dict[str, Any]
+    content_hash: str
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1]) if self.matrix.ndim == 2 else 0
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def scores(self, vector: Any) -> np.ndarray:
+        """Cosine similarity of ``vector`` against every anchor."""
+        query = np.asarray(vector, dtype=np.float32)
+        if not self.labels or query.shape != (self.dim,):
+            return np.zeros(len(self.labels), dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return np.zeros(len(self.labels), dtype=np.float32)
+        return self.matrix @ (query / norm)
+
+    def top_k(self, vector: Any, k: int | None = None) -> list[tuple[str, float]]:
+        """Labels ranked by similarity, best first (all labels when ``k`` is None)."""
+        scores = self.scores(vector)
+        if k is None or k >= len(scores):
+            order = np.argsort(-scores, kind="stable")
+        else:
+            top = np.argpartition(-scores, k)[:k]
+            order = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.labels[i], float(scores[i])) for i in order]
+
+    def best(self, vector: Any) -> tuple[str, float] | None:
+        """Highest-scoring label, or None for an empty index."""
+        ranked = self.top_k(vector, 1)
+        return ranked[0] if ranked else None
+
+
+# (filename, section) -> (file hash, index)
+_INDEXES: dict[tuple[str, str], tuple[str, AnchorIndex]] = {}
+_BUILD_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+
+
+def _section_anchors(section_data: Any) -> dict[str, Any]:
+    """Map label -> raw entry for a mapping section or a list of ``{text: ...}`` items."""
+    if isinstance(section_data, dict):
+        return {str(label): text for label, text in section_data.items() if text}
+    if isinstance(section_data, list):
+        return {
+            str(item["text"]): item
+            for item in section_data
+            if isinstance(item, dict) and item.get("text")
+        }
+    return {}
+
+
+def _anchor_text(entry: Any) -> str:
+    return str(entry["text"]) if isinstance(entry, dict) else str(entry)
+
+
+def _normalize_rows(vectors: list[list[float]]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        return np.zeros((0, 0), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+async def _embed_texts(embedder: Any, texts: list[str]) -> list[list[float]]:
+    if hasattr(embedder, "embed_batch"):
+        return await embedder.embed_batch(texts)
+    return list(await asyncio.gather(*(embedder.embed_single(t) for t in texts)))
+
+
+async def get_anchor_index(
+    filename: str,
+    section: str,
+    embedder: Any,
+    dim: int | None = None,
+) -> AnchorIndex:
+    """Return the anchor index for ``section`` of a knowledge/system/ file.
+
+    The file is re-parsed only when its content changes, and anchors are
+    re-embedded only when the section content (or the embedding width,
+    when ``dim`` is given) changes.
+    """
+    key = (filename, section)
+    knowledge = compile_system_knowledge(filename)
+    file_hash = knowledge.content_hash
+    cached = _INDEXES.get(key)
+    if cached and cached[0] == file_hash and (dim is None or cached[1].dim == dim):
+        return cached[1]
+
+    lock = _BUILD_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _INDEXES.get(key)
+        if cached and cached[0] == file_hash and (dim is None or cached[1].dim == dim):
+            return cached[1]
+
+        anchors = _section_anchors(knowledge.data.get(section))
+        content_hash = hashlib.sha256(
+            json.dumps(anchors, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+        if cached and cached[1].content_hash == content_hash and (dim is None or cached[1].dim == dim):
+            # File changed elsewhere; this section did not.
+            index = cached[1]
+        else:
+            labels = tuple(anchors)
+            vectors = await _embed_texts(embedder, [_anchor_text(anchors[label]) for label in labels]) if labels else []
+            index = AnchorIndex(
+                labels=labels,
+                matrix=_normalize_rows(vectors),
+                entries=anchors,
+                content_hash=content_hash,
+            )
+            log.debug("Anchor index built", filename=filename, section=section, anchors=len(labels), dim=index.dim)
+
+        _INDEXES[key] = (file_hash, index)
+        return index
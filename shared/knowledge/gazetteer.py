@@ -0,0 +1,123 @@
+"""
+Gazetteer Matcher.
+
+Aho-Corasick multi-pattern automaton for knowledge-driven vocabularies
+(place names, organizations, entity lexicons). All terms are matched in a
+single linear pass over the text, independent of vocabulary size.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """One term occurrence: ``text[start:end]`` matched the term for ``key``."""
+
+    start: int
+    end: int
+    key: str
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class Gazetteer:
+    """Aho-Corasick automaton over a fixed vocabulary.
+
+    ``terms`` is either an iterable of terms or a mapping of term -> key;
+    matches report the key. Matching is case-insensitive and restricted to
+    whole words (``\\bterm\\b``) by default.
+    """
+
+    def __init__(
+        self,
+        terms: Mapping[str, str] | Iterable[str],
+        *,
+        case_sensitive: bool = False,
+        whole_words: bool = True,
+    ) -> None:
+        self._case_sensitive = case_sensitive
+        self._whole_words = whole_words
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (term length, key, term starts/ends with a word char)
+        self._out: list[list[tuple[int, str, bool, bool]]] = [[]]
+        self._size = 0
+
+        items = terms.items() if isinstance(terms, Mapping) else ((t, t) for t in terms)
+        for term, key in items:
+            self._add(str(term), str(key))
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _fold(self, text: str) -> str:
+        if self._case_sensitive:
+            return text
+        folded = text.lower()
+        if len(folded) == len(text):
+            return folded
+        # Keep offsets aligned when lowercasing changes a character's length
+        return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def _add(self, term: str, key: str) -> None:
+        folded = self._fold(term)
+        if not folded:
+            return
+        state = 0
+        for ch in folded:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state].append(
+            (len(folded), key, _is_word_char(folded[0]), _is_word_char(folded[-1]))
+        )
+        self._size += 1
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[GazetteerMatch]:
+        """All (possibly overlapping) term matches, ordered by position."""
+        folded = self._fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        matches: list[GazetteerMatch] = []
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            for length, key, word_start, word_end in out[state]:
+                start = end - length
+                if self._whole_words and (
+                    (word_start and start > 0 and _is_word_char(text[start - 1]))
+                    or (word_end and end < len(text) and _is_word_char(text[end]))
+                ):
+                    continue
+                matches.append(GazetteerMatch(start=start, end=end, key=key))
+        matches.sort(key=lambda m: (m.start, -m.end))
+        return matches
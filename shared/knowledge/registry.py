@@ -14,12 +14,10 @@ import json
 from typing import Any
 
 import asyncpg
-import httpx
-from pgvector.asyncpg import register_vector
 
-from shared.database.connection import get_database_pool
+from shared.database.connection import ensure_vector_codec, get_database_pool
 from shared.config import get_settings
-from shared.embedding.model_manager import get_embedding_provider, get_reranker_provider
+from shared.embedding.model_manager import embed_in_batches, get_embedding_provider, get_reranker_provider
 from shared.logging.main import get_logger
 
 logger = get_logger(__name__)
@@ -73,7 +71,7 @@ class PostgresKnowledgeRegistry:
                 await conn.execute(f"SELECT pg_advisory_lock({settings.knowledge.advisory_lock_id})")
                 try:
                     await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-                    await register_vector(conn)
+                    await ensure_vector_codec(conn)
 
                     await conn.execute(f"""
                         CREATE TABLE IF NOT EXISTS {self.table_name} (
@@ -149,6 +147,7 @@ class PostgresKnowledgeRegistry:
     async def sync_knowledge(
         self,
         items: list[dict[str, Any]],
+        prune: bool = False,
     ) -> int:
         """
         Incremental sync of knowledge items to registry.
@@ -163,6 +162,12 @@ class PostgresKnowledgeRegistry:
             - content: Full markdown content
             - metadata: Optional extra metadata dict
 
+        The registry is diffed against ``items`` with one hash query; only
+        new or modified items are embedded, and all writes are applied as
+        set-based statements in one transaction. With ``prune`` rows whose
+        id is absent from ``items`` are deleted (pass it only for a full,
+        unfiltered scan).
+
         Returns:
             Number of items updated/inserted
         """
@@ -170,149 +175,101 @@ class PostgresKnowledgeRegistry:
             return 0
 
         pool = await self._get_pool()
+        settings = get_settings()
         logger.info(f"Knowledge Registry: Syncing {len(items)} items...")
 
-        updates_needed: list[tuple[dict[str, Any], str]] = []
+        # Last occurrence wins, as with sequential upserts
+        by_id = {item["knowledge_id"]: item for item in items}
+        hashes = {kid: self._compute_hash(item["content"]) for kid, item in by_id.items()}
 
         async with pool.acquire() as conn:
-            for item in items:
-                content_hash = self._compute_hash(item["content"])
-                knowledge_id = item["knowledge_id"]
-
-                row = await conn.fetchrow(
-                    f"SELECT content_hash FROM {self.table_name} WHERE knowledge_id = $1",
-                    knowledge_id,
-                )
+            existing = {
+                row["knowledge_id"]: row["content_hash"]
+                for row in await conn.fetch(f"SELECT knowledge_id, content_hash FROM {self.table_name}")
+            }
+
+        unchanged = [kid for kid, h in hashes.items() if existing.get(kid) == h]
+        changed = [kid for kid, h in hashes.items() if existing.get(kid) != h]
+        deleted = [kid for kid in existing if kid not in hashes] if prune else []
+
+        embeddings: list[list[float] | None] = []
+        if changed:
+            logger.info(f"Knowledge Registry: Embedding {len(changed)} new/modified items in batches...")
+            limit = settings.knowledge.embedding_content_limit
+            embeddings = await embed_in_batches(self.embedder, [
+                f"Knowledge: {by_id[kid]['name']}\n"
+                f"Description: {by_id[kid]['description']}\n"
+                f"Domain: {by_id[kid]['domain']}\n"
+                f"Tags: {', '.join(by_id[kid].get('tags', []))}\n"
+                f"Content:\n{by_id[kid]['content'][:limit]}"
+                for kid in changed
+            ])
+
+        upserts = [(kid, vector) for kid, vector in zip(changed, embeddings) if vector is not None]
 
-                if row and row["content_hash"] == content_hash:
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await ensure_vector_codec(conn)
+                if unchanged:
                     await conn.execute(
                         f"UPDATE {self.table_name} SET last_seen = CURRENT_TIMESTAMP "
-                        f"WHERE knowledge_id = $1",
-                        knowledge_id,
+                        f"WHERE knowledge_id = ANY($1::text[])",
+                        unchanged,
+                    )
+                if upserts:
+                    rows = [by_id[kid] for kid, _ in upserts]
+                    # tags (TEXT[]) cannot be a column of UNNEST, so it travels as JSON
+                    await conn.execute(
+                        f"""
+                        INSERT INTO {self.table_name}
+                            (knowledge_id, name, description, domain, category,
+                             tags, content, content_hash, metadata, embedding, version, parent_id)
+                        SELECT u.knowledge_id, u.name, u.description, u.domain, u.category,
+                               ARRAY(SELECT jsonb_array_elements_text(u.tags)),
+                               u.content, u.content_hash, u.metadata, u.embedding, u.version, u.parent_id
+                        FROM UNNEST(
+                            $1::text[], $2::text[], $3::text[], $4::text[], $5::text[],
+                            $6::jsonb[], $7::text[], $8::text[], $9::jsonb[], $10::vector[],
+                            $11::text[], $12::text[]
+                        ) AS u(knowledge_id, name, description, domain, category,
+                               tags, content, content_hash, metadata, embedding, version, parent_id)
+                        ON CONFLICT (knowledge_id) DO UPDATE SET
+                            name = EXCLUDED.name,
+                            description = EXCLUDED.description,
+                            domain = EXCLUDED.domain,
+                            category = EXCLUDED.category,
+                            tags = EXCLUDED.tags,
+                            content = EXCLUDED.content,
+                            content_hash = EXCLUDED.content_hash,
+                            metadata = EXCLUDED.metadata,
+                            embedding = EXCLUDED.embedding,
+                            version = EXCLUDED.version,
+                            last_seen = CURRENT_TIMESTAMP
+                        """,
+                        [item["knowledge_id"] for item in rows],
+                        [item["name"] for item in rows],
+                        [item["description"] for item in rows],
+                        [item["domain"] for item in rows],
+                        [item.get("category", settings.knowledge.default_category) for item in rows],
+                        [json.dumps(list(item.get("tags", []))) for item in rows],
+                        [item["content"] for item in rows],
+                        [hashes[kid] for kid, _ in upserts],
+                        [json.dumps(item.get("metadata", {})) for item in rows],
+                        [vector for _, vector in upserts],
+                        [item.get("version", settings.knowledge.default_version) for item in rows],
+                        [item.get("parent_id") for item in rows],
+                    )
+                if deleted:
+                    await conn.execute(
+                        f"DELETE FROM {self.table_name} WHERE knowledge_id = ANY($1::text[])",
+                        deleted,
                     )
-                else:
-                    updates_needed.append((item, content_hash))
-
-        if not updates_needed:
-            logger.info("Knowledge Registry: All items up to date.")
-            return 0
-
-        logger.info(f"Knowledge Registry: Embedding {len(updates_needed)} new/modified items in batches...")
-
-        # Senior Architect Fix: Dynamic Chunked Batching to prevent OOM
-        batch_size = 20
-        logger.info(f"Registry: Syncing {len(updates_needed)} items to table '{self.table_name}'...")
-        total_updated = 0
-        
-        i = 0
-        while i < len(updates_needed):
-            actual_batch_size = min(batch_size, len(updates_needed) - i)
-            batch = updates_needed[i : i + actual_batch_size]
-            
-            logger.debug(f"Registry: Processing batch at offset {i}", offset=i, batch_count=len(batch))
-            batch_texts = []
-            for item, _ in batch:
-                embed_text = (
-                    f"Knowledge: {item['name']}\n"
-                    f"Description: {item['description']}\n"
-                    f"Domain: {item['domain']}\n"
-                    f"Tags: {', '.join(item.get('tags', []))}\n"
-                    f"Content:\n{item['content'][:get_settings().knowledge.embedding_content_limit]}"
-                )
-                batch_texts.append(embed_text)
-
-            settings = get_settings()
-            max_retries = settings.database.max_retries
-            retry_delay = settings.database.retry_delay
-
-            batch_success = False
-            for attempt in range(max_retries):
-                try:
-                    # 1. Generate embeddings for the batch
-                    embeddings = await self.embedder.embed(batch_texts)
-
-                    # 2. Bulk Insert/Upsert in a single transaction
-                    async with pool.acquire() as conn:
-                        async with conn.transaction():
-                            await register_vector(conn)
-                            for j, (item, content_hash) in enumerate(batch):
-                                tags = item.get("tags", [])
-                                metadata = json.dumps(item.get("metadata", {}))
-
-                                await conn.execute(
-                                    f"""
-                                    INSERT INTO {self.table_name}
-                                        (knowledge_id, name, description, domain, category,
-                                         tags, content, content_hash, metadata, embedding, version, parent_id)
-                                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::jsonb, $10, $11, $12)
-                                    ON CONFLICT (knowledge_id) DO UPDATE SET
-                                        name = EXCLUDED.name,
-                                        description = EXCLUDED.description,
-                                        domain = EXCLUDED.domain,
-                                        category = EXCLUDED.category,
-                                        tags = EXCLUDED.tags,
-                                        content = EXCLUDED.content,
-                                        content_hash = EXCLUDED.content_hash,
-                                        metadata = EXCLUDED.metadata,
-                                        embedding = EXCLUDED.embedding,
-                                        version = EXCLUDED.version,
-                                        last_seen = CURRENT_TIMESTAMP
-                                    """,
-                                    item["knowledge_id"],
-                                    item["name"],
-                                    item["description"],
-                                    item["domain"],
-                                    item.get("category", settings.knowledge.default_category),
-                                    tags,
-                                    item["content"],
-                                    content_hash,
-                                    metadata,
-                                    embeddings[j],
-                                    item.get("version", settings.knowledge.default_version),
-                                    item.get("parent_id"),
-                                )
-                    
-                    total_updated += len(batch)
-                    logger.info(f"Knowledge Registry: Committed {len(batch)} items")
-                    i += actual_batch_size  # Move forward ONLY on success
-                    batch_success = True
-                    break
 
-                except Exception as e:
-                    # Senior Architect Fix: Explicitly check for timeout and connection errors
-                    # Note: str(e) is often empty for TimeoutError/ReadError on Windows, so we check types.
-                    is_transient = isinstance(e, (
-                        asyncio.TimeoutError,
-                        httpx.TimeoutException,
-                        httpx.ReadError,
-                    ))
-                    error_str = str(e).lower()
-                    
-                    if is_transient or "500" in error_str or "timeout" in error_str or "disconnected" in error_str:
-                        import math
-                        if batch_size > 1:
-                            logger.warning(
-                                f"Batch sync OOM/Timeout (attempt {attempt+1}/{max_retries}). "
-                                f"Halving sync batch size from {batch_size} to {math.ceil(batch_size/2)}."
-                            )
-                            batch_size = math.ceil(batch_size / 2)
-                            await asyncio.sleep(retry_delay)
-                            continue # Try same batch again with smaller size
-                        else:
-                            logger.error(f"Batch sync permanently failed. Document too large for embedding model.", error=f"{type(e).__name__}: {e}")
-                            # Skip this item so the entire bootup sequence doesn't fail
-                            i += 1 
-                            break
-                    elif attempt < max_retries - 1:
-                        logger.warning(f"Batch sync failed (attempt {attempt+1}/{max_retries}): {type(e).__name__}: {e}. Retrying...")
-                        await asyncio.sleep(retry_delay)
-                    else:
-                        logger.error(f"Batch sync permanently failed at offset {i}", error=f"{type(e).__name__}: {e}")
-                        # Skip this single item and move on
-                        i += actual_batch_size
-                        break
-
-        return total_updated
+        logger.info(
+            f"Knowledge Registry: {len(upserts)} upserted, {len(unchanged)} unchanged, "
+            f"{len(deleted)} deleted, {len(changed) - len(upserts)} skipped"
+        )
+        return len(upserts)
 
     async def _get_reranker(self):
         """Lazy load reranker via model_manager facade (HTTP → local)."""
@@ -382,9 +339,10 @@ class PostgresKnowledgeRegistry:
             params.append(candidate_limit)
 
             async with pool.acquire() as conn:
-                await register_vector(conn)
+                await ensure_vector_codec(conn)
 
-                rows = await conn.fetch(
+                rows = await pool.fetch_prepared(
+                    conn,
                     f"""
                     SELECT knowledge_id, name, description, domain, category,
                            tags, content, metadata, version, parent_id,
@@ -24,6 +24,7 @@ from typing import Any
 
 import httpx
 
+from shared.http_pool import get_http_client
 from shared.logging.main import get_logger
 from shared.service_registry import ServiceName, ServiceRegistry
 
@@ -100,17 +101,18 @@ class KnowledgeRetriever:
         logger.debug(f"KnowledgeRetriever: querying RAG Service [{label}] q='{query[:60]}'")
 
         try:
-            async with httpx.AsyncClient(timeout=settings.knowledge.timeout_search) as client:
-                resp = await client.post(
-                    f"{self._rag_url()}/knowledge/search",
-                    json=payload,
+            url = f"{self._rag_url()}/knowledge/search"
+            resp = await get_http_client(url).post(
+                url,
+                json=payload,
+                timeout=settings.knowledge.timeout_search,
+            )
+            if resp.status_code != 200:
+                logger.warning(
+                    f"KnowledgeRetriever: RAG Service returned {resp.status_code} [{label}]"
                 )
-                if resp.status_code != 200:
-                    logger.warning(
-                        f"KnowledgeRetriever: RAG Service returned {resp.status_code} [{label}]"
-                    )
-                    return ""
-                results: list[dict[str, Any]] = resp.json()
+                return ""
+            results: list[dict[str, Any]] = resp.json()
 
             if not results:
                 logger.debug(f"KnowledgeRetriever: no items found [{label}]")
@@ -185,14 +187,15 @@ class KnowledgeRetriever:
             payload["tags"] = tags
             
         try:
-            async with httpx.AsyncClient(timeout=settings.knowledge.timeout_raw) as client:
-                resp = await client.post(
-                    f"{self._rag_url()}/knowledge/search",
-                    json=payload,
-                )
-                if resp.status_code == 200:
-                    return resp.json()
-                return []
+            url = f"{self._rag_url()}/knowledge/search"
+            resp = await get_http_client(url).post(
+                url,
+                json=payload,
+                timeout=settings.knowledge.timeout_raw,
+            )
+            if resp.status_code == 200:
+                return resp.json()
+            return []
         except Exception as e:
             logger.warning(f"KnowledgeRetriever: Raw search failed: {type(e).__name__}: {e}")
             return []
@@ -289,9 +292,9 @@ class KnowledgeRetriever:
         from shared.config import get_settings
         settings = get_settings()
         try:
-            async with httpx.AsyncClient(timeout=settings.knowledge.timeout_health) as client:
-                resp = await client.get(f"{self._rag_url()}/health")
-                return resp.status_code == 200
+            url = f"{self._rag_url()}/health"
+            resp = await get_http_client(url).get(url, timeout=settings.knowledge.timeout_health)
+            return resp.status_code == 200
         except Exception:
             return False
 
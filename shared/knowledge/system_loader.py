@@ -3,26 +3,170 @@ System Knowledge Loader.
 
 Provides direct access to core kernel knowledge files stored in knowledge/system/
 that are required for bootstrap and high-speed perception (T1/T6).
+
+Files are compiled once: the parsed YAML, precompiled regex rules and
+gazetteer automata are cached per file and only rebuilt when the file's
+mtime changes *and* its content hash differs.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
+import re
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, TypeVar
 import yaml
 
 from shared.config import get_settings
+from shared.knowledge.gazetteer import Gazetteer
 from shared.logging.main import get_logger
 
 log = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+def system_knowledge_path(filename: str) -> Path:
+    """Resolve the on-disk path of a knowledge/system/ file (may not exist)."""
+    settings = get_settings()
+
+    # Standard path: knowledge/system/<filename>
+    # We use settings.app.knowledge_dir which defaults to 'knowledge'
+    # Resolve path relative to project root
+    # In most deployments, the working directory is the project root
+    project_root = Path(os.getcwd())
+    file_path = project_root / settings.app.knowledge_dir / "system" / filename
+
+    if not file_path.exists():
+        # Fallback for different execution contexts
+        # Try relative to this file's parent's parent (shared/knowledge/...)
+        file_path = Path(__file__).parents[2] / settings.app.knowledge_dir / "system" / filename
+
+    return file_path
+
+
+class CompiledKnowledge:
+    """One parsed knowledge/system/ file plus artifacts derived from it.
+
+    ``data`` is shared between callers and must be treated as read-only.
+    Derived artifacts (compiled patterns, gazetteers, lexicons) are built
+    lazily on first use and live as long as this content version.
+    """
+
+    def __init__(self, filename: str, data: dict[str, Any], content_hash: str) -> None:
+        self.filename = filename
+        self.data = data
+        self.content_hash = content_hash
+        self._derived: dict[Any, Any] = {}
+        self._lock = threading.Lock()
+
+    def derive(self, key: Any, builder: Callable[[dict[str, Any]], T]) -> T:
+        """Build (once) and cache an artifact computed from ``data``."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self.data)
+            return self._derived[key]
+
+    def patterns(self, section: str, flags: int = re.IGNORECASE) -> dict[str, re.Pattern[str]]:
+        """Precompiled ``{name: regex}`` rules from a mapping section.
+
+        Rules that fail to compile are logged and skipped.
+        """
+        def build(data: dict[str, Any]) -> dict[str, re.Pattern[str]]:
+            compiled: dict[str, re.Pattern[str]] = {}
+            for name, raw in (data.get(section) or {}).items():
+                try:
+                    compiled[name] = re.compile(raw, flags)
+                except (re.error, TypeError) as e:
+                    log.warning("Invalid knowledge pattern", filename=self.filename, rule=name, error=str(e))
+            return compiled
+
+        return self.derive(("patterns", section, flags), build)
+
+    def gazetteer(self, *sections: str, case_sensitive: bool = False) -> Gazetteer:
+        """Aho-Corasick automaton over the keys of one or more mapping sections."""
+        def build(data: dict[str, Any]) -> Gazetteer:
+            return Gazetteer(
+                _section_terms(data, sections),
+                case_sensitive=case_sensitive,
+            )
+
+        return self.derive(("gazetteer", sections, case_sensitive), build)
+
+
+def _section_terms(data: dict[str, Any], sections: Iterable[str]) -> dict[str, str]:
+    terms: dict[str, str] = {}
+    for section in sections:
+        value = data.get(section) or {}
+        keys = value.keys() if isinstance(value, dict) else value
+        for key in keys:
+            terms.setdefault(str(key), str(key))
+    return terms
+
+
+# filename -> (path, mtime_ns, size, compiled)
+_COMPILED: dict[str, tuple[Path, int, int, CompiledKnowledge]] = {}
+_COMPILE_LOCK = threading.Lock()
+
+
+def compile_system_knowledge(filename: str) -> CompiledKnowledge:
+    """
+    Return the compiled form of a knowledge/system/ file.
+
+    A ``stat`` per call detects edits; the file is re-read only when its
+    mtime or size changed, and re-parsed only when its content hash changed.
+    Missing or unreadable files compile to empty knowledge.
+    """
+    try:
+        file_path = system_knowledge_path(filename)
+        stat = file_path.stat()
+    except OSError:
+        log.warning("System knowledge file not found", filename=filename)
+        return CompiledKnowledge(filename, {}, "")
+    except Exception as e:
+        log.error("Failed to load system knowledge", filename=filename, error=str(e))
+        return CompiledKnowledge(filename, {}, "")
+
+    cached = _COMPILED.get(filename)
+    if cached and cached[0] == file_path and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+        return cached[3]
+
+    with _COMPILE_LOCK:
+        cached = _COMPILED.get(filename)
+        try:
+            raw = file_path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+            if cached and cached[0] == file_path and cached[3].content_hash == content_hash:
+                # Touched but unchanged: keep the compiled artifacts.
+                compiled = cached[3]
+            else:
+                data = yaml.safe_load(raw.decode("utf-8"))
+                compiled = CompiledKnowledge(
+                    filename, data if isinstance(data, dict) else {}, content_hash
+                )
+                log.debug("System knowledge compiled", filename=filename, sha256=content_hash[:12])
+        except Exception as e:
+            log.error("Failed to load system knowledge", filename=filename, error=str(e))
+            return CompiledKnowledge(filename, {}, "")
+
+        _COMPILED[filename] = (file_path, stat.st_mtime_ns, stat.st_size, compiled)
+        return compiled
+
+
 def load_system_knowledge(filename: str) -> dict[str, Any]:
     """
     Load a YAML file from the knowledge/system/ directory.
     
     This is used as a bootstrap mechanism for Tier 1 and Tier 6 logic
     that requires predefined anchors for embedding-based classification.
+    The parsed content is cached (see ``compile_system_knowledge``) and
+    shared between callers, so treat it as read-only.
     
     Args:
         filename: Name of the file (e.g., 'core_perception.yaml')
@@ -30,30 +174,4 @@ def load_system_knowledge(filename: str) -> dict[str, Any]:
     Returns:
         Dictionary containing the parsed YAML content, or empty dict on error.
     """
-    settings = get_settings()
-    
-    # Standard path: knowledge/system/<filename>
-    # We use settings.app.knowledge_dir which defaults to 'knowledge'
-    try:
-        # Resolve path relative to project root
-        # In most deployments, the working directory is the project root
-        project_root = Path(os.getcwd())
-        knowledge_dir = project_root / settings.app.knowledge_dir
-        file_path = knowledge_dir / "system" / filename
-        
-        if not file_path.exists():
-            # Fallback for different execution contexts
-            # Try relative to this file's parent's parent (shared/knowledge/...)
-            file_path = Path(__file__).parents[2] / settings.app.knowledge_dir / "system" / filename
-
-        if not file_path.exists():
-            log.warning("System knowledge file not found", path=str(file_path))
-            return {}
-            
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data if isinstance(data, dict) else {}
-            
-    except Exception as e:
-        log.error("Failed to load system knowledge", filename=filename, error=str(e))
-        return {}
+    return compile_system_knowledge(filename).data
@@ -0,0 +1,360 @@
+"""
+LLM Response Cache.
+
+Provider-agnostic cache for completions, keyed on a canonical hash of the
+provider, model, messages and sampling parameters.
+
+- Memory tier: bounded LRU with a TTL.
+- Disk tier (optional, ``settings.llm.cache_dir``): one JSON file per key,
+  so deterministic prompts survive restarts.
+- Single-flight: concurrent identical requests on one event loop share a
+  single upstream call (including its retries).
+- Only deterministic requests are cached (temperature at or below
+  ``settings.llm.cache_max_temperature``) unless ``LLMConfig.cache`` says
+  otherwise.
+- Streams are recorded chunk by chunk and replayed on a hit.
+
+Providers route through it with ``get_llm_cache().complete(...)`` and
+``.stream(...)``; ``CachedLLMProvider`` wraps any other provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+from shared.config import get_settings
+from shared.llm.provider import (
+    LLMConfig,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMStreamChunk,
+)
+from shared.logging.main import get_logger
+
+
+logger = get_logger(__name__)
+
+try:
+    from prometheus_client import Counter
+    LLM_CACHE_REQUESTS = Counter(
+        "system_llm_cache_requests_total",
+        "LLM cache lookups (hit, disk_hit, coalesced, miss, bypass)",
+        ["namespace", "result"],
+    )
+    METRICS_ENABLED = True
+except ImportError:
+    METRICS_ENABLED = False
+
+CompleteFn = Callable[[list[LLMMessage], LLMConfig], Awaitable[LLMResponse]]
+StreamFn = Callable[[list[LLMMessage], LLMConfig], AsyncIterator[LLMStreamChunk]]
+
+# Fields that do not change the upstream request
+_UNKEYED_FIELDS = {"cache"}
+
+
+def request_key(namespace: str, messages: list[LLMMessage], config: LLMConfig) -> str:
+    """SHA-256 over a canonical JSON encoding of the request."""
+    params = config.model_dump(mode="json", exclude=_UNKEYED_FIELDS)
+    params["model"] = config.model or get_settings().llm.default_model
+    payload = {
+        "namespace": namespace,
+        "messages": [m.model_dump(mode="json", exclude_none=True) for m in messages],
+        "params": params,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(config: LLMConfig) -> bool:
+    """Explicit ``config.cache`` wins; otherwise only deterministic sampling is cached."""
+    if config.cache is not None:
+        return config.cache
+    return config.temperature <= get_settings().llm.cache_max_temperature
+
+
+def replay_chunks(response: LLMResponse) -> list[LLMStreamChunk]:
+    """Stream chunks equivalent to a completed response (for cached completions)."""
+    chunks = []
+    if response.reasoning:
+        chunks.append(LLMStreamChunk(reasoning=response.reasoning, is_reasoning=True))
+    chunks.append(LLMStreamChunk(content=response.content, finish_reason=response.finish_reason))
+    return chunks
+
+
+class _StreamAbandoned(Exception):
+    """The leading stream was closed early; waiters must call upstream themselves."""
+
+
+class LLMResponseCache:
+    """Two-tier response cache with single-flight coalescing."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        cache_dir: str | Path | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # key -> (expires_at, entry); entry = {"response": dict, "chunks": list | None}
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Futures are bound to a loop, so in-flight calls are tracked per loop
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+        self.stats = {"hit": 0, "disk_hit": 0, "coalesced": 0, "miss": 0, "bypass": 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def complete(
+        self,
+        namespace: str,
+        messages: list[LLMMessage],
+        config: LLMConfig,
+        call: CompleteFn,
+    ) -> LLMResponse:
+        """Cached ``call(messages, config)``."""
+        if not (self.enabled and is_cacheable(config)):
+            self._record(namespace, "bypass")
+            return await call(messages, config)
+
+        key = request_key(namespace, messages, config)
+        while True:
+            entry = await self._lookup(namespace, key)
+            if entry is not None:
+                return LLMResponse.model_validate(entry["response"])
+
+            loop = asyncio.get_running_loop()
+            inflight = self._inflight.get((loop, key))
+            if inflight is not None:
+                self._record(namespace, "coalesced")
+                try:
+                    return LLMResponse.model_validate(await asyncio.shield(inflight))
+                except _StreamAbandoned:
+                    continue
+
+            self._record(namespace, "miss")
+            task = loop.create_task(self._fill(key, call, messages, config))
+            self._track(loop, key, task)
+            return LLMResponse.model_validate(await asyncio.shield(task))
+
+    async def stream(
+        self,
+        namespace: str,
+        messages: list[LLMMessage],
+        config: LLMConfig,
+        call: StreamFn,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Cached ``call(messages, config)`` stream, recorded on a miss and replayed on a hit."""
+        if not (self.enabled and is_cacheable(config)):
+            self._record(namespace, "bypass")
+            async for chunk in call(messages, config):
+                yield chunk
+            return
+
+        key = request_key(namespace, messages, config)
+        loop = asyncio.get_running_loop()
+        entry = await self._lookup(namespace, key)
+        if entry is None:
+            inflight = self._inflight.get((loop, key))
+            if inflight is not None:
+                self._record(namespace, "coalesced")
+                try:
+                    entry = {"response": await asyncio.shield(inflight), "chunks": None}
+                except _StreamAbandoned:
+                    pass
+
+        if entry is not None:
+            chunks = entry.get("chunks")
+            if chunks is None:
+                for chunk in replay_chunks(LLMResponse.model_validate(entry["response"])):
+                    yield chunk
+            else:
+                for chunk in chunks:
+                    yield LLMStreamChunk.model_validate(chunk)
+            return
+
+        self._record(namespace, "miss")
+        future = loop.create_future()
+        self._track(loop, key, future)
+        recorded: list[LLMStreamChunk] = []
+        try:
+            async for chunk in call(messages, config):
+                recorded.append(chunk)
+                yield chunk
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(
+                    e if isinstance(e, Exception) else _StreamAbandoned()
+                )
+            raise
+        if not any(c.content or c.finish_reason for c in recorded):
+            # Nothing worth replaying
+            future.set_exception(_StreamAbandoned())
+            return
+
+        response = LLMResponse(
+            content="".join(c.content for c in recorded),
+            reasoning="".join(c.reasoning for c in recorded) or None,
+            model=config.model or get_settings().llm.default_model,
+            finish_reason=next((c.finish_reason for c in reversed(recorded) if c.finish_reason), None),
+        )
+        entry = {
+            "response": response.model_dump(mode="json"),
+            "chunks": [c.model_dump(mode="json") for c in recorded],
+        }
+        await self._store(key, entry)
+        future.set_result(entry["response"])
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is left alone)."""
+        with self._lock:
+            self._memory.clear()
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    async def _fill(
+        self, key: str, call: CompleteFn, messages: list[LLMMessage], config: LLMConfig
+    ) -> dict:
+        response = await call(messages, config)
+        entry = {"response": response.model_dump(mode="json"), "chunks": None}
+        # Empty 200s are how some upstreams report errors; don't replay them
+        if response.content:
+            await self._store(key, entry)
+        return entry["response"]
+
+    async def _lookup(self, namespace: str, key: str) -> dict | None:
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._memory.move_to_end(key)
+                    self._record(namespace, "hit")
+                    return cached[1]
+                del self._memory[key]
+
+        if self.cache_dir is None:
+            return None
+        cached = await asyncio.to_thread(self._read_disk, key, now)
+        if cached is None:
+            return None
+        self._remember(key, *cached)
+        self._record(namespace, "disk_hit")
+        return cached[1]
+
+    async def _store(self, key: str, entry: dict) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        self._remember(key, expires_at, entry)
+        if self.cache_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, expires_at, entry)
+
+    def _remember(self, key: str, expires_at: float, entry: dict) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, entry)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> tuple[float, dict] | None:
+        path = self._disk_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["expires_at"] > now:
+                return data["expires_at"], data["entry"]
+            path.unlink(missing_ok=True)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path}: {e}")
+        return None
+
+    def _write_disk(self, key: str, expires_at: float, entry: dict) -> None:
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps({"expires_at": expires_at, "entry": entry}), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _track(self, loop: asyncio.AbstractEventLoop, key: str, future: asyncio.Future) -> None:
+        self._inflight[(loop, key)] = future
+
+        def _done(f: asyncio.Future) -> None:
+            if self._inflight.get((loop, key)) is f:
+                del self._inflight[(loop, key)]
+            # Mark the exception retrieved; waiters (if any) re-raise it themselves
+            if not f.cancelled():
+                f.exception()
+
+        future.add_done_callback(_done)
+
+    def _record(self, namespace: str, result: str) -> None:
+        self.stats[result] += 1
+        if METRICS_ENABLED:
+            LLM_CACHE_REQUESTS.labels(namespace=namespace, result=result).inc()
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wrap any ``LLMProvider`` with the response cache."""
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: LLMResponseCache | None = None,
+        namespace: str | None = None,
+    ) -> None:
+        self.provider = provider
+        self.cache = cache or get_llm_cache()
+        self.namespace = namespace or type(provider).__name__
+
+    async def complete(self, messages: list[LLMMessage], config: LLMConfig) -> LLMResponse:
+        return await self.cache.complete(self.namespace, messages, config, self.provider.complete)
+
+    async def stream(self, messages: list[LLMMessage], config: LLMConfig) -> AsyncIterator[LLMStreamChunk]:
+        async for chunk in self.cache.stream(self.namespace, messages, config, self.provider.stream):
+            yield chunk
+
+    async def count_tokens(self, text: str, model: str) -> int:
+        return await self.provider.count_tokens(text, model)
+
+
+_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Process-wide response cache configured from ``settings.llm``."""
+    global _cache
+    if _cache is None:
+        settings = get_settings().llm
+        _cache = LLMResponseCache(
+            max_entries=settings.cache_max_entries,
+            ttl_seconds=settings.cache_ttl_seconds,
+            cache_dir=settings.cache_dir or None,
+            enabled=settings.cache_enabled,
+        )
+    return _cache
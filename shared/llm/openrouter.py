@@ -19,9 +19,11 @@ from shared.llm.provider import (
     LLMUsage,
     LLMStreamChunk,
 )
+from shared.llm.cache import get_llm_cache
 
 
 from shared.config import get_settings
+from shared.http_pool import get_http_client
 from shared.logging.main import (
     record_llm_request, 
     record_llm_tokens, 
@@ -124,10 +126,24 @@ class OpenRouterProvider(LLMProvider):
         
         return body
     
+    @property
+    def _cache_namespace(self) -> str:
+        return f"openrouter:{self.base_url}"
+    
     async def complete(
         self,
         messages: list[LLMMessage],
         config: LLMConfig,
+    ) -> LLMResponse:
+        """Generate a completion (cached and coalesced when deterministic)."""
+        return await get_llm_cache().complete(
+            self._cache_namespace, messages, config, self._complete_uncached
+        )
+    
+    async def _complete_uncached(
+        self,
+        messages: list[LLMMessage],
+        config: LLMConfig,
     ) -> LLMResponse:
         """Generate a completion with retry logic."""
         settings = get_settings()
@@ -148,18 +164,19 @@ class OpenRouterProvider(LLMProvider):
             
             log_llm_request(log, messages, model=body.get("model", "unknown"))
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self._get_headers(),
-                    json=body,
-                )
-                # Only retry on transient errors
-                if response.status_code in (429, 500, 502, 503, 504):
-                    response.raise_for_status()
-                
+            url = f"{self.base_url}/chat/completions"
+            response = await get_http_client(url).post(
+                url,
+                headers=self._get_headers(),
+                json=body,
+                timeout=timeout,
+            )
+            # Only retry on transient errors
+            if response.status_code in (429, 500, 502, 503, 504):
                 response.raise_for_status()
-                return response.json()
+            
+            response.raise_for_status()
+            return response.json()
 
         try:
             data = await _execute()
@@ -210,6 +227,17 @@ class OpenRouterProvider(LLMProvider):
         self,
         messages: list[LLMMessage],
         config: LLMConfig,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Stream a completion (replayed from the cache when deterministic)."""
+        async for chunk in get_llm_cache().stream(
+            self._cache_namespace, messages, config, self._stream_uncached
+        ):
+            yield chunk
+    
+    async def _stream_uncached(
+        self,
+        messages: list[LLMMessage],
+        config: LLMConfig,
     ) -> AsyncIterator[LLMStreamChunk]:
         """Stream a completion."""
         
@@ -218,60 +246,61 @@ class OpenRouterProvider(LLMProvider):
         settings = get_settings()
         timeout = settings.timeouts.llm_streaming
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/chat/completions",
-                headers=self._get_headers(),
-                json=body,
-            ) as response:
-                response.raise_for_status()
+        url = f"{self.base_url}/chat/completions"
+        async with get_http_client(url).stream(
+            "POST",
+            url,
+            headers=self._get_headers(),
+            json=body,
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
+            
+            full_content = []
+            full_reasoning = []
+            
+            async for line in response.aiter_lines():
+                if not line or not line.startswith("data: "):
+                    continue
                 
-                full_content = []
-                full_reasoning = []
+                data_str = line[6:]
+                if data_str == "[DONE]":
+                    break
                 
-                async for line in response.aiter_lines():
-                    if not line or not line.startswith("data: "):
-                        continue
+                try:
+                    import json
+                    data = json.loads(data_str)
+                    choice = data.get("choices", [{}])[0]
+                    delta = choice.get("delta", {})
                     
-                    data_str = line[6:]
-                    if data_str == "[DONE]":
-                        break
+                    chunk_content = delta.get("content", "")
+                    chunk_reasoning = delta.get("reasoning", "")
                     
-                    try:
-                        import json
-                        data = json.loads(data_str)
-                        choice = data.get("choices", [{}])[0]
-                        delta = choice.get("delta", {})
-                        
-                        chunk_content = delta.get("content", "")
-                        chunk_reasoning = delta.get("reasoning", "")
+                    if chunk_content:
+                        full_content.append(chunk_content)
+                    if chunk_reasoning:
+                        full_reasoning.append(chunk_reasoning)
                         
-                        if chunk_content:
-                            full_content.append(chunk_content)
-                        if chunk_reasoning:
-                            full_reasoning.append(chunk_reasoning)
-                            
-                        # Check if this is reasoning content
-                        is_reasoning = "reasoning" in delta
-                        
-                        yield LLMStreamChunk(
-                            content=chunk_content,
-                            reasoning=chunk_reasoning,
-                            is_reasoning=is_reasoning,
-                            finish_reason=choice.get("finish_reason"),
-                        )
-                    except Exception:
-                        continue
-                
-                log_llm_response(
-                    log, 
-                    content="".join(full_content), 
-                    model=config.model, 
-                    reasoning="".join(full_reasoning),
-                    event_name="LLM Stream Finished"
-                )
-    
+                    # Check if this is reasoning content
+                    is_reasoning = "reasoning" in delta
+                    
+                    yield LLMStreamChunk(
+                        content=chunk_content,
+                        reasoning=chunk_reasoning,
+                        is_reasoning=is_reasoning,
+                        finish_reason=choice.get("finish_reason"),
+                    )
+                except Exception:
+                    continue
+            
+            log_llm_response(
+                log, 
+                content="".join(full_content), 
+                model=config.model, 
+                reasoning="".join(full_reasoning),
+                event_name="LLM Stream Finished"
+            )
+
     async def count_tokens(self, text: str, model: str) -> int:
         """
         Estimate token count.
@@ -42,6 +42,9 @@ class LLMConfig(BaseModel):
     # Reasoning support
     enable_reasoning: bool = False
     reasoning_effort: str = "medium"  # low, medium, high
+    
+    # Response cache: None caches only deterministic requests, False never caches
+    cache: bool | None = None
 
 
 class LLMUsage(BaseModel):
@@ -1,17 +1,76 @@
 import inspect
 import functools
+import itertools
+import logging
 import time
 import asyncio
-from typing import Any, Callable, Optional
+import zlib
+from typing import Any, Callable, Iterator, Optional
 
 # Imports will be lazy to prevent circular dependencies at bootstrap time
 
+# Envelopes from log_input/log_output/log_error are emitted on this logger
+_IO_LOGGER = logging.getLogger("io")
+
+
+def _trace_io_settings() -> Any:
+    try:
+        from shared.config import get_settings
+        return get_settings().logging
+    except Exception:
+        return None
+
+
+def _trace_io_mode() -> str:
+    settings = _trace_io_settings()
+    return str(getattr(settings, "trace_io_mode", "auto")).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_rate(source: str) -> float:
+    """Capture rate for a source: the longest matching module prefix wins."""
+    settings = _trace_io_settings()
+    if settings is None:
+        return 1.0
+    rate = settings.trace_io_sample_rate
+    best = -1
+    for prefix, prefix_rate in settings.trace_io_module_sample_rates.items():
+        if source.startswith(prefix) and len(prefix) > best:
+            best, rate = len(prefix), prefix_rate
+    return min(1.0, max(0.0, float(rate)))
+
+
+def _is_sampled(rate: float, counter: Iterator[int]) -> bool:
+    """Deterministic sampling decision.
+
+    Inside a trace the decision depends only on the trace id, so a sampled
+    trace is captured end to end across every module sharing its rate.
+    Untraced calls fall back to every ``1/rate``-th call of the function.
+    """
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    import structlog
+    trace_id = structlog.contextvars.get_contextvars().get("trace_id")
+    if trace_id:
+        return zlib.crc32(str(trace_id).encode("utf-8")) % 10_000 < rate * 10_000
+    n = next(counter)
+    return int(n * rate) != int((n - 1) * rate)
+
+
 def trace_io(logger_name: Optional[str] = None):
     """
     A unified decorator to standardize input/output logging for any function.
-    Automatically captures function name, input arguments (mapped to names), 
+    Automatically captures function name, input arguments (mapped to names),
     duration, and outputs. Works with both async and sync functions.
-    
+
+    Payloads are captured lazily: arguments are bound and serialized only
+    when the ``io`` logger is enabled for DEBUG and the call is sampled
+    (``logging.trace_io_sample_rate`` / ``trace_io_module_sample_rates``).
+    With ``logging.trace_io_mode = "off"`` the function is returned
+    undecorated. Errors are always reported at ERROR level.
+
     Usage:
         @trace_io(logger_name="kernel.planner")
         async def generate_plan(user_id: str, context: dict) -> Plan:
@@ -20,19 +79,26 @@ def trace_io(logger_name: Optional[str] = None):
     from shared.logging.main import log_input, log_output, log_error, _truncate_data
 
     def decorator(func: Callable) -> Callable:
+        if _trace_io_mode() == "off":
+            return func
+
         # Resolve the function name or use the override logger_name for source tracking
         source = logger_name or f"{func.__module__}.{func.__qualname__}"
-        
+        counter = itertools.count(1)
+
         # Capture signature once
         try:
             sig = inspect.signature(func)
         except ValueError:
             sig = None
-        
+
+        def _should_capture() -> bool:
+            return _IO_LOGGER.isEnabledFor(logging.DEBUG) and _is_sampled(_sample_rate(source), counter)
+
         def _prepare_inputs(*args, **kwargs) -> dict:
             if not sig:
                 return {"args": _truncate_data(args), "kwargs": _truncate_data(kwargs)}
-                
+
             try:
                 bound = sig.bind(*args, **kwargs)
                 bound.apply_defaults()
@@ -42,48 +108,54 @@ def trace_io(logger_name: Optional[str] = None):
                 # Fallback if binding fails for any tricky args
                 return {"args": _truncate_data(args), "kwargs": _truncate_data(kwargs)}
 
+        def _log_result(start_time: float, result: Any) -> None:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            safe_result = _truncate_data(result)
+            log_output(source=source, data={"result": safe_result, "metrics": {"duration_ms": round(duration_ms, 2)}})
+
+        def _log_failure(start_time: float, e: Exception) -> None:
+            if not _IO_LOGGER.isEnabledFor(logging.ERROR):
+                return
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            # We pass the metrics inside a dict, which stringifies nicely if log_error explicitly stringifies it,
+            # but provides all data for JSON serialization.
+            err_payload = {"error": str(e) or e.__class__.__name__, "metrics": {"duration_ms": round(duration_ms, 2)}}
+            log_error(source=source, err=err_payload)
+
         if asyncio.iscoroutinefunction(func):
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                inputs_safe = _prepare_inputs(*args, **kwargs)
-                log_input(source=source, data=inputs_safe)
-                
+                capture = _should_capture()
+                if capture:
+                    log_input(source=source, data=_prepare_inputs(*args, **kwargs))
+
                 start_time = time.perf_counter()
                 try:
                     result = await func(*args, **kwargs)
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    
-                    safe_result = _truncate_data(result)
-                    log_output(source=source, data={"result": safe_result, "metrics": {"duration_ms": round(duration_ms, 2)}})
-                    return result
                 except Exception as e:
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    # We pass the metrics inside a dict, which stringifies nicely if log_error explicitly stringifies it, 
-                    # but provides all data for JSON serialization.
-                    err_payload = {"error": str(e) or e.__class__.__name__, "metrics": {"duration_ms": round(duration_ms, 2)}}
-                    log_error(source=source, err=err_payload)
+                    _log_failure(start_time, e)
                     raise
+                if capture:
+                    _log_result(start_time, result)
+                return result
             return async_wrapper
 
         else:
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs) -> Any:
-                inputs_safe = _prepare_inputs(*args, **kwargs)
-                log_input(source=source, data=inputs_safe)
-                
+                capture = _should_capture()
+                if capture:
+                    log_input(source=source, data=_prepare_inputs(*args, **kwargs))
+
                 start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    
-                    safe_result = _truncate_data(result)
-                    log_output(source=source, data={"result": safe_result, "metrics": {"duration_ms": round(duration_ms, 2)}})
-                    return result
                 except Exception as e:
-                    duration_ms = (time.perf_counter() - start_time) * 1000
-                    err_payload = {"error": str(e) or e.__class__.__name__, "metrics": {"duration_ms": round(duration_ms, 2)}}
-                    log_error(source=source, err=err_payload)
+                    _log_failure(start_time, e)
                     raise
+                if capture:
+                    _log_result(start_time, result)
+                return result
             return sync_wrapper
 
     return decorator
@@ -104,31 +104,29 @@ class SSETransport(Transport):
     
     async def send(self, message: JSONRPCRequest | JSONRPCResponse | JSONRPCNotification) -> None:
         """Send a message via HTTP POST."""
-        import httpx
+        from shared.http_pool import get_http_client
         
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                self.url,
-                json=message.model_dump(),
-                headers={"Content-Type": "application/json"}
-            )
+        await get_http_client(self.url).post(
+            self.url,
+            json=message.model_dump(),
+            headers={"Content-Type": "application/json"}
+        )
     
     async def receive(self) -> AsyncIterator[dict]:
         """Receive messages via SSE stream."""
-        import httpx
+        from shared.http_pool import get_http_client
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream("GET", self.url) as response:
-                async for line in response.aiter_lines():
-                    if self._closed:
-                        break
-                    
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        try:
-                            yield json.loads(data)
-                        except json.JSONDecodeError:
-                            continue
+        async with get_http_client(self.url).stream("GET", self.url) as response:
+            async for line in response.aiter_lines():
+                if self._closed:
+                    break
+                
+                if line.startswith("data: "):
+                    data = line[6:]
+                    try:
+                        yield json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
     
     async def close(self) -> None:
         """Close the transport."""
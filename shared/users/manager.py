@@ -9,12 +9,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any
 import asyncio
+import hashlib
 import os
 
 from shared.logging.main import get_logger
 from shared.config import get_settings
 from shared.database.connection import get_database_pool
 from shared.users.models import User, UserRole, APIKey, USERS_TABLE_SQL, API_KEYS_TABLE_SQL
+from shared.users.principal_cache import Principal, get_principal_cache, publish_invalidation
 
 
 logger = get_logger(__name__)
@@ -130,6 +132,7 @@ class UserManager:
                 f"UPDATE users SET {set_clause} WHERE user_id = $1",
                 *values
             )
+            await publish_invalidation(conn, f"user:{user_id}")
         
         return True
     
@@ -137,6 +140,7 @@ class UserManager:
         """Delete user."""
         async with self._pool.acquire() as conn:
             await conn.execute("DELETE FROM users WHERE user_id = $1", user_id)
+            await publish_invalidation(conn, f"user:{user_id}")
         
         logger.info(f"Deleted user: {user_id}")
         return True
@@ -238,6 +242,7 @@ class APIKeyManager:
                 api_key.key_hash, api_key.key_prefix, api_key.scopes,
                 api_key.rate_limit, api_key.is_active,
                 api_key.created_at, api_key.expires_at)
+            await publish_invalidation(conn, f"prefix:{api_key.key_prefix}")
         
         return api_key, raw_key
     
@@ -266,6 +271,58 @@ class APIKeyManager:
         
         return None
     
+    async def resolve_principal(self, raw_key: str) -> Principal | None:
+        """
+        Resolve an API key to its key + user, served from the principal cache.
+
+        Misses fall through to the database (one key lookup, one user load);
+        ``last_used_at`` is therefore refreshed once per cache TTL rather than
+        on every request.
+        """
+        cache = get_principal_cache()
+        if not raw_key or not raw_key.startswith(get_settings().auth.api_key_prefix):
+            return None
+        if cache is None:
+            api_key = await self.validate_key(raw_key)
+            if api_key is None:
+                return None
+            user_manager = await get_user_manager()
+            return Principal(api_key=api_key, user=await user_manager.get_user(api_key.user_id))
+
+        key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
+        key_prefix = raw_key[:12]
+        found, principal = cache.lookup(key_hash, key_prefix)
+        if found:
+            return principal
+        generation = cache.generation
+
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT * FROM api_keys WHERE key_prefix = $1 AND is_active = true",
+                key_prefix
+            )
+        if row is None:
+            cache.store_unknown_prefix(key_prefix, generation)
+            return None
+        if not APIKey.verify(raw_key, row["key_hash"]):
+            cache.store_rejection(key_hash, generation)
+            return None
+        api_key = self._row_to_key(dict(row))
+        if api_key.is_expired():
+            cache.store_rejection(key_hash, generation)
+            return None
+
+        api_key.last_used_at = datetime.utcnow()
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE api_keys SET last_used_at = $1 WHERE key_id = $2",
+                api_key.last_used_at, api_key.key_id
+            )
+        user_manager = await get_user_manager()
+        principal = Principal(api_key=api_key, user=await user_manager.get_user(api_key.user_id))
+        cache.store(key_hash, principal, generation)
+        return principal
+    
     async def list_keys(self, user_id: str) -> list[APIKey]:
         """List user's API keys."""
         keys = []
@@ -292,6 +349,7 @@ class APIKeyManager:
                     "UPDATE api_keys SET is_active = false WHERE key_id = $1",
                     key_id
                 )
+            await publish_invalidation(conn, f"key:{key_id}")
         
         return True
     
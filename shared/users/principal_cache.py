@@ -0,0 +1,250 @@
+"""
+Principal Cache.
+
+Bounded in-process cache of authenticated API-key principals (key + user)
+for the gateway auth path. Entries are keyed by the SHA-256 key hash and
+expire after a short TTL; unknown key prefixes and bad keys are cached
+negatively for a shorter TTL, in their own smaller LRU so a flood of bad
+keys cannot evict valid principals. The user/key managers invalidate entries
+explicitly and broadcast the invalidation to other replicas over Postgres
+LISTEN/NOTIFY.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from shared.config import get_settings
+from shared.logging.main import get_logger
+from shared.users.models import APIKey, User
+
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """An authenticated API key and the user it belongs to."""
+    api_key: APIKey
+    user: User | None
+
+
+class PrincipalCache:
+    """
+    LRU + TTL cache of API-key principals.
+
+    ``lookup`` returns ``(True, principal)`` on a hit (``principal`` is None
+    for a cached rejection) and ``(False, None)`` on a miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl: float | None = None,
+        negative_ttl: float | None = None,
+        max_negative_entries: int | None = None,
+    ) -> None:
+        settings = get_settings().auth
+        self.max_entries = max(1, max_entries or settings.principal_cache_max_entries)
+        self.ttl = settings.principal_cache_ttl if ttl is None else ttl
+        self.negative_ttl = settings.principal_cache_negative_ttl if negative_ttl is None else negative_ttl
+        self.max_negative_entries = max(
+            1, max_negative_entries or settings.principal_cache_negative_max_entries
+        )
+        # ("hash", key_hash) | ("prefix", key_prefix) -> (expires_at, principal or None)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Principal | None]] = OrderedDict()
+        # Rejections live apart so they only ever evict each other
+        self._negatives: OrderedDict[tuple[str, str], tuple[float, None]] = OrderedDict()
+        self._by_key_id: dict[str, str] = {}
+        self._by_user_id: dict[str, set[str]] = {}
+        # Bumped on every invalidation so a resolution that raced one is not cached
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._negatives)
+
+    def lookup(self, key_hash: str, key_prefix: str) -> tuple[bool, Principal | None]:
+        """Cached resolution for a key, checking the prefix negative entry first."""
+        for slot in (("prefix", key_prefix), ("hash", key_hash)):
+            table = self._negatives if slot in self._negatives else self._entries
+            entry = table.get(slot)
+            if entry is None:
+                continue
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._remove(slot)
+                continue
+            if principal is not None and principal.api_key.is_expired():
+                self._remove(slot)
+                continue
+            table.move_to_end(slot)
+            return True, principal
+        return False, None
+
+    def store(self, key_hash: str, principal: Principal, generation: int | None = None) -> None:
+        """Cache a successful resolution (skipped if an invalidation ran since ``generation``)."""
+        if self.ttl <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._put(("hash", key_hash), principal, self.ttl)
+        self._by_key_id[principal.api_key.key_id] = key_hash
+        self._by_user_id.setdefault(principal.api_key.user_id, set()).add(key_hash)
+
+    def store_rejection(self, key_hash: str, generation: int | None = None) -> None:
+        """Cache a key whose prefix exists but which failed verification."""
+        if generation is not None and generation != self.generation:
+            return
+        self._put(("hash", key_hash), None, self.negative_ttl)
+
+    def store_unknown_prefix(self, key_prefix: str, generation: int | None = None) -> None:
+        """Cache a prefix that matches no active key."""
+        if generation is not None and generation != self.generation:
+            return
+        self._put(("prefix", key_prefix), None, self.negative_ttl)
+
+    def invalidate_key(self, key_id: str) -> None:
+        key_hash = self._by_key_id.get(key_id)
+        if key_hash:
+            self._remove(("hash", key_hash))
+
+    def invalidate_user(self, user_id: str) -> None:
+        for key_hash in list(self._by_user_id.get(user_id, ())):
+            self._remove(("hash", key_hash))
+
+    def invalidate_prefix(self, key_prefix: str) -> None:
+        self._remove(("prefix", key_prefix))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._negatives.clear()
+        self._by_key_id.clear()
+        self._by_user_id.clear()
+
+    def apply(self, message: str) -> None:
+        """Apply an invalidation message (``key:<id>``, ``user:<id>``, ``prefix:<p>`` or ``all``)."""
+        self.generation += 1
+        kind, _, value = message.partition(":")
+        if kind == "key":
+            self.invalidate_key(value)
+        elif kind == "user":
+            self.invalidate_user(value)
+        elif kind == "prefix":
+            self.invalidate_prefix(value)
+        else:
+            self.clear()
+
+    def _put(self, slot: tuple[str, str], principal: Principal | None, ttl: float) -> None:
+        self._remove(slot)
+        if ttl <= 0:
+            return
+        if principal is None:
+            table, limit = self._negatives, self.max_negative_entries
+        else:
+            table, limit = self._entries, self.max_entries
+        table[slot] = (time.monotonic() + ttl, principal)
+        while len(table) > limit:
+            self._remove(next(iter(table)))
+
+    def _remove(self, slot: tuple[str, str]) -> None:
+        self._negatives.pop(slot, None)
+        entry = self._entries.pop(slot, None)
+        if entry is None or entry[1] is None:
+            return
+        api_key = entry[1].api_key
+        if self._by_key_id.get(api_key.key_id) == slot[1]:
+            del self._by_key_id[api_key.key_id]
+        hashes = self._by_user_id.get(api_key.user_id)
+        if hashes is not None:
+            hashes.discard(slot[1])
+            if not hashes:
+                del self._by_user_id[api_key.user_id]
+
+
+# ============================================================================
+# Singleton & cross-replica invalidation
+# ============================================================================
+
+_principal_cache: PrincipalCache | None = None
+_listener_task: asyncio.Task | None = None
+
+
+def get_principal_cache() -> PrincipalCache | None:
+    """Process-wide principal cache, or None when disabled."""
+    global _principal_cache
+    if not get_settings().auth.principal_cache_enabled:
+        return None
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
+
+
+async def publish_invalidation(conn: Any, message: str) -> None:
+    """Invalidate locally and notify other replicas over ``conn``."""
+    cache = get_principal_cache()
+    if cache is None:
+        return
+    cache.apply(message)
+    try:
+        await conn.execute(
+            "SELECT pg_notify($1, $2)", get_settings().auth.principal_invalidation_channel, message
+        )
+    except Exception as e:
+        logger.warning(f"Principal invalidation broadcast failed: {e}")
+
+
+async def _listen(dsn: str) -> None:
+    """Keep a LISTEN connection open; drop the whole cache whenever it is lost."""
+    import asyncpg
+
+    settings = get_settings()
+    channel = settings.auth.principal_invalidation_channel
+
+    def on_notify(_conn, _pid, _channel, payload) -> None:
+        cache = get_principal_cache()
+        if cache is not None:
+            cache.apply(payload)
+
+    while True:
+        lost = asyncio.Event()
+        conn = None
+        try:
+            conn = await asyncpg.connect(dsn)
+            conn.add_termination_listener(lambda _conn: lost.set())
+            await conn.add_listener(channel, on_notify)
+            # Anything published while we were not listening is unknown
+            cache = get_principal_cache()
+            if cache is not None:
+                cache.clear()
+            await lost.wait()
+        except asyncio.CancelledError:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+            raise
+        except Exception as e:
+            logger.warning(f"Principal invalidation listener failed: {e}")
+        cache = get_principal_cache()
+        if cache is not None:
+            cache.clear()
+        await asyncio.sleep(settings.database.retry_delay)
+
+
+async def start_invalidation_listener() -> None:
+    """Start listening for invalidations from other replicas (idempotent)."""
+    global _listener_task
+    settings = get_settings()
+    if not settings.auth.principal_cache_enabled or not settings.database.url:
+        return
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(_listen(settings.database.url))
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        await asyncio.gather(_listener_task, return_exceptions=True)
+        _listener_task = None
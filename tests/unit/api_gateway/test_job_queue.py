@@ -0,0 +1,67 @@
+"""
+Unit Tests: Durable job queue.
+
+Tests for services/api_gateway/core/job_queue.py event dispatch
+(no database required).
+"""
+
+import asyncio
+
+import pytest
+
+from services.api_gateway.core.job_queue import JobQueue
+
+
+class TestJobQueueEvents:
+
+    @pytest.mark.asyncio
+    async def test_submitted_wakes_workers_of_that_type(self):
+        queue = JobQueue()
+
+        queue._dispatch({"event": "submitted", "job_type": "task"})
+
+        assert queue._wakeup("task").is_set()
+        assert not queue._wakeup("autonomous").is_set()
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_status_events(self):
+        queue = JobQueue()
+
+        async with queue.subscribe("job-1") as events:
+            queue._dispatch({"event": "status", "job_id": "job-2", "status": "running"})
+            queue._dispatch({"event": "status", "job_id": "job-1", "status": "completed"})
+
+            event = await asyncio.wait_for(events.get(), timeout=1)
+            assert event["status"] == "completed"
+            assert events.empty()
+
+        assert "job-1" not in queue._subscribers
+
+    @pytest.mark.asyncio
+    async def test_retry_requeue_wakes_workers(self):
+        queue = JobQueue()
+
+        queue._dispatch({"event": "status", "job_id": "job-1", "job_type": "task", "status": "pending"})
+
+        assert queue._wakeup("task").is_set()
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_running_job(self):
+        queue = JobQueue()
+        started = asyncio.Event()
+
+        async def handler(job):
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        queue.register("task", handler)
+        run = asyncio.create_task(queue._run({
+            "job_id": "job-1", "job_type": "task", "attempts": 1, "priority": 0,
+        }))
+        await started.wait()
+
+        queue._dispatch({"event": "status", "job_id": "job-1", "status": "cancelled"})
+        await asyncio.wait_for(run, timeout=1)
+
+        assert "job-1" not in queue._running
@@ -2,15 +2,20 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from kernel.graph_synthesizer import engine as synth_engine
 from kernel.graph_synthesizer.engine import (
     calculate_dependency_edges,
     compile_dag,
+    compute_critical_path_priorities,
     map_subtasks_to_nodes,
+    ready_node_ids,
+    record_node_latency,
 )
 from kernel.graph_synthesizer.types import (
     ActionInstruction,
     Edge,
     EdgeKind,
+    ExecutableDAG,
     ExecutableNode,
     NodeStatus,
 )
@@ -133,3 +138,53 @@ async def test_llm_fallback_map_subtasks(monkeypatch):
 
     assert len(nodes) == 1
     assert nodes[0].instruction.action_type == "advanced_tool"
+
+
+def _tool_node(node_id: str, tool: str) -> ExecutableNode:
+    return ExecutableNode(
+        node_id=node_id,
+        instruction=ActionInstruction(task_id=node_id, description=node_id, action_type="tool_call", required_tools=[tool]),
+    )
+
+
+def _edge(src: str, dst: str) -> Edge:
+    return Edge(from_node_id=src, to_node_id=dst, kind=EdgeKind.SEQUENTIAL, data_key=f"{src}_{dst}")
+
+
+def test_critical_path_priorities_use_latency_history(monkeypatch):
+    monkeypatch.setattr(synth_engine, "_NODE_LATENCY_MS", {})
+    record_node_latency(_tool_node("x", "slow_tool"), 500.0)
+    record_node_latency(_tool_node("x", "fast_tool"), 10.0)
+
+    # a -> b (fast chain), c -> d -> e (slow chain)
+    nodes = [
+        _tool_node("a", "fast_tool"), _tool_node("b", "fast_tool"),
+        _tool_node("c", "slow_tool"), _tool_node("d", "slow_tool"), _tool_node("e", "fast_tool"),
+    ]
+    dag = ExecutableDAG(
+        dag_id="d", description="", nodes=nodes,
+        edges=[_edge("a", "b"), _edge("c", "d"), _edge("d", "e")],
+        execution_order=["a", "c", "b", "d", "e"],
+    )
+
+    priorities = compute_critical_path_priorities(dag)
+
+    assert priorities["c"] == pytest.approx(1010.0)
+    assert priorities["a"] == pytest.approx(20.0)
+    statuses = {n.node_id: NodeStatus.PENDING for n in nodes}
+    assert ready_node_ids(dag, statuses) == ["c", "a"]
+    assert ready_node_ids(dag, statuses, limit=1) == ["c"]
+
+
+def test_ready_nodes_released_per_dependency_not_per_level(monkeypatch):
+    monkeypatch.setattr(synth_engine, "_NODE_LATENCY_MS", {})
+    nodes = [_tool_node(n, "t") for n in ("a", "b", "c", "d")]
+    # Levels: {a, c} -> {b, d}; b only needs a
+    dag = ExecutableDAG(
+        dag_id="d", description="", nodes=nodes,
+        edges=[_edge("a", "b"), _edge("c", "d")],
+        execution_order=["a", "c", "b", "d"],
+    )
+    statuses = {"a": NodeStatus.COMPLETED, "c": NodeStatus.RUNNING, "b": NodeStatus.PENDING, "d": NodeStatus.PENDING}
+
+    assert ready_node_ids(dag, statuses) == ["b"]
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,19 +12,21 @@ from kernel.graph_synthesizer.types import (
     NodeStatus,
 )
 from kernel.ooda_loop.engine import (
+    act,
     decide,
     observe,
     orient,
 )
 from kernel.ooda_loop.types import (
+    AgentState,
+    Decision,
     DecisionAction,
     EventStream,
     MacroObjective,
-    ObservationEvent,
     OrientedState,
 )
 from kernel.short_term_memory.engine import ShortTermMemory
-from kernel.short_term_memory.types import EventSource
+from kernel.short_term_memory.types import EventSource, NodeExecutionStatus, ObservationEvent
 from shared.inference_kit import InferenceKit
 
 
@@ -94,3 +98,152 @@ async def test_llm_fallback_orient():
     assert oriented.is_blocked
     assert oriented.blocking_reason == "Firewall"
     assert oriented.observation_summary == "Firewall blocked access"
+
+
+def _tool_dag(node_ids, output_keys=None):
+    nodes = [
+        ExecutableNode(
+            node_id=nid,
+            instruction=ActionInstruction(task_id=nid, description=f"task {nid}", action_type="tool_call", required_tools=[f"tool_{nid}"]),
+            output_keys=(output_keys or {}).get(nid, [f"out_{nid}"]),
+            parallelizable=True,
+        )
+        for nid in node_ids
+    ]
+    return ExecutableDAG(dag_id="d1", description="", nodes=nodes, edges=[], entry_node_ids=list(node_ids), terminal_node_ids=list(node_ids), parallel_groups=[list(node_ids)])
+
+
+def _tool_kit(executor):
+    kit = MagicMock(spec=InferenceKit)
+    kit.has_llm = False
+    kit.tool_executor = executor
+    return kit
+
+
+@pytest.mark.asyncio
+async def test_act_runs_batch_concurrently_in_decided_order():
+    delays = {"tool_a": 0.15, "tool_b": 0.05, "tool_c": 0.10}
+
+    async def executor(tool_name, arguments):
+        await asyncio.sleep(delays[tool_name])
+        return {"answer": tool_name}
+
+    dag = _tool_dag(["a", "b", "c"])
+    stm = ShortTermMemory()
+    state = AgentState(agent_id="agent")
+    decision = Decision(action=DecisionAction.CONTINUE, reasoning="", target_node_ids=["a", "b", "c"])
+
+    started = time.perf_counter()
+    results = await act(decision, dag, stm, _tool_kit(executor), state)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < sum(delays.values())
+    assert [r.node_id for r in results] == ["a", "b", "c"]
+    assert all(r.success for r in results)
+    assert state.context["out_a"] == "tool_a"
+    assert state.context["out_c"] == "tool_c"
+
+
+@pytest.mark.asyncio
+async def test_act_merges_shared_output_key_in_batch_order():
+    async def executor(tool_name, arguments):
+        # Later node in the batch finishes first
+        await asyncio.sleep(0.05 if tool_name == "tool_a" else 0.0)
+        return {"answer": tool_name}
+
+    dag = _tool_dag(["a", "b"], output_keys={"a": ["shared"], "b": ["shared"]})
+    state = AgentState(agent_id="agent")
+    decision = Decision(action=DecisionAction.CONTINUE, reasoning="", target_node_ids=["a", "b"])
+
+    await act(decision, dag, ShortTermMemory(), _tool_kit(executor), state)
+
+    assert state.context["shared"] == "tool_b"
+
+
+@pytest.mark.asyncio
+async def test_act_node_timeout_fails_only_that_node(monkeypatch):
+    from shared.config import get_settings
+
+    monkeypatch.setattr(get_settings().kernel, "node_execution_timeout_ms", 50.0)
+
+    async def executor(tool_name, arguments):
+        if tool_name == "tool_slow":
+            await asyncio.sleep(1.0)
+        return {"answer": tool_name}
+
+    dag = _tool_dag(["slow", "fast"])
+    stm = ShortTermMemory()
+    decision = Decision(action=DecisionAction.CONTINUE, reasoning="", target_node_ids=["slow", "fast"])
+
+    results = await act(decision, dag, stm, _tool_kit(executor), AgentState(agent_id="agent"))
+
+    assert results[0].success is False
+    assert "timed out" in results[0].error_message
+    assert results[1].success is True
+    assert stm.get_dag_snapshot("d1").node_statuses["slow"] == NodeExecutionStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_act_fatal_error_cancels_siblings():
+    dag = _tool_dag(["boom", "slow"])
+    stm = ShortTermMemory()
+    decision = Decision(action=DecisionAction.CONTINUE, reasoning="", target_node_ids=["boom", "slow"])
+
+    async def executor(tool_name, arguments):
+        await asyncio.sleep(5.0)
+        return {"answer": tool_name}
+
+    kit = _tool_kit(executor)
+    # A broken arguments mapping escapes the node's own error handling
+    dag.nodes[0].instruction.parameters = None
+
+    with pytest.raises(Exception):
+        await asyncio.wait_for(act(decision, dag, stm, kit, AgentState(agent_id="agent")), timeout=2.0)
+
+    assert dag.nodes[1].status == NodeStatus.PENDING
+    assert stm.get_dag_snapshot("d1").node_statuses["slow"] == NodeExecutionStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_act_releases_dependents_without_level_barrier():
+    from kernel.graph_synthesizer.types import Edge, EdgeKind
+
+    delays = {"tool_a": 0.05, "tool_b": 0.05, "tool_c": 0.15}
+    started: dict[str, float] = {}
+
+    async def executor(tool_name, arguments):
+        started[tool_name] = time.perf_counter()
+        await asyncio.sleep(delays[tool_name])
+        return {"answer": tool_name}
+
+    # a -> b while c runs long; b must not wait for c
+    dag = _tool_dag(["a", "c", "b"])
+    dag.edges = [Edge(from_node_id="a", to_node_id="b", kind=EdgeKind.SEQUENTIAL, data_key="out_a")]
+    dag.nodes[2].input_keys = ["out_a"]
+    dag.execution_order = ["a", "c", "b"]
+    state = AgentState(agent_id="agent")
+    decision = Decision(action=DecisionAction.CONTINUE, reasoning="", target_node_ids=["a", "c"])
+
+    t0 = time.perf_counter()
+    results = await act(decision, dag, ShortTermMemory(), _tool_kit(executor), state)
+    elapsed = time.perf_counter() - t0
+
+    assert [r.node_id for r in results] == ["a", "c", "b"]
+    assert started["tool_b"] - t0 < delays["tool_c"]
+    assert elapsed < delays["tool_a"] + delays["tool_b"] + delays["tool_c"]
+    assert state.context["out_b"] == "tool_b"
+
+
+@pytest.mark.asyncio
+async def test_decide_replans_when_pending_nodes_blocked_by_failure():
+    from kernel.graph_synthesizer.types import Edge, EdgeKind
+
+    dag = _tool_dag(["a", "b"])
+    dag.edges = [Edge(from_node_id="a", to_node_id="b", kind=EdgeKind.SEQUENTIAL, data_key="out_a")]
+    dag.nodes[0].status = NodeStatus.FAILED
+    oriented = OrientedState(is_blocked=False, blocking_reason="", enriched_context={}, observation_summary="", state_changes=[])
+
+    dec = await decide(oriented, [MacroObjective(description="x")], dag, None)
+
+    assert dec.action == DecisionAction.REPLAN
+    assert dec.replan_context["failed_nodes"] == ["a"]
@@ -84,3 +84,114 @@ async def test_llm_fallback_classify_claims():
     assert len(claims) == 1
     assert claims[0].text == "LLM claim"
     assert claims[0].claim_type == ClaimType.FACTUAL
+
+
+class _KeywordEmbedder:
+    """Bag-of-words vectors over a tiny fixed vocabulary."""
+
+    vocab = ["sky", "blue", "grass", "green", "gdp", "growth", "rain", "mars"]
+
+    def __init__(self):
+        self.batches = 0
+
+    async def embed_batch(self, texts):
+        self.batches += 1
+        return [[float(w in t.lower()) for w in self.vocab] for t in texts]
+
+
+def _claim(cid, text, ctype=ClaimType.FACTUAL):
+    return Claim(claim_id=cid, text=text, claim_type=ctype, source_sentence=text, position=0)
+
+
+@pytest.mark.asyncio
+async def test_grade_claims_batches_llm_calls(monkeypatch):
+    from shared.config import get_settings
+    from kernel.hallucination_monitor.engine import grade_claims
+
+    settings = get_settings().kernel
+    monkeypatch.setattr(settings, "grounding_prescreen_enabled", False)
+    monkeypatch.setattr(settings, "grounding_batch_size", 4)
+
+    claims = [_claim(f"c{i}", f"Claim number {i}") for i in range(10)]
+    kit = MagicMock(spec=InferenceKit)
+    kit.has_llm = True
+    kit.llm_config = MagicMock()
+    kit.llm = AsyncMock()
+    mock_resp = MagicMock()
+    mock_resp.content = '[{"id": 1, "grade": "GROUNDED", "reasoning": "ok", "similarity": 0.9}]'
+    kit.llm.complete.return_value = mock_resp
+
+    grades = await grade_claims(claims, [Origin(origin_id="o1", content="Unrelated evidence")], kit)
+
+    # 10 claims in batches of 4 -> 3 LLM calls instead of 10
+    assert kit.llm.complete.await_count == 3
+    assert [g.claim_id for g in grades] == [c.claim_id for c in claims]
+    grounded = [g.claim_id for g in grades if g.grade == ClaimGradeLevel.GROUNDED]
+    assert grounded == ["c0", "c4", "c8"]
+
+
+@pytest.mark.asyncio
+async def test_grade_claims_prescreen_skips_llm(monkeypatch):
+    from shared.config import get_settings
+    from kernel.hallucination_monitor.engine import grade_claims
+
+    settings = get_settings().kernel
+    monkeypatch.setattr(settings, "grounding_prescreen_enabled", True)
+    monkeypatch.setattr(settings, "grounding_prescreen_grounded_similarity", 0.9)
+    monkeypatch.setattr(settings, "grounding_prescreen_fabricated_similarity", 0.2)
+
+    claims = [
+        _claim("c1", "The sky is blue"),             # matches evidence exactly
+        _claim("c2", "Mars has rain"),               # no overlap at all
+        _claim("c3", "The sky over the grass"),      # ambiguous -> LLM
+        _claim("c4", "I think it is nice", ClaimType.OPINION),
+    ]
+    embedder = _KeywordEmbedder()
+    kit = MagicMock(spec=InferenceKit)
+    kit.has_llm = True
+    kit.has_embedder = True
+    kit.embedder = embedder
+    kit.llm_config = MagicMock()
+    kit.llm = AsyncMock()
+    mock_resp = MagicMock()
+    mock_resp.content = '[{"id": 1, "grade": "FABRICATED", "reasoning": "no"}]'
+    kit.llm.complete.return_value = mock_resp
+
+    grades = {g.claim_id: g for g in await grade_claims(
+        claims, [Origin(origin_id="o1", content="The sky is blue")], kit
+    )}
+
+    assert embedder.batches == 1
+    assert kit.llm.complete.await_count == 1
+    assert "The sky over the grass" in kit.llm.complete.await_args.args[0][1].content
+    assert "Mars" not in kit.llm.complete.await_args.args[0][1].content
+    assert grades["c1"].grade == ClaimGradeLevel.GROUNDED
+    assert grades["c1"].evidence_links[0].origin_id == "o1"
+    assert grades["c2"].grade == ClaimGradeLevel.FABRICATED
+    assert grades["c4"].grade == ClaimGradeLevel.GROUNDED
+
+
+@pytest.mark.asyncio
+async def test_batched_grades_wrapped_in_prose_are_all_read(monkeypatch):
+    from shared.config import get_settings
+    from kernel.hallucination_monitor.engine import grade_claims
+
+    settings = get_settings().kernel
+    monkeypatch.setattr(settings, "grounding_prescreen_enabled", False)
+    monkeypatch.setattr(settings, "grounding_batch_size", 4)
+
+    claims = [_claim(f"c{i}", f"Claim number {i}") for i in range(3)]
+    kit = MagicMock(spec=InferenceKit)
+    kit.has_llm = True
+    kit.llm_config = MagicMock()
+    kit.llm = AsyncMock()
+    mock_resp = MagicMock()
+    mock_resp.content = (
+        'Here are the grades: [{"id": 1, "grade": "GROUNDED"}, '
+        '{"id": 2, "grade": "GROUNDED"}, {"id": 3, "grade": "GROUNDED"}] Hope this helps.'
+    )
+    kit.llm.complete.return_value = mock_resp
+
+    grades = await grade_claims(claims, [Origin(origin_id="o1", content="Unrelated evidence")], kit)
+
+    assert all(g.grade == ClaimGradeLevel.GROUNDED for g in grades)
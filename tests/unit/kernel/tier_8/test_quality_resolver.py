@@ -0,0 +1,87 @@
+"""
+Unit Tests: Quality Resolver conflict detection.
+"""
+
+import numpy as np
+import pytest
+
+from kernel.quality_resolver.engine import candidate_pairs, detect_conflicts
+from shared.inference_kit import InferenceKit
+
+
+_TOPICS = ["postgres", "kubernetes", "redis"]
+
+
+class _TopicEmbedder:
+    """One-hot embedding on the first word; rerank is exact-topic match."""
+
+    def __init__(self):
+        self.batches = 0
+        self.singles = 0
+        self.reranks = 0
+
+    def _vector(self, text):
+        vec = [0.0] * len(_TOPICS)
+        vec[_TOPICS.index(text.split()[0])] = 1.0
+        return vec
+
+    async def embed_batch(self, texts):
+        self.batches += 1
+        return [self._vector(t) for t in texts]
+
+    async def embed_single(self, text):
+        self.singles += 1
+        return self._vector(text)
+
+    async def rerank_single(self, query, document):
+        self.reranks += 1
+        return 1.0 if query.split()[0] == document.split()[0] else 0.0
+
+
+def _normalized(rows):
+    matrix = np.asarray(rows, dtype=np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def test_candidate_pairs_blocked_matches_full():
+    rng = np.random.default_rng(0)
+    matrix = _normalized(rng.normal(size=(50, 16)))
+
+    full = candidate_pairs(matrix, threshold=0.3, block_size=1000)
+    blocked = candidate_pairs(matrix, threshold=0.3, block_size=7)
+
+    sims = matrix @ matrix.T
+    expected = [(i, j) for i in range(50) for j in range(i + 1, 50) if sims[i, j] >= 0.3]
+    assert full == blocked == expected
+
+
+def test_candidate_pairs_top_k_bounds_candidates():
+    matrix = _normalized([[1.0, 0.0], [0.99, 0.1], [0.98, 0.2], [0.0, 1.0]])
+
+    assert candidate_pairs(matrix, threshold=0.5) == [(0, 1), (0, 2), (1, 2)]
+    # Each row keeps only its nearest neighbour
+    assert candidate_pairs(matrix, threshold=0.5, top_k=1) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_detect_conflicts_scores_only_candidate_pairs():
+    embedder = _TopicEmbedder()
+    kit = InferenceKit(embedder=embedder)
+    artifacts = [
+        {"artifact_id": "a", "content": "postgres async driver is required"},
+        {"artifact_id": "b", "content": "postgres sync driver is enough"},
+        {"artifact_id": "c", "content": ""},
+        {"artifact_id": "d", "content": "kubernetes deployment with helm"},
+        {"artifact_id": "e", "content": "redis cache in front of the api"},
+    ]
+
+    result = await detect_conflicts(artifacts, kit)
+
+    assert result.is_success
+    data = result.signals[0].body["data"]
+    pairs = {(c["artifact_a_id"], c["artifact_b_id"]) for c in data["conflicts"]}
+    assert pairs == {("a", "b")}
+    assert embedder.batches == 1
+    # Vectors come from the batch; only the one candidate pair is reranked
+    assert embedder.singles == 0
+    assert embedder.reranks == 1
@@ -0,0 +1,172 @@
+"""
+Unit Tests: Workforce Manager specialist matching.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from kernel.workforce_manager.engine import (
+    SpecialistIndex,
+    assign_by_score,
+    assign_specialists,
+    get_specialist_index,
+    match_specialist,
+)
+from kernel.workforce_manager.types import MissionChunk
+from shared.inference_kit import InferenceKit
+
+_SKILLS = ["python", "sql", "react", "kubernetes"]
+
+
+class _SkillEmbedder:
+    """Bag-of-skills embedding; rerank is the fraction of query skills present."""
+
+    model_name = "skills"
+
+    def __init__(self):
+        self.embedded = 0
+        self.reranks = 0
+
+    def _vector(self, text):
+        words = text.split()
+        return [float(words.count(skill)) + 0.01 for skill in _SKILLS]
+
+    async def embed_batch(self, texts):
+        self.embedded += len(texts)
+        return [self._vector(t) for t in texts]
+
+    async def embed_single(self, text):
+        self.embedded += 1
+        return self._vector(text)
+
+    async def rerank_single(self, query, document):
+        self.reranks += 1
+        wanted = [s for s in _SKILLS if s in query.split()]
+        return sum(s in document.split() for s in wanted) / max(len(wanted), 1)
+
+
+def _chunk(chunk_id, skills):
+    return MissionChunk(
+        chunk_id=chunk_id,
+        parent_objective_id="obj",
+        domain="engineering",
+        sub_objective="build it",
+        required_skills=skills,
+    )
+
+
+_PROFILES = [
+    {"profile_id": "backend", "role_name": "Backend", "skills": ["python", "sql"]},
+    {"profile_id": "frontend", "role_name": "Frontend", "skills": ["react"]},
+    {"profile_id": "ops", "role_name": "Ops", "skills": ["kubernetes"]},
+]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index():
+    get_specialist_index().clear()
+    yield
+    get_specialist_index().clear()
+
+
+def test_assign_by_score_respects_capacity():
+    scores = np.array([
+        [0.9, 0.8],
+        [0.85, 0.1],
+        [0.7, 0.6],
+    ])
+
+    assert assign_by_score(scores) == [0, 0, 0]
+    # Hungarian maximizes the total: chunk 1 needs profile 0 most
+    assert assign_by_score(scores, capacity=1) == [1, 0, None]
+    assert assign_by_score(scores, capacity=2, min_score=0.65) == [1, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_specialist_index_embeds_each_profile_once():
+    embedder = _SkillEmbedder()
+    index = SpecialistIndex()
+
+    first = await index.matrix(["python sql", "react"], embedder)
+    second = await index.matrix(["react", "python sql", "react"], embedder)
+
+    assert embedder.embedded == 2
+    assert np.allclose(np.linalg.norm(second, axis=1), 1.0)
+    assert np.allclose(second[1], first[0])
+
+
+@pytest.mark.asyncio
+async def test_match_specialist_uses_index():
+    embedder = _SkillEmbedder()
+    kit = InferenceKit(embedder=embedder)
+
+    for skill, expected in (("react", "frontend"), ("kubernetes", "ops")):
+        result = await match_specialist(_chunk("c", [skill]), _PROFILES, kit)
+        assert result.is_success
+        assert result.signals[0].body["data"]["agent_profile_id"] == expected
+
+    # Profiles embedded on the first call only, plus one query per call
+    assert embedder.embedded == len(_PROFILES) + 2
+
+
+@pytest.mark.asyncio
+async def test_assign_specialists_matches_whole_sprint(monkeypatch):
+    from shared.config import get_settings
+
+    monkeypatch.setattr(get_settings().corporate, "specialist_shortlist_size", 1)
+    embedder = _SkillEmbedder()
+    kit = InferenceKit(embedder=embedder)
+    chunks = [
+        _chunk("api", ["python", "sql"]),
+        _chunk("ui", ["react"]),
+        _chunk("deploy", ["kubernetes"]),
+        _chunk("etl", ["python"]),
+    ]
+
+    result = await assign_specialists(chunks, _PROFILES, kit, capacity=1)
+
+    assert result.is_success
+    data = result.signals[0].body["data"]
+    assigned = {m["chunk_id"]: m["agent_profile_id"] for m in data["matches"]}
+    assert assigned == {"api": "backend", "ui": "frontend", "deploy": "ops", "etl": "none"}
+    assert data["unassigned"] == 1
+    # One batch for the roster and the sprint; one rerank per chunk shortlist
+    assert embedder.embedded == len(_PROFILES) + len(chunks)
+    assert embedder.reranks == len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_unshortlisted_cosine_never_beats_t1_score(monkeypatch):
+    import kernel.scoring
+    from shared.config import get_settings
+
+    monkeypatch.setattr(get_settings().corporate, "specialist_shortlist_size", 1)
+
+    async def low_t1_score(content, query, kit=None):
+        return SimpleNamespace(signals=[SimpleNamespace(body={"data": {"score": 0.2}})])
+
+    monkeypatch.setattr(kernel.scoring, "score", low_t1_score)
+    kit = InferenceKit(embedder=_SkillEmbedder())
+
+    # Frontend is the closer cosine match and gets the only T1 slot; backend's
+    # cosine (~0.5) is higher than that T1 score but was never T1-scored.
+    result = await match_specialist(_chunk("c", ["python", "react"]), _PROFILES, kit)
+
+    assert result.signals[0].body["data"]["agent_profile_id"] == "frontend"
+
+
+@pytest.mark.asyncio
+async def test_zero_shortlist_matches_on_cosine_alone(monkeypatch):
+    from shared.config import get_settings
+
+    monkeypatch.setattr(get_settings().corporate, "specialist_shortlist_size", 0)
+    embedder = _SkillEmbedder()
+    chunks = [_chunk("ui", ["react"]), _chunk("deploy", ["kubernetes"])]
+
+    result = await assign_specialists(chunks, _PROFILES, InferenceKit(embedder=embedder))
+
+    assigned = {m["chunk_id"]: m["agent_profile_id"] for m in result.signals[0].body["data"]["matches"]}
+    assert assigned == {"ui": "frontend", "deploy": "ops"}
+    assert embedder.reranks == 0
@@ -0,0 +1,95 @@
+"""
+Unit Tests: pandas_server in-memory chain execution.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+utils = pytest.importorskip("mcp_servers.pandas_server.utils")
+chain_ops = pytest.importorskip("mcp_servers.pandas_server.tools.chain_ops")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "age": [25, 30, 35, 40],
+        "city": ["NY", "LA", "NY", "SF"],
+        "note": ["a", "b", "c", "d"],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+class TestFuseSteps:
+
+    def test_adjacent_filters_and_selects_fuse(self):
+        plan = chain_ops._fuse_steps([
+            {"op": "filter", "args": {"query": "age > 25"}},
+            {"op": "filter", "args": {"query": "city == 'NY'"}},
+            {"op": "select", "args": {"columns": ["id", "age"]}},
+            {"op": "select", "args": {"columns": ["id"]}},
+        ])
+
+        assert [(i, op) for i, op, _ in plan] == [(0, "filter"), (2, "select")]
+        assert plan[0][2]["query"] == "(age > 25) and (city == 'NY')"
+        assert plan[1][2]["columns"] == ["id"]
+
+    def test_dependent_renames_are_not_fused(self):
+        plan = chain_ops._fuse_steps([
+            {"op": "rename", "args": {"mapping": {"a": "b"}}},
+            {"op": "rename", "args": {"mapping": {"b": "c"}}},
+        ])
+        assert len(plan) == 2
+
+    def test_unknown_op_rejected(self):
+        with pytest.raises(ValueError):
+            chain_ops._fuse_steps([{"op": "nope"}])
+
+
+class TestPushdown:
+
+    def test_parquet_filters_from_simple_query(self):
+        filters = chain_ops._query_to_parquet_filters("age >= 30 and city in ['NY', 'LA'] and note.str.len() > 0")
+        assert filters == [("age", ">=", 30), ("city", "in", ["NY", "LA"])]
+
+    def test_negated_terms_are_not_pushed_down(self):
+        # pyarrow drops nulls for != / not in, while DataFrame.query keeps them.
+        filters = chain_ops._query_to_parquet_filters("city != 'SF' and age not in [25] and id > 1")
+        assert filters == [("id", ">", 1)]
+
+    def test_csv_projection_includes_filter_columns(self, csv_path):
+        plan = chain_ops._fuse_steps([
+            {"op": "filter", "args": {"query": "age > 25"}},
+            {"op": "select", "args": {"columns": ["id"]}},
+        ])
+        usecols = chain_ops._pushdown_read_kwargs(csv_path, plan)["usecols"]
+        assert [c for c in ["id", "age", "city", "note"] if usecols(c)] == ["id", "age"]
+
+
+class TestExecuteChain:
+
+    def test_chain_runs_in_memory_and_writes_final_only(self, csv_path, tmp_path):
+        out = str(tmp_path / "out.csv")
+        result = chain_ops.execute_chain(csv_path, [
+            {"op": "filter", "args": {"query": "age > 25"}},
+            {"op": "select", "args": {"columns": ["id", "city"]}},
+            {"op": "rename", "args": {"mapping": {"city": "town"}}},
+            {"op": "sort", "args": {"by": "id", "ascending": False}},
+        ], final_output_path=out)
+
+        assert result["final_output"] == out
+        assert result["steps_executed"] == 4
+        assert result["temp_files_created"] == []
+        assert utils._MEMORY_FRAMES == {}
+        df = pd.read_csv(out)
+        assert list(df.columns) == ["id", "town"]
+        assert df["id"].tolist() == [4, 3, 2]
+
+    def test_failure_reports_original_step_and_releases_frames(self, csv_path):
+        with pytest.raises(RuntimeError, match=r"step 1 \(select\)"):
+            chain_ops.execute_chain(csv_path, [
+                {"op": "filter", "args": {"query": "age > 25"}},
+                {"op": "select", "args": {"columns": ["missing"]}},
+            ])
+        assert utils._MEMORY_FRAMES == {}
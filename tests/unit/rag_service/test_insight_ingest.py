@@ -0,0 +1,80 @@
+"""
+Unit Tests: Batched insight ingestion.
+
+Tests for InsightStore.add_insights / ingest_insights and the default
+VectorStore.ingest batching.
+"""
+
+import pytest
+
+from services.rag_service.core.insight_store import InsightStore
+from services.vault.core.vector_store import Document, InMemoryVectorStore
+from shared.schemas import AtomicInsight
+
+
+class RecordingStore(InMemoryVectorStore):
+    def __init__(self):
+        super().__init__()
+        self.add_calls: list[int] = []
+        self.cleared: list[str] = []
+
+    async def add(self, documents):
+        self.add_calls.append(len(documents))
+        return await super().add(documents)
+
+    async def clear_checkpoint(self, job_id):
+        self.cleared.append(job_id)
+
+
+def _insight(i: int) -> AtomicInsight:
+    return AtomicInsight(
+        insight_id=f"i-{i}",
+        entity=f"entity {i}",
+        attribute="content",
+        value=f"value {i}",
+        origin_url="https://example.com",
+    )
+
+
+async def _stream(items):
+    for item in items:
+        yield item
+
+
+class TestInsightIngest:
+
+    @pytest.mark.asyncio
+    async def test_add_insights_is_one_write(self):
+        store = RecordingStore()
+        insights = InsightStore(vector_store=store)
+
+        ids = await insights.add_insights([_insight(i) for i in range(5)], dataset_id="ds")
+
+        assert ids == [f"i-{i}" for i in range(5)]
+        assert store.add_calls == [5]
+        docs = await store.get(["i-3"])
+        assert docs[0].metadata["dataset_id"] == "ds"
+
+    @pytest.mark.asyncio
+    async def test_ingest_batches_stream_and_clears_checkpoint(self, monkeypatch):
+        from shared.config import get_settings
+        monkeypatch.setattr(get_settings().rag, "ingest_copy_batch_size", 4)
+        store = RecordingStore()
+        insights = InsightStore(vector_store=store)
+
+        count = await insights.ingest_insights(
+            _stream([_insight(i) for i in range(10)]), dataset_id="ds", job_id="job-1"
+        )
+
+        assert count == 10
+        assert store.add_calls == [4, 4, 2]
+        assert store.cleared == ["job-1"]
+        assert await insights.get_insight("i-9") is not None
+
+    @pytest.mark.asyncio
+    async def test_default_ingest_empty_stream(self):
+        store = RecordingStore()
+
+        assert await store.ingest(_stream([])) == 0
+        assert store.add_calls == []
+        assert await store.ingest(_stream([Document(id="d", content="x")])) == 1
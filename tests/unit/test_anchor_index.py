@@ -0,0 +1,71 @@
+"""
+Unit Tests: Vectorized anchor similarity index.
+"""
+
+import pytest
+
+from shared.knowledge import anchor_index, system_loader
+from shared.knowledge.anchor_index import get_anchor_index
+
+AXES = {"north": [0.0, 2.0], "east": [3.0, 0.0], "northeast": [1.0, 1.0]}
+
+
+class BatchEmbedder:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [AXES[t] for t in texts]
+
+
+@pytest.fixture
+def knowledge_file(tmp_path, monkeypatch):
+    path = tmp_path / "anchors.yaml"
+    path.write_text("directions:\n  up: north\n  right: east\n  diag: northeast\nother: 1\n")
+    monkeypatch.setattr(system_loader, "system_knowledge_path", lambda filename: path)
+    monkeypatch.setattr(system_loader, "_COMPILED", {})
+    monkeypatch.setattr(anchor_index, "_INDEXES", {})
+    return path
+
+
+class TestAnchorIndex:
+
+    @pytest.mark.asyncio
+    async def test_scores_all_labels_with_one_batch(self, knowledge_file):
+        embedder = BatchEmbedder()
+
+        index = await get_anchor_index("anchors.yaml", "directions", embedder)
+        ranked = index.top_k([0.0, 5.0])
+
+        assert embedder.batches == [["north", "east", "northeast"]]
+        assert [label for label, _ in ranked] == ["up", "diag", "right"]
+        assert ranked[0][1] == pytest.approx(1.0)
+        assert ranked[2][1] == pytest.approx(0.0)
+        assert index.top_k([1.0, 0.0], k=1) == [("right", pytest.approx(1.0))]
+        assert index.best([0.0, 0.0])[1] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_only_when_section_changes(self, knowledge_file):
+        embedder = BatchEmbedder()
+        first = await get_anchor_index("anchors.yaml", "directions", embedder)
+
+        assert await get_anchor_index("anchors.yaml", "directions", embedder) is first
+
+        knowledge_file.write_text(knowledge_file.read_text().replace("other: 1", "other: 2"))
+        assert await get_anchor_index("anchors.yaml", "directions", embedder) is first
+        assert len(embedder.batches) == 1
+
+        knowledge_file.write_text(knowledge_file.read_text().replace("  diag: northeast\n", ""))
+        rebuilt = await get_anchor_index("anchors.yaml", "directions", embedder)
+        assert rebuilt.labels == ("up", "right")
+        assert len(embedder.batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_dimension_change_forces_rebuild(self, knowledge_file):
+        embedder = BatchEmbedder()
+        first = await get_anchor_index("anchors.yaml", "directions", embedder, dim=2)
+
+        assert await get_anchor_index("anchors.yaml", "directions", embedder, dim=2) is first
+        await get_anchor_index("anchors.yaml", "directions", embedder, dim=3)
+        assert len(embedder.batches) == 2
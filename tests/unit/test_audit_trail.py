@@ -0,0 +1,157 @@
+"""
+Unit Tests: Audit Trail.
+
+Tests for services/vault/core/audit_trail.py group commit, hash chain,
+checkpoints and streaming export (in-memory backend).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from services.vault.core.audit_trail import (
+    GENESIS_HASH,
+    AuditCommitError,
+    AuditTrail,
+    MemoryBackend,
+    chain_hash,
+    merkle_root,
+)
+from shared.schemas import AuditEventType
+
+
+class RecordingBackend(MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[int] = []
+
+    async def write_batch(self, entries):
+        self.batches.append(len(entries))
+        return await super().write_batch(entries)
+
+
+async def _log_many(audit: AuditTrail, n: int) -> list[str]:
+    return await asyncio.gather(*[
+        audit.log(AuditEventType.ERROR, action=f"event {i}") for i in range(n)
+    ])
+
+
+class TestGroupCommit:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_logs_share_commits(self):
+        backend = RecordingBackend()
+        audit = AuditTrail(backend=backend)
+
+        await _log_many(audit, 20)
+        await audit.flush()
+
+        assert sum(backend.batches) == 20
+        assert len(backend.batches) < 20
+
+    @pytest.mark.asyncio
+    async def test_durable_log_is_committed_on_return(self):
+        backend = RecordingBackend()
+        audit = AuditTrail(backend=backend)
+
+        entry_id = await audit.log(AuditEventType.ERROR, action="durable", durable=True)
+
+        assert await backend.get_by_id(entry_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_durable_commit_raises(self):
+        class FailingBackend(MemoryBackend):
+            async def write_batch(self, entries):
+                raise ConnectionError("database down")
+
+        audit = AuditTrail(backend=FailingBackend())
+
+        with pytest.raises(AuditCommitError):
+            await audit.log(AuditEventType.ERROR, action="durable", durable=True)
+
+
+class TestHashChain:
+
+    @pytest.mark.asyncio
+    async def test_entries_are_chained(self):
+        backend = MemoryBackend()
+        audit = AuditTrail(backend=backend)
+
+        await _log_many(audit, 3)
+        await audit.flush()
+        entries = [e async for e in backend.stream()]
+
+        assert [e.seq for e in entries] == [1, 2, 3]
+        assert entries[0].prev_hash == GENESIS_HASH
+        assert entries[1].prev_hash == entries[0].chain_hash
+        assert entries[2].chain_hash == chain_hash(entries[1].chain_hash, entries[2].checksum)
+        assert await audit.verify_integrity() == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_tampering_detected(self):
+        backend = MemoryBackend()
+        audit = AuditTrail(backend=backend)
+
+        await _log_many(audit, 3)
+        await audit.flush()
+        backend._entries[1].action = "rewritten"
+
+        assert await audit.verify_integrity() == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_verification_resumes_from_checkpoint(self, monkeypatch):
+        from shared.config import get_settings
+        monkeypatch.setattr(get_settings().vault_settings, "audit_checkpoint_interval", 4)
+        backend = MemoryBackend()
+        audit = AuditTrail(backend=backend)
+
+        await _log_many(audit, 10)
+        assert await audit.verify_integrity() == (10, 0)
+
+        checkpoint = await backend.last_checkpoint()
+        assert (checkpoint.seq_from, checkpoint.seq_to) == (5, 8)
+        assert await audit.verify_checkpoint(checkpoint)
+
+        await _log_many(audit, 2)
+        # Only entries after seq 8 are rehashed
+        assert await audit.verify_integrity() == (4, 0)
+        assert await audit.verify_integrity(full=True) == (12, 0)
+
+    def test_merkle_root(self):
+        a, b, c = ("a" * 64, "b" * 64, "c" * 64)
+
+        assert merkle_root([]) == GENESIS_HASH
+        assert merkle_root([a]) == a
+        assert merkle_root([a, b, c]) == merkle_root([a, b, c, c])
+        assert merkle_root([a, b]) != merkle_root([b, a])
+
+
+class TestExport:
+
+    @pytest.mark.asyncio
+    async def test_json_export_oldest_first(self):
+        audit = AuditTrail(backend=MemoryBackend())
+        for i in range(3):
+            await audit.log(AuditEventType.ERROR, action=f"event {i}")
+
+        data = json.loads(await audit.export("json"))
+
+        assert [d["action"] for d in data] == ["event 0", "event 1", "event 2"]
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self):
+        audit = AuditTrail(backend=MemoryBackend())
+        await audit.log(AuditEventType.ERROR, action="only")
+
+        lines = (await audit.export("csv")).decode().strip().splitlines()
+
+        assert lines[0].startswith("entry_id,")
+        assert len(lines) == 2
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format(self):
+        audit = AuditTrail(backend=MemoryBackend())
+
+        with pytest.raises(ValueError):
+            await audit.export("xml")
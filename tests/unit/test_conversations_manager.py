@@ -126,3 +126,22 @@ class TestConversationManager:
         retrieved = await manager.get_conversation(conv.conversation_id)
         assert retrieved is not None
         assert retrieved.user_id == "user_1"
+
+
+class TestSearchCursor:
+    """Tests for keyset search cursors."""
+
+    def test_round_trip(self):
+        """Cursor decodes to the exact rank and id."""
+        from shared.conversations.manager import decode_search_cursor, encode_search_cursor
+
+        cursor = encode_search_cursor(0.123456789012345, "conv_abc")
+
+        assert decode_search_cursor(cursor) == (0.123456789012345, "conv_abc")
+
+    def test_invalid_cursor(self):
+        """Malformed cursors raise ValueError."""
+        from shared.conversations.manager import decode_search_cursor
+
+        with pytest.raises(ValueError):
+            decode_search_cursor("not-a-cursor")
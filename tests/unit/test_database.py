@@ -3,7 +3,9 @@ Tests for database health checks and connection pool.
 """
 
 
+import asyncpg
 import pytest
+from asyncpg.connresource import ConnectionResource, guarded
 
 
 class TestHealthStatus:
@@ -129,3 +131,164 @@ class TestDatabasePool:
         result = await pool.health_check()
 
         assert "status" in result
+
+
+class FakeStatement(ConnectionResource):
+    """PreparedStatement stand-in with asyncpg's real release guard."""
+
+    def __init__(self, con, query):
+        super().__init__(con)
+        self.query = query
+
+    @guarded
+    async def fetch(self, *args):
+        return []
+
+
+class FakeConnection:
+    """Mirrors the asyncpg Connection state that matters across pool releases."""
+
+    def __init__(self):
+        self._pool_release_ctr = 0
+        self._stmt_cache: dict[str, FakeStatement] = {}
+        self.parsed: list[str] = []
+
+    def is_closed(self):
+        return False
+
+    def _on_release(self):
+        # asyncpg invalidates PreparedStatement handles here but keeps
+        # its internal statement cache.
+        self._pool_release_ctr += 1
+
+    async def prepare(self, query):
+        self.parsed.append(query)
+        return FakeStatement(self, query)
+
+    async def fetch(self, query, *args):
+        if query not in self._stmt_cache:
+            self.parsed.append(query)
+            self._stmt_cache[query] = FakeStatement(self, query)
+        # Cached statements are re-bound on every call, as asyncpg does.
+        return []
+
+
+class FakeProxy:
+    """Stands in for asyncpg's PoolConnectionProxy."""
+
+    def __init__(self, con):
+        self._con = con
+
+    async def prepare(self, query):
+        return await self._con.prepare(query)
+
+    async def fetch(self, query, *args):
+        return await self._con.fetch(query, *args)
+
+
+class FakeAsyncpgPool:
+    def __init__(self, con):
+        self.con = con
+
+    def acquire(self):
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                return FakeProxy(pool.con)
+
+            async def __aexit__(self, *exc):
+                pool.con._on_release()
+                return False
+
+        return _Ctx()
+
+    def get_size(self):
+        return 1
+
+    def get_idle_size(self):
+        return 0
+
+
+class TestPoolStatements:
+    """Tests for statement reuse across acquires and pool stats."""
+
+    def _pool(self, con):
+        from shared.database.connection import DatabaseConfig, DatabasePool
+
+        pool = DatabasePool(DatabaseConfig(url="postgresql://test"))
+        pool._pool = FakeAsyncpgPool(con)
+        pool._is_initialized = True
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_prepared_statement_is_invalid_after_release(self):
+        con = FakeConnection()
+        pool = self._pool(con)
+
+        async with pool.acquire() as conn:
+            stmt = await conn.prepare("SELECT 1")
+            await stmt.fetch()
+
+        async with pool.acquire():
+            with pytest.raises(asyncpg.InterfaceError, match="released back to the pool"):
+                await stmt.fetch()
+
+    @pytest.mark.asyncio
+    async def test_store_reads_reuse_statements_across_acquires(self, monkeypatch):
+        from shared.database import connection
+        from services.vault.core import postgres_store
+
+        con = FakeConnection()
+        pool = self._pool(con)
+        connection._VECTOR_READY.add(con)
+
+        async def get_db_pool():
+            return pool
+
+        monkeypatch.setattr(postgres_store, "get_db_pool", get_db_pool)
+        store = postgres_store.PostgresVectorStore(table_name="docs")
+        store._initialized = True
+
+        for _ in range(3):
+            assert await store.get(["a"]) == []
+
+        stats = pool.stats()
+        assert len(con.parsed) == 1
+        assert stats["in_use"] == 0
+        assert stats["acquires"] == 3
+        assert stats["statement_cache_hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_statement_hit_tracking_is_lru_bounded(self):
+        from shared.database.connection import DatabaseConfig, DatabasePool
+
+        con = FakeConnection()
+        pool = DatabasePool(DatabaseConfig(url="postgresql://test", statement_cache_size=2))
+        pool._pool = FakeAsyncpgPool(con)
+        pool._is_initialized = True
+
+        async with pool.acquire() as conn:
+            for query in ("A", "B", "A", "C", "B"):
+                await pool.fetch_prepared(conn, query)
+
+        # B was evicted by C, as asyncpg's own LRU would
+        assert pool.stats()["statement_cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_vector_codec_registered_once(self, monkeypatch):
+        pgvector_asyncpg = pytest.importorskip("pgvector.asyncpg")
+        from shared.database import connection
+
+        calls = []
+
+        async def register_vector(conn):
+            calls.append(conn)
+
+        monkeypatch.setattr(pgvector_asyncpg, "register_vector", register_vector)
+
+        con = FakeConnection()
+        await connection.ensure_vector_codec(con)
+        await connection.ensure_vector_codec(FakeProxy(con))
+
+        assert len(calls) == 1
@@ -0,0 +1,115 @@
+"""
+Unit Tests: MCP tool discovery snapshot.
+
+Tests for services/mcp_host/core/discovery_snapshot.py.
+"""
+
+from services.mcp_host.core.discovery_snapshot import (
+    DiscoverySnapshot,
+    iter_server_scripts,
+    scan_server_source,
+)
+
+
+SERVER_SOURCE = '''
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("demo")
+
+
+@mcp.tool()
+async def search(query: str, limit: int = 10, exact: bool = False) -> str:
+    """Search things."""
+    return query
+
+
+class Legacy:
+    def setup(self):
+        self.register_tool(name="legacy_tool", handler=None)
+'''
+
+
+def _write_server(base, name, source=SERVER_SOURCE):
+    server_dir = base / name
+    server_dir.mkdir(parents=True, exist_ok=True)
+    script = server_dir / "server.py"
+    script.write_text(source, encoding="utf-8")
+    return script
+
+
+class TestStaticScan:
+
+    def test_fastmcp_and_legacy_tools(self):
+        result = scan_server_source("demo", SERVER_SOURCE)
+
+        assert result["legacy_tools"] == ["legacy_tool"]
+        tool = result["tools"][0]
+        assert tool["name"] == "search"
+        assert tool["description"] == "Search things."
+        assert tool["inputSchema"]["properties"]["limit"]["type"] == "number"
+        assert tool["inputSchema"]["properties"]["exact"]["type"] == "boolean"
+        assert tool["inputSchema"]["required"] == ["query"]
+
+
+class TestDiscoverySnapshot:
+
+    def test_unchanged_servers_are_not_reparsed(self, tmp_path):
+        servers = tmp_path / "mcp_servers"
+        _write_server(servers, "alpha")
+        _write_server(servers, "beta")
+        path = tmp_path / "snapshot.json"
+
+        first = DiscoverySnapshot.load(path)
+        for name, script in iter_server_scripts(servers):
+            first.scan(name, script)
+        assert first.save() is True
+        assert first.rescanned == 2
+
+        second = DiscoverySnapshot.load(path)
+        entries = {name: second.scan(name, script) for name, script in iter_server_scripts(servers)}
+        assert second.rescanned == 0
+        assert second.save() is False
+        assert entries["alpha"]["tools"][0]["name"] == "search"
+
+    def test_changed_server_is_reparsed(self, tmp_path):
+        servers = tmp_path / "mcp_servers"
+        script = _write_server(servers, "alpha")
+        path = tmp_path / "snapshot.json"
+        snapshot = DiscoverySnapshot.load(path)
+        snapshot.scan("alpha", script)
+        snapshot.save()
+
+        _write_server(servers, "alpha", SERVER_SOURCE.replace("def search", "def find"))
+        snapshot = DiscoverySnapshot.load(path)
+        entry = snapshot.scan("alpha", script)
+
+        assert snapshot.rescanned == 1
+        assert entry["tools"][0]["name"] == "find"
+
+    def test_removed_servers_are_dropped(self, tmp_path):
+        servers = tmp_path / "mcp_servers"
+        alpha = _write_server(servers, "alpha")
+        beta = _write_server(servers, "beta")
+        path = tmp_path / "snapshot.json"
+        snapshot = DiscoverySnapshot.load(path)
+        snapshot.scan("alpha", alpha)
+        snapshot.scan("beta", beta)
+        snapshot.save()
+
+        snapshot = DiscoverySnapshot.load(path)
+        snapshot.scan("alpha", alpha)
+        assert snapshot.save() is True
+
+        assert "beta" not in DiscoverySnapshot.load(path)._servers
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        servers = tmp_path / "mcp_servers"
+        script = _write_server(servers, "alpha")
+        path = tmp_path / "snapshot.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        snapshot = DiscoverySnapshot.load(path)
+        entry = snapshot.scan("alpha", script)
+
+        assert entry["tools"][0]["name"] == "search"
+        assert snapshot.save() is True
@@ -95,5 +95,45 @@ class TestFactory:
         assert isinstance(provider, LocalEmbedding)
 
 
+class TestEmbedInBatches:
+    """Tests for registry-sync batch embedding."""
+
+    class FlakyEmbedder:
+        def __init__(self, max_ok: int, poison: str | None = None):
+            self.max_ok = max_ok
+            self.poison = poison
+            self.calls: list[int] = []
+
+        async def embed(self, texts):
+            self.calls.append(len(texts))
+            if len(texts) > self.max_ok or self.poison in texts:
+                raise TimeoutError("timeout")
+            return [[float(len(t))] for t in texts]
+
+    @pytest.fixture(autouse=True)
+    def _no_delay(self, monkeypatch):
+        from shared.config import get_settings
+        monkeypatch.setattr(get_settings().database, "retry_delay", 0.0)
+
+    @pytest.mark.asyncio
+    async def test_single_large_batch(self):
+        from shared.embedding.model_manager import embed_in_batches
+
+        embedder = self.FlakyEmbedder(max_ok=100)
+        vectors = await embed_in_batches(embedder, ["a", "bb", "ccc"], batch_size=64)
+
+        assert embedder.calls == [3]
+        assert vectors == [[1.0], [2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_halves_on_timeout_and_skips_poison(self):
+        from shared.embedding.model_manager import embed_in_batches
+
+        embedder = self.FlakyEmbedder(max_ok=2, poison="xx")
+        vectors = await embed_in_batches(embedder, ["a", "xx", "ccc", "dddd"], batch_size=4)
+
+        assert vectors == [[1.0], None, [3.0], [4.0]]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""
+Unit Tests: Content-addressed embedding cache.
+"""
+
+import pytest
+
+from shared.config import EmbeddingCacheSettings
+from shared.embedding.cache import CachedEmbeddingProvider, EmbeddingCache, make_cache_key
+
+
+def cache_config(tmp_path, **overrides) -> EmbeddingCacheSettings:
+    defaults = dict(disk_path=str(tmp_path / "embeddings.sqlite3"), memory_max_items=100)
+    defaults.update(overrides)
+    return EmbeddingCacheSettings(**defaults)
+
+
+class CountingProvider:
+    model_name = "test-model"
+    _dimension = 3
+
+    def __init__(self):
+        self.embedded: list[list[str]] = []
+        self.queries: list[str] = []
+
+    @property
+    def dimension(self) -> int:
+        return 3
+
+    async def embed(self, texts):
+        self.embedded.append(list(texts))
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+    async def embed_query(self, query):
+        self.queries.append(query)
+        return [float(len(query)), 2.0, 0.25]
+
+
+class TestEmbeddingCache:
+
+    def test_keys_depend_on_model_instruction_and_text(self):
+        base = make_cache_key("m@1024", "", "hello")
+        assert base == make_cache_key("m@1024", "", "hello")
+        assert base != make_cache_key("m@512", "", "hello")
+        assert base != make_cache_key("m@1024", "query", "hello")
+        assert base != make_cache_key("m@1024", "", "hello!")
+
+    def test_memory_lru_evicts_oldest(self, tmp_path):
+        cache = EmbeddingCache(cache_config(tmp_path, memory_max_items=2, disk_enabled=False))
+        cache.put_many({"a": [1.0], "b": [2.0]})
+        cache.get_many(["a"])
+        cache.put_many({"c": [3.0]})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_vectors_survive_restart_via_disk(self, tmp_path):
+        first = EmbeddingCache(cache_config(tmp_path))
+        first.put_many({"k": [0.5, 0.25]})
+        first.close()
+
+        second = EmbeddingCache(cache_config(tmp_path))
+        found = second.get_many(["k", "missing"])
+
+        assert found == {"k": [0.5, 0.25]}
+        assert second.stats()["disk_hits"] == 1
+        assert second.stats()["misses"] == 1
+        second.close()
+
+    def test_disk_store_is_pruned(self, tmp_path):
+        cache = EmbeddingCache(cache_config(tmp_path, disk_max_items=3, disk_prune_batch=2))
+        cache.put_many({f"k{i}": [float(i)] for i in range(4)})
+
+        assert cache.stats()["disk_items"] <= 3
+        cache.close()
+
+
+class TestCachedEmbeddingProvider:
+
+    @pytest.mark.asyncio
+    async def test_only_misses_reach_the_model(self, tmp_path):
+        provider = CountingProvider()
+        cached = CachedEmbeddingProvider(provider, EmbeddingCache(cache_config(tmp_path)))
+
+        first = await cached.embed(["alpha", "beta"])
+        second = await cached.embed(["beta", "gamma", "gamma"])
+
+        assert provider.embedded == [["alpha", "beta"], ["gamma"]]
+        assert second[0] == first[1]
+        assert second[1] == second[2]
+
+    @pytest.mark.asyncio
+    async def test_queries_are_cached_separately_from_documents(self, tmp_path):
+        provider = CountingProvider()
+        cached = CachedEmbeddingProvider(provider, EmbeddingCache(cache_config(tmp_path)))
+
+        await cached.embed(["alpha"])
+        query_vector = await cached.embed_query("alpha")
+        again = await cached.embed_query("alpha")
+
+        assert provider.queries == ["alpha"]
+        assert query_vector == again == [5.0, 2.0, 0.25]
+
+    def test_format_query_only_exposed_when_wrapped_provider_has_it(self, tmp_path):
+        cached = CachedEmbeddingProvider(CountingProvider(), EmbeddingCache(cache_config(tmp_path)))
+        assert getattr(cached, "format_query", None) is None
+
+    @pytest.mark.asyncio
+    async def test_vector_store_batches_through_wrapper_without_format_query(self, tmp_path):
+        from services.vault.core.postgres_store import PostgresVectorStore
+
+        provider = CountingProvider()
+        store = PostgresVectorStore(embedding_dim=3)
+        store._embedding_provider = CachedEmbeddingProvider(provider, EmbeddingCache(cache_config(tmp_path)))
+
+        vectors = await store._get_embeddings(["a", "bb"])
+
+        assert sorted(provider.queries) == ["a", "bb"]
+        assert vectors == [[1.0, 2.0, 0.25], [2.0, 2.0, 0.25]]
+
+    @pytest.mark.asyncio
+    async def test_vectors_from_mid_call_fallback_are_not_cached(self, tmp_path):
+        class SwitchingProvider:
+            """Fails over to its secondary while serving the first call."""
+
+            def __init__(self):
+                self.primary = CountingProvider()
+                self.secondary = CountingProvider()
+                self.secondary.model_name = "api-model"
+                self.using_secondary = False
+
+            async def embed(self, texts):
+                self.using_secondary = True
+                return await self.secondary.embed(texts)
+
+            async def embed_query(self, query):
+                self.using_secondary = True
+                return await self.secondary.embed_query(query)
+
+        provider = SwitchingProvider()
+        cache = EmbeddingCache(cache_config(tmp_path))
+        cached = CachedEmbeddingProvider(provider, cache)
+
+        await cached.embed(["alpha"])
+        provider.using_secondary = False
+        await cached.embed_query("beta")
+
+        assert cache.stats()["memory_items"] == 0
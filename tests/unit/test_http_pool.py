@@ -0,0 +1,124 @@
+"""
+Unit Tests: Pooled HTTP clients.
+
+Tests for shared/http_pool.py client registry and connection reuse
+(against a local keep-alive server).
+"""
+
+import asyncio
+
+import pytest
+
+from shared.http_pool import HttpClientRegistry, origin_of
+
+
+async def _start_server():
+    """Minimal HTTP/1.1 keep-alive server; returns (server, url, connection count)."""
+    connections = [0]
+
+    async def handle(reader, writer):
+        connections[0] += 1
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+
+    async def handle_safely(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_safely, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", connections
+
+
+class TestOrigin:
+
+    def test_default_ports(self):
+        assert origin_of("https://openrouter.ai/api/v1/chat") == "https://openrouter.ai:443"
+        assert origin_of("http://localhost:8001/tools") == "http://localhost:8001"
+        assert origin_of("http://vault/persistence") == "http://vault:80"
+
+
+class TestHttpClientRegistry:
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_origin(self):
+        registry = HttpClientRegistry()
+
+        a = registry.get("http://localhost:8001/tools")
+        b = registry.get("http://localhost:8001/tools/execute")
+        c = registry.get("http://localhost:8002/health")
+
+        assert a is b
+        assert a is not c
+        await registry.close()
+        assert a.is_closed
+
+    @pytest.mark.asyncio
+    async def test_host_limit_override(self, monkeypatch):
+        from shared.config import get_settings
+        monkeypatch.setattr(get_settings().http, "host_limits", {"localhost:8001": 2})
+        registry = HttpClientRegistry()
+
+        registry.get("http://localhost:8001/")
+        registry.get("http://localhost:8002/")
+
+        transports = next(iter(registry._transports.values()))
+        assert transports["http://localhost:8001"]._pool._max_connections == 2
+        assert transports["http://localhost:8002"]._pool._max_connections == (
+            get_settings().http.max_connections_per_host
+        )
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self):
+        server, url, connections = await _start_server()
+        registry = HttpClientRegistry()
+        try:
+            client = registry.get(url)
+            for _ in range(5):
+                resp = await client.get(f"{url}/ping")
+                assert resp.text == "ok"
+
+            stats = registry.stats()[origin_of(url)]
+            assert connections[0] == 1
+            assert (stats.requests, stats.new_connections, stats.reused) == (5, 1, 4)
+            assert stats.in_use == 0
+        finally:
+            await registry.close()
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_holds_slot_until_closed(self):
+        server, url, _ = await _start_server()
+        registry = HttpClientRegistry()
+        try:
+            async with registry.get(url).stream("GET", f"{url}/ping") as resp:
+                assert registry.stats()[origin_of(url)].in_use == 1
+                await resp.aread()
+            assert registry.stats()[origin_of(url)].in_use == 0
+        finally:
+            await registry.close()
+            server.close()
+            await server.wait_closed()
+
+    def test_clients_are_per_event_loop(self):
+        registry = HttpClientRegistry()
+
+        async def get():
+            return registry.get("http://localhost:8001/")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        assert first is not second
+        # The first loop's clients were dropped once it closed
+        assert len(registry._clients) == 1
@@ -0,0 +1,151 @@
+"""
+Unit Tests: InferenceKit request-scoped embedding memo.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from shared.inference_kit import (
+    InferenceKit,
+    RequestEmbeddingMemo,
+    embed_texts,
+    memoized_embedding_kit,
+    normalize_rows,
+)
+
+
+class CountingEmbedder:
+    def __init__(self, fail_first: bool = False):
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+        self._fail_next = fail_first
+
+    async def embed_single(self, text):
+        self.single_calls.append(text)
+        await asyncio.sleep(0.01)
+        if self._fail_next:
+            self._fail_next = False
+            raise RuntimeError("transient")
+        return [float(len(text))]
+
+    async def embed_batch(self, texts):
+        self.batch_calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    async def rerank_single(self, query, document):
+        return 0.9
+
+
+class TestRequestEmbeddingMemo:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        embedder = CountingEmbedder()
+        memo = RequestEmbeddingMemo(embedder)
+
+        vectors = await asyncio.gather(*(memo.embed_single("hello") for _ in range(3)))
+        again = await memo.embed_single("hello")
+
+        assert embedder.single_calls == ["hello"]
+        assert vectors == [[5.0]] * 3
+        assert again == [5.0]
+
+    @pytest.mark.asyncio
+    async def test_batch_only_embeds_new_texts(self):
+        embedder = CountingEmbedder()
+        memo = RequestEmbeddingMemo(embedder)
+
+        await memo.embed_batch(["a", "bb"])
+        result = await memo.embed_batch(["bb", "ccc", "ccc"])
+
+        assert embedder.batch_calls == [["a", "bb"], ["ccc"]]
+        assert result == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_memoized(self):
+        embedder = CountingEmbedder(fail_first=True)
+        memo = RequestEmbeddingMemo(embedder)
+
+        with pytest.raises(RuntimeError):
+            await memo.embed_single("x")
+        assert await memo.embed_single("x") == [1.0]
+        assert embedder.single_calls == ["x", "x"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_is_not_memoized(self):
+        embedder = CountingEmbedder()
+        gate = asyncio.Event()
+        embed_batch = embedder.embed_batch
+
+        async def slow_batch(texts):
+            await gate.wait()
+            return await embed_batch(texts)
+
+        embedder.embed_batch = slow_batch
+        memo = RequestEmbeddingMemo(embedder)
+
+        call = asyncio.create_task(memo.embed_batch(["a", "bb"]))
+        await asyncio.sleep(0)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        gate.set()
+        result = await asyncio.wait_for(memo.embed_batch(["a", "bb"]), timeout=1.0)
+
+        assert result == [[1.0, 1.0], [2.0, 1.0]]
+        assert embedder.batch_calls == [["a", "bb"]]
+
+    @pytest.mark.asyncio
+    async def test_other_methods_are_delegated(self):
+        memo = RequestEmbeddingMemo(CountingEmbedder())
+        assert await memo.rerank_single("q", "d") == 0.9
+
+
+class TestKitWithEmbeddingMemo:
+
+    def test_kit_copy_wraps_embedder_once(self):
+        embedder = CountingEmbedder()
+        kit = InferenceKit(embedder=embedder)
+
+        scoped = kit.with_embedding_memo()
+
+        assert isinstance(scoped.embedder, RequestEmbeddingMemo)
+        assert kit.embedder is embedder
+        assert scoped.with_embedding_memo() is scoped
+        assert scoped.has_reranker
+
+    def test_empty_kit_is_unchanged(self):
+        kit = InferenceKit.empty()
+        assert kit.with_embedding_memo() is kit
+
+
+class TestEmbeddingHelpers:
+
+    @pytest.mark.asyncio
+    async def test_embed_texts_prefers_batch(self):
+        embedder = CountingEmbedder()
+
+        vectors = await embed_texts(embedder, ["a", "bb"])
+
+        assert embedder.batch_calls == [["a", "bb"]]
+        assert vectors == [[1.0, 1.0], [2.0, 1.0]]
+
+    def test_normalize_rows_keeps_zero_rows(self):
+        rows = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]]))
+        assert np.allclose(rows, [[0.6, 0.8], [0.0, 0.0]])
+
+    def test_memoized_kit_falls_back_to_model_manager(self, monkeypatch):
+        from shared.embedding import model_manager
+
+        manager = CountingEmbedder()
+        monkeypatch.setattr(model_manager, "get_model_manager", lambda: manager)
+
+        own = memoized_embedding_kit(InferenceKit(embedder=CountingEmbedder()))
+        fallback = memoized_embedding_kit(None)
+
+        assert isinstance(own.embedder, RequestEmbeddingMemo)
+        assert own.embedder.wrapped is not manager
+        assert fallback.embedder.wrapped is manager
@@ -0,0 +1,206 @@
+"""
+Unit Tests: LLM Response Cache.
+
+Tests for shared/llm/cache.py against a local fake provider.
+"""
+
+import asyncio
+
+import pytest
+
+from shared.llm.cache import CachedLLMProvider, LLMResponseCache, request_key
+from shared.llm.provider import (
+    LLMConfig,
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMRole,
+    LLMStreamChunk,
+)
+
+
+class FakeProvider(LLMProvider):
+    """Counts upstream calls; completions take ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.streams = 0
+
+    async def complete(self, messages, config):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return LLMResponse(content=f"answer to {messages[-1].content}", model=config.model)
+
+    async def stream(self, messages, config):
+        self.streams += 1
+        for part in ("ans", "wer"):
+            yield LLMStreamChunk(content=part)
+        yield LLMStreamChunk(finish_reason="stop")
+
+    async def count_tokens(self, text, model):
+        return len(text)
+
+
+def _messages(text="hello"):
+    return [LLMMessage(role=LLMRole.USER, content=text)]
+
+
+def _deterministic(**kwargs):
+    return LLMConfig(model="test/model", temperature=0.0, **kwargs)
+
+
+def _provider(fake, cache_dir=None):
+    return CachedLLMProvider(fake, cache=LLMResponseCache(cache_dir=cache_dir))
+
+
+class TestRequestKey:
+
+    def test_sampling_parameters_change_the_key(self):
+        base = request_key("ns", _messages(), _deterministic())
+
+        assert base == request_key("ns", _messages(), _deterministic())
+        assert base != request_key("ns", _messages(), _deterministic(max_tokens=10))
+        assert base != request_key("ns", _messages("other"), _deterministic())
+        assert base != request_key("other", _messages(), _deterministic())
+        # The cache opt-in flag is not part of the request
+        assert base == request_key("ns", _messages(), _deterministic(cache=True))
+
+
+class TestCompletionCache:
+
+    @pytest.mark.asyncio
+    async def test_repeated_deterministic_prompt_hits_cache(self):
+        fake = FakeProvider()
+        provider = _provider(fake)
+
+        first = await provider.complete(_messages(), _deterministic())
+        second = await provider.complete(_messages(), _deterministic())
+
+        assert fake.calls == 1
+        assert second.content == first.content
+        assert provider.cache.stats["hit"] == 1
+
+    @pytest.mark.asyncio
+    async def test_nondeterministic_sampling_bypasses_cache(self):
+        fake = FakeProvider()
+        provider = _provider(fake)
+        config = LLMConfig(model="test/model", temperature=0.7)
+
+        await provider.complete(_messages(), config)
+        await provider.complete(_messages(), config)
+        await provider.complete(_messages(), _deterministic(cache=False))
+
+        assert fake.calls == 3
+        assert provider.cache.stats["bypass"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        fake = FakeProvider(delay=0.05)
+        provider = _provider(fake)
+
+        results = await asyncio.gather(*[
+            provider.complete(_messages(), _deterministic()) for _ in range(10)
+        ])
+
+        assert fake.calls == 1
+        assert {r.content for r in results} == {"answer to hello"}
+        assert provider.cache.stats["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_cached(self):
+        fake = FakeProvider(delay=0.01, fail=True)
+        provider = _provider(fake)
+
+        results = await asyncio.gather(
+            provider.complete(_messages(), _deterministic()),
+            provider.complete(_messages(), _deterministic()),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert fake.calls == 1
+
+        fake.fail = False
+        await provider.complete(_messages(), _deterministic())
+        assert fake.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_completions_are_not_cached(self):
+        class EmptyProvider(FakeProvider):
+            async def complete(self, messages, config):
+                self.calls += 1
+                return LLMResponse(content="", model=config.model)
+
+        fake = EmptyProvider()
+        provider = _provider(fake)
+
+        await provider.complete(_messages(), _deterministic())
+        await provider.complete(_messages(), _deterministic())
+
+        assert fake.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        fake = FakeProvider()
+        provider = CachedLLMProvider(fake, cache=LLMResponseCache(max_entries=2))
+
+        for text in ("a", "b", "c", "a"):
+            await provider.complete(_messages(text), _deterministic())
+
+        assert fake.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        fake = FakeProvider()
+        await _provider(fake, cache_dir=tmp_path).complete(_messages(), _deterministic())
+
+        restarted = _provider(fake, cache_dir=tmp_path)
+        response = await restarted.complete(_messages(), _deterministic())
+
+        assert fake.calls == 1
+        assert response.content == "answer to hello"
+        assert restarted.cache.stats["disk_hit"] == 1
+
+
+class TestStreamReplay:
+
+    @pytest.mark.asyncio
+    async def test_stream_is_recorded_and_replayed(self):
+        fake = FakeProvider()
+        provider = _provider(fake)
+
+        first = [c async for c in provider.stream(_messages(), _deterministic())]
+        second = [c async for c in provider.stream(_messages(), _deterministic())]
+
+        assert fake.streams == 1
+        assert second == first
+        # The recorded stream also serves completions
+        response = await provider.complete(_messages(), _deterministic())
+        assert response.content == "answer"
+        assert fake.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_completion_replays_as_stream(self):
+        fake = FakeProvider()
+        provider = _provider(fake)
+
+        await provider.complete(_messages(), _deterministic())
+        chunks = [c async for c in provider.stream(_messages(), _deterministic())]
+
+        assert fake.streams == 0
+        assert "".join(c.content for c in chunks) == "answer to hello"
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_is_not_cached(self):
+        fake = FakeProvider()
+        provider = _provider(fake)
+
+        stream = provider.stream(_messages(), _deterministic())
+        await stream.__anext__()
+        await stream.aclose()
+        [c async for c in provider.stream(_messages(), _deterministic())]
+
+        assert fake.streams == 2
@@ -0,0 +1,309 @@
+"""
+Unit Tests: MCP Host warm process pool.
+
+Uses an in-memory spawner so no server processes are started.
+"""
+
+import asyncio
+
+import pytest
+
+from services.mcp_host.core.process_pool import PoolClosedError, ServerProcessPool
+from shared.config import MCPPoolSettings
+
+
+class FakeProcess:
+    _next_pid = 1000
+
+    def __init__(self):
+        FakeProcess._next_pid += 1
+        self.pid = FakeProcess._next_pid
+        self.returncode = None
+        self.stderr = None
+        self._exited = asyncio.Event()
+
+    async def wait(self):
+        await self._exited.wait()
+        return self.returncode
+
+    def crash(self, code: int = 1):
+        self.returncode = code
+        self._exited.set()
+
+    def terminate(self):
+        if self.returncode is None:
+            self.crash(0)
+
+    def kill(self):
+        self.terminate()
+
+
+class FakeClient:
+    def __init__(self, process: FakeProcess, delay: float = 0.0):
+        self.process = process
+        self.delay = delay
+        self.calls = 0
+        self.healthy = True
+        self.closed = False
+
+    async def call_tool(self, name, arguments):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"pid": self.process.pid, "tool": name, "args": arguments}
+
+    async def ping(self):
+        return self.healthy
+
+    async def close(self):
+        self.closed = True
+
+
+def make_spawner(delay: float = 0.0):
+    spawned: list[FakeClient] = []
+
+    async def spawner():
+        process = FakeProcess()
+        client = FakeClient(process, delay)
+        spawned.append(client)
+        return client, process
+
+    return spawner, spawned
+
+
+def pool_config(**overrides) -> MCPPoolSettings:
+    defaults = dict(
+        min_size=0,
+        max_size=2,
+        max_concurrency_per_process=1,
+        idle_timeout=60.0,
+        health_check_interval=3600.0,
+        health_check_timeout=0.5,
+        acquire_timeout=2.0,
+        restart_backoff_seconds=0.0,
+    )
+    defaults.update(overrides)
+    return MCPPoolSettings(**defaults)
+
+
+class TestServerProcessPool:
+
+    @pytest.mark.asyncio
+    async def test_process_is_reused_across_calls(self):
+        spawner, spawned = make_spawner()
+        pool = ServerProcessPool("demo", spawner, pool_config())
+        await pool.start()
+
+        first = await pool.call_tool("echo", {"x": 1})
+        second = await pool.call_tool("echo", {"x": 2})
+
+        assert first["pid"] == second["pid"]
+        assert len(spawned) == 1
+        assert pool.stats()["calls"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_warm_start_respects_min_size(self):
+        spawner, spawned = make_spawner()
+        pool = ServerProcessPool("demo", spawner, pool_config(min_size=2))
+        await pool.start()
+
+        assert len(spawned) == 2
+        assert pool.stats()["idle"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped_by_max_size(self):
+        spawner, spawned = make_spawner(delay=0.05)
+        pool = ServerProcessPool("demo", spawner, pool_config(max_size=2))
+        await pool.start()
+
+        results = await asyncio.gather(*(pool.call_tool("echo", {"i": i}) for i in range(6)))
+
+        assert len(results) == 6
+        assert len(spawned) == 2
+        assert pool.stats()["waits"] > 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_crashed_process_is_replaced(self):
+        spawner, spawned = make_spawner()
+        pool = ServerProcessPool("demo", spawner, pool_config())
+        await pool.start()
+
+        first = await pool.call_tool("echo", {})
+        spawned[0].process.crash()
+        second = await pool.call_tool("echo", {})
+
+        assert first["pid"] != second["pid"]
+        assert pool.stats()["crashed"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_crash_mid_call_fails_fast(self):
+        spawner, spawned = make_spawner(delay=10.0)
+        pool = ServerProcessPool("demo", spawner, pool_config())
+        await pool.start()
+
+        call = asyncio.create_task(pool.call_tool("slow", {}))
+        await asyncio.sleep(0.01)
+        spawned[0].process.crash()
+
+        with pytest.raises(RuntimeError, match="exited"):
+            await asyncio.wait_for(call, timeout=1.0)
+        assert pool.stats()["size"] == 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_processes_above_min_are_reaped(self):
+        spawner, spawned = make_spawner(delay=0.02)
+        pool = ServerProcessPool("demo", spawner, pool_config(min_size=1, idle_timeout=0.0))
+        await pool.start()
+        await asyncio.gather(*(pool.call_tool("echo", {}) for _ in range(2)))
+        assert pool.stats()["size"] == 2
+
+        await pool._maintain()
+
+        assert pool.stats()["size"] == 1
+        assert pool.stats()["reaped"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_process_is_recycled(self):
+        spawner, spawned = make_spawner()
+        pool = ServerProcessPool("demo", spawner, pool_config(min_size=1))
+        await pool.start()
+        spawned[0].healthy = False
+
+        await pool._maintain()
+
+        stats = pool.stats()
+        assert stats["recycled"] == 1
+        assert stats["size"] == 1
+        assert len(spawned) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_calls(self):
+        spawner, spawned = make_spawner()
+        pool = ServerProcessPool("demo", spawner, pool_config(min_size=1))
+        await pool.start()
+        await pool.close()
+
+        assert spawned[0].closed is True
+        with pytest.raises(PoolClosedError):
+            await pool.call_tool("echo", {})
+
+    @pytest.mark.asyncio
+    async def test_slow_spawn_counts_against_acquire_timeout(self):
+        async def spawner():
+            await asyncio.sleep(5)
+            process = FakeProcess()
+            return FakeClient(process), process
+
+        pool = ServerProcessPool("demo", spawner, pool_config(acquire_timeout=0.05))
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(pool.call_tool("t", {}), timeout=1.0)
+        assert pool.stats()["spawning"] == 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_spawn_backoff_is_capped(self, monkeypatch):
+        delays: list[float] = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        spawner, _ = make_spawner()
+        pool = ServerProcessPool(
+            "demo", spawner,
+            pool_config(restart_backoff_seconds=1.0, restart_backoff_max_seconds=4.0),
+        )
+        pool._spawn_failures = 10
+        monkeypatch.setattr("services.mcp_host.core.process_pool.asyncio.sleep", fake_sleep)
+        await pool._spawn()
+        assert delays == [4.0]
+
+    @pytest.mark.asyncio
+    async def test_replenish_after_close_does_not_keep_process(self):
+        release = asyncio.Event()
+        spawned: list[FakeClient] = []
+
+        async def spawner():
+            await release.wait()
+            process = FakeProcess()
+            client = FakeClient(process)
+            spawned.append(client)
+            return client, process
+
+        pool = ServerProcessPool("demo", spawner, pool_config(min_size=1))
+        warm = asyncio.create_task(pool._replenish())
+        await asyncio.sleep(0)
+        await pool.close()
+        release.set()
+        await warm
+
+        assert pool.stats()["size"] == 0
+        assert spawned[0].process.returncode is not None
+
+    @pytest.mark.asyncio
+    async def test_acquire_spawn_finishing_after_close_is_terminated(self):
+        release = asyncio.Event()
+        spawned: list[FakeClient] = []
+
+        async def spawner():
+            await release.wait()
+            process = FakeProcess()
+            client = FakeClient(process)
+            spawned.append(client)
+            return client, process
+
+        pool = ServerProcessPool("demo", spawner, pool_config())
+        call = asyncio.create_task(pool.call_tool("echo", {}))
+        await asyncio.sleep(0)
+        await pool.close()
+        release.set()
+
+        with pytest.raises(PoolClosedError):
+            await call
+        assert pool.stats()["size"] == 0
+        assert spawned[0].closed is True
+        assert spawned[0].process.returncode is not None
+
+
+class TestSpawnProcessCancellation:
+
+    @pytest.mark.asyncio
+    async def test_cancelled_handshake_kills_process(self, tmp_path, monkeypatch):
+        import os
+
+        from services.mcp_host.core.session_registry import ServerConfig, SessionRegistry
+        from shared.config import get_settings
+
+        script = tmp_path / "server.py"
+        script.write_text("import time\ntime.sleep(30)\n")
+        monkeypatch.setattr(get_settings().mcp.jit, "uv_enabled", False)
+        monkeypatch.setattr(
+            SessionRegistry,
+            "_shared_server_configs",
+            {"sleepy": ServerConfig(name="sleepy", script_path=script, env=dict(os.environ))},
+        )
+        started = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def create_subprocess_exec(*args, **kwargs):
+            process = await real_exec(*args, **kwargs)
+            started.append(process)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+        registry = SessionRegistry.__new__(SessionRegistry)
+
+        spawn = asyncio.create_task(registry._spawn_process("sleepy"))
+        while not started:
+            await asyncio.sleep(0.01)
+        spawn.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await spawn
+
+        # Killed rather than left running for the full sleep
+        assert await asyncio.wait_for(started[0].wait(), timeout=5.0) != 0
@@ -75,9 +75,9 @@ class TestSSETransport:
         """Test sending message via SSE."""
         request = JSONRPCRequest(id="1", method="test")
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("shared.http_pool.get_http_client") as mock_get_client:
             mock_instance = AsyncMock()
-            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_get_client.return_value = mock_instance
             mock_instance.post = AsyncMock()
 
             await transport.send(request)
@@ -0,0 +1,177 @@
+"""
+Unit Tests: Corporate Ops mission executor.
+
+Tests for services/corporate_ops/core/mission_executor.py against
+in-memory Orchestrator and Vault clients.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from kernel.team_orchestrator import Sprint
+from services.corporate_ops.core.mission_executor import MissionExecutor, assign_profiles
+from shared.config import get_settings
+from shared.schemas import CorporateAgentProcessResponse, CorporateAgentSpawnResponse
+
+
+class FakeOrchestrator:
+    """Processing takes ``delays[raw_input]`` seconds; records spans and spawn requests."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.spawns = []
+        self.terminated = []
+        self.spans = {}
+        self.processed = {}
+
+    async def spawn_agent(self, request):
+        self.spawns.append(request)
+        return CorporateAgentSpawnResponse(agent_id=f"agent_{len(self.spawns)}", profile_id=request.profile_id)
+
+    async def process_agent(self, agent_id, request):
+        self.processed[request.raw_input] = request
+        start = time.perf_counter()
+        await asyncio.sleep(self.delays.get(request.raw_input, 0.0))
+        self.spans[request.raw_input] = (start, time.perf_counter())
+        return CorporateAgentProcessResponse(agent_id=agent_id, result={"out": request.raw_input}, cost=1.0)
+
+    async def terminate_agent(self, agent_id, reason="mission_complete"):
+        self.terminated.append(agent_id)
+        return {}
+
+
+class FakeVault:
+
+    def __init__(self):
+        self.writes = []
+
+    async def write_artifact(self, agent_id, team_id, content, metadata):
+        self.writes.append(metadata.chunk_id)
+        return f"art_{metadata.chunk_id}"
+
+
+def _chunk(chunk_id, depends_on=(), tools=()):
+    return {
+        "chunk_id": chunk_id,
+        "sub_objective": chunk_id,
+        "depends_on": list(depends_on),
+        "required_tools": list(tools),
+    }
+
+
+def _sprints(*groups):
+    return [
+        Sprint(sprint_id=f"m_sprint_{n}", sprint_number=n, mission_id="m", objective="", chunks=chunks)
+        for n, chunks in enumerate(groups, start=1)
+    ]
+
+
+async def _approve(sprint, result):
+    return True
+
+
+@pytest.mark.asyncio
+async def test_next_sprint_starts_when_its_inputs_are_ready():
+    orch = FakeOrchestrator({"a": 0.01, "b": 0.2, "c": 0.01})
+    vault = FakeVault()
+    executor = MissionExecutor(
+        "m", _sprints([_chunk("a"), _chunk("b")], [_chunk("c", depends_on=["a"])]), [], orch, vault
+    )
+
+    results = await executor.run(_approve)
+
+    # c overlapped the slow chunk of sprint 1 and received a's artifact
+    assert orch.spans["c"][0] < orch.spans["b"][1]
+    assert orch.processed["c"].attachments == [
+        {"type": "predecessor_artifacts", "artifact_ids": ["art_a"]}
+    ]
+    assert [r.completed_chunks for r in results] == [["a", "b"], ["c"]]
+    assert sorted(results[0].artifacts_produced) == ["art_a", "art_b"]
+
+
+@pytest.mark.asyncio
+async def test_agents_are_reused_and_writes_batched(monkeypatch):
+    monkeypatch.setattr(get_settings().corporate, "sprint_max_parallel_tasks", 1)
+    orch = FakeOrchestrator({})
+    vault = FakeVault()
+    executor = MissionExecutor(
+        "m",
+        _sprints([_chunk("a"), _chunk("b"), _chunk("c", tools=["web"])], [_chunk("d")]),
+        [],
+        orch,
+        vault,
+    )
+
+    results = await executor.run(_approve)
+
+    # One agent per (profile, tools) key, terminated once at the end
+    assert len(orch.spawns) == 2
+    assert executor.agents.reused == 2
+    assert sorted(orch.terminated) == ["agent_1", "agent_2"]
+    assert sorted(vault.writes) == ["a", "b", "c", "d"]
+    assert executor.writes.batches < len(vault.writes)
+    # Reused agents keep one entry per chunk
+    assert len(results[0].agent_results) == 3
+
+
+@pytest.mark.asyncio
+async def test_blocked_review_stops_later_sprints(monkeypatch):
+    monkeypatch.setattr(get_settings().corporate, "sprint_pipelining_enabled", False)
+    orch = FakeOrchestrator({})
+    executor = MissionExecutor(
+        "m", _sprints([_chunk("a")], [_chunk("b", depends_on=["a"])]), [], orch, FakeVault()
+    )
+
+    async def block(sprint, result):
+        return False
+
+    results = await executor.run(block)
+
+    assert len(results) == 1
+    assert "b" not in orch.spans
+    assert executor.late_results == []
+
+
+class SkillEmbedder:
+    """Bag-of-skills embedder standing in for the model manager."""
+
+    skills = ["python", "react"]
+
+    def _vector(self, text):
+        return [float(text.split().count(skill)) + 0.01 for skill in self.skills]
+
+    async def embed_batch(self, texts):
+        return [self._vector(t) for t in texts]
+
+    async def embed_single(self, text):
+        return self._vector(text)
+
+    async def rerank_single(self, query, document):
+        wanted = [s for s in self.skills if s in query.split()]
+        return sum(s in document.split() for s in wanted) / max(len(wanted), 1)
+
+
+@pytest.mark.asyncio
+async def test_assign_profiles_reads_kernel_assignment(monkeypatch):
+    from kernel.workforce_manager.engine import get_specialist_index
+    from shared.embedding import model_manager
+
+    monkeypatch.setattr(model_manager, "get_model_manager", lambda: SkillEmbedder())
+    get_specialist_index().clear()
+    profiles = [
+        {"profile_id": "backend", "role_name": "Backend", "skills": ["python"]},
+        {"profile_id": "frontend", "role_name": "Frontend", "skills": ["react"]},
+    ]
+    chunks = [
+        {**_chunk("api"), "parent_objective_id": "m", "domain": "eng", "required_skills": ["python"]},
+        {**_chunk("ui"), "parent_objective_id": "m", "domain": "eng", "required_skills": ["react"]},
+    ]
+
+    try:
+        assignments = await assign_profiles(chunks, profiles)
+    finally:
+        get_specialist_index().clear()
+
+    assert assignments == {"api": "backend", "ui": "frontend"}
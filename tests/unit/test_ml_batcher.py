@@ -0,0 +1,152 @@
+"""
+Unit Tests: ML Inference cross-request micro-batcher.
+
+Uses in-memory runners so no models are loaded.
+"""
+
+import asyncio
+
+import pytest
+
+from services.ml_inference.core.batcher import MicroBatcher, estimate_tokens, length_sorted
+from shared.config import MLInferenceSettings
+from shared.embedding.qwen3_reranker import RerankerProvider, RerankResult
+
+
+def batch_config(**overrides) -> MLInferenceSettings:
+    defaults = dict(batch_max_wait_ms=20.0, batch_max_items=256, batch_max_tokens=100_000)
+    defaults.update(overrides)
+    return MLInferenceSettings(**defaults)
+
+
+def make_runner(delay: float = 0.0):
+    calls: list[list[str]] = []
+
+    async def runner(items: list[str]) -> list[str]:
+        calls.append(list(items))
+        await asyncio.sleep(delay)
+        return [item.upper() for item in items]
+
+    return runner, calls
+
+
+class TestMicroBatcher:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        runner, calls = make_runner()
+        batcher = MicroBatcher("test", runner, cost=estimate_tokens, config=batch_config())
+
+        results = await asyncio.gather(
+            batcher.submit(["a", "b"]),
+            batcher.submit(["c"]),
+            batcher.submit(["d", "e", "f"]),
+        )
+
+        assert results == [["A", "B"], ["C"], ["D", "E", "F"]]
+        assert calls == [["a", "b", "c", "d", "e", "f"]]
+        assert batcher.stats()["requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_item_budget_splits_batches(self):
+        runner, calls = make_runner()
+        batcher = MicroBatcher(
+            "test", runner, cost=estimate_tokens, config=batch_config(batch_max_items=2)
+        )
+
+        results = await asyncio.gather(*(batcher.submit([str(i)]) for i in range(5)))
+
+        assert [r[0] for r in results] == ["0", "1", "2", "3", "4"]
+        assert [len(c) for c in calls] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_still_runs_alone(self):
+        runner, calls = make_runner()
+        batcher = MicroBatcher(
+            "test", runner, cost=estimate_tokens, config=batch_config(batch_max_tokens=5)
+        )
+
+        results = await asyncio.gather(batcher.submit(["x" * 100]), batcher.submit(["y"]))
+
+        assert results == [["X" * 100], ["Y"]]
+        assert calls == [["x" * 100], ["y"]]
+
+    @pytest.mark.asyncio
+    async def test_full_budget_skips_wait_window(self):
+        runner, calls = make_runner()
+        batcher = MicroBatcher(
+            "test", runner, cost=estimate_tokens,
+            config=batch_config(batch_max_wait_ms=5000.0, batch_max_items=2),
+        )
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"])), timeout=1.0
+        )
+
+        assert results == [["A"], ["B"]]
+
+    @pytest.mark.asyncio
+    async def test_runner_failure_reaches_every_caller(self):
+        async def runner(items):
+            raise ValueError("model exploded")
+
+        batcher = MicroBatcher("test", runner, cost=estimate_tokens, config=batch_config())
+
+        results = await asyncio.gather(
+            batcher.submit(["a"]), batcher.submit(["b"]), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_runs_under_semaphore(self):
+        semaphore = asyncio.Semaphore(1)
+        seen: list[bool] = []
+
+        async def runner(items):
+            seen.append(semaphore.locked())
+            return items
+
+        batcher = MicroBatcher(
+            "test", runner, cost=estimate_tokens,
+            semaphore=lambda: semaphore, config=batch_config(batch_max_wait_ms=0.0),
+        )
+
+        assert await batcher.submit(["a"]) == ["a"]
+        assert seen == [True]
+
+    @pytest.mark.asyncio
+    async def test_length_sorted_restores_order(self):
+        received: list[list[str]] = []
+
+        async def runner(texts):
+            received.append(texts)
+            return [len(t) for t in texts]
+
+        run = length_sorted(runner)
+
+        assert await run(["ccc", "a", "bb"]) == [3, 1, 2]
+        assert received == [["a", "bb", "ccc"]]
+
+
+class TestRerankerScorePairs:
+
+    @pytest.mark.asyncio
+    async def test_default_score_pairs_groups_by_query(self):
+        class LengthReranker(RerankerProvider):
+            def __init__(self):
+                self.queries = []
+
+            async def rerank(self, query, documents, top_k=None):
+                self.queries.append(query)
+                results = [
+                    RerankResult(index=i, score=float(len(doc)), text=doc)
+                    for i, doc in enumerate(documents)
+                ]
+                return sorted(results, key=lambda r: r.score, reverse=True)
+
+        reranker = LengthReranker()
+        scores = await reranker.score_pairs([("q1", "a"), ("q2", "bbb"), ("q1", "cc")])
+
+        assert scores == [1.0, 3.0, 2.0]
+        assert reranker.queries == ["q1", "q2"]
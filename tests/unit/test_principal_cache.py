@@ -0,0 +1,109 @@
+"""
+Unit Tests: API-key principal cache.
+"""
+
+from datetime import datetime, timedelta
+
+from shared.users import User, UserRole
+from shared.users.models import APIKey
+from shared.users.principal_cache import Principal, PrincipalCache
+
+
+def _principal(key_id="key_1", user_id="user_1", expires_at=None) -> Principal:
+    api_key = APIKey(
+        key_id=key_id,
+        user_id=user_id,
+        name="test",
+        key_hash=f"hash-{key_id}",
+        key_prefix="project_abcd",
+        expires_at=expires_at,
+    )
+    user = User(user_id=user_id, email=f"{user_id}@example.com", name="Test", role=UserRole.USER)
+    return Principal(api_key=api_key, user=user)
+
+
+class TestPrincipalCache:
+
+    def test_hit_and_miss(self):
+        cache = PrincipalCache(max_entries=10, ttl=60, negative_ttl=60)
+        principal = _principal()
+
+        assert cache.lookup("h1", "project_abcd") == (False, None)
+        cache.store("h1", principal)
+        assert cache.lookup("h1", "project_abcd") == (True, principal)
+
+    def test_negative_prefix_and_rejection(self):
+        cache = PrincipalCache(max_entries=10, ttl=60, negative_ttl=60)
+
+        cache.store_unknown_prefix("project_zzzz")
+        cache.store_rejection("bad")
+
+        assert cache.lookup("anything", "project_zzzz") == (True, None)
+        assert cache.lookup("bad", "project_abcd") == (True, None)
+        cache.apply("prefix:project_zzzz")
+        assert cache.lookup("anything", "project_zzzz") == (False, None)
+
+    def test_ttl_expiry(self, monkeypatch):
+        from shared.users import principal_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(principal_cache.time, "monotonic", lambda: now[0])
+        cache = PrincipalCache(max_entries=10, ttl=30, negative_ttl=5)
+        cache.store("h1", _principal())
+
+        now[0] += 31
+        assert cache.lookup("h1", "project_abcd") == (False, None)
+        assert len(cache) == 0
+
+    def test_expired_key_not_served(self):
+        cache = PrincipalCache(max_entries=10, ttl=60, negative_ttl=60)
+        cache.store("h1", _principal(expires_at=datetime.utcnow() - timedelta(seconds=1)))
+
+        assert cache.lookup("h1", "project_abcd") == (False, None)
+
+    def test_invalidate_by_key_and_user(self):
+        cache = PrincipalCache(max_entries=10, ttl=60, negative_ttl=60)
+        cache.store("h1", _principal("key_1", "user_1"))
+        cache.store("h2", _principal("key_2", "user_1"))
+        cache.store("h3", _principal("key_3", "user_2"))
+
+        cache.apply("key:key_1")
+        assert cache.lookup("h1", "p")[0] is False
+        assert cache.lookup("h2", "p")[0] is True
+
+        cache.apply("user:user_1")
+        assert cache.lookup("h2", "p")[0] is False
+        assert cache.lookup("h3", "p")[0] is True
+
+    def test_store_skipped_after_racing_invalidation(self):
+        cache = PrincipalCache(max_entries=10, ttl=60, negative_ttl=60)
+        generation = cache.generation
+
+        cache.apply("key:key_1")
+        cache.store("h1", _principal(), generation)
+
+        assert cache.lookup("h1", "p") == (False, None)
+
+    def test_lru_bound(self):
+        cache = PrincipalCache(max_entries=2, ttl=60, negative_ttl=60)
+        cache.store("h1", _principal("key_1"))
+        cache.store("h2", _principal("key_2"))
+        cache.lookup("h1", "p")
+        cache.store("h3", _principal("key_3"))
+
+        assert len(cache) == 2
+        assert cache.lookup("h2", "p")[0] is False
+        assert cache.lookup("h1", "p")[0] is True
+
+    def test_rejections_do_not_evict_principals(self):
+        cache = PrincipalCache(max_entries=2, ttl=60, negative_ttl=60, max_negative_entries=2)
+        principal = _principal()
+        cache.store("h1", principal)
+        for i in range(5):
+            cache.store_rejection(f"bad{i}")
+            cache.store_unknown_prefix(f"project_{i}")
+
+        assert len(cache) == 3
+        assert cache.lookup("h1", "project_abcd") == (True, principal)
+        assert cache.lookup("bad0", "p") == (False, None)
+        assert cache.lookup("anything", "project_4") == (True, None)
@@ -1,18 +1,18 @@
 """
 Unit Tests: Rate Limiting Middleware.
 
-Tests for rate limiter, sliding window, and circuit breaker.
+Tests for rate limiter, GCRA limiter, and circuit breaker.
 """
 
-import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from services.api_gateway.middleware.rate_limit import (
+    GCRALimiter,
     RateLimitConfig,
     RateLimitMiddleware,
-    SlidingWindowCounter,
+    RateLimitRule,
 )
 
 
@@ -48,70 +48,133 @@ class TestRateLimitConfig:
             assert config.requests_per_minute == 30
 
 
-class TestSlidingWindowCounter:
-    """Test in-memory rate limiter."""
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestGCRALimiter:
+    """Test in-memory GCRA rate limiter."""
 
     def test_initial_request_allowed(self):
         """Test first request is allowed."""
-        counter = SlidingWindowCounter()
+        limiter = GCRALimiter()
 
-        allowed, remaining = counter.is_allowed("user:1", limit=10)
+        allowed, remaining = limiter.is_allowed("user:1", limit=10)
 
         assert allowed is True
         assert remaining == 9
 
     def test_requests_counted(self):
         """Test multiple requests are counted."""
-        counter = SlidingWindowCounter()
+        limiter = GCRALimiter(clock=FakeClock())
 
         for i in range(5):
-            counter.is_allowed("user:1", limit=10)
+            limiter.is_allowed("user:1", limit=10)
 
-        allowed, remaining = counter.is_allowed("user:1", limit=10)
+        allowed, remaining = limiter.is_allowed("user:1", limit=10)
 
         assert allowed is True
         assert remaining == 4
 
     def test_limit_exceeded(self):
         """Test rate limit exceeded."""
-        counter = SlidingWindowCounter()
+        limiter = GCRALimiter(clock=FakeClock())
 
         # Use all requests
         for i in range(10):
-            counter.is_allowed("user:1", limit=10)
+            limiter.is_allowed("user:1", limit=10)
 
         # Next should be blocked
-        allowed, remaining = counter.is_allowed("user:1", limit=10)
+        allowed, remaining = limiter.is_allowed("user:1", limit=10)
 
         assert allowed is False
         assert remaining == 0
 
     def test_different_keys_independent(self):
         """Test different users are independent."""
-        counter = SlidingWindowCounter()
+        limiter = GCRALimiter(clock=FakeClock())
 
         # Max out user 1
         for i in range(10):
-            counter.is_allowed("user:1", limit=10)
+            limiter.is_allowed("user:1", limit=10)
 
         # User 2 should still be allowed
-        allowed, _ = counter.is_allowed("user:2", limit=10)
+        allowed, _ = limiter.is_allowed("user:2", limit=10)
 
         assert allowed is True
 
     def test_window_expiry(self):
-        """Test old requests expire from window."""
-        counter = SlidingWindowCounter()
+        """Test capacity is fully restored after a window."""
+        clock = FakeClock()
+        limiter = GCRALimiter(clock=clock)
 
-        # Add old request manually
-        counter._windows["user:1"] = [time.time() - 120]  # 2 minutes ago
+        for i in range(10):
+            limiter.is_allowed("user:1", limit=10, window_seconds=60)
 
-        # Request with 60s window should not see old request
-        allowed, remaining = counter.is_allowed("user:1", limit=10, window_seconds=60)
+        clock.now += 60
+        allowed, remaining = limiter.is_allowed("user:1", limit=10, window_seconds=60)
 
         assert allowed is True
         assert remaining == 9
 
+    def test_burst_then_sustained_rate(self):
+        """Test burst is admitted at once, then one request per interval."""
+        clock = FakeClock()
+        limiter = GCRALimiter(clock=clock)
+        rules = (RateLimitRule(limit=60, period=60, burst=3),)
+
+        assert [limiter.check("k", rules).allowed for _ in range(4)] == [True, True, True, False]
+
+        clock.now += 1
+        assert limiter.check("k", rules).allowed is True
+        assert limiter.check("k", rules).allowed is False
+
+    def test_retry_after(self):
+        """Test denied decisions report when the next request will pass."""
+        clock = FakeClock()
+        limiter = GCRALimiter(clock=clock)
+        rules = (RateLimitRule(limit=10, period=60),)
+
+        for i in range(10):
+            limiter.check("k", rules)
+        decision = limiter.check("k", rules)
+
+        assert decision.allowed is False
+        assert decision.retry_after == pytest.approx(6.0)
+
+        clock.now += decision.retry_after
+        assert limiter.check("k", rules).allowed is True
+
+    def test_all_rules_must_allow(self):
+        """Test a denied rule does not consume the others."""
+        limiter = GCRALimiter(clock=FakeClock())
+        rules = (RateLimitRule(limit=60, period=60, burst=10), RateLimitRule(limit=2, period=3600))
+
+        assert limiter.check("k", rules).allowed is True
+        assert limiter.check("k", rules).allowed is True
+        decision = limiter.check("k", rules)
+
+        assert decision.allowed is False
+        assert decision.retry_after == pytest.approx(1800.0)
+
+    def test_idle_keys_evicted(self):
+        """Test sweep drops keys whose state has fully decayed."""
+        clock = FakeClock()
+        limiter = GCRALimiter(sweep_interval=30, clock=clock)
+
+        limiter.is_allowed("user:1", limit=10)
+        limiter.is_allowed("user:2", limit=10)
+        assert len(limiter) == 2
+
+        clock.now += 31
+        limiter.is_allowed("user:3", limit=10)
+
+        assert len(limiter) == 1
+
 
 class TestRateLimitMiddlewareUnit:
     """Unit tests for rate limit middleware."""
@@ -174,3 +237,29 @@ class TestRateLimitMiddlewareUnit:
         key = middleware._get_key(mock_request)
 
         assert key == "ip:10.0.0.1"
+
+
+class TestRateLimiterShutdown:
+    """Test shutdown of the Postgres-backed limiter."""
+
+    @pytest.mark.asyncio
+    async def test_close_rate_limiters_stops_sync_and_flushes(self):
+        from services.api_gateway.middleware import rate_limit
+
+        limiter = rate_limit.PostgresRateLimiter()
+        flushed = []
+
+        async def flush():
+            flushed.append(True)
+
+        limiter.flush = flush
+        rate_limit._postgres_limiters.add(limiter)
+        limiter.check("user:1", (RateLimitRule(10, 60),))
+        sync_task = limiter._sync_task
+
+        await rate_limit.close_rate_limiters()
+
+        assert sync_task.cancelled()
+        assert limiter._sync_task is None
+        assert flushed == [True]
+        assert len(rate_limit._postgres_limiters) == 0
@@ -0,0 +1,75 @@
+"""
+Unit Tests: Compiled system knowledge and gazetteer matching.
+"""
+
+import os
+
+import pytest
+
+from shared.knowledge import system_loader
+from shared.knowledge.gazetteer import Gazetteer, GazetteerMatch
+from shared.knowledge.system_loader import compile_system_knowledge, load_system_knowledge
+
+
+class TestGazetteer:
+
+    def test_matches_all_terms_in_one_pass(self):
+        gazetteer = Gazetteer(["New York", "york", "EU", "he", "she", "hers"])
+
+        matches = gazetteer.find_all("I love new York and the EU, ushers. She said hers. EUR")
+
+        assert matches == [
+            GazetteerMatch(7, 15, "New York"),
+            GazetteerMatch(11, 15, "york"),
+            GazetteerMatch(24, 26, "EU"),
+            GazetteerMatch(36, 39, "she"),
+            GazetteerMatch(45, 49, "hers"),
+        ]
+
+    def test_mapping_keys_and_case_sensitivity(self):
+        gazetteer = Gazetteer({"nyc": "New York"}, case_sensitive=True)
+
+        assert gazetteer.find_all("NYC or nyc") == [GazetteerMatch(7, 10, "New York")]
+        assert len(gazetteer) == 1
+
+
+@pytest.fixture
+def knowledge_file(tmp_path, monkeypatch):
+    path = tmp_path / "rules.yaml"
+    path.write_text("patterns:\n  NUM: '[0-9]+'\n  BAD: '('\nregions:\n  APAC: {}\n  EMEA: {}\n")
+    monkeypatch.setattr(system_loader, "system_knowledge_path", lambda filename: path)
+    monkeypatch.setattr(system_loader, "_COMPILED", {})
+    return path
+
+
+def _touch(path, text):
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestCompiledKnowledge:
+
+    def test_parses_once_and_compiles_artifacts(self, knowledge_file):
+        compiled = compile_system_knowledge("rules.yaml")
+
+        assert compile_system_knowledge("rules.yaml") is compiled
+        assert load_system_knowledge("rules.yaml") is compiled.data
+        assert list(compiled.patterns("patterns")) == ["NUM"]
+        assert compiled.patterns("patterns") is compiled.patterns("patterns")
+        assert [m.key for m in compiled.gazetteer("regions").find_all("apac and EMEA")] == ["APAC", "EMEA"]
+
+    def test_invalidates_on_content_change_only(self, knowledge_file):
+        compiled = compile_system_knowledge("rules.yaml")
+
+        _touch(knowledge_file, knowledge_file.read_text())
+        assert compile_system_knowledge("rules.yaml") is compiled
+
+        _touch(knowledge_file, "regions:\n  LATAM: {}\n")
+        recompiled = compile_system_knowledge("rules.yaml")
+        assert recompiled is not compiled
+        assert list(recompiled.data["regions"]) == ["LATAM"]
+
+    def test_missing_file_is_empty(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(system_loader, "system_knowledge_path", lambda filename: tmp_path / "missing.yaml")
+        assert load_system_knowledge("missing.yaml") == {}
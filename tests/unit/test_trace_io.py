@@ -0,0 +1,105 @@
+"""
+Unit Tests: trace_io lazy capture, sampling and off mode.
+"""
+
+import asyncio
+import itertools
+import logging
+
+import pytest
+
+from shared.logging import decorators
+from shared.logging.decorators import _is_sampled, trace_io
+
+
+class Payload:
+    def __init__(self):
+        self.dumps = 0
+
+    def model_dump(self):
+        self.dumps += 1
+        return {"value": 1}
+
+
+@pytest.fixture
+def io_calls(monkeypatch):
+    calls = []
+    import shared.logging.main as main
+    monkeypatch.setattr(main, "log_input", lambda source, data, **kw: calls.append(("input", data)))
+    monkeypatch.setattr(main, "log_output", lambda source, data, **kw: calls.append(("output", data)))
+    monkeypatch.setattr(main, "log_error", lambda source, err, **kw: calls.append(("error", err)))
+    decorators._sample_rate.cache_clear()
+    yield calls
+    decorators._sample_rate.cache_clear()
+
+
+@pytest.fixture
+def set_io_level():
+    original = decorators._IO_LOGGER.level
+    yield decorators._IO_LOGGER.setLevel
+    decorators._IO_LOGGER.setLevel(original)
+
+
+class TestTraceIO:
+
+    def test_payloads_not_touched_when_debug_disabled(self, io_calls, set_io_level):
+        set_io_level(logging.INFO)
+        payload = Payload()
+
+        @trace_io()
+        def handle(p):
+            return p
+
+        assert handle(payload) is payload
+        assert payload.dumps == 0
+        assert io_calls == []
+
+    def test_payloads_captured_at_debug(self, io_calls, set_io_level):
+        set_io_level(logging.DEBUG)
+
+        @trace_io()
+        async def handle(p):
+            return p
+
+        asyncio.run(handle(Payload()))
+
+        assert [kind for kind, _ in io_calls] == ["input", "output"]
+        assert io_calls[0][1] == {"p": {"value": 1}}
+
+    def test_errors_logged_without_capture(self, io_calls, set_io_level):
+        set_io_level(logging.INFO)
+
+        @trace_io()
+        def boom():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            boom()
+        assert io_calls[0][0] == "error"
+        assert io_calls[0][1]["error"] == "bad"
+
+    def test_off_mode_returns_function_unchanged(self, monkeypatch):
+        monkeypatch.setattr(decorators, "_trace_io_mode", lambda: "off")
+
+        def handle():
+            return 1
+
+        assert trace_io()(handle) is handle
+
+
+class TestSampling:
+
+    def test_untraced_calls_sample_every_nth(self):
+        counter = itertools.count(1)
+        decisions = [_is_sampled(0.25, counter) for _ in range(8)]
+        assert decisions == [False, False, False, True, False, False, False, True]
+
+    def test_traced_calls_are_deterministic_per_trace(self):
+        import structlog
+        structlog.contextvars.bind_contextvars(trace_id="trace-abc")
+        try:
+            first = [_is_sampled(0.5, itertools.count(1)) for _ in range(5)]
+        finally:
+            structlog.contextvars.clear_contextvars()
+        assert len(set(first)) == 1
+        assert _is_sampled(1.0, itertools.count(1)) and not _is_sampled(0.0, itertools.count(1))